@@ -0,0 +1,68 @@
+"""valid_objects_projection
+
+Revision ID: 1a7e3c9d2b40
+Revises: c704f8f17f09
+Create Date: 2026-10-17 09:12:41.532118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# We need these to load all sqlalchemy tables
+from app.main import app  ## noqa
+from app.core.db import table_metadata  ## noqa
+from app.core.settings import Settings  ## noqa
+
+settings = Settings()
+
+
+# revision identifiers, used by Alembic.
+revision = "1a7e3c9d2b40"
+down_revision = "c704f8f17f09"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "valid_objects",
+        sa.Column("Code", sa.Unicode(length=35), nullable=False),
+        sa.Column("Object_Type", sa.Unicode(length=25), nullable=False),
+        sa.Column("Object_UUID", sa.Uuid(), nullable=False),
+        sa.Column("Refreshed_Date", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["Code"],
+            ["object_statics.Code"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["Object_UUID"],
+            ["objects.UUID"],
+        ),
+        sa.PrimaryKeyConstraint("Code"),
+        sa.UniqueConstraint("Object_UUID"),
+    )
+    op.create_index(op.f("ix_valid_objects_Object_Type"), "valid_objects", ["Object_Type"], unique=False)
+
+    # Initial fill, afterwards maintained by the application and `refresh-valid-objects`
+    op.execute(
+        """
+        INSERT INTO valid_objects (Code, Object_Type, Object_UUID, Refreshed_Date)
+        SELECT Code, Object_Type, UUID, CURRENT_TIMESTAMP
+        FROM (
+            SELECT
+                Code,
+                Object_Type,
+                UUID,
+                ROW_NUMBER() OVER (PARTITION BY Code ORDER BY Modified_Date DESC) AS _RowNumber
+            FROM objects
+            WHERE Start_Validity <= CURRENT_TIMESTAMP
+        ) AS latest
+        WHERE _RowNumber = 1
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_valid_objects_Object_Type"), table_name="valid_objects")
+    op.drop_table("valid_objects")
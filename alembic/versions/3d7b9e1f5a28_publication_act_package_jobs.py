@@ -0,0 +1,58 @@
+"""publication_act_package_jobs
+
+Revision ID: 3d7b9e1f5a28
+Revises: 8c1f4a6e2d97
+Create Date: 2026-10-17 21:04:13.208531
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# We need these to load all sqlalchemy tables
+from app.main import app  ## noqa
+from app.core.db import table_metadata  ## noqa
+from app.core.settings import Settings  ## noqa
+
+settings = Settings()
+
+
+# revision identifiers, used by Alembic.
+revision = "3d7b9e1f5a28"
+down_revision = "8c1f4a6e2d97"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "publication_act_package_jobs",
+        sa.Column("UUID", sa.Uuid(), nullable=False),
+        sa.Column("Publication_Version_UUID", sa.Uuid(), nullable=False),
+        sa.Column("Package_Type", sa.Unicode(length=64), nullable=False),
+        sa.Column("Status", sa.Unicode(length=32), nullable=False),
+        sa.Column("Error_Code", sa.Integer(), nullable=True),
+        sa.Column("Error", sa.JSON(), nullable=True),
+        sa.Column("Act_Package_UUID", sa.Uuid(), nullable=True),
+        sa.Column("Stage_Timings", sa.JSON(), nullable=True),
+        sa.Column("Created_Date", sa.DateTime(), nullable=False),
+        sa.Column("Modified_Date", sa.DateTime(), nullable=False),
+        sa.Column("Created_By_UUID", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["Publication_Version_UUID"],
+            ["publication_versions.UUID"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["Act_Package_UUID"],
+            ["publication_act_packages.UUID"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["Created_By_UUID"],
+            ["Gebruikers.UUID"],
+        ),
+        sa.PrimaryKeyConstraint("UUID"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("publication_act_package_jobs")
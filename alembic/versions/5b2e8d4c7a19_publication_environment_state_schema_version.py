@@ -0,0 +1,33 @@
+"""publication_environment_state_schema_version
+
+Revision ID: 5b2e8d4c7a19
+Revises: 3d7b9e1f5a28
+Create Date: 2026-10-17 22:11:42.615203
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# We need these to load all sqlalchemy tables
+from app.main import app  ## noqa
+from app.core.db import table_metadata  ## noqa
+from app.core.settings import Settings  ## noqa
+
+settings = Settings()
+
+
+# revision identifiers, used by Alembic.
+revision = "5b2e8d4c7a19"
+down_revision = "3d7b9e1f5a28"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filled when a state is loaded, or for all states by the `migrate-publication-states` command
+    op.add_column("publication_environment_states", sa.Column("Schema_Version", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("publication_environment_states", "Schema_Version")
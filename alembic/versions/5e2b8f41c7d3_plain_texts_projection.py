@@ -0,0 +1,39 @@
+"""plain_texts_projection
+
+Revision ID: 5e2b8f41c7d3
+Revises: 1a7e3c9d2b40
+Create Date: 2026-10-17 11:03:17.208431
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# We need these to load all sqlalchemy tables
+from app.main import app  ## noqa
+from app.core.db import table_metadata  ## noqa
+from app.core.settings import Settings  ## noqa
+
+settings = Settings()
+
+
+# revision identifiers, used by Alembic.
+revision = "5e2b8f41c7d3"
+down_revision = "1a7e3c9d2b40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filled by `refresh-plain-texts`, as the html has to be parsed in python
+    op.create_table(
+        "plain_texts",
+        sa.Column("UUID", sa.Uuid(), nullable=False),
+        sa.Column("Field", sa.Unicode(length=50), nullable=False),
+        sa.Column("Text", sa.UnicodeText(), nullable=False),
+        sa.PrimaryKeyConstraint("UUID", "Field"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("plain_texts")
@@ -0,0 +1,49 @@
+"""publication_pdf_export_jobs
+
+Revision ID: 8c1f4a6e2d97
+Revises: 5e2b8f41c7d3
+Create Date: 2026-10-17 12:26:50.671042
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# We need these to load all sqlalchemy tables
+from app.main import app  ## noqa
+from app.core.db import table_metadata  ## noqa
+from app.core.settings import Settings  ## noqa
+
+settings = Settings()
+
+
+# revision identifiers, used by Alembic.
+revision = "8c1f4a6e2d97"
+down_revision = "5e2b8f41c7d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "publication_pdf_export_jobs",
+        sa.Column("UUID", sa.Uuid(), nullable=False),
+        sa.Column("Environment_Code", sa.Unicode(length=32), nullable=False),
+        sa.Column("Filename", sa.Unicode(length=255), nullable=False),
+        sa.Column("Status", sa.Unicode(length=32), nullable=False),
+        sa.Column("Progress", sa.Integer(), nullable=False),
+        sa.Column("Error", sa.UnicodeText(), nullable=True),
+        sa.Column("Binary", sa.LargeBinary(), nullable=True),
+        sa.Column("Created_Date", sa.DateTime(), nullable=False),
+        sa.Column("Modified_Date", sa.DateTime(), nullable=False),
+        sa.Column("Created_By_UUID", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["Created_By_UUID"],
+            ["Gebruikers.UUID"],
+        ),
+        sa.PrimaryKeyConstraint("UUID"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("publication_pdf_export_jobs")
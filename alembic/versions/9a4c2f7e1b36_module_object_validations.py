@@ -0,0 +1,51 @@
+"""module_object_validations
+
+Revision ID: 9a4c2f7e1b36
+Revises: 5b2e8d4c7a19
+Create Date: 2026-10-17 23:02:51.730964
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# We need these to load all sqlalchemy tables
+from app.main import app  ## noqa
+from app.core.db import table_metadata  ## noqa
+from app.core.settings import Settings  ## noqa
+
+settings = Settings()
+
+
+# revision identifiers, used by Alembic.
+revision = "9a4c2f7e1b36"
+down_revision = "5b2e8d4c7a19"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "module_object_validations",
+        sa.Column("Module_Object_UUID", sa.Uuid(), nullable=False),
+        sa.Column("Rules_Version", sa.Unicode(length=64), nullable=False),
+        sa.Column("Module_ID", sa.Integer(), nullable=False),
+        sa.Column("Errors", sa.JSON(), nullable=True),
+        sa.Column("Created_Date", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["Module_ID"],
+            ["modules.Module_ID"],
+        ),
+        sa.PrimaryKeyConstraint("Module_Object_UUID", "Rules_Version"),
+    )
+    op.create_index(
+        op.f("ix_module_object_validations_Module_ID"),
+        "module_object_validations",
+        ["Module_ID"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_module_object_validations_Module_ID"), table_name="module_object_validations")
+    op.drop_table("module_object_validations")
@@ -0,0 +1,35 @@
+"""module_object_deltas
+
+Revision ID: c5d81f3a6e47
+Revises: 9a4c2f7e1b36
+Create Date: 2026-10-17 23:48:12.402118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# We need these to load all sqlalchemy tables
+from app.main import app  ## noqa
+from app.core.db import table_metadata  ## noqa
+from app.core.settings import Settings  ## noqa
+
+settings = Settings()
+
+
+# revision identifiers, used by Alembic.
+revision = "c5d81f3a6e47"
+down_revision = "9a4c2f7e1b36"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("module_objects", sa.Column("Delta_Base_UUID", sa.Uuid(), nullable=True))
+    op.add_column("module_objects", sa.Column("Delta", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    # Run `compact-module-object-history --interval 0` first, the compacted versions can not be restored after this
+    op.drop_column("module_objects", "Delta")
+    op.drop_column("module_objects", "Delta_Base_UUID")
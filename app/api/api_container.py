@@ -14,10 +14,18 @@ import app.api.domains.werkingsgebieden.services as werkingsgebied_services
 import app.api.events.listeners as event_listeners
 from app.api.domains.modules.services.module_objects_to_models_parser import ModuleObjectsToModelsParser
 from app.api.domains.others.repositories import object_related_file_repository, storage_file_repository
-from app.api.domains.others.services import PdfMetaService
+from app.api.domains.others.services import (
+    MssqlSearchBackend,
+    PdfMetaService,
+    RelationGraphIndex,
+    SqliteSearchBackend,
+)
+from app.api.domains.others.services.relation_graph_index import RELATION_GRAPH_INDEX_INFO_KEY
 from app.api.domains.publications.publication_container import PublicationContainer
+from app.api.domains.users.services.user_cache import USER_CACHE_INFO_KEY
 from app.api.events import event_manager
 from app.api.services import permission_service
+from app.api.utils.count_cache import COUNT_CACHE_INFO_KEY, CountCache
 from app.core.db.session import create_db_engine
 from app.core.services.main_config import MainConfig
 from app.core.settings import Settings
@@ -27,6 +35,7 @@ class ApiContainer(containers.DeclarativeContainer):
     models_provider = providers.Dependency()
     object_field_mapping_provider = providers.Dependency()
     required_object_fields_rule_mapping = providers.Dependency()
+    required_object_fields_rule_validators = providers.Dependency()
     publication_required_object_fields_rule_mapping = providers.Dependency()
 
     config = providers.Configuration(pydantic_settings=[Settings()])
@@ -36,9 +45,31 @@ class ApiContainer(containers.DeclarativeContainer):
         create_db_engine,
         uri=config.SQLALCHEMY_DATABASE_URI,
         echo=config.SQLALCHEMY_ECHO,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_POOL_MAX_OVERFLOW,
+        pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+    )
+    count_cache = providers.Singleton(CountCache, ttl_seconds=config.COUNT_CACHE_TTL_SECONDS)
+    relation_graph_index = providers.Singleton(RelationGraphIndex, ttl_seconds=config.RELATION_GRAPH_TTL_SECONDS)
+    user_cache = providers.Singleton(
+        user_domain.UserCache,
+        ttl_seconds=config.USER_CACHE_TTL_SECONDS,
+        max_entries=config.USER_CACHE_MAX_ENTRIES,
     )
     db_session_factory = providers.Singleton(
-        sessionmaker, bind=db_engine, autocommit=False, autoflush=False, expire_on_commit=False
+        sessionmaker,
+        bind=db_engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        info=providers.Dict(
+            {
+                COUNT_CACHE_INFO_KEY: count_cache,
+                RELATION_GRAPH_INDEX_INFO_KEY: relation_graph_index,
+                USER_CACHE_INFO_KEY: user_cache,
+            }
+        ),
     )
 
     permission_service = providers.Singleton(
@@ -48,14 +79,37 @@ class ApiContainer(containers.DeclarativeContainer):
 
     pdf_meta_service = providers.Singleton(PdfMetaService)
 
+    plain_text_repository = providers.Singleton(object_repositories.PlainTextRepository)
+    search_backend = providers.Selector(
+        config.DB_TYPE,
+        sqlite=providers.Singleton(
+            SqliteSearchBackend,
+            main_config=main_config,
+            plain_text_repository=plain_text_repository,
+        ),
+        mssql=providers.Singleton(
+            MssqlSearchBackend,
+            main_config=main_config,
+            plain_text_repository=plain_text_repository,
+        ),
+    )
+
     input_geo_werkingsgebieden_repository = providers.Singleton(
         werkingsgebieden_repositories.InputGeoWerkingsgebiedenRepository
     )
     storage_file_repository = providers.Singleton(storage_file_repository.StorageFileRepository)
     object_related_file_repository = providers.Singleton(object_related_file_repository.ObjectRelatedFileRepository)
-    object_repository = providers.Singleton(object_repositories.ObjectRepository)
+    object_repository = providers.Singleton(
+        object_repositories.ObjectRepository,
+        use_valid_index=config.OBJECTS_USE_VALID_INDEX,
+    )
+    valid_objects_repository = providers.Singleton(object_repositories.ValidObjectsRepository)
     object_static_repository = providers.Singleton(object_repositories.ObjectStaticRepository)
-    asset_repository = providers.Singleton(object_repositories.AssetRepository)
+    asset_cache = providers.Singleton(
+        object_repositories.AssetCache,
+        max_bytes=config.ASSET_CACHE_MAX_BYTES,
+    )
+    asset_repository = providers.Singleton(object_repositories.AssetRepository, cache=asset_cache)
     werkingsgebieden_repository = providers.Singleton(werkingsgebieden_repositories.WerkingsgebiedenRepository)
     sqlite_geometry_repository = providers.Singleton(werkingsgebieden_repositories.SqliteGeometryRepository)
     sqlite_area_geometry_repository = providers.Singleton(werkingsgebieden_repositories.SqliteAreaGeometryRepository)
@@ -75,6 +129,15 @@ class ApiContainer(containers.DeclarativeContainer):
 
     module_object_context_repository = providers.Singleton(module_domain.ModuleObjectContextRepository)
     module_object_repository = providers.Singleton(module_domain.ModuleObjectRepository)
+    module_object_delta_repository = providers.Singleton(
+        module_domain.ModuleObjectDeltaRepository,
+        snapshot_interval=config.MODULE_OBJECT_DELTA_SNAPSHOT_INTERVAL,
+    )
+    module_object_delta_restore_listener = providers.Resource(
+        module_domain.init_restore_listener,
+        repository=module_object_delta_repository,
+    )
+    module_object_validation_repository = providers.Singleton(module_domain.ModuleObjectValidationRepository)
     module_repository = providers.Singleton(module_domain.ModuleRepository)
     module_status_repository = providers.Singleton(module_domain.ModuleStatusRepository)
     acknowledged_relations_repository = providers.Singleton(object_repositories.AcknowledgedRelationsRepository)
@@ -113,6 +176,8 @@ class ApiContainer(containers.DeclarativeContainer):
         object_field_mapping_provider=object_field_mapping_provider,
         publication_required_object_fields_rule_mapping=publication_required_object_fields_rule_mapping,
         dso_gebiedsaanwijzingen_factory=dso_gebiedsaanwijzingen_factory,
+        module_object_delta_repository=module_object_delta_repository,
+        db_session_factory=db_session_factory,
     )
 
     html_images_extractor_factory = providers.Factory(
@@ -174,7 +239,8 @@ class ApiContainer(containers.DeclarativeContainer):
     join_documents_service_factory = providers.Singleton(object_services.JoinDocumentsServiceFactory)
     join_related_files_service_factory = providers.Singleton(object_services.JoinRelatedFilesServiceFactory)
     resolve_child_objects_via_hierarchy_service_factory = providers.Singleton(
-        object_services.ResolveChildObjectsViaHierarchyServiceFactory
+        object_services.ResolveChildObjectsViaHierarchyServiceFactory,
+        object_repository=object_repository,
     )
     area_processor_service_factory = providers.Singleton(
         werkingsgebied_services.AreaProcessorServiceFactory,
@@ -199,6 +265,7 @@ class ApiContainer(containers.DeclarativeContainer):
             providers.Singleton(
                 module_services.RequiredObjectFieldsRule,
                 object_map=required_object_fields_rule_mapping,
+                validators_config=required_object_fields_rule_validators,
             ),
             providers.Singleton(
                 module_services.RequireExistingHierarchyCodeRule,
@@ -226,6 +293,8 @@ class ApiContainer(containers.DeclarativeContainer):
             ),
             providers.Singleton(module_services.CheckEmptyAreaDesignationTextRule, main_config=main_config),
         ),
+        validation_repository=module_object_validation_repository,
+        db_session_factory=db_session_factory,
     )
 
     validate_module_runner = providers.Singleton(
@@ -247,6 +316,7 @@ class ApiContainer(containers.DeclarativeContainer):
         object_context_service=manage_object_context_service,
         area_repository=area_repository,
         area_geometry_repository=area_geometry_repository,
+        search_backend=search_backend,
     )
 
     event_listeners = providers.Factory(
@@ -1,7 +1,8 @@
 from sqlalchemy import Select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
 
-from app.api.utils.pagination import PaginatedQueryResult, add_pagination, query_paginated, query_total_count
+from app.api.utils.pagination import CountMode, PaginatedQueryResult, query_paginated, query_paginated_no_scalars
 
 
 class BaseRepository:
@@ -16,18 +17,49 @@ class BaseRepository:
         yield from result.scalars().yield_per(batch_size)
 
     def fetch_paginated(
-        self, session: Session, statement: Select, offset: int, limit: int, sort=None
+        self,
+        session: Session,
+        statement: Select,
+        offset: int,
+        limit: int,
+        sort=None,
+        keyset: ColumnElement | None = None,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
     ) -> PaginatedQueryResult:
-        return query_paginated(query=statement, session=session, limit=limit, offset=offset, sort=sort)
+        return query_paginated(
+            query=statement,
+            session=session,
+            limit=limit,
+            offset=offset,
+            sort=sort,
+            keyset=keyset,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
 
     def fetch_paginated_no_scalars(
-        self, session: Session, statement: Select, offset: int, limit: int, sort=None
+        self,
+        session: Session,
+        statement: Select,
+        offset: int,
+        limit: int,
+        sort=None,
+        keyset: ColumnElement | None = None,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
     ) -> PaginatedQueryResult:
         """
         Same as fetch_paginated without calling scalars() on results
         to allow custom query results.
         """
-        paginated = add_pagination(statement, limit, offset, sort)
-        results = session.execute(paginated).all()
-        total_count = query_total_count(statement, session)
-        return PaginatedQueryResult(items=list(results), total_count=total_count)
+        return query_paginated_no_scalars(
+            query=statement,
+            session=session,
+            limit=limit,
+            offset=offset,
+            sort=sort,
+            keyset=keyset,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
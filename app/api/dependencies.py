@@ -1,7 +1,7 @@
 from fastapi import Request
-from sqlalchemy import text
 
-from app.api.utils.pagination import OptionalSort, OptionalSortedPagination, SimplePagination, SortOrder
+from app.api.types import AssetMode
+from app.api.utils.pagination import CountMode, OptionalSort, OptionalSortedPagination, SimplePagination, SortOrder
 
 
 def depends_db_session(request: Request):
@@ -9,10 +9,7 @@ def depends_db_session(request: Request):
 
     with db_sessionmaker.begin() as session:
         try:
-            # when using SQLite, ensure FK constraints and load Spatialite
-            if session.bind.dialect.name == "sqlite":
-                session.execute(text("PRAGMA foreign_keys = ON"))
-                session.execute(text("SELECT load_extension('mod_spatialite')"))
+            # Sqlite connections are configured once when they are opened, see `create_db_engine`
             yield session
             # commit happens automatically when exiting the 'with' block
         except Exception:
@@ -32,6 +29,8 @@ def depends_optional_sorted_pagination(
     limit: int | None = None,
     sort_column: str | None = None,
     sort_order: SortOrder | None = None,
+    include_total: bool | None = None,
+    count_mode: CountMode | None = None,
 ) -> OptionalSortedPagination:
     optional_sort = OptionalSort(
         column=sort_column,
@@ -40,6 +39,41 @@ def depends_optional_sorted_pagination(
     pagination = OptionalSortedPagination(
         offset=offset,
         limit=limit,
+        include_total=include_total,
+        count_mode=count_mode,
         sort=optional_sort,
     )
     return pagination
+
+
+def depends_keyset_sorted_pagination(
+    offset: int | None = None,
+    limit: int | None = None,
+    sort_column: str | None = None,
+    sort_order: SortOrder | None = None,
+    cursor: str | None = None,
+    include_total: bool | None = None,
+    count_mode: CountMode | None = None,
+) -> OptionalSortedPagination:
+    """
+    Only for listings paginated by keyset, these can continue after the `next_cursor` of a page.
+    """
+    optional_sort = OptionalSort(
+        column=sort_column,
+        order=sort_order,
+    )
+    pagination = OptionalSortedPagination(
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+        count_mode=count_mode,
+        sort=optional_sort,
+    )
+    return pagination
+
+
+def depends_asset_mode(
+    asset_mode: AssetMode | None = None,
+) -> AssetMode | None:
+    return asset_mode
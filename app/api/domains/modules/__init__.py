@@ -1,7 +1,10 @@
 from .repositories import (
     ModuleObjectContextRepository,
+    ModuleObjectDeltaRepository,
     ModuleObjectRepository,
+    ModuleObjectValidationRepository,
     ModuleRepository,
     ModuleStatusRepository,
+    init_restore_listener,
 )
 from .services import ObjectProvider
@@ -6,6 +6,7 @@ from typing import Annotated, Any
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, HTTPException, status
 from pydantic import BaseModel, Field
+from sqlalchemy import insert, inspect, select, update
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
@@ -14,6 +15,8 @@ from app.api.domains.modules.dependencies import depends_active_module
 from app.api.domains.modules.repositories.module_object_repository import ModuleObjectRepository
 from app.api.domains.modules.types import ModuleObjectAction, ModuleStatusCode, ModuleStatusCodeInternal
 from app.api.domains.modules.utils import guard_module_is_locked
+from app.api.domains.objects.repositories.valid_objects_repository import ValidObjectsRepository
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.users.dependencies import depends_current_user
 from app.api.permissions import Permissions
 from app.api.services.permission_service import PermissionService
@@ -67,43 +70,60 @@ def _create_objects(
     module: ModuleTable,
     object_in: CompleteModule,
     timepoint: datetime,
-) -> None:
+) -> list[dict[str, Any]]:
     module_objects: list[ModuleObjectsTable] = module_object_repository.get_objects_in_time(
         session,
         module.Module_ID,
         timepoint,
     )
+    contexts: dict[str, ModuleObjectContextTable] = {
+        context.Code: context
+        for context in session.scalars(
+            select(ModuleObjectContextTable).filter(ModuleObjectContextTable.Module_ID == module.Module_ID)
+        )
+    }
+    object_columns: set[str] = {column.key for column in inspect(ObjectsTable).column_attrs}
 
+    new_objects: list[dict[str, Any]] = []
     for module_object_table in module_objects:
         module_object_dict: dict[str, Any] = table_to_dict(module_object_table)
-        new_object: ObjectsTable = ObjectsTable()
 
         # Copy module object into the new object
-        for key, value in module_object_dict.items():
-            if key in ["Module_ID"]:
-                continue
-            setattr(new_object, key, copy(value))
+        new_object: dict[str, Any] = {
+            key: copy(value)
+            for key, value in module_object_dict.items()
+            if key in object_columns and key not in ["Module_ID"]
+        }
 
-        new_object.Adjust_On = module_object_dict["UUID"]
-        new_object.UUID = uuid.uuid4()
+        new_object["Adjust_On"] = module_object_dict["UUID"]
+        new_object["UUID"] = uuid.uuid4()
 
-        new_object.Modified_By_UUID = user.UUID
-        new_object.Modified_Date = timepoint
+        new_object["Modified_By_UUID"] = user.UUID
+        new_object["Modified_Date"] = timepoint
 
         validities: ObjectValidities = _get_validities(
             object_in,
-            module_object_table.ModuleObjectContext,
+            contexts.get(module_object_table.Code),
             timepoint,
         )
-        new_object.Start_Validity = validities.start
-        new_object.End_Validity = validities.end
+        new_object["Start_Validity"] = validities.start
+        new_object["End_Validity"] = validities.end
 
-        statics: ObjectStaticsTable = (
-            session.query(ObjectStaticsTable).filter(ObjectStaticsTable.Code == new_object.Code).one()
-        )
-        statics.Cached_Title = new_object.Title
-        session.add(new_object)
-        session.add(statics)
+        new_objects.append(new_object)
+
+    if not new_objects:
+        return new_objects
+
+    # Batched by insertmanyvalues instead of a statement per object
+    session.execute(insert(ObjectsTable), new_objects)
+
+    # The cached titles of the statics become the titles of the new objects, updated by primary key in one batch
+    session.execute(
+        update(ObjectStaticsTable),
+        [{"Code": new_object["Code"], "Cached_Title": new_object["Title"]} for new_object in new_objects],
+    )
+
+    return new_objects
 
 
 @inject
@@ -115,6 +135,10 @@ def post_complete_module_endpoint(
     module_object_repository: Annotated[
         ModuleObjectRepository, Depends(Provide[ApiContainer.module_object_repository])
     ],
+    valid_objects_repository: Annotated[
+        ValidObjectsRepository, Depends(Provide[ApiContainer.valid_objects_repository])
+    ],
+    search_backend: Annotated[SearchBackend, Depends(Provide[ApiContainer.search_backend])],
     object_in: CompleteModule,
 ) -> ResponseOK:
     permission_service.guard_valid_user(
@@ -136,7 +160,9 @@ def post_complete_module_endpoint(
         )
         session.add(status)
 
-        _create_objects(session, module_object_repository, user, module, object_in, timepoint)
+        new_objects: list[dict[str, Any]] = _create_objects(
+            session, module_object_repository, user, module, object_in, timepoint
+        )
 
         module.Closed = True
         module.Successful = True
@@ -145,6 +171,8 @@ def post_complete_module_endpoint(
         session.add(module)
 
         session.flush()
+        valid_objects_repository.refresh_codes(session, {o["Code"] for o in new_objects}, timepoint)
+        search_backend.sync(session, ObjectsTable.__tablename__, [o["UUID"] for o in new_objects])
         session.commit()
 
     except Exception:
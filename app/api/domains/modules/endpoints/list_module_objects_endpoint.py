@@ -9,7 +9,7 @@ from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
-from app.api.dependencies import depends_db_session, depends_optional_sorted_pagination
+from app.api.dependencies import depends_db_session, depends_keyset_sorted_pagination
 from app.api.domains.modules.repositories.module_object_repository import ModuleObjectRepository, OwnerFilter
 from app.api.domains.modules.services.module_objects_to_models_parser import ModuleObjectsToModelsParser
 from app.api.domains.modules.types import (
@@ -63,7 +63,7 @@ def get_list_module_objects_endpoint(
     ],
     _: Annotated[UsersTable, Depends(depends_current_user)],
     session: Annotated[Session, Depends(depends_db_session)],
-    optional_pagination: Annotated[OptionalSortedPagination, Depends(depends_optional_sorted_pagination)],
+    optional_pagination: Annotated[OptionalSortedPagination, Depends(depends_keyset_sorted_pagination)],
     context: Annotated[ListModuleObjectsEndpointContext, Depends()],
     module_objects_to_models_parser: Annotated[
         ModuleObjectsToModelsParser, Depends(Provide[ApiContainer.module_objects_to_models_parser])
@@ -124,6 +124,7 @@ def get_list_module_objects_endpoint(
 
     return PagedResponse(
         total=paginated_result.total_count,
+        next_cursor=paginated_result.next_cursor,
         limit=pagination.limit,
         offset=pagination.offset,
         results=rows,
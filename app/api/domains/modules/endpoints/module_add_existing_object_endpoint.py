@@ -14,6 +14,7 @@ from app.api.domains.modules.repositories.module_object_context_repository impor
 from app.api.domains.modules.services.object_provider import ObjectProvider
 from app.api.domains.modules.types import ModuleObjectAction
 from app.api.domains.modules.utils import guard_module_not_locked
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.users.dependencies import depends_current_user
 from app.api.endpoint import BaseEndpointContext
 from app.api.permissions import Permissions
@@ -52,6 +53,7 @@ class ModuleAddExistingObjectService:
         user: UsersTable,
         object_in: ModuleAddExistingObject,
         context: ModuleAddExistingObjectEndpointContext,
+        search_backend: SearchBackend,
     ):
         self._session: Session = session
         self._object_provider: ObjectProvider = object_provider
@@ -60,6 +62,7 @@ class ModuleAddExistingObjectService:
         self._user: UsersTable = user
         self._object_in: ModuleAddExistingObject = object_in
         self._context: ModuleAddExistingObjectEndpointContext = context
+        self._search_backend: SearchBackend = search_backend
         self._timepoint: datetime = datetime.now(UTC)
 
     def process(self):
@@ -96,9 +99,10 @@ class ModuleAddExistingObjectService:
                 # therefor we can not add it again
                 raise HTTPException(status.HTTP_400_BAD_REQUEST, "Object already exists in module")
 
-            self._create_object(object_data)
+            module_object: ModuleObjectsTable = self._create_object(object_data)
 
             self._session.flush()
+            self._search_backend.sync(self._session, ModuleObjectsTable.__tablename__, [module_object.UUID])
             self._session.commit()
         except Exception:
             self._session.rollback()
@@ -131,7 +135,7 @@ class ModuleAddExistingObjectService:
         object_context.Conclusion = self._object_in.Conclusion
         self._session.add(object_context)
 
-    def _create_object(self, object_data: dict):
+    def _create_object(self, object_data: dict) -> ModuleObjectsTable:
         module_object = ModuleObjectsTable()
 
         for key, value in object_data.items():
@@ -144,6 +148,7 @@ class ModuleAddExistingObjectService:
         module_object.Modified_By_UUID = self._user.UUID
 
         self._session.add(module_object)
+        return module_object
 
 
 @inject
@@ -157,6 +162,7 @@ def post_module_add_existing_object_endpoint(
         ModuleObjectContextRepository, Depends(Provide[ApiContainer.module_object_context_repository])
     ],
     context: Annotated[ModuleAddExistingObjectEndpointContext, Depends()],
+    search_backend: Annotated[SearchBackend, Depends(Provide[ApiContainer.search_backend])],
     object_in: ModuleAddExistingObject,
 ) -> ResponseOK:
     permission_service.guard_valid_user(
@@ -174,6 +180,7 @@ def post_module_add_existing_object_endpoint(
         user,
         object_in,
         context,
+        search_backend,
     )
     service.process()
 
@@ -13,6 +13,7 @@ from app.api.dependencies import depends_db_session
 from app.api.domains.modules.dependencies import depends_active_module
 from app.api.domains.modules.types import ModuleObjectActionFull
 from app.api.domains.modules.utils import guard_module_not_locked
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.users.dependencies import depends_current_user
 from app.api.endpoint import BaseEndpointContext
 from app.api.permissions import Permissions
@@ -66,20 +67,23 @@ class ModuleAddNewObjectService:
         module: ModuleTable,
         user: UsersTable,
         object_in: ModuleAddNewObject,
+        search_backend: SearchBackend,
     ):
         self._session: Session = session
         self._module: ModuleTable = module
         self._user: UsersTable = user
         self._object_in: ModuleAddNewObject = object_in
+        self._search_backend: SearchBackend = search_backend
         self._timepoint: datetime = datetime.now(UTC)
 
     def process(self) -> NewObjectStaticResponse:
         try:
             object_static: ObjectStaticsTable = self._create_new_object_static()
             self._create_object_context(object_static)
-            self._create_object(object_static)
+            module_object: ModuleObjectsTable = self._create_object(object_static)
 
             self._session.flush()
+            self._search_backend.sync(self._session, ModuleObjectsTable.__tablename__, [module_object.UUID])
             self._session.commit()
 
             return NewObjectStaticResponse.model_validate(object_static)
@@ -133,7 +137,7 @@ class ModuleAddNewObjectService:
         )
         self._session.add(object_context)
 
-    def _create_object(self, object_static: ObjectStaticsTable):
+    def _create_object(self, object_static: ObjectStaticsTable) -> ModuleObjectsTable:
         module_object: ModuleObjectsTable = ModuleObjectsTable(
             Module_ID=self._module.Module_ID,
             Object_Type=object_static.Object_Type,
@@ -147,6 +151,7 @@ class ModuleAddNewObjectService:
             Modified_By_UUID=self._user.UUID,
         )
         self._session.add(module_object)
+        return module_object
 
 
 @inject
@@ -156,6 +161,7 @@ def post_module_add_new_object_endpoint(
     session: Annotated[Session, Depends(depends_db_session)],
     permission_service: Annotated[PermissionService, Depends(Provide[ApiContainer.permission_service])],
     context: Annotated[ModuleAddNewObjectEndpointContext, Depends()],
+    search_backend: Annotated[SearchBackend, Depends(Provide[ApiContainer.search_backend])],
     object_in: ModuleAddNewObject,
 ) -> NewObjectStaticResponse:
     permission_service.guard_valid_user(
@@ -176,6 +182,7 @@ def post_module_add_new_object_endpoint(
         module,
         user,
         object_in,
+        search_backend,
     )
     response: NewObjectStaticResponse = service.process()
 
@@ -6,13 +6,14 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
-from app.api.dependencies import depends_db_session
+from app.api.dependencies import depends_asset_mode, depends_db_session
 from app.api.domains.modules.dependencies import depends_module
 from app.api.domains.modules.repositories.module_object_repository import ModuleObjectRepository
 from app.api.domains.users.dependencies import depends_current_user
 from app.api.endpoint import BaseEndpointContext
 from app.api.events.event_manager import ApiEventManager
 from app.api.events.retrieved_module_objects_event import RetrievedModuleObjectsEvent
+from app.api.types import AssetMode
 from app.core.tables.modules import ModuleObjectsTable, ModuleTable
 from app.core.tables.users import UsersTable
 from app.core.types import Model
@@ -33,6 +34,7 @@ def view_module_object_latest_endpoint(
     ],
     event_manager: Annotated[ApiEventManager, Depends(Provide[ApiContainer.event_manager])],
     session: Annotated[Session, Depends(depends_db_session)],
+    asset_mode: Annotated[AssetMode | None, Depends(depends_asset_mode)],
     context: Annotated[ModuleObjectLatestEndpointContext, Depends()],
 ) -> BaseModel:
     module_object: ModuleObjectsTable | None = module_object_repository.get_latest_by_id(
@@ -52,6 +54,7 @@ def view_module_object_latest_endpoint(
             [row],
             context.builder_data.endpoint_id,
             context.response_config_model,
+            asset_mode,
         ),
     )
     row = event.payload.rows[0]
@@ -14,13 +14,14 @@ from app.api.domains.modules.dependencies import depends_active_module
 from app.api.domains.modules.repositories.module_object_repository import ModuleObjectRepository
 from app.api.domains.modules.utils import guard_module_not_locked
 from app.api.domains.objects.repositories.object_static_repository import ObjectStaticRepository
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.users.dependencies import depends_current_user
 from app.api.endpoint import BaseEndpointContext
 from app.api.events.event_manager import ApiEventManager
 from app.api.events.module_object_patched_event import ModuleObjectPatchedEvent
 from app.api.permissions import Permissions
 from app.api.services.permission_service import PermissionService
-from app.core.tables.modules import ModuleTable
+from app.core.tables.modules import ModuleObjectsTable, ModuleTable
 from app.core.tables.objects import ObjectsTable, ObjectStaticsTable
 from app.core.tables.users import UsersTable
 from app.core.types import Model
@@ -47,6 +48,7 @@ def post_module_patch_object_endpoint(
     ],
     event_manager: Annotated[ApiEventManager, Depends(Provide[ApiContainer.event_manager])],
     permission_service: Annotated[PermissionService, Depends(Provide[ApiContainer.permission_service])],
+    search_backend: Annotated[SearchBackend, Depends(Provide[ApiContainer.search_backend])],
     object_in_raw: Annotated[dict, Body()],
 ) -> BaseModel:
     object_static: ObjectStaticsTable | None = object_static_repository.get_by_object_type_and_id(
@@ -115,6 +117,7 @@ def post_module_patch_object_endpoint(
 
     session.add(new_record)
     session.flush()
+    search_backend.sync(session, ModuleObjectsTable.__tablename__, [new_record.UUID])
     session.commit()
 
     response: BaseModel = context.response_config_model.pydantic_model.model_validate(new_record)
@@ -11,11 +11,12 @@ from app.api.domains.modules.dependencies import depends_active_module, depends_
 from app.api.domains.modules.repositories.module_object_repository import ModuleObjectRepository
 from app.api.domains.modules.utils import guard_module_not_locked
 from app.api.domains.objects.dependencies import depends_object_static_by_object_type_and_id
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.users.dependencies import depends_current_user
 from app.api.permissions import Permissions
 from app.api.services.permission_service import PermissionService
 from app.api.types import ResponseOK
-from app.core.tables.modules import ModuleObjectContextTable, ModuleTable
+from app.core.tables.modules import ModuleObjectContextTable, ModuleObjectsTable, ModuleTable
 from app.core.tables.objects import ObjectStaticsTable
 from app.core.tables.users import UsersTable
 
@@ -36,6 +37,7 @@ def post_module_remove_object_endpoint(
         ModuleObjectRepository, Depends(Provide[ApiContainer.module_object_repository])
     ],
     permission_service: Annotated[PermissionService, Depends(Provide[ApiContainer.permission_service])],
+    search_backend: Annotated[SearchBackend, Depends(Provide[ApiContainer.search_backend])],
 ) -> ResponseOK:
     permission_service.guard_valid_user(
         Permissions.module_can_remove_object_from_module,
@@ -66,6 +68,7 @@ def post_module_remove_object_endpoint(
     )
     session.add(new_record)
     session.flush()
+    search_backend.sync(session, ModuleObjectsTable.__tablename__, [new_record.UUID])
     session.commit()
 
     return ResponseOK(message="OK")
@@ -1,4 +1,6 @@
 from .module_object_context_repository import ModuleObjectContextRepository
+from .module_object_delta_repository import ModuleObjectDeltaRepository, init_restore_listener
 from .module_object_repository import ModuleObjectRepository
+from .module_object_validation_repository import ModuleObjectValidationRepository
 from .module_repository import ModuleRepository
 from .module_status_repository import ModuleStatusRepository
@@ -18,3 +18,14 @@ class ModuleObjectContextRepository(BaseRepository):
 
         maybe_context: ModuleObjectContextTable | None = session.scalars(stmt).first()
         return maybe_context
+
+    def get_by_codes(self, session: Session, module_id: int, codes: set[str]) -> dict[str, ModuleObjectContextTable]:
+        if not codes:
+            return {}
+
+        stmt = (
+            select(ModuleObjectContextTable)
+            .filter(ModuleObjectContextTable.Module_ID == module_id)
+            .filter(ModuleObjectContextTable.Code.in_(codes))
+        )
+        return {context.Code: context for context in session.scalars(stmt)}
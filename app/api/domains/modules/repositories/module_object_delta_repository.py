@@ -0,0 +1,289 @@
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Final
+
+from sqlalchemy import JSON, String, event, select, update
+from sqlalchemy.orm import ORMExecuteState, Session, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.base import instance_state
+
+from app.api.base_repository import BaseRepository
+from app.core.tables.modules import ModuleObjectsTable, ModuleStatusHistoryTable
+
+# Small fields read with column selects (listings, search results, relations) are never moved into the delta
+KEPT_FIELDS: Final[frozenset[str]] = frozenset({"Title"})
+
+UUIDS_PER_QUERY: Final[int] = 500
+
+
+def get_delta_fields() -> tuple[str, ...]:
+    """
+    The unbounded text and json columns of the module objects, these are stored as a delta in compacted versions.
+    Resolved lazily as the object columns are added to the table during the build.
+    """
+    return tuple(
+        column.key
+        for column in ModuleObjectsTable.__table__.columns
+        if column.key != "Delta"
+        and column.key not in KEPT_FIELDS
+        and (isinstance(column.type, JSON) or (isinstance(column.type, String) and column.type.length is None))
+    )
+
+
+class ModuleObjectDeltaRepository(BaseRepository):
+    """
+    Older module object versions can be compacted into the fields which differ from the next (newer) version,
+    the `Delta_Base_UUID`. Their other delta fields are then stored as NULL.
+
+    New versions are always written whole, the `compact` run rewrites the history of a module object.
+    Every `snapshot_interval`th version from the newest one, and the versions captured by a module status change,
+    stay whole so that the current state and the module snapshots never need reconstruction.
+
+    While the delta mode is enabled the entity loads of module objects are reconstructed by a session listener,
+    see `init_restore_listener`. Their results are buffered, so `yield_per` does not stream them.
+    """
+
+    def __init__(self, snapshot_interval: int = 0):
+        self._snapshot_interval: int = snapshot_interval
+
+    def is_enabled(self) -> bool:
+        # An interval of 0 or 1 keeps every version whole
+        return self._snapshot_interval > 1
+
+    def register_listener(self) -> None:
+        event.listen(Session, "do_orm_execute", self._on_orm_execute)
+
+    def remove_listener(self) -> None:
+        event.remove(Session, "do_orm_execute", self._on_orm_execute)
+
+    def restore(self, session: Session, module_objects: Iterable[ModuleObjectsTable]) -> None:
+        """
+        Fills the delta fields of compacted versions loaded by the session, as if they were stored whole.
+        Only versions with their `Delta_Base_UUID` loaded are considered, the listener always loads it.
+        """
+        compacted: dict[uuid.UUID, ModuleObjectsTable] = {
+            module_object.UUID: module_object
+            for module_object in module_objects
+            if "Delta_Base_UUID" not in instance_state(module_object).unloaded
+            and module_object.Delta_Base_UUID is not None
+        }
+        if not compacted:
+            return
+
+        values: dict[uuid.UUID, dict] = self._resolve(session, set(compacted.keys()), get_delta_fields())
+        for object_uuid, module_object in compacted.items():
+            restored: dict | None = values.get(object_uuid)
+            if restored is None:
+                continue
+            state = instance_state(module_object)
+            for field, value in restored.items():
+                # Never overwrite pending changes
+                if field in state.committed_state:
+                    continue
+                set_committed_value(module_object, field, value)
+
+    def restore_rows(self, session: Session, rows: Sequence[dict], fields: Iterable[str]) -> None:
+        """
+        Fills the delta fields of column select results of module object versions, keyed by the `UUID` column.
+        Rows of other tables are left untouched as their UUIDs are not found.
+        """
+        requested_fields: tuple[str, ...] = tuple(field for field in get_delta_fields() if field in set(fields))
+        if not requested_fields:
+            return
+
+        candidates: list[dict] = [row for row in rows if all(row.get(field) is None for field in requested_fields)]
+        if not candidates:
+            return
+
+        values: dict[uuid.UUID, dict] = self._resolve(session, {row["UUID"] for row in candidates}, requested_fields)
+        for row in candidates:
+            restored: dict | None = values.get(row["UUID"])
+            if restored is not None:
+                row.update(restored)
+
+    def compact(self, session: Session, module_id: int, code: str, snapshot_interval: int | None = None) -> int:
+        """
+        Rewrites the versions of one module object, returns the number of updated rows.
+        An interval of 0 or 1 stores every version whole again.
+        """
+        interval: int = self._snapshot_interval if snapshot_interval is None else snapshot_interval
+        delta_fields: tuple[str, ...] = get_delta_fields()
+
+        stmt = (
+            select(
+                ModuleObjectsTable.UUID,
+                ModuleObjectsTable.Modified_Date,
+                ModuleObjectsTable.Delta_Base_UUID,
+                ModuleObjectsTable.Delta,
+                *[getattr(ModuleObjectsTable, field) for field in delta_fields],
+            )
+            .filter(ModuleObjectsTable.Module_ID == module_id)
+            .filter(ModuleObjectsTable.Code == code)
+            .order_by(ModuleObjectsTable.Modified_Date.desc(), ModuleObjectsTable.UUID)
+        )
+        versions: list[dict] = [row._asdict() for row in session.execute(stmt)]
+        if not versions:
+            return 0
+
+        stored: dict[uuid.UUID, dict] = {version["UUID"]: version for version in versions}
+        values: dict[uuid.UUID, dict] = self._reconstruct(
+            stored,
+            stored.keys(),
+            delta_fields,
+            lambda missing: self._fetch_stored(session, missing, delta_fields),
+        )
+        keep_whole: set[uuid.UUID] = self._get_snapshot_uuids(session, module_id, versions)
+
+        changes: list[dict] = []
+        for index, version in enumerate(versions):
+            current: dict = values[version["UUID"]]
+            if interval <= 1 or index % interval == 0 or version["UUID"] in keep_whole:
+                target: dict = {"Delta_Base_UUID": None, "Delta": None, **current}
+            else:
+                base: dict = versions[index - 1]
+                base_values: dict = values[base["UUID"]]
+                target = {
+                    "Delta_Base_UUID": base["UUID"],
+                    "Delta": {field: current[field] for field in delta_fields if current[field] != base_values[field]},
+                    **{field: None for field in delta_fields},
+                }
+
+            if any(version[key] != value for key, value in target.items()):
+                changes.append({"UUID": version["UUID"], **target})
+
+        if changes:
+            session.execute(update(ModuleObjectsTable), changes)
+        return len(changes)
+
+    def get_chains(self, session: Session) -> list[tuple[int, str]]:
+        stmt = (
+            select(ModuleObjectsTable.Module_ID, ModuleObjectsTable.Code)
+            .distinct()
+            .order_by(ModuleObjectsTable.Module_ID, ModuleObjectsTable.Code)
+        )
+        return [(row.Module_ID, row.Code) for row in session.execute(stmt)]
+
+    def _get_snapshot_uuids(self, session: Session, module_id: int, versions: list[dict]) -> set[uuid.UUID]:
+        """
+        The versions seen by the module snapshots (`Modified_Date < status date`)
+        and by the public search (`Modified_Date <= status date`).
+        """
+        stmt = select(ModuleStatusHistoryTable.Created_Date).filter(ModuleStatusHistoryTable.Module_ID == module_id)
+        status_dates: list[datetime] = list(session.execute(stmt).scalars())
+
+        result: set[uuid.UUID] = set()
+        for status_date in status_dates:
+            before = next((v for v in versions if v["Modified_Date"] < status_date), None)
+            until = next((v for v in versions if v["Modified_Date"] <= status_date), None)
+            result.update(version["UUID"] for version in (before, until) if version is not None)
+        return result
+
+    def _resolve(self, session: Session, uuids: set[uuid.UUID], fields: Sequence[str]) -> dict[uuid.UUID, dict]:
+        delta_fields: tuple[str, ...] = get_delta_fields()
+        stored: dict[uuid.UUID, dict] = self._fetch_stored(session, uuids, delta_fields)
+        values: dict[uuid.UUID, dict] = self._reconstruct(
+            stored,
+            [object_uuid for object_uuid in uuids if object_uuid in stored],
+            delta_fields,
+            lambda missing: self._fetch_stored(session, missing, delta_fields),
+        )
+        return {object_uuid: {field: value[field] for field in fields} for object_uuid, value in values.items()}
+
+    def _reconstruct(
+        self,
+        stored: dict[uuid.UUID, dict],
+        uuids: Iterable[uuid.UUID],
+        delta_fields: Sequence[str],
+        fetch: Callable[[set[uuid.UUID]], dict[uuid.UUID, dict]],
+    ) -> dict[uuid.UUID, dict]:
+        # Fetch the bases until every chain ends at a whole version
+        missing: set[uuid.UUID] = self._missing_bases(stored, uuids)
+        while missing:
+            fetched: dict[uuid.UUID, dict] = fetch(missing)
+            if len(fetched) != len(missing):
+                raise RuntimeError(f"Missing delta base versions: {missing - fetched.keys()}")
+            stored.update(fetched)
+            missing = self._missing_bases(stored, fetched.keys())
+
+        values: dict[uuid.UUID, dict] = {}
+        for object_uuid in uuids:
+            # Walk up to the first resolved or whole version, then apply the deltas down the chain
+            chain: list[uuid.UUID] = []
+            current: uuid.UUID | None = object_uuid
+            while current is not None and current not in values:
+                chain.append(current)
+                current = stored[current]["Delta_Base_UUID"]
+
+            for chain_uuid in reversed(chain):
+                row: dict = stored[chain_uuid]
+                if row["Delta_Base_UUID"] is None:
+                    values[chain_uuid] = {field: row[field] for field in delta_fields}
+                else:
+                    values[chain_uuid] = {**values[row["Delta_Base_UUID"]], **(row["Delta"] or {})}
+        return values
+
+    def _missing_bases(self, stored: dict[uuid.UUID, dict], uuids: Iterable[uuid.UUID]) -> set[uuid.UUID]:
+        result: set[uuid.UUID] = set()
+        for object_uuid in uuids:
+            base_uuid: uuid.UUID | None = stored[object_uuid]["Delta_Base_UUID"]
+            if base_uuid is not None and base_uuid not in stored:
+                result.add(base_uuid)
+        return result
+
+    def _fetch_stored(
+        self, session: Session, uuids: Iterable[uuid.UUID], delta_fields: Sequence[str]
+    ) -> dict[uuid.UUID, dict]:
+        uuids = list(uuids)
+        result: dict[uuid.UUID, dict] = {}
+        for offset in range(0, len(uuids), UUIDS_PER_QUERY):
+            stmt = select(
+                ModuleObjectsTable.UUID,
+                ModuleObjectsTable.Delta_Base_UUID,
+                ModuleObjectsTable.Delta,
+                *[getattr(ModuleObjectsTable, field) for field in delta_fields],
+            ).filter(ModuleObjectsTable.UUID.in_(uuids[offset : offset + UUIDS_PER_QUERY]))
+            result.update({row.UUID: row._asdict() for row in session.execute(stmt)})
+        return result
+
+    def _on_orm_execute(self, state: ORMExecuteState) -> None:
+        """
+        Reconstructs the compacted versions of every module object entity load, so repositories and endpoints
+        keep seeing whole versions.
+        """
+        if not state.is_select or state.is_column_load:
+            return
+        entities = [
+            description["entity"]
+            for description in state.statement.column_descriptions
+            if description.get("type") is ModuleObjectsTable
+        ]
+        if not entities:
+            return
+
+        # Partial loads still load the Delta_Base_UUID, so only actually compacted versions are reconstructed
+        statement = state.statement.options(*[undefer(entity.Delta_Base_UUID) for entity in entities])
+        frozen = state.invoke_statement(statement=statement).freeze()
+        module_objects: dict[int, ModuleObjectsTable] = {}
+        for row in frozen().all():
+            for value in row:
+                if isinstance(value, ModuleObjectsTable):
+                    module_objects[id(value)] = value
+        self.restore(state.session, module_objects.values())
+        return frozen()
+
+
+def init_restore_listener(repository: ModuleObjectDeltaRepository) -> Iterator[None]:
+    """
+    Registers the reconstruction of compacted versions while the delta mode is enabled.
+    Otherwise no version is compacted and the module object loads are left alone.
+    """
+    if not repository.is_enabled():
+        yield
+        return
+
+    repository.register_listener()
+    try:
+        yield
+    finally:
+        repository.remove_listener()
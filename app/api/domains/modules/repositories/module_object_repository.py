@@ -72,6 +72,34 @@ class ModuleObjectRepository(BaseRepository):
         )
         return self.fetch_first(session, stmt)
 
+    def get_latest_by_module_id_object_codes(
+        self,
+        session: Session,
+        module_id: int,
+        object_codes: set[str],
+    ) -> dict[str, ModuleObjectsTable]:
+        if not object_codes:
+            return {}
+
+        subq = (
+            select(
+                ModuleObjectsTable,
+                func.row_number()
+                .over(
+                    partition_by=ModuleObjectsTable.Code,
+                    order_by=desc(ModuleObjectsTable.Modified_Date),
+                )
+                .label("_RowNumber"),
+            )
+            .filter(ModuleObjectsTable.Module_ID == module_id)
+            .filter(ModuleObjectsTable.Code.in_(object_codes))
+            .subquery()
+        )
+        aliased_objects = aliased(ModuleObjectsTable, subq)
+        stmt = select(aliased_objects).filter(subq.c._RowNumber == 1)
+
+        return {module_object.Code: module_object for module_object in session.scalars(stmt)}
+
     def get_latest_by_id(
         self,
         session: Session,
@@ -317,6 +345,9 @@ class ModuleObjectRepository(BaseRepository):
             limit=pagination.limit,
             offset=pagination.offset,
             sort=(getattr(subq.c, pagination.sort.column), pagination.sort.order),
+            keyset=subq.c.UUID,
+            cursor=pagination.cursor,
+            count_mode=pagination.get_count_mode(),
         )
 
     def patch_latest_module_object(
@@ -369,6 +400,9 @@ class ModuleObjectRepository(BaseRepository):
         new_record.Adjust_On = previous_uuid
         new_record.Modified_Date = timepoint
         new_record.Modified_By_UUID = by_uuid
+        # New versions are always stored whole
+        new_record.Delta_Base_UUID = None
+        new_record.Delta = None
 
         return new_record
 
@@ -0,0 +1,101 @@
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Final
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.api.base_repository import BaseRepository
+from app.core.tables.modules import ModuleObjectValidationTable
+
+UUIDS_PER_QUERY: Final[int] = 500
+
+
+class ModuleObjectValidationRepository(BaseRepository):
+    def get_errors(
+        self,
+        session: Session,
+        module_object_uuids: Sequence[uuid.UUID],
+        rules_version: str,
+    ) -> dict[uuid.UUID, list[dict]]:
+        module_object_uuids = list(module_object_uuids)
+        result: dict[uuid.UUID, list[dict]] = {}
+        for offset in range(0, len(module_object_uuids), UUIDS_PER_QUERY):
+            stmt = select(ModuleObjectValidationTable.Module_Object_UUID, ModuleObjectValidationTable.Errors).filter(
+                ModuleObjectValidationTable.Module_Object_UUID.in_(
+                    module_object_uuids[offset : offset + UUIDS_PER_QUERY]
+                ),
+                ModuleObjectValidationTable.Rules_Version == rules_version,
+            )
+            result.update({row.Module_Object_UUID: row.Errors for row in session.execute(stmt)})
+        return result
+
+    def store(
+        self,
+        session: Session,
+        module_id: int,
+        rules_version: str,
+        errors_by_uuid: dict[uuid.UUID, list[dict]],
+        current_uuids: Sequence[uuid.UUID],
+        timepoint: datetime,
+    ) -> None:
+        """
+        Stores the results of the module objects which have none yet and removes the results
+        of other rule versions and of module object versions which are no longer current in the module.
+        """
+        # Results of other rule versions can not be used anymore
+        session.execute(
+            delete(ModuleObjectValidationTable).filter(
+                ModuleObjectValidationTable.Module_ID == module_id,
+                ModuleObjectValidationTable.Rules_Version != rules_version,
+            )
+        )
+        self._prune(session, module_id, set(current_uuids))
+
+        # The results of a module object version are the same for every run of the rules version,
+        # so results stored by another validation run in the meantime can be kept
+        stored_uuids: set[uuid.UUID] = set(self.get_errors(session, list(errors_by_uuid.keys()), rules_version))
+        validations: list[ModuleObjectValidationTable] = [
+            ModuleObjectValidationTable(
+                Module_Object_UUID=module_object_uuid,
+                Rules_Version=rules_version,
+                Module_ID=module_id,
+                Errors=errors,
+                Created_Date=timepoint,
+            )
+            for module_object_uuid, errors in errors_by_uuid.items()
+            if module_object_uuid not in stored_uuids
+        ]
+        if not validations:
+            return
+
+        try:
+            with session.begin_nested():
+                session.add_all(validations)
+        except IntegrityError:
+            # A concurrent run stored some of them after the check, add the others one by one
+            for validation in validations:
+                try:
+                    with session.begin_nested():
+                        session.merge(validation)
+                except IntegrityError:
+                    pass
+
+    def _prune(self, session: Session, module_id: int, current_uuids: set[uuid.UUID]) -> None:
+        stmt = select(ModuleObjectValidationTable.Module_Object_UUID).filter(
+            ModuleObjectValidationTable.Module_ID == module_id
+        )
+        superseded: list[uuid.UUID] = [
+            module_object_uuid
+            for module_object_uuid in session.execute(stmt).scalars()
+            if module_object_uuid not in current_uuids
+        ]
+        for offset in range(0, len(superseded), UUIDS_PER_QUERY):
+            session.execute(
+                delete(ModuleObjectValidationTable).filter(
+                    ModuleObjectValidationTable.Module_ID == module_id,
+                    ModuleObjectValidationTable.Module_Object_UUID.in_(superseded[offset : offset + UUIDS_PER_QUERY]),
+                )
+            )
@@ -92,6 +92,7 @@ class ModuleRepository(BaseRepository):
             session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
             sort=(getattr(ModuleTable, pagination.sort.column), pagination.sort.order),
         )
@@ -123,6 +124,7 @@ class ModuleRepository(BaseRepository):
             session=session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
         )
         return paged_result
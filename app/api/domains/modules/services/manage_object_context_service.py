@@ -52,7 +52,32 @@ class ManageObjectContextService:
             request.object_type,
             request.object_id,
         )
+        return self._ensure(session, request, existing_object_context)
 
+    def ensure_exists_many(
+        self,
+        session: Session,
+        module_id: int,
+        requests: list[ExistRequest],
+    ) -> list[Result]:
+        """
+        Same as `ensure_exists` for many objects of one module, with one query for the existing object contexts.
+        """
+        existing_object_contexts: dict[str, ModuleObjectContextTable] = self._context_repository.get_by_codes(
+            session,
+            module_id,
+            {request.get_code() for request in requests},
+        )
+        return [
+            self._ensure(session, request, existing_object_contexts.get(request.get_code())) for request in requests
+        ]
+
+    def _ensure(
+        self,
+        session: Session,
+        request: ExistRequest,
+        existing_object_context: ModuleObjectContextTable | None,
+    ) -> Result:
         # It could be that the object context exists but is hidden
         # This means that the object previously lived in the module but was removed
         # In that case we must activate the object context again
@@ -1,3 +1,6 @@
+import hashlib
+import json
+import uuid
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from enum import Enum
@@ -9,12 +12,16 @@ from dso.models import DocumentType
 from dso.services.ow.gebiedsaanwijzingen.types import Gebiedsaanwijzing, GebiedsaanwijzingWaarde
 from dso.services.ow.themas.thema import ThemaFactory
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError, computed_field
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.api.domains.modules import ModuleObjectRepository
+from app.api.domains.modules import ModuleObjectRepository, ModuleObjectValidationRepository
 from app.api.domains.modules.types import ModuleObjectActionFull
 from app.api.domains.publications.repository.publication_object_repository import PublicationObjectRepository
 from app.api.domains.werkingsgebieden.repositories import InputGeoOnderverdelingRepository
+from app.api.utils.html_documents import HtmlDocuments, HtmlDocumentStats
+from app.core.db.session import SessionFactoryType, session_scope_with_context
+from app.core.logging import logger
 from app.core.services import MainConfig
 from app.core.tables.modules import ModuleObjectsTable
 from app.core.tables.others import AreasTable
@@ -46,6 +53,7 @@ class ValidateModuleRequest(BaseModel):
     module_objects: list[ModuleObjectsTable]
 
     _module_object_lookup: dict[str, ModuleObjectsTable] = PrivateAttr(default_factory=dict)
+    _html_documents: HtmlDocuments = PrivateAttr(default_factory=HtmlDocuments)
 
     def model_post_init(self, context: Any) -> None:
         self._module_object_lookup = {module_object.Code: module_object for module_object in self.module_objects}
@@ -53,14 +61,37 @@ class ValidateModuleRequest(BaseModel):
     def get_module_object(self, code: str) -> ModuleObjectsTable | None:
         return self._module_object_lookup.get(code, None)
 
+    def with_module_objects(self, module_objects: list[ModuleObjectsTable]) -> "ValidateModuleRequest":
+        # Shares the parsed html, the module objects are a subset of the ones in this request
+        request = ValidateModuleRequest(module_id=self.module_id, module_objects=module_objects)
+        request._html_documents = self._html_documents
+        return request
+
+    def get_html_document(self, module_object: ModuleObjectsTable, field_name: str) -> BeautifulSoup:
+        value: str = str(getattr(module_object, field_name, ""))
+        return self._html_documents.get(module_object.UUID, field_name, value)
+
+    def get_html_document_stats(self) -> HtmlDocumentStats:
+        return self._html_documents.get_stats()
+
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
 
 
 class ValidateModuleRule(ABC):
+    # Object scoped rules only look at each module object by itself,
+    # so their results are stored per module object UUID and only computed for new versions
+    object_scoped: bool = False
+
     @abstractmethod
     def validate(self, db: Session, request: ValidateModuleRequest) -> list[ValidateModuleError]:
         pass
 
+    def get_version(self) -> str:
+        """
+        Part of the key of the stored results, should change with everything that changes the outcome of the rule.
+        """
+        return type(self).__name__
+
 
 class ValidateModuleResult(BaseModel):
     errors: list[ValidateModuleError]
@@ -73,23 +104,131 @@ class ValidateModuleResult(BaseModel):
         return "Failed"
 
 
+# Bump when a rule changes its outcome without a change to its configuration
+VALIDATE_MODULE_RULES_VERSION: int = 1
+
+
 class ValidateModuleService:
-    def __init__(self, rules: list[ValidateModuleRule]):
+    """
+    Object scoped rules only validate the module objects without stored results for the current rules version.
+    The other rules always validate the whole module.
+    """
+
+    def __init__(
+        self,
+        rules: list[ValidateModuleRule],
+        validation_repository: ModuleObjectValidationRepository | None = None,
+        db_session_factory: SessionFactoryType | None = None,
+    ):
         self._rules: list[ValidateModuleRule] = rules
+        self._validation_repository: ModuleObjectValidationRepository | None = validation_repository
+        self._db_session_factory: SessionFactoryType | None = db_session_factory
+        self._rules_version: str | None = None
+
+    def get_rules_version(self) -> str:
+        if self._rules_version is None:
+            versions: list[str] = [str(VALIDATE_MODULE_RULES_VERSION)] + [rule.get_version() for rule in self._rules]
+            self._rules_version = hashlib.sha256("\n".join(versions).encode("utf-8")).hexdigest()
+        return self._rules_version
 
     def validate(self, db: Session, request: ValidateModuleRequest) -> ValidateModuleResult:
-        errors: list[ValidateModuleError] = []
-        for rule in self._rules:
-            errors += rule.validate(db, request)
+        rules_version: str = self.get_rules_version()
+        stored_errors: dict[uuid.UUID, list[dict]] = {}
+        if self._validation_repository is not None:
+            stored_errors = self._validation_repository.get_errors(
+                db,
+                [module_object.UUID for module_object in request.module_objects],
+                rules_version,
+            )
+        changed_objects: list[ModuleObjectsTable] = [
+            module_object for module_object in request.module_objects if module_object.UUID not in stored_errors
+        ]
+        changed_request: ValidateModuleRequest = request.with_module_objects(changed_objects)
+
+        object_positions: dict[str, int] = {
+            module_object.Code: position for position, module_object in enumerate(request.module_objects)
+        }
+        uuids_by_code: dict[str, uuid.UUID] = {
+            module_object.Code: module_object.UUID for module_object in changed_objects
+        }
+        new_errors: dict[uuid.UUID, list[dict]] = {module_object.UUID: [] for module_object in changed_objects}
+
+        # Errors are sorted by rule and then by module object, like when all rules validate the whole module
+        ranked_errors: list[tuple[int, int, ValidateModuleError]] = []
+        for rule_index, rule in enumerate(self._rules):
+            if not rule.object_scoped:
+                ranked_errors += [(rule_index, 0, error) for error in rule.validate(db, request)]
+                continue
+
+            for error in rule.validate(db, changed_request):
+                ranked_errors.append((rule_index, object_positions.get(error.object.code, 0), error))
+                new_errors[uuids_by_code[error.object.code]].append(
+                    {"Rule_Index": rule_index, "Error": error.model_dump(mode="json")}
+                )
+
+        for module_object in request.module_objects:
+            for stored_error in stored_errors.get(module_object.UUID, []):
+                error = ValidateModuleError.model_validate(stored_error["Error"])
+                ranked_errors.append((stored_error["Rule_Index"], object_positions[module_object.Code], error))
+        ranked_errors.sort(key=lambda ranked_error: ranked_error[:2])
+
+        self._store_errors(request, rules_version, new_errors)
+
+        html_stats: HtmlDocumentStats = request.get_html_document_stats()
+        logger.info(
+            f"Validated module {request.module_id}: {len(changed_objects)} of {len(request.module_objects)} objects "
+            f"changed, parsed {html_stats.parses} html fields, reused {html_stats.hits}"
+        )
 
         return ValidateModuleResult(
-            errors=errors,
+            errors=[error for _, _, error in ranked_errors],
         )
 
+    def _store_errors(
+        self,
+        request: ValidateModuleRequest,
+        rules_version: str,
+        new_errors: dict[uuid.UUID, list[dict]],
+    ) -> None:
+        """
+        The results are stored in their own transaction, so validating never writes in the session of the caller.
+        They only save work for the next run, failing to store them does not fail the validation.
+        """
+        if self._validation_repository is None or self._db_session_factory is None:
+            return
+
+        try:
+            with session_scope_with_context(self._db_session_factory) as session:
+                self._validation_repository.store(
+                    session,
+                    request.module_id,
+                    rules_version,
+                    new_errors,
+                    [module_object.UUID for module_object in request.module_objects],
+                    datetime.now(UTC),
+                )
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not store the validation results of module {request.module_id}: {e}")
+
 
 class RequiredObjectFieldsRule(ValidateModuleRule):
-    def __init__(self, object_map: dict[str, type[BaseModel]]):
+    object_scoped = True
+
+    def __init__(self, object_map: dict[str, type[BaseModel]], validators_config: dict[str, dict]):
         self._object_map: dict[str, type[BaseModel]] = object_map
+        self._validators_config: dict[str, dict] = validators_config
+
+    def get_version(self) -> str:
+        # Validators are only known by their config, their reprs would differ between processes
+        fields: list[str] = [
+            f"{object_type}.{name}:{field.annotation}:{field.is_required()}"
+            for object_type, model in sorted(self._object_map.items())
+            for name, field in model.model_fields.items()
+        ]
+        validators_json: str = json.dumps(self._validators_config, sort_keys=True, default=str)
+        validators_hash: str = hashlib.sha256(validators_json.encode("utf-8")).hexdigest()
+        return f"{type(self).__name__}:{validators_hash}:{','.join(fields)}"
 
     def validate(self, db: Session, request: ValidateModuleRequest) -> list[ValidateModuleError]:
         errors: list[ValidateModuleError] = []
@@ -234,19 +373,24 @@ class ForbiddenHtmlTagsRuleConfig(BaseModel):
 
 
 class ForbiddenHtmlTagsRule(ValidateModuleRule):
+    object_scoped = True
+
     def __init__(self, main_config: MainConfig):
         self._config: ForbiddenHtmlTagsRuleConfig = main_config.get_as_model(
             "forbidden_html_tags_rule",
             ForbiddenHtmlTagsRuleConfig,
         )
 
+    def get_version(self) -> str:
+        return f"{type(self).__name__}:{self._config.model_dump_json()}"
+
     def validate(self, db: Session, request: ValidateModuleRequest) -> list[ValidateModuleError]:
         errors: list[ValidateModuleError] = []
 
         for object_table in request.module_objects:
             for field_name in self._config.fields:
-                value: str = str(getattr(object_table, field_name, ""))
-                maybe_forbidden_tag = self._has_forbidden_tags(value)
+                document: BeautifulSoup = request.get_html_document(object_table, field_name)
+                maybe_forbidden_tag = self._has_forbidden_tags(document)
                 if maybe_forbidden_tag:
                     errors.append(
                         ValidateModuleError(
@@ -263,8 +407,7 @@ class ForbiddenHtmlTagsRule(ValidateModuleRule):
 
         return errors
 
-    def _has_forbidden_tags(self, text: str) -> str | None:
-        soup = BeautifulSoup(text, "html.parser")
+    def _has_forbidden_tags(self, soup: BeautifulSoup) -> str | None:
         for tag in self._config.forbidden_html_tags:
             elements = soup.find_all(tag)
             if elements:
@@ -279,19 +422,24 @@ class ForbidEmptyHtmlNodesRuleConfig(BaseModel):
 
 
 class ForbidEmptyHtmlNodesRule(ValidateModuleRule):
+    object_scoped = True
+
     def __init__(self, main_config: MainConfig):
         self._config: ForbidEmptyHtmlNodesRuleConfig = main_config.get_as_model(
             "forbid_empty_html_nodes_rule",
             ForbidEmptyHtmlNodesRuleConfig,
         )
 
+    def get_version(self) -> str:
+        return f"{type(self).__name__}:{self._config.model_dump_json()}"
+
     def validate(self, db: Session, request: ValidateModuleRequest) -> list[ValidateModuleError]:
         errors: list[ValidateModuleError] = []
 
         for object_table in request.module_objects:
             for field_name in self._config.fields:
-                value: str = str(getattr(object_table, field_name, ""))
-                if self._has_empty_nodes(value):
+                document: BeautifulSoup = request.get_html_document(object_table, field_name)
+                if self._has_empty_nodes(document):
                     errors.append(
                         ValidateModuleError(
                             rule="forbid_empty_html_nodes_rule",
@@ -307,9 +455,7 @@ class ForbidEmptyHtmlNodesRule(ValidateModuleRule):
 
         return errors
 
-    def _has_empty_nodes(self, text: str) -> bool:
-        soup: BeautifulSoup = BeautifulSoup(text, "html.parser")
-
+    def _has_empty_nodes(self, soup: BeautifulSoup) -> bool:
         for tag in soup.find_all(True):
             if tag.name in self._config.html_void_elements:
                 continue
@@ -470,19 +616,23 @@ class CheckEmptyAreaDesignationTextConfig(BaseModel):
 
 
 class CheckEmptyAreaDesignationTextRule(ValidateModuleRule):
+    object_scoped = True
+
     def __init__(self, main_config: MainConfig):
         self._config: CheckEmptyAreaDesignationTextConfig = main_config.get_as_model(
             "check_empty_area_designation_text_rule",
             CheckEmptyAreaDesignationTextConfig,
         )
 
+    def get_version(self) -> str:
+        return f"{type(self).__name__}:{self._config.model_dump_json()}"
+
     def validate(self, db: Session, request: ValidateModuleRequest) -> list[ValidateModuleError]:
         errors: list[ValidateModuleError] = []
 
         for object_table in request.module_objects:
             for field_name in self._config.fields:
-                value: str = str(getattr(object_table, field_name, ""))
-                soup = BeautifulSoup(value, "html.parser")
+                soup: BeautifulSoup = request.get_html_document(object_table, field_name)
                 for gebiedsaanwijzing in soup.select('a[data-hint-type="gebiedsaanwijzing"]'):
                     inner_text = gebiedsaanwijzing.get_text(strip=True)
                     if len(inner_text) == 0:
@@ -10,6 +10,8 @@ from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session
+from app.api.domains.objects.repositories.valid_objects_repository import ValidObjectsRepository
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.users.dependencies import depends_current_user
 from app.api.endpoint import BaseEndpointContext
 from app.api.permissions import Permissions
@@ -61,6 +63,10 @@ def atemporal_create_object_endpoint(
     object_in: BaseModel,
     user: Annotated[UsersTable, Depends(depends_current_user)],
     permission_service: Annotated[PermissionService, Depends(Provide[ApiContainer.permission_service])],
+    valid_objects_repository: Annotated[
+        ValidObjectsRepository, Depends(Provide[ApiContainer.valid_objects_repository])
+    ],
+    search_backend: Annotated[SearchBackend, Depends(Provide[ApiContainer.search_backend])],
     session: Annotated[Session, Depends(depends_db_session)],
     context: Annotated[AtemporalCreateObjectEndpointContext, Depends()],
 ) -> BaseModel:
@@ -97,6 +103,8 @@ def atemporal_create_object_endpoint(
         )
         session.add(new_object)
         session.flush()
+        valid_objects_repository.refresh_codes(session, {object_static.Code}, timepoint)
+        search_backend.sync(session, ObjectsTable.__tablename__, [new_object.UUID])
         session.commit()
 
         response: BaseModel = context.response_type.model_validate(new_object)
@@ -10,6 +10,8 @@ from sqlalchemy.orm import Session
 from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session
 from app.api.domains.objects.repositories.object_repository import ObjectRepository
+from app.api.domains.objects.repositories.valid_objects_repository import ValidObjectsRepository
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.users.dependencies import depends_current_user
 from app.api.endpoint import BaseEndpointContext
 from app.api.permissions import Permissions
@@ -32,6 +34,10 @@ def atemporal_edit_object_endpoint(
     user: Annotated[UsersTable, Depends(depends_current_user)],
     object_repository: Annotated[ObjectRepository, Depends(Provide[ApiContainer.object_repository])],
     permission_service: Annotated[PermissionService, Depends(Provide[ApiContainer.permission_service])],
+    valid_objects_repository: Annotated[
+        ValidObjectsRepository, Depends(Provide[ApiContainer.valid_objects_repository])
+    ],
+    search_backend: Annotated[SearchBackend, Depends(Provide[ApiContainer.search_backend])],
     session: Annotated[Session, Depends(depends_db_session)],
     context: Annotated[AtemporalEditObjectEndpointContext, Depends()],
 ) -> ResponseOK:
@@ -79,6 +85,8 @@ def atemporal_edit_object_endpoint(
     session.add(change_log)
 
     session.flush()
+    valid_objects_repository.refresh_codes(session, {maybe_object.Code}, timepoint)
+    search_backend.sync(session, ObjectsTable.__tablename__, [maybe_object.UUID])
     session.commit()
 
     return ResponseOK(message="OK")
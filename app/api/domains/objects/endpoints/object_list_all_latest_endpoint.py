@@ -7,7 +7,7 @@ from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
-from app.api.dependencies import depends_db_session, depends_optional_sorted_pagination
+from app.api.dependencies import depends_db_session, depends_keyset_sorted_pagination
 from app.api.domains.modules.services.module_objects_to_models_parser import ModuleObjectsToModelsParser
 from app.api.domains.modules.types import ObjectStaticShort
 from app.api.domains.objects.repositories.object_repository import ObjectRepository
@@ -38,7 +38,7 @@ class ObjectListAllLatestEndpointContext(BaseEndpointContext):
 
 @inject
 def do_list_all_latest_endpoint(
-    optional_pagination: Annotated[OptionalSortedPagination, Depends(depends_optional_sorted_pagination)],
+    optional_pagination: Annotated[OptionalSortedPagination, Depends(depends_keyset_sorted_pagination)],
     object_repository: Annotated[ObjectRepository, Depends(Provide[ApiContainer.object_repository])],
     session: Annotated[Session, Depends(depends_db_session)],
     context: Annotated[ObjectListAllLatestEndpointContext, Depends()],
@@ -73,6 +73,7 @@ def do_list_all_latest_endpoint(
 
     return PagedResponse[ObjectListAllLatestResponse[BaseModel]](
         total=paginated_result.total_count,
+        next_cursor=paginated_result.next_cursor,
         limit=pagination.limit,
         offset=pagination.offset,
         results=objects,
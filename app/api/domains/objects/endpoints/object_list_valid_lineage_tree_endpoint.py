@@ -7,13 +7,13 @@ from sqlalchemy import Select
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
-from app.api.dependencies import depends_db_session, depends_optional_sorted_pagination
+from app.api.dependencies import depends_asset_mode, depends_db_session, depends_optional_sorted_pagination
 from app.api.domains.objects.repositories.object_repository import ObjectRepository
 from app.api.endpoint import BaseEndpointContext
 from app.api.events.before_select_execution_event import BeforeSelectExecutionEvent
 from app.api.events.event_manager import ApiEventManager
 from app.api.events.retrieved_objects_event import RetrievedObjectsEvent
-from app.api.types import PreparedQuery
+from app.api.types import AssetMode, PreparedQuery
 from app.api.utils.pagination import (
     OptionalSortedPagination,
     OrderConfig,
@@ -40,6 +40,7 @@ def list_valid_lineage_tree_endpoint(
     object_repository: Annotated[ObjectRepository, Depends(Provide[ApiContainer.object_repository])],
     event_manager: Annotated[ApiEventManager, Depends(Provide[ApiContainer.event_manager])],
     session: Annotated[Session, Depends(depends_db_session)],
+    asset_mode: Annotated[AssetMode | None, Depends(depends_asset_mode)],
     context: Annotated[ObjectListValidLineageTreeEndpointContext, Depends()],
 ) -> PagedResponse[BaseModel]:
     sort: Sort = context.order_config.get_sort(optional_pagination.sort)
@@ -75,6 +76,7 @@ def list_valid_lineage_tree_endpoint(
             rows=rows,
             endpoint_id=context.builder_data.endpoint_id,
             response_model=context.response_config_model,
+            asset_mode=asset_mode,
         ),
     )
 
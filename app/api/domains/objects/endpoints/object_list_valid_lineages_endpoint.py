@@ -7,13 +7,13 @@ from sqlalchemy import Select
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
-from app.api.dependencies import depends_db_session, depends_optional_sorted_pagination
+from app.api.dependencies import depends_asset_mode, depends_db_session, depends_keyset_sorted_pagination
 from app.api.domains.objects.repositories.object_repository import ObjectRepository
 from app.api.endpoint import BaseEndpointContext
 from app.api.events.before_select_execution_event import BeforeSelectExecutionEvent
 from app.api.events.event_manager import ApiEventManager
 from app.api.events.retrieved_objects_event import RetrievedObjectsEvent
-from app.api.types import PreparedQuery
+from app.api.types import AssetMode, PreparedQuery
 from app.api.utils.pagination import (
     OptionalSortedPagination,
     OrderConfig,
@@ -35,11 +35,12 @@ class ObjectListValidLineagesEndpointContext(BaseEndpointContext):
 
 @inject
 def list_valid_lineages_endpoint(
-    optional_pagination: Annotated[OptionalSortedPagination, Depends(depends_optional_sorted_pagination)],
+    optional_pagination: Annotated[OptionalSortedPagination, Depends(depends_keyset_sorted_pagination)],
     object_repository: Annotated[ObjectRepository, Depends(Provide[ApiContainer.object_repository])],
     event_manager: Annotated[ApiEventManager, Depends(Provide[ApiContainer.event_manager])],
     context: Annotated[ObjectListValidLineagesEndpointContext, Depends()],
     session: Annotated[Session, Depends(depends_db_session)],
+    asset_mode: Annotated[AssetMode | None, Depends(depends_asset_mode)],
     filter_title: str | None = None,
 ) -> PagedResponse[BaseModel]:
     sort: Sort = context.order_config.get_sort(optional_pagination.sort)
@@ -64,6 +65,9 @@ def list_valid_lineages_endpoint(
         limit=pagination.limit,
         offset=pagination.offset,
         sort=(getattr(prepared_query.aliased_ref, pagination.sort.column), pagination.sort.order),
+        keyset=prepared_query.aliased_ref.UUID,
+        cursor=pagination.cursor,
+        count_mode=pagination.get_count_mode(),
     )
 
     rows: list[BaseModel] = [
@@ -75,11 +79,13 @@ def list_valid_lineages_endpoint(
             rows=rows,
             endpoint_id=context.builder_data.endpoint_id,
             response_model=context.response_config_model,
+            asset_mode=asset_mode,
         ),
     )
 
     return PagedResponse[BaseModel](
         total=paginated_result.total_count,
+        next_cursor=paginated_result.next_cursor,
         offset=pagination.offset,
         limit=pagination.limit,
         results=retrieved_objects_event.payload.rows,
@@ -7,11 +7,12 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
-from app.api.dependencies import depends_db_session
+from app.api.dependencies import depends_asset_mode, depends_db_session
 from app.api.domains.objects.repositories.object_repository import ObjectRepository
 from app.api.endpoint import BaseEndpointContext
 from app.api.events.event_manager import ApiEventManager
 from app.api.events.retrieved_objects_event import RetrievedObjectsEvent
+from app.api.types import AssetMode
 from app.core.tables.objects import ObjectsTable
 from app.core.types import Model
 
@@ -27,6 +28,7 @@ def view_object_version_endpoint(
     object_repository: Annotated[ObjectRepository, Depends(Provide[ApiContainer.object_repository])],
     event_manager: Annotated[ApiEventManager, Depends(Provide[ApiContainer.event_manager])],
     session: Annotated[Session, Depends(depends_db_session)],
+    asset_mode: Annotated[AssetMode | None, Depends(depends_asset_mode)],
     context: Annotated[ObjectVersionEndpointContext, Depends()],
 ) -> BaseModel:
     maybe_object: ObjectsTable | None = object_repository.get_by_object_type_and_uuid(
@@ -45,6 +47,7 @@ def view_object_version_endpoint(
             rows=[result],
             endpoint_id=context.builder_data.endpoint_id,
             response_model=context.response_config_model,
+            asset_mode=asset_mode,
         ),
     )
     result = event.payload.rows[0]
@@ -1,4 +1,7 @@
 from .acknowledged_relations_repository import AcknowledgedRelationsRepository
+from .asset_cache import AssetCache, AssetCacheStats
 from .asset_repository import AssetRepository
 from .object_repository import ObjectRepository
 from .object_static_repository import ObjectStaticRepository
+from .plain_text_repository import PlainTextRepository
+from .valid_objects_repository import ValidObjectsRepository
@@ -0,0 +1,119 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.core.tables.others import AssetsTable
+
+
+@dataclass
+class AssetCacheStats:
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class AssetCache:
+    """
+    Process wide LRU cache of assets keyed by UUID and bounded by the total content size.
+
+    Assets are immutable once stored (they are content addressed by their Hash),
+    only a removal of the asset itself (a GDPR clean-up) requires an explicit `evict`.
+    Other processes keep serving their cached copy until they restart, or until the entry is evicted for size.
+
+    The cache holds detached copies, never the instances of a session,
+    so that a rollback or expire in one request can not affect another.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes: int = max_bytes
+        self._entries: OrderedDict[UUID, AssetsTable] = OrderedDict()
+        self._size_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def get_many(self, uuids: Iterable[UUID]) -> dict[UUID, AssetsTable]:
+        found: dict[UUID, AssetsTable] = {}
+        with self._lock:
+            for uuid in uuids:
+                asset: AssetsTable | None = self._entries.get(uuid)
+                if asset is None:
+                    self._misses += 1
+                    continue
+
+                self._entries.move_to_end(uuid)
+                self._hits += 1
+                found[uuid] = asset
+        return found
+
+    def put_many(self, assets: Iterable[AssetsTable]) -> dict[UUID, AssetsTable]:
+        copies: dict[UUID, AssetsTable] = {asset.UUID: self._detached_copy(asset) for asset in assets}
+        if not self.is_enabled():
+            return copies
+
+        with self._lock:
+            for uuid, asset in copies.items():
+                size: int = self._size_of(asset)
+                if size > self._max_bytes:
+                    continue
+
+                if uuid in self._entries:
+                    self._remove(uuid)
+                self._entries[uuid] = asset
+                self._size_bytes += size
+
+            while self._size_bytes > self._max_bytes:
+                oldest_uuid: UUID = next(iter(self._entries))
+                self._remove(oldest_uuid)
+                self._evictions += 1
+
+        return copies
+
+    def evict(self, uuid: UUID) -> None:
+        with self._lock:
+            if uuid in self._entries:
+                self._remove(uuid)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def get_stats(self) -> AssetCacheStats:
+        with self._lock:
+            return AssetCacheStats(
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def _remove(self, uuid: UUID) -> None:
+        asset: AssetsTable = self._entries.pop(uuid)
+        self._size_bytes -= self._size_of(asset)
+
+    def _size_of(self, asset: AssetsTable) -> int:
+        # Content is base64 and Meta is json, both ascii, so length equals bytes
+        return len(asset.Content or "") + len(asset.Meta or "")
+
+    def _detached_copy(self, asset: AssetsTable) -> AssetsTable:
+        return AssetsTable(
+            UUID=asset.UUID,
+            Created_Date=asset.Created_Date,
+            Created_By_UUID=asset.Created_By_UUID,
+            Lookup=asset.Lookup,
+            Hash=asset.Hash,
+            Meta=asset.Meta,
+            Content=asset.Content,
+        )
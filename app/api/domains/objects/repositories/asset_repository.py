@@ -1,23 +1,43 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from app.api.base_repository import BaseRepository
+from app.api.domains.objects.repositories.asset_cache import AssetCache
 from app.core.tables.others import AssetsTable
 
+# MSSQL allows at most 2100 parameters per statement
+UUIDS_PER_QUERY = 1000
+
 
 class AssetRepository(BaseRepository):
+    def __init__(self, cache: AssetCache | None = None):
+        self._cache: AssetCache | None = cache if cache is not None and cache.is_enabled() else None
+
     def get_by_uuid(self, session: Session, uuid: UUID) -> AssetsTable | None:
+        if self._cache is not None:
+            return self.get_map_by_uuids(session, [uuid]).get(uuid)
+
         stmt = select(AssetsTable).filter(AssetsTable.UUID == uuid)
         maybe_asset = session.scalars(stmt).first()
         return maybe_asset
 
     def get_by_uuids(self, session: Session, uuids: list[UUID]) -> Sequence[AssetsTable]:
-        stmt = select(AssetsTable).filter(AssetsTable.UUID.in_(uuids))
-        assets = session.scalars(stmt).all()
-        return assets
+        unique_uuids: list[UUID] = list(dict.fromkeys(uuids))
+        if self._cache is None:
+            return self._fetch_by_uuids(session, unique_uuids)
+
+        cached: dict[UUID, AssetsTable] = self._cache.get_many(unique_uuids)
+        missing: list[UUID] = [uuid for uuid in unique_uuids if uuid not in cached]
+        if missing:
+            cached.update(self._cache.put_many(self._fetch_by_uuids(session, missing)))
+
+        return [cached[uuid] for uuid in unique_uuids if uuid in cached]
+
+    def get_map_by_uuids(self, session: Session, uuids: list[UUID]) -> dict[UUID, AssetsTable]:
+        return {asset.UUID: asset for asset in self.get_by_uuids(session, uuids)}
 
     def get_by_hash_and_content(self, session: Session, hash: str, content: str) -> AssetsTable | None:
         stmt = (
@@ -32,3 +52,20 @@ class AssetRepository(BaseRepository):
     def get_all(self, session: Session) -> Sequence[AssetsTable]:
         stmt = select(AssetsTable)
         return self.fetch_all(session, stmt)
+
+    def delete_by_uuid(self, session: Session, uuid: UUID) -> None:
+        """
+        Assets are otherwise immutable, so removing one (like for GDPR)
+        is the only moment the cache needs to be told about a change.
+        """
+        session.execute(delete(AssetsTable).where(AssetsTable.UUID == uuid))
+        if self._cache is not None:
+            self._cache.evict(uuid)
+
+    def _fetch_by_uuids(self, session: Session, uuids: list[UUID]) -> list[AssetsTable]:
+        assets: list[AssetsTable] = []
+        for start in range(0, len(uuids), UUIDS_PER_QUERY):
+            chunk: list[UUID] = uuids[start : start + UUIDS_PER_QUERY]
+            stmt = select(AssetsTable).filter(AssetsTable.UUID.in_(chunk))
+            assets.extend(session.scalars(stmt).all())
+        return assets
@@ -2,7 +2,7 @@ from collections.abc import Sequence
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import desc, select
+from sqlalchemy import ColumnElement, Select, Subquery, desc, select
 from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 from sqlalchemy.sql import and_, func, or_
 
@@ -10,11 +10,66 @@ from app.api.base_repository import BaseRepository
 from app.api.domains.objects.types import ObjectCount
 from app.api.types import PreparedQuery
 from app.api.utils.pagination import PaginatedQueryResult, SortedPagination
-from app.core.tables.objects import ObjectsTable, ObjectStaticsTable
+from app.core.tables.objects import ObjectsTable, ObjectStaticsTable, ValidObjectsTable
 
 
 class ObjectRepository(BaseRepository):
+    def __init__(self, use_valid_index: bool = False):
+        # When enabled the valid object lookups join against the `valid_objects` projection
+        # instead of ranking all object versions with a window function
+        self._use_valid_index: bool = use_valid_index
+
+    def _select_indexed(self, *entities) -> Select:
+        return select(*entities).join(ValidObjectsTable, ValidObjectsTable.Object_UUID == ObjectsTable.UUID)
+
+    def _filter_not_ended(self, stmt: Select) -> Select:
+        return stmt.filter(
+            or_(
+                ObjectsTable.End_Validity > datetime.now(UTC),
+                ObjectsTable.End_Validity.is_(None),
+            )
+        )
+
+    def get_valid_subquery(self, *filters: ColumnElement[bool]) -> Subquery:
+        """
+        The latest valid version of every object, with all object columns.
+        The filters are applied before the versions are ranked, so they should only use columns
+        which are the same for every version of a Code (like Code and Object_Type).
+        """
+        if self._use_valid_index:
+            return self._filter_not_ended(self._select_indexed(ObjectsTable).filter(*filters)).subquery()
+
+        timepoint: datetime = datetime.now(UTC)
+        ranked = (
+            select(
+                ObjectsTable,
+                func.row_number()
+                .over(
+                    partition_by=ObjectsTable.Code,
+                    order_by=desc(ObjectsTable.Modified_Date),
+                )
+                .label("_RowNumber"),
+            )
+            .filter(ObjectsTable.Start_Validity <= timepoint)
+            .filter(*filters)
+            .subquery()
+        )
+        return (
+            select(ranked)
+            .filter(ranked.c._RowNumber == 1)
+            .filter(
+                or_(
+                    ranked.c.End_Validity > timepoint,
+                    ranked.c.End_Validity.is_(None),
+                )
+            )
+            .subquery()
+        )
+
     def get_valid_counts(self, session: Session, user_uuid: UUID) -> list[ObjectCount]:
+        if self._use_valid_index:
+            return self._get_valid_counts_indexed(session, user_uuid)
+
         row_number = (
             func.row_number()
             .over(
@@ -60,6 +115,27 @@ class ObjectRepository(BaseRepository):
         result = [ObjectCount(object_type=r[0], count=r[1]) for r in rows]
         return result
 
+    def _get_valid_counts_indexed(self, session: Session, user_uuid: UUID) -> list[ObjectCount]:
+        stmt = (
+            self._select_indexed(ObjectsTable.Object_Type, func.count())
+            .join(ObjectsTable.ObjectStatics)
+            .filter(
+                or_(
+                    ObjectStaticsTable.Owner_1_UUID == user_uuid,
+                    ObjectStaticsTable.Owner_2_UUID == user_uuid,
+                    ObjectStaticsTable.Portfolio_Holder_1_UUID == user_uuid,
+                    ObjectStaticsTable.Portfolio_Holder_2_UUID == user_uuid,
+                    ObjectStaticsTable.Client_1_UUID == user_uuid,
+                ).self_group()
+            )
+            .group_by(ObjectsTable.Object_Type)
+        )
+        stmt = self._filter_not_ended(stmt)
+
+        rows = session.execute(stmt).fetchall()
+        result = [ObjectCount(object_type=r[0], count=r[1]) for r in rows]
+        return result
+
     def get_by_uuid(self, session: Session, uuid: UUID) -> ObjectsTable | None:
         stmt = select(ObjectsTable).filter(ObjectsTable.UUID == uuid)
         return self.fetch_first(session, stmt)
@@ -90,6 +166,15 @@ class ObjectRepository(BaseRepository):
         return self.fetch_first(session, stmt)
 
     def get_latest_valid_by_id(self, session: Session, object_type: str, object_id: int) -> ObjectsTable | None:
+        if self._use_valid_index:
+            indexed_stmt = (
+                self._select_indexed(ObjectsTable)
+                .options(selectinload(ObjectsTable.ObjectStatics))
+                .filter(ObjectsTable.Object_Type == object_type)
+                .filter(ObjectsTable.Object_ID == object_id)
+            )
+            return self.fetch_first(session, self._filter_not_ended(indexed_stmt))
+
         row_number = (
             func.row_number()
             .over(
@@ -140,6 +225,40 @@ class ObjectRepository(BaseRepository):
         owner_uuid: UUID | None = None,
         object_types: Sequence[str] = (),
     ) -> PaginatedQueryResult:
+        filters = []
+        if owner_uuid is not None:
+            owner_filter = or_(
+                ObjectStaticsTable.Owner_1_UUID == owner_uuid,
+                ObjectStaticsTable.Owner_2_UUID == owner_uuid,
+                ObjectStaticsTable.Portfolio_Holder_1_UUID == owner_uuid,
+                ObjectStaticsTable.Portfolio_Holder_2_UUID == owner_uuid,
+                ObjectStaticsTable.Client_1_UUID == owner_uuid,
+            )
+            filters.append(owner_filter)
+
+        if object_types:
+            filters.append(ObjectsTable.Object_Type.in_(object_types))
+
+        if self._use_valid_index:
+            indexed_stmt = (
+                self._select_indexed(ObjectsTable)
+                .options(joinedload(ObjectsTable.ObjectStatics))
+                .join(ObjectsTable.ObjectStatics)
+            )
+            if len(filters) > 0:
+                indexed_stmt = indexed_stmt.filter(and_(*filters))
+
+            return self.fetch_paginated(
+                session=session,
+                statement=indexed_stmt,
+                limit=pagination.limit,
+                offset=pagination.offset,
+                sort=(getattr(ObjectsTable, pagination.sort.column), pagination.sort.order),
+                keyset=ObjectsTable.UUID,
+                cursor=pagination.cursor,
+                count_mode=pagination.get_count_mode(),
+            )
+
         row_number = (
             func.row_number()
             .over(
@@ -156,20 +275,6 @@ class ObjectRepository(BaseRepository):
             .filter(ObjectsTable.Start_Validity <= datetime.now(UTC))
         )
 
-        filters = []
-        if owner_uuid is not None:
-            owner_filter = or_(
-                ObjectStaticsTable.Owner_1_UUID == owner_uuid,
-                ObjectStaticsTable.Owner_2_UUID == owner_uuid,
-                ObjectStaticsTable.Portfolio_Holder_1_UUID == owner_uuid,
-                ObjectStaticsTable.Portfolio_Holder_2_UUID == owner_uuid,
-                ObjectStaticsTable.Client_1_UUID == owner_uuid,
-            )
-            filters.append(owner_filter)
-
-        if object_types:
-            filters.append(ObjectsTable.Object_Type.in_(object_types))
-
         if len(filters) > 0:
             subq = subq.filter(and_(*filters))
 
@@ -183,9 +288,24 @@ class ObjectRepository(BaseRepository):
             limit=pagination.limit,
             offset=pagination.offset,
             sort=(getattr(subq.c, pagination.sort.column), pagination.sort.order),
+            keyset=subq.c.UUID,
+            cursor=pagination.cursor,
+            count_mode=pagination.get_count_mode(),
         )
 
     def prepare_list_valid_lineages(self, object_type: str, filter_title: str | None = None) -> PreparedQuery:
+        if self._use_valid_index:
+            indexed_stmt = self._filter_not_ended(
+                self._select_indexed(ObjectsTable).filter(ValidObjectsTable.Object_Type == object_type)
+            )
+            if filter_title:
+                indexed_stmt = indexed_stmt.filter(ObjectsTable.Title.like(filter_title))
+
+            return PreparedQuery(
+                query=indexed_stmt,
+                aliased_ref=ObjectsTable,
+            )
+
         subq = (
             select(
                 ObjectsTable,
@@ -39,6 +39,16 @@ class ObjectStaticRepository(BaseRepository):
         stmt = select(ObjectStaticsTable).filter(ObjectStaticsTable.Source_Identifier == source_key)
         return self.fetch_first(session, stmt)
 
+    def get_by_sources(self, session: Session, source_keys: set[str]) -> dict[str, ObjectStaticsTable]:
+        if not source_keys:
+            return {}
+
+        stmt = select(ObjectStaticsTable).filter(ObjectStaticsTable.Source_Identifier.in_(source_keys))
+        result: dict[str, ObjectStaticsTable] = {}
+        for object_static in self.fetch_all(session, stmt):
+            result.setdefault(object_static.Source_Identifier, object_static)
+        return result
+
     def does_codes_exists(self, session: Session, codes: set[str]) -> tuple[bool, set[str]]:
         if not len(codes):
             return True, set()
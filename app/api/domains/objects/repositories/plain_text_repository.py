@@ -0,0 +1,76 @@
+from collections.abc import Iterable, Sequence
+from uuid import UUID
+
+from bs4 import BeautifulSoup
+from sqlalchemy import ScalarSelect, Table, delete, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from app.api.base_repository import BaseRepository
+from app.core.tables.objects import PlainTextsTable
+
+UUIDS_PER_QUERY = 1000
+
+
+def html_to_text(value: str) -> str:
+    soup = BeautifulSoup(value, "html.parser")
+    return soup.get_text()
+
+
+class PlainTextRepository(BaseRepository):
+    """
+    Maintains the `plain_texts` projection, so that html fields
+    do not have to be parsed again on every search request.
+    """
+
+    def refresh(self, session: Session, source: Table, fields: Sequence[str], uuids: Iterable[UUID]) -> None:
+        unique_uuids: list[UUID] = list(set(uuids))
+        for i in range(0, len(unique_uuids), UUIDS_PER_QUERY):
+            chunk: list[UUID] = unique_uuids[i : i + UUIDS_PER_QUERY]
+            session.execute(delete(PlainTextsTable).where(PlainTextsTable.UUID.in_(chunk)))
+            rows = session.execute(
+                select(source.c.UUID, *[source.c[field] for field in fields]).filter(source.c.UUID.in_(chunk))
+            ).all()
+            self._insert(session, fields, rows)
+
+    def refresh_all(self, session: Session, source: Table, fields: Sequence[str], batch_size: int = 500) -> int:
+        session.execute(delete(PlainTextsTable).where(PlainTextsTable.UUID.in_(select(source.c.UUID))))
+
+        # Keyset pages which are fully fetched before inserting,
+        # as mssql connections can not execute while the results of another statement are still open
+        count: int = 0
+        last_uuid: UUID | None = None
+        while True:
+            stmt = (
+                select(source.c.UUID, *[source.c[field] for field in fields]).order_by(source.c.UUID).limit(batch_size)
+            )
+            if last_uuid is not None:
+                stmt = stmt.filter(source.c.UUID > last_uuid)
+            rows = session.execute(stmt).all()
+            if not rows:
+                return count
+
+            self._insert(session, fields, rows)
+            count += len(rows)
+            last_uuid = rows[-1][0]
+
+    def get_text_column(self, uuid_column: ColumnElement, field: str) -> ScalarSelect:
+        """
+        Correlated subquery of the plain text of `field` for the row of `uuid_column`.
+        """
+        return (
+            select(PlainTextsTable.Text)
+            .filter(PlainTextsTable.UUID == uuid_column)
+            .filter(PlainTextsTable.Field == field)
+            .scalar_subquery()
+        )
+
+    def _insert(self, session: Session, fields: Sequence[str], rows: Sequence) -> None:
+        values: list[dict] = [
+            {"UUID": row[0], "Field": field, "Text": html_to_text(value)}
+            for row in rows
+            for field, value in zip(fields, row[1:])
+            if isinstance(value, str)
+        ]
+        if values:
+            session.execute(insert(PlainTextsTable), values)
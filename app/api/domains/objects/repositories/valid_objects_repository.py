@@ -0,0 +1,59 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import Insert, Select, delete, desc, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.api.base_repository import BaseRepository
+from app.core.tables.objects import ObjectsTable, ValidObjectsTable
+
+
+class ValidObjectsRepository(BaseRepository):
+    """
+    Maintains the `valid_objects` projection which points every Code
+    to the UUID of its latest version with a Start_Validity in the past.
+    """
+
+    def refresh_codes(self, session: Session, codes: Iterable[str], timepoint: datetime) -> None:
+        unique_codes: set[str] = set(codes)
+        if not unique_codes:
+            return
+
+        session.execute(delete(ValidObjectsTable).where(ValidObjectsTable.Code.in_(unique_codes)))
+        session.execute(self._build_insert(timepoint, unique_codes))
+
+    def refresh_all(self, session: Session, timepoint: datetime) -> None:
+        session.execute(delete(ValidObjectsTable))
+        session.execute(self._build_insert(timepoint))
+
+    def _build_insert(self, timepoint: datetime, codes: set[str] | None = None) -> Insert:
+        row_number = (
+            func.row_number()
+            .over(
+                partition_by=ObjectsTable.Code,
+                order_by=desc(ObjectsTable.Modified_Date),
+            )
+            .label("_RowNumber")
+        )
+
+        latest_stmt: Select = select(
+            ObjectsTable.Code,
+            ObjectsTable.Object_Type,
+            ObjectsTable.UUID,
+            row_number,
+        ).filter(ObjectsTable.Start_Validity <= timepoint)
+        if codes is not None:
+            latest_stmt = latest_stmt.filter(ObjectsTable.Code.in_(codes))
+        subq = latest_stmt.subquery()
+
+        source: Select = select(
+            subq.c.Code,
+            subq.c.Object_Type,
+            subq.c.UUID,
+            literal(timepoint, ValidObjectsTable.Refreshed_Date.type),
+        ).filter(subq.c._RowNumber == 1)
+
+        return insert(ValidObjectsTable).from_select(
+            ["Code", "Object_Type", "Object_UUID", "Refreshed_Date"],
+            source,
+        )
@@ -25,7 +25,9 @@ class ColumnImageInserter:
         self._asset_repository: AssetRepository = asset_repository
 
     def process(self) -> list[BaseModel]:
-        for index, row in enumerate(self._rows):
+        # First collect every referenced asset so they can be fetched in one go
+        references: list[tuple[BaseModel, str, UUID]] = []
+        for row in self._rows:
             for field_name in self._config.fields:
                 if not hasattr(row, field_name):
                     continue
@@ -39,11 +41,21 @@ class ColumnImageInserter:
                 except ValueError:
                     continue
 
-                asset: AssetsTable | None = self._asset_repository.get_by_uuid(self._session, image_uuid)
-                if not asset:
-                    continue
+                references.append((row, field_name, image_uuid))
+
+        if not references:
+            return self._rows
+
+        assets: dict[UUID, AssetsTable] = self._asset_repository.get_map_by_uuids(
+            self._session,
+            [image_uuid for _, _, image_uuid in references],
+        )
+        for row, field_name, image_uuid in references:
+            asset: AssetsTable | None = assets.get(image_uuid)
+            if not asset:
+                continue
 
-                setattr(row, field_name, asset.Content)
+            setattr(row, field_name, asset.Content)
 
         return self._rows
 
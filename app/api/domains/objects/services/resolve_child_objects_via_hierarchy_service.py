@@ -1,12 +1,11 @@
 import uuid
 from collections import defaultdict
-from datetime import UTC, datetime
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import Subquery, select
 from sqlalchemy.orm import Session
 
-from app.core.tables.objects import ObjectsTable
+from app.api.domains.objects.repositories.object_repository import ObjectRepository
 from app.core.types import Model
 
 
@@ -28,9 +27,11 @@ class HierachyReference(BaseModel):
 class ResolveChildObjectsViaHierarchyService:
     def __init__(
         self,
+        object_repository: ObjectRepository,
         session: Session,
         config: ResolveChildObjectsViaHierarchyConfig,
     ):
+        self._object_repository: ObjectRepository = object_repository
         self._session: Session = session
         self._config: ResolveChildObjectsViaHierarchyConfig = config
 
@@ -52,37 +53,16 @@ class ResolveChildObjectsViaHierarchyService:
         if len(hierarchy_targets) == 0:
             return []
 
-        subq = (
-            select(
-                ObjectsTable.UUID,
-                ObjectsTable.Object_Type,
-                ObjectsTable.Object_ID,
-                ObjectsTable.Code,
-                ObjectsTable.Hierarchy_Code,
-                ObjectsTable.Title,
-                ObjectsTable.End_Validity,
-                func.row_number()
-                .over(
-                    partition_by=ObjectsTable.Code,
-                    order_by=desc(ObjectsTable.Modified_Date),
-                )
-                .label("_RowNumber"),
-            )
-            .filter(ObjectsTable.Start_Validity <= datetime.now(UTC))
-            .subquery()
-        )
-
-        stmt = (
-            select(subq)
-            .filter(subq.c._RowNumber == 1)
-            .filter(subq.c.Hierarchy_Code.in_(hierarchy_targets))
-            .filter(
-                or_(
-                    subq.c.End_Validity > datetime.now(UTC),
-                    subq.c.End_Validity.is_(None),
-                )
-            )
-        )
+        # The hierarchy can change between versions, so it is only filtered on the valid version
+        subq: Subquery = self._object_repository.get_valid_subquery()
+        stmt = select(
+            subq.c.UUID,
+            subq.c.Object_Type,
+            subq.c.Object_ID,
+            subq.c.Code,
+            subq.c.Hierarchy_Code,
+            subq.c.Title,
+        ).filter(subq.c.Hierarchy_Code.in_(hierarchy_targets))
 
         child_rows = self._session.execute(stmt).all()
 
@@ -92,12 +72,16 @@ class ResolveChildObjectsViaHierarchyService:
 
 
 class ResolveChildObjectsViaHierarchyServiceFactory:
+    def __init__(self, object_repository: ObjectRepository):
+        self._object_repository: ObjectRepository = object_repository
+
     def create_service(
         self,
         session: Session,
         config: ResolveChildObjectsViaHierarchyConfig,
     ):
         return ResolveChildObjectsViaHierarchyService(
+            object_repository=self._object_repository,
             session=session,
             config=config,
         )
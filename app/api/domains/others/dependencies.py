@@ -7,10 +7,11 @@ from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session
+from app.api.domains.objects.repositories.asset_repository import AssetRepository
 from app.api.domains.objects.repositories.object_repository import ObjectRepository
 from app.api.domains.others.repositories.storage_file_repository import StorageFileRepository
 from app.core.tables.objects import ObjectsTable
-from app.core.tables.others import StorageFileTable
+from app.core.tables.others import AssetsTable, StorageFileTable
 
 
 @inject
@@ -35,3 +36,15 @@ def depends_storage_file(
     if not maybe_file:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Storage file niet gevonden")
     return maybe_file
+
+
+@inject
+def depends_asset(
+    asset_uuid: uuid.UUID,
+    session: Annotated[Session, Depends(depends_db_session)],
+    repository: Annotated[AssetRepository, Depends(Provide[ApiContainer.asset_repository])],
+):
+    maybe_asset: AssetsTable | None = repository.get_by_uuid(session, asset_uuid)
+    if not maybe_asset:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Asset niet gevonden")
+    return maybe_asset
@@ -1,3 +1,4 @@
+from .asset_download_endpoint import get_asset_download_endpoint
 from .files_download_endpoint import get_files_download_endpoint
 from .files_list_endpoint import get_files_list_endpoint
 from .files_upload_endpoint import post_files_upload_endpoint
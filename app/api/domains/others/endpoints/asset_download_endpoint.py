@@ -0,0 +1,46 @@
+import base64
+import json
+import re
+from typing import Annotated
+
+from fastapi import Depends, Request, Response, status
+
+from app.api.domains.others.dependencies import depends_asset
+from app.api.utils.http_cache import if_none_match
+from app.core.tables.others import AssetsTable
+
+# Assets never change once stored, so clients may keep them as long as they like
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _decode(asset: AssetsTable) -> tuple[str, bytes]:
+    match = re.match(r"data:(image/.*?);base64,(.*)", asset.Content, re.DOTALL)
+    if match:
+        media_type, base64_data = match.groups()
+        return media_type, base64.b64decode(base64_data)
+
+    # @note: We have some invalid entries in the database where the data:image prefix is not present
+    meta: dict[str, str] = json.loads(asset.Meta)
+    mime_type: str = meta.get("ext", "png").lower()
+    return f"image/{mime_type}", base64.b64decode(asset.Content)
+
+
+def get_asset_download_endpoint(
+    request: Request,
+    asset: Annotated[AssetsTable, Depends(depends_asset)],
+) -> Response:
+    etag: str = f'"{asset.Hash}"'
+    headers: dict[str, str] = {
+        "ETag": etag,
+        "Cache-Control": ASSET_CACHE_CONTROL,
+    }
+
+    if if_none_match(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    media_type, content = _decode(asset)
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -1,24 +1,35 @@
 from typing import Annotated
 
-from fastapi import Depends, Response
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Request, Response
 
+from app.api.api_container import ApiContainer
 from app.api.domains.others.dependencies import depends_storage_file
+from app.api.utils.binary_response import binary_response
+from app.core.db.session import SessionFactoryType
 from app.core.tables.others import StorageFileTable
 
 
+@inject
 def get_files_download_endpoint(
+    request: Request,
     storage_file: Annotated[StorageFileTable, Depends(depends_storage_file)],
+    db_session_factory: Annotated[SessionFactoryType, Depends(Provide[ApiContainer.db_session_factory])],
 ) -> Response:
     filename = storage_file.Filename
-    content = storage_file.Binary
     content_type = storage_file.Content_Type
 
-    return Response(
-        content=content,
+    return binary_response(
+        request,
+        db_session_factory,
+        StorageFileTable.Binary,
+        storage_file.UUID,
+        size=storage_file.Size,
+        checksum=storage_file.Checksum,
+        last_modified=storage_file.Created_Date,
         media_type=content_type,
         headers={
             "Access-Control-Expose-Headers": "Content-Disposition",
             "Content-Disposition": f"attachment; filename={filename}",
-            "Content-Length": str(len(content)),
         },
     )
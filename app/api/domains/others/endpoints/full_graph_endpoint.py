@@ -1,21 +1,25 @@
-from collections.abc import Sequence
-from datetime import UTC, datetime
+import hashlib
 from typing import Annotated
 
-from fastapi import Depends
-from sqlalchemy import desc, func, or_, select
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Request, Response, status
+from sqlalchemy import Subquery, desc, select
 from sqlalchemy.orm import Session, aliased, load_only
 
+from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session
+from app.api.domains.objects.repositories.object_repository import ObjectRepository
+from app.api.domains.others.services.relation_graph_index import RelationGraph, RelationGraphIndex
 from app.api.domains.others.types import GraphEdge, GraphEdgeType, GraphResponse, GraphVertice
-from app.core.tables.acknowledged_relations import AcknowledgedRelationsTable
+from app.api.utils.http_cache import if_none_match
 from app.core.tables.objects import ObjectsTable
-from app.core.tables.others import RelationsTable
 
 
 class EndpointHandler:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, relation_graph_index: RelationGraphIndex, object_repository: ObjectRepository):
         self._session: Session = session
+        self._relation_graph_index: RelationGraphIndex = relation_graph_index
+        self._object_repository: ObjectRepository = object_repository
 
     def handle(self) -> GraphResponse:
         vertices: list[GraphVertice] = []
@@ -29,73 +33,23 @@ class EndpointHandler:
         )
 
     def _get_other_edges(self) -> list[GraphEdge]:
-        relations: list[GraphEdge] = self._get_all_relations()
-        acknowledged_relations: list[GraphEdge] = self._get_valid_acknowledged_relations()
-
-        return relations + acknowledged_relations
-
-    def _get_all_relations(self) -> list[GraphEdge]:
-        stmt = select(RelationsTable)
-        rows: Sequence[RelationsTable] = self._session.execute(stmt).scalars().all()
-        edges: list[GraphEdge] = [
-            GraphEdge(
-                Type=GraphEdgeType.relation,
-                Vertice_A_Code=r.From_Code,
-                Vertice_B_Code=r.To_Code,
-            )
-            for r in rows
+        graph: RelationGraph = self._relation_graph_index.get(self._session)
+        relations: list[GraphEdge] = [
+            GraphEdge(Type=GraphEdgeType.relation, Vertice_A_Code=from_code, Vertice_B_Code=to_code)
+            for from_code, to_code in graph.relations.edges
         ]
-        return edges
-
-    def _get_valid_acknowledged_relations(self) -> list[GraphEdge]:
-        stmt = (
-            select(AcknowledgedRelationsTable)
-            .filter(AcknowledgedRelationsTable.From_Acknowledged.is_not(None))
-            .filter(AcknowledgedRelationsTable.To_Acknowledged.is_not(None))
-            .options(
-                load_only(
-                    AcknowledgedRelationsTable.From_Code,
-                    AcknowledgedRelationsTable.To_Code,
-                )
-            )
-        )
-        rows: Sequence[AcknowledgedRelationsTable] = self._session.execute(stmt).scalars().all()
-        edges: list[GraphEdge] = [
-            GraphEdge(
-                Type=GraphEdgeType.acknowledged_relation,
-                Vertice_A_Code=r.From_Code,
-                Vertice_B_Code=r.To_Code,
-            )
-            for r in rows
+        acknowledged_relations: list[GraphEdge] = [
+            GraphEdge(Type=GraphEdgeType.acknowledged_relation, Vertice_A_Code=from_code, Vertice_B_Code=to_code)
+            for from_code, to_code in graph.acknowledged_relations.edges
         ]
-        return edges
 
-    def _resolve_valid_object_data(self) -> tuple[list[GraphVertice], list[GraphEdge]]:
-        subq = (
-            select(
-                ObjectsTable,
-                func.row_number()
-                .over(
-                    partition_by=ObjectsTable.Code,
-                    order_by=desc(ObjectsTable.Modified_Date),
-                )
-                .label("_RowNumber"),
-            )
-            .select_from(ObjectsTable)
-            .filter(ObjectsTable.Start_Validity <= datetime.now(UTC))
-            .subquery()
-        )
+        return relations + acknowledged_relations
 
+    def _resolve_valid_object_data(self) -> tuple[list[GraphVertice], list[GraphEdge]]:
+        subq: Subquery = self._object_repository.get_valid_subquery()
         aliased_subq = aliased(ObjectsTable, subq)
         stmt = (
             select(aliased_subq)
-            .filter(subq.c._RowNumber == 1)
-            .filter(
-                or_(
-                    subq.c.End_Validity > datetime.now(UTC),
-                    subq.c.End_Validity.is_(None),
-                )
-            )
             .order_by(desc(subq.c.Modified_Date))
             .options(
                 load_only(
@@ -128,8 +82,21 @@ class EndpointHandler:
         return vertices, hierarchy_code_edges
 
 
+@inject
 def get_full_graph_endpoint(
+    request: Request,
     session: Annotated[Session, Depends(depends_db_session)],
+    relation_graph_index: Annotated[RelationGraphIndex, Depends(Provide[ApiContainer.relation_graph_index])],
+    object_repository: Annotated[ObjectRepository, Depends(Provide[ApiContainer.object_repository])],
 ) -> GraphResponse:
-    handler = EndpointHandler(session)
-    return handler.handle()
+    handler = EndpointHandler(session, relation_graph_index, object_repository)
+    graph: GraphResponse = handler.handle()
+
+    # The graph is serialized once to stamp it, unchanged graphs are not sent again
+    content: bytes = graph.model_dump_json().encode("utf-8")
+    etag: str = f'"{hashlib.sha256(content).hexdigest()}"'
+    headers: dict[str, str] = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=content, media_type="application/json", headers=headers)
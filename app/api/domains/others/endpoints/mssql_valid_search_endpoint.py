@@ -1,6 +1,5 @@
 from typing import Annotated
 
-from bs4 import BeautifulSoup
 from dependency_injector.wiring import Provide
 from fastapi import Depends
 from pydantic import BaseModel
@@ -10,10 +9,11 @@ from sqlalchemy.orm import Session
 from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session, depends_simple_pagination
 from app.api.domains.modules.services.module_objects_to_models_parser import ModuleObjectsToModelsParser
+from app.api.domains.objects.repositories.plain_text_repository import html_to_text
 from app.api.domains.others.types import SearchRequestData, ValidSearchConfig, ValidSearchObject
 from app.api.endpoint import BaseEndpointContext
 from app.api.utils.pagination import PagedResponse, SimplePagination
-from app.core.tables.objects import ObjectsTable
+from app.core.tables.objects import ObjectsTable, PlainTextsTable
 
 
 class EndpointHandler:
@@ -81,9 +81,10 @@ class EndpointHandler:
             )
 
             description: str = ""
-            if row["Description"] and isinstance(row["Description"], str):
-                soup = BeautifulSoup(row["Description"], "html.parser")
-                description = soup.get_text()
+            if isinstance(row["_Plain_Description"], str):
+                description = row["_Plain_Description"]
+            elif row["Description"] and isinstance(row["Description"], str):
+                description = html_to_text(row["Description"])
 
             search_object: ValidSearchObject = ValidSearchObject(
                 Object_Type=row["Object_Type"],
@@ -131,8 +132,10 @@ class EndpointHandler:
                 SELECT
                     v.*,
                     s.WeightedRank AS _Rank,
+                    p.Text AS _Plain_Description,
                     COUNT(*) OVER() AS _Total_Count
                 FROM valid_uuids AS v
+                LEFT JOIN {PlainTextsTable.__table__} AS p ON p.UUID = v.UUID AND p.Field = 'Description'
                 INNER JOIN
                 (
                     SELECT
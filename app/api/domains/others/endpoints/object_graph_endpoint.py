@@ -1,18 +1,19 @@
-from datetime import UTC, datetime
 from typing import Annotated
 
+from dependency_injector.wiring import Provide
 from fastapi import Depends
 from pydantic import BaseModel
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import Subquery, desc, select
 from sqlalchemy.orm import Session, aliased, load_only
 
+from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session
+from app.api.domains.objects.repositories.object_repository import ObjectRepository
 from app.api.domains.others.dependencies import depends_object_by_uuid
+from app.api.domains.others.services.relation_graph_index import RelationGraph, RelationGraphIndex
 from app.api.domains.others.types import GraphEdge, GraphEdgeType, GraphResponse, GraphVertice
 from app.api.endpoint import BaseEndpointContext
-from app.core.tables.acknowledged_relations import AcknowledgedRelationsTable
 from app.core.tables.objects import ObjectsTable
-from app.core.tables.others import RelationsTable
 
 
 class GraphIteration(BaseModel):
@@ -32,10 +33,14 @@ class EndpointHandler:
     def __init__(
         self,
         session: Session,
+        relation_graph_index: RelationGraphIndex,
+        object_repository: ObjectRepository,
         iterations_config: GraphIterationsConfig,
         object_table: ObjectsTable,
     ):
         self._session: Session = session
+        self._relation_graph_index: RelationGraphIndex = relation_graph_index
+        self._object_repository: ObjectRepository = object_repository
         self._iterations_config: GraphIterationsConfig = iterations_config
         self._object = object_table
 
@@ -57,32 +62,10 @@ class EndpointHandler:
         if not codes:
             return []
 
-        subq = (
-            select(
-                ObjectsTable,
-                func.row_number()
-                .over(
-                    partition_by=ObjectsTable.Code,
-                    order_by=desc(ObjectsTable.Modified_Date),
-                )
-                .label("_RowNumber"),
-            )
-            .select_from(ObjectsTable)
-            .filter(ObjectsTable.Start_Validity <= datetime.now(UTC))
-            .filter(ObjectsTable.Code.in_(codes))
-            .subquery()
-        )
-
+        subq: Subquery = self._object_repository.get_valid_subquery(ObjectsTable.Code.in_(codes))
         aliased_subq = aliased(ObjectsTable, subq)
         stmt = (
             select(aliased_subq)
-            .filter(subq.c._RowNumber == 1)
-            .filter(
-                or_(
-                    subq.c.End_Validity > datetime.now(UTC),
-                    subq.c.End_Validity.is_(None),
-                )
-            )
             .order_by(desc(subq.c.Modified_Date))
             .options(
                 load_only(
@@ -100,151 +83,31 @@ class EndpointHandler:
         return vertices
 
     def _get_edges(self) -> list[GraphEdge]:
-        relations: set[GraphEdge] = self._get_relations()
-        acknowledged_relations: set[GraphEdge] = self._get_valid_acknowledged_relations()
-
-        return list(set.union(relations, acknowledged_relations))
-
-    def _get_relations(self) -> set[GraphEdge]:
-        search_codes: set[str] = {
-            self._object.Code,
-        }
-        ignore_codes: set[str] = set()
-        edges: set[GraphEdge] = set()
-
-        for iteration_config in self._iterations_config.relations:
-            if not search_codes:
-                break
-
-            stmt = (
-                select(RelationsTable)
-                .filter(
-                    or_(
-                        and_(
-                            RelationsTable.From_Code.in_(search_codes),
-                            or_(
-                                *[
-                                    RelationsTable.To_Code.like(f"{object_type}-%")
-                                    for object_type in iteration_config.allowed_object_types
-                                ],
-                            ).self_group(),
-                        ).self_group(),
-                        and_(
-                            RelationsTable.To_Code.in_(search_codes),
-                            or_(
-                                *[
-                                    RelationsTable.From_Code.like(f"{object_type}-%")
-                                    for object_type in iteration_config.allowed_object_types
-                                ],
-                            ).self_group(),
-                        ).self_group(),
-                    )
-                )
-                .filter(RelationsTable.From_Code.not_in(ignore_codes))
-                .filter(RelationsTable.To_Code.not_in(ignore_codes))
+        graph: RelationGraph = self._relation_graph_index.get(self._session)
+        relations: set[GraphEdge] = {
+            GraphEdge(Type=GraphEdgeType.relation, Vertice_A_Code=from_code, Vertice_B_Code=to_code)
+            for from_code, to_code in graph.relations.walk(
+                self._object.Code,
+                [iteration.allowed_object_types for iteration in self._iterations_config.relations],
             )
-            rows: list[RelationsTable] = self._session.execute(stmt).scalars().all()
-
-            # Update the search and ignore codes for the next iteration
-            ignore_codes = set.union(ignore_codes, search_codes)
-            search_codes = set()
-
-            for row in rows:
-                edges.add(
-                    GraphEdge(
-                        Type=GraphEdgeType.relation,
-                        Vertice_A_Code=row.From_Code,
-                        Vertice_B_Code=row.To_Code,
-                    )
-                )
-
-                # Just add everything to search codes for now
-                # We intersect it later with ignore codes to only search for something we have not searched for before
-                search_codes.add(row.From_Code)
-                search_codes.add(row.To_Code)
-
-            # Remove everything from search_codes that is already in ignore_codes
-            search_codes = set.difference(search_codes, ignore_codes)
-
-        return edges
-
-    def _get_valid_acknowledged_relations(self) -> set[GraphEdge]:
-        search_codes: set[str] = {
-            self._object.Code,
         }
-        ignore_codes: set[str] = set()
-        edges: set[GraphEdge] = set()
-
-        for iteration_config in self._iterations_config.acknowledged_relations:
-            if not search_codes:
-                break
-
-            stmt = (
-                select(AcknowledgedRelationsTable)
-                .filter(
-                    or_(
-                        and_(
-                            AcknowledgedRelationsTable.From_Code.in_(search_codes),
-                            or_(
-                                *[
-                                    AcknowledgedRelationsTable.To_Code.like(f"{object_type}-%")
-                                    for object_type in iteration_config.allowed_object_types
-                                ],
-                            ).self_group(),
-                        ).self_group(),
-                        and_(
-                            AcknowledgedRelationsTable.To_Code.in_(search_codes),
-                            or_(
-                                *[
-                                    AcknowledgedRelationsTable.From_Code.like(f"{object_type}-%")
-                                    for object_type in iteration_config.allowed_object_types
-                                ],
-                            ).self_group(),
-                        ).self_group(),
-                    )
-                )
-                .filter(AcknowledgedRelationsTable.From_Code.not_in(ignore_codes))
-                .filter(AcknowledgedRelationsTable.To_Code.not_in(ignore_codes))
-                .filter(AcknowledgedRelationsTable.From_Acknowledged.is_not(None))
-                .filter(AcknowledgedRelationsTable.To_Acknowledged.is_not(None))
-                .options(
-                    load_only(
-                        AcknowledgedRelationsTable.From_Code,
-                        AcknowledgedRelationsTable.To_Code,
-                    )
-                )
+        acknowledged_relations: set[GraphEdge] = {
+            GraphEdge(Type=GraphEdgeType.acknowledged_relation, Vertice_A_Code=from_code, Vertice_B_Code=to_code)
+            for from_code, to_code in graph.acknowledged_relations.walk(
+                self._object.Code,
+                [iteration.allowed_object_types for iteration in self._iterations_config.acknowledged_relations],
             )
+        }
 
-            rows: list[AcknowledgedRelationsTable] = self._session.execute(stmt).scalars().all()
-
-            # Update the search and ignore codes for the next iteration
-            ignore_codes = set.union(ignore_codes, search_codes)
-            search_codes = set()
-
-            for row in rows:
-                edges.add(
-                    GraphEdge(
-                        Type=GraphEdgeType.acknowledged_relation,
-                        Vertice_A_Code=row.From_Code,
-                        Vertice_B_Code=row.To_Code,
-                    )
-                )
-
-                # Just add everything to search codes for now
-                # We intersect it later with ignore codes to only search for something we have not searched for before
-                search_codes.add(row.From_Code)
-                search_codes.add(row.To_Code)
-
-            # Remove everything from search_codes that is already in ignore_codes
-            search_codes = set.difference(search_codes, ignore_codes)
-
-        return edges
+        return list(set.union(relations, acknowledged_relations))
 
 
 def get_object_graph_endpoint(
     session: Annotated[Session, Depends(depends_db_session)],
     object_table: Annotated[ObjectsTable, Depends(depends_object_by_uuid)],
     context: Annotated[ObjectGraphEndpointContext, Depends()],
+    relation_graph_index: Annotated[RelationGraphIndex, Depends(Provide[ApiContainer.relation_graph_index])],
+    object_repository: Annotated[ObjectRepository, Depends(Provide[ApiContainer.object_repository])],
 ) -> GraphResponse:
-    handler = EndpointHandler(session, context.graph_iterations, object_table)
+    handler = EndpointHandler(session, relation_graph_index, object_repository, context.graph_iterations, object_table)
     return handler.handle()
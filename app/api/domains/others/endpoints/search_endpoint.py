@@ -1,17 +1,18 @@
-from datetime import UTC, datetime
 from typing import Annotated, Self
 
-from bs4 import BeautifulSoup
 from dependency_injector.wiring import Provide
 from fastapi import Body, Depends, HTTPException, status
 from pydantic import BaseModel, ConfigDict, Field, model_validator
-from sqlalchemy import Select, asc, desc, func, literal, or_, select, union_all
+from sqlalchemy import Select, Subquery, asc, desc, func, literal, or_, select, union_all
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session, depends_simple_pagination
 from app.api.domains.modules.services.module_objects_to_models_parser import ModuleObjectsToModelsParser
 from app.api.domains.modules.types import PublicModuleStatusCode
+from app.api.domains.objects.repositories.object_repository import ObjectRepository
+from app.api.domains.objects.repositories.plain_text_repository import PlainTextRepository, html_to_text
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.users.dependencies import depends_optional_current_user
 from app.api.endpoint import BaseEndpointContext
 from app.api.utils.pagination import (
@@ -35,6 +36,7 @@ class SearchEndpointContext(BaseEndpointContext):
     allowed_object_types: set[str]
     search_columns: set[str]
     used_columns: set[str]
+    full_text: bool = False
 
 
 class RequestData(BaseModel):
@@ -71,6 +73,7 @@ class SearchObject[T: BaseModel](BaseModel):
 
     Title: str
     Description: str
+    Score: float | None = None
     Model: T
 
     model_config = ConfigDict(from_attributes=True, title="SearchObject")
@@ -85,6 +88,9 @@ class EndpointHandler:
         context: SearchEndpointContext,
         request_data: RequestData,
         pagination: SimplePagination,
+        search_backend: SearchBackend,
+        plain_text_repository: PlainTextRepository,
+        object_repository: ObjectRepository,
     ):
         self._session: Session = session
         self._module_objects_to_models_parser: ModuleObjectsToModelsParser = module_objects_to_models_parser
@@ -92,11 +98,19 @@ class EndpointHandler:
         self._context: SearchEndpointContext = context
         self._request_data: RequestData = request_data
         self._pagination: SimplePagination = pagination
+        self._search_backend: SearchBackend = search_backend
+        self._plain_text_repository: PlainTextRepository = plain_text_repository
+        self._object_repository: ObjectRepository = object_repository
 
     def handle(self) -> PagedResponse[SearchObject]:
         if self._pagination.limit > 50:
             raise HTTPException(status.HTTP_422_UNPROCESSABLE_CONTENT, "Pagination limit is too high")
         self._request_data.validate_object_types(self._context.allowed_object_types)
+        if self._context.full_text:
+            try:
+                SearchBackend.to_phrase(self._request_data.query)
+            except ValueError as e:
+                raise HTTPException(status.HTTP_422_UNPROCESSABLE_CONTENT, str(e))
 
         paginated: PaginatedQueryResult = query_paginated_no_scalars(
             query=self._build_statement(),
@@ -113,16 +127,18 @@ class EndpointHandler:
             )
 
             description: str = ""
-            match getattr(row, "Description", None):
-                case str() as row_description:
-                    soup = BeautifulSoup(row_description, "html.parser")
-                    description = soup.get_text()
+            match getattr(row, "_Plain_Description", None), getattr(row, "Description", None):
+                case str() as plain_description, _:
+                    description = plain_description
+                case None, str() as row_description:
+                    description = html_to_text(row_description)
 
             search_object: SearchObject = SearchObject(
                 Module_ID=row.Module_ID or None,
                 Object_Type=row.Object_Type,
                 Title=row.Title or "",
                 Description=description,
+                Score=getattr(row, "_Rank", None),
                 Model=parsed_model,
             )
             search_objects.append(search_object)
@@ -143,45 +159,23 @@ class EndpointHandler:
 
         combined = union_all(*branches).subquery() if len(branches) > 1 else branches[0].subquery()
 
-        return select(combined).order_by(
+        stmt: Select = select(combined)
+        if self._context.full_text:
+            stmt = stmt.order_by(desc(combined.c._Rank))
+
+        return stmt.order_by(
             desc(combined.c.Modified_Date),
             desc(combined.c.Module_ID),
             asc(combined.c.UUID),
         )
 
     def _valid_branch(self) -> Select:
-        timepoint: datetime = datetime.now(UTC)
-        subq = (
-            select(
-                ObjectsTable,
-                func.row_number()
-                .over(
-                    partition_by=ObjectsTable.Code,
-                    order_by=desc(ObjectsTable.Modified_Date),
-                )
-                .label("_RowNumber"),
-            )
-            .select_from(ObjectsTable)
-            .filter(ObjectsTable.Start_Validity <= timepoint)
-            .subquery()
-        )
+        subq: Subquery = self._object_repository.get_valid_subquery()
 
-        return (
-            select(literal(0).label("Module_ID"), *[subq.c[name] for name in self._context.used_columns])
-            .filter(subq.c._RowNumber == 1)
-            .filter(
-                or_(
-                    subq.c.End_Validity > timepoint,
-                    subq.c.End_Validity.is_(None),
-                ).self_group()
-            )
-            .filter(
-                or_(
-                    *[subq.c[name].like(self._request_data.query) for name in self._context.search_columns]
-                ).self_group()
-            )
-            .filter(subq.c.Object_Type.in_(self._request_data.object_types))
-        )
+        stmt: Select = select(
+            literal(0).label("Module_ID"), *[subq.c[name] for name in self._context.used_columns]
+        ).filter(subq.c.Object_Type.in_(self._request_data.object_types))
+        return self._filter_query(stmt, subq, ObjectsTable.__tablename__)
 
     def _module_branch(self) -> Select:
         subq = (
@@ -231,17 +225,40 @@ class EndpointHandler:
 
         subq = subq.subquery()
 
-        return (
+        stmt: Select = (
             select(subq.c.Module_ID, *[subq.c[name] for name in self._context.used_columns])
             .filter(subq.c._RowNumber == 1)
             .filter(subq.c.Deleted == False)
-            .filter(
+            .filter(subq.c.Object_Type.in_(self._request_data.object_types))
+        )
+        return self._filter_query(stmt, subq, ModuleObjectsTable.__tablename__)
+
+    def _filter_query(self, stmt: Select, subq: Subquery, table_name: str) -> Select:
+        if "Description" in self._context.used_columns:
+            stmt = stmt.add_columns(
+                self._plain_text_repository.get_text_column(subq.c.UUID, "Description").label("_Plain_Description")
+            )
+
+        if not self._context.full_text:
+            return stmt.filter(
                 or_(
-                    *[subq.c[name].like(self._request_data.query) for name in self._context.search_columns]
+                    *[
+                        self._searchable_text(subq, name).like(self._request_data.query)
+                        for name in self._context.search_columns
+                    ]
                 ).self_group()
             )
-            .filter(subq.c.Object_Type.in_(self._request_data.object_types))
+
+        ranked: Subquery = self._search_backend.get_ranked_query(
+            self._session,
+            table_name,
+            self._request_data.query,
         )
+        return stmt.add_columns(ranked.c.Rank.label("_Rank")).join(ranked, ranked.c.UUID == subq.c.UUID)
+
+    def _searchable_text(self, subq: Subquery, name: str):
+        # Rows written before the plain texts existed fall back to the html
+        return func.coalesce(self._plain_text_repository.get_text_column(subq.c.UUID, name), subq.c[name])
 
 
 def get_search_endpoint(
@@ -253,6 +270,9 @@ def get_search_endpoint(
     user: Annotated[UsersTable | None, Depends(depends_optional_current_user)],
     context: Annotated[SearchEndpointContext, Depends()],
     request_data: Annotated[RequestData, Body()],
+    search_backend: Annotated[SearchBackend, Depends(Provide[ApiContainer.search_backend])],
+    plain_text_repository: Annotated[PlainTextRepository, Depends(Provide[ApiContainer.plain_text_repository])],
+    object_repository: Annotated[ObjectRepository, Depends(Provide[ApiContainer.object_repository])],
 ) -> PagedResponse[SearchObject]:
     handler: EndpointHandler = EndpointHandler(
         session,
@@ -261,6 +281,9 @@ def get_search_endpoint(
         context,
         request_data,
         pagination,
+        search_backend,
+        plain_text_repository,
+        object_repository,
     )
     results: PagedResponse[SearchObject] = handler.handle()
     return results
@@ -43,6 +43,7 @@ class ObjectRelatedFileRepository(BaseRepository):
             session=session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
             sort=(getattr(ObjectRelatedFileTable, pagination.sort.column), pagination.sort.order),
         )
@@ -50,6 +50,7 @@ class StorageFileRepository(BaseRepository):
             session=session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
             sort=(getattr(StorageFileTable, pagination.sort.column), pagination.sort.order),
         )
@@ -1 +1,3 @@
 from .pdf_meta_service import PdfMetaService
+from .relation_graph_index import RelationGraphIndex
+from .search_backend import MssqlSearchBackend, SearchBackend, SearchIndexConfig, SqliteSearchBackend
@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.db.session import register_commit_invalidation
+from app.core.tables.acknowledged_relations import AcknowledgedRelationsTable
+from app.core.tables.others import RelationsTable
+
+# Sessions carrying a RelationGraphIndex in their `info` invalidate it when they commit relation writes
+RELATION_GRAPH_INDEX_INFO_KEY = "relation_graph_index"
+
+WATCHED_TABLES: frozenset[str] = frozenset({"relations", "acknowledged_relations"})
+
+Edge = tuple[str, str]
+
+
+@dataclass
+class RelationAdjacency:
+    """
+    Edges as (From_Code, To_Code), in the order of the table, and the edges per code on either side.
+    """
+
+    edges: list[Edge] = field(default_factory=list)
+    by_code: dict[str, list[Edge]] = field(default_factory=lambda: defaultdict(list))
+
+    def add(self, edge: Edge) -> None:
+        self.edges.append(edge)
+        self.by_code[edge[0]].append(edge)
+        if edge[1] != edge[0]:
+            self.by_code[edge[1]].append(edge)
+
+    def walk(self, code: str, iterations: Sequence[Sequence[str]]) -> set[Edge]:
+        """
+        Breadth first from `code`, every iteration only follows edges to the object types allowed in that iteration.
+        Edges touching a code searched in an earlier iteration are skipped.
+        """
+        search_codes: set[str] = {code}
+        ignore_codes: set[str] = set()
+        edges: set[Edge] = set()
+
+        for allowed_object_types in iterations:
+            if not search_codes:
+                break
+
+            prefixes: tuple[str, ...] = tuple(f"{object_type}-" for object_type in allowed_object_types)
+            found: set[Edge] = set()
+            for search_code in search_codes:
+                for edge in self.by_code.get(search_code, []):
+                    other_code: str = edge[1] if edge[0] == search_code else edge[0]
+                    if other_code in ignore_codes or not other_code.startswith(prefixes):
+                        continue
+                    found.add(edge)
+
+            ignore_codes |= search_codes
+            search_codes = {edge_code for edge in found for edge_code in edge} - ignore_codes
+            edges |= found
+
+        return edges
+
+
+@dataclass
+class RelationGraph:
+    relations: RelationAdjacency
+    # Only the relations acknowledged by both sides
+    acknowledged_relations: RelationAdjacency
+
+
+class RelationGraphIndex:
+    """
+    In process adjacency index of the relations and acknowledged relations,
+    so the graph endpoints do not query the relations per iteration or on every call.
+
+    The index is dropped when a session commits a write to one of the `WATCHED_TABLES`,
+    the ttl bounds the staleness of writes made by other processes.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self._ttl_seconds: int = ttl_seconds
+        self._graph: RelationGraph | None = None
+        self._expires_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def get(self, session: Session) -> RelationGraph:
+        if not self.is_enabled():
+            return self._load(session)
+
+        with self._lock:
+            if self._graph is None or self._expires_at < time.monotonic():
+                self._graph = self._load(session)
+                self._expires_at = time.monotonic() + self._ttl_seconds
+            return self._graph
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._graph = None
+
+    def _load(self, session: Session) -> RelationGraph:
+        relations = RelationAdjacency()
+        for row in session.execute(select(RelationsTable.From_Code, RelationsTable.To_Code)):
+            relations.add((row.From_Code, row.To_Code))
+
+        acknowledged_relations = RelationAdjacency()
+        stmt = (
+            select(AcknowledgedRelationsTable.From_Code, AcknowledgedRelationsTable.To_Code)
+            .filter(AcknowledgedRelationsTable.From_Acknowledged.is_not(None))
+            .filter(AcknowledgedRelationsTable.To_Acknowledged.is_not(None))
+        )
+        for row in session.execute(stmt):
+            acknowledged_relations.add((row.From_Code, row.To_Code))
+
+        return RelationGraph(relations=relations, acknowledged_relations=acknowledged_relations)
+
+
+register_commit_invalidation(RELATION_GRAPH_INDEX_INFO_KEY, WATCHED_TABLES, RelationGraphIndex.invalidate)
@@ -0,0 +1,227 @@
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+from sqlalchemy import (
+    Float,
+    Insert,
+    Select,
+    Subquery,
+    Table,
+    bindparam,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from app.api.domains.objects.repositories.plain_text_repository import PlainTextRepository
+from app.core.db import table_metadata
+from app.core.services.main_config import MainConfig
+
+HIGH_WEIGHT: float = 1.0
+LOW_WEIGHT: float = 0.5
+
+
+class SearchIndexConfig(BaseModel):
+    table_name: str
+    searchable_columns_high: list[str] = Field(default_factory=list)
+    searchable_columns_low: list[str] = Field(default_factory=list)
+
+    @property
+    def columns(self) -> list[str]:
+        return self.searchable_columns_high + self.searchable_columns_low
+
+
+class SearchBackend(ABC):
+    """
+    Full text search over the tables configured in the `search_index` main config.
+
+    `get_ranked_query` returns a subquery with the `UUID` and relevance `Rank` of every
+    row (of any version) matching the query, to be joined on the table itself.
+
+    The plain text of the configured columns is kept in `plain_texts` by `sync`,
+    so search results can show it without parsing the html again.
+    """
+
+    def __init__(self, main_config: MainConfig, plain_text_repository: PlainTextRepository):
+        self._plain_text_repository: PlainTextRepository = plain_text_repository
+        main_config_dict: dict = main_config.get_main_config()
+        self._configs: dict[str, SearchIndexConfig] = {
+            config.table_name: config
+            for config in (SearchIndexConfig.model_validate(c) for c in main_config_dict.get("search_index", []))
+        }
+
+    @staticmethod
+    def to_phrase(query: str) -> str:
+        # The query might still be given as a LIKE pattern, so wildcards are ignored
+        phrase: str = re.sub(r'["*%\\]', " ", query)
+        phrase = " ".join(phrase.split())
+        if not phrase:
+            raise ValueError("Search query has no words")
+        return phrase
+
+    @abstractmethod
+    def get_ranked_query(self, session: Session, table_name: str, query: str) -> Subquery:
+        pass
+
+    def sync(self, session: Session, table_name: str, uuids: Iterable[UUID]) -> None:
+        """
+        Called after rows are written, with the UUIDs of the written rows.
+        """
+        config: SearchIndexConfig | None = self._configs.get(table_name)
+        if config is None or not config.columns:
+            return
+        self._plain_text_repository.refresh(session, self._source_table(table_name), config.columns, uuids)
+
+    def rebuild(self, session: Session) -> None:
+        self.refresh_plain_texts(session)
+
+    def refresh_plain_texts(self, session: Session) -> int:
+        count: int = 0
+        for config in self._configs.values():
+            if config.columns:
+                source: Table = self._source_table(config.table_name)
+                count += self._plain_text_repository.refresh_all(session, source, config.columns)
+        return count
+
+    def _get_config(self, table_name: str) -> SearchIndexConfig:
+        config: SearchIndexConfig | None = self._configs.get(table_name)
+        if config is None or not config.columns:
+            raise RuntimeError(f"No search index configured for table '{table_name}'")
+        return config
+
+    def _source_table(self, table_name: str) -> Table:
+        return table_metadata.tables[table_name]
+
+
+class SqliteSearchBackend(SearchBackend):
+    """
+    Keeps an FTS5 table `<table_name>_fts` per configured table.
+    The index is created on first use and updated through `sync` by the write paths.
+    """
+
+    def get_ranked_query(self, session: Session, table_name: str, query: str) -> Subquery:
+        config: SearchIndexConfig = self._get_config(table_name)
+        self._ensure_index(session, config)
+
+        fts_name: str = self._fts_name(table_name)
+        weights: list[str] = ["0"]
+        weights += [str(HIGH_WEIGHT)] * len(config.searchable_columns_high)
+        weights += [str(LOW_WEIGHT)] * len(config.searchable_columns_low)
+
+        # bm25 is lower for better matches
+        stmt = text(
+            f"""
+                SELECT UUID, -bm25({fts_name}, {", ".join(weights)}) AS Rank
+                FROM {fts_name}
+                WHERE {fts_name} MATCH :{fts_name}_query
+            """
+        ).bindparams(bindparam(f"{fts_name}_query", f'"{self.to_phrase(query)}" *'))
+
+        source: Table = self._source_table(table_name)
+        return stmt.columns(column("UUID", source.c.UUID.type), column("Rank", Float)).subquery(f"{fts_name}_ranked")
+
+    def sync(self, session: Session, table_name: str, uuids: Iterable[UUID]) -> None:
+        config: SearchIndexConfig | None = self._configs.get(table_name)
+        unique_uuids: set[UUID] = set(uuids)
+        if config is None or not config.columns or not unique_uuids:
+            return
+        super().sync(session, table_name, unique_uuids)
+        if self._ensure_index(session, config):
+            return
+
+        source: Table = self._source_table(table_name)
+        fts = self._fts_table(config, source)
+        session.execute(delete(fts).where(fts.c.UUID.in_(unique_uuids)))
+        session.execute(self._build_insert(config, source, unique_uuids))
+
+    def rebuild(self, session: Session) -> None:
+        super().rebuild(session)
+        for config in self._configs.values():
+            session.execute(text(f"DROP TABLE IF EXISTS {self._fts_name(config.table_name)}"))
+            self._ensure_index(session, config)
+
+    def _ensure_index(self, session: Session, config: SearchIndexConfig) -> bool:
+        """
+        Returns True if the index had to be created, in which case it is filled with all rows.
+        """
+        fts_name: str = self._fts_name(config.table_name)
+        exists = session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": fts_name},
+        ).first()
+        if exists:
+            return False
+
+        session.execute(
+            text(f"CREATE VIRTUAL TABLE {fts_name} USING fts5(UUID UNINDEXED, {', '.join(config.columns)})")
+        )
+        source: Table = self._source_table(config.table_name)
+        session.execute(self._build_insert(config, source))
+        return True
+
+    def _build_insert(self, config: SearchIndexConfig, source: Table, uuids: set[UUID] | None = None) -> Insert:
+        # Index the plain text where it is known, so html markup does not end up in the index
+        rows_stmt: Select = select(
+            source.c.UUID,
+            *[
+                func.coalesce(self._plain_text_repository.get_text_column(source.c.UUID, name), source.c[name])
+                for name in config.columns
+            ],
+        )
+        if uuids is not None:
+            rows_stmt = rows_stmt.filter(source.c.UUID.in_(uuids))
+
+        fts = self._fts_table(config, source)
+        return insert(fts).from_select(["UUID", *config.columns], rows_stmt)
+
+    def _fts_table(self, config: SearchIndexConfig, source: Table):
+        return table(
+            self._fts_name(config.table_name),
+            column("UUID", source.c.UUID.type),
+            *[column(name) for name in config.columns],
+        )
+
+    def _fts_name(self, table_name: str) -> str:
+        return f"{table_name}_fts"
+
+
+class MssqlSearchBackend(SearchBackend):
+    """
+    Uses the full text indexes created by the `mssql-setup-search-database` command.
+    Those track changes automatically, so `sync` only maintains the plain texts.
+    """
+
+    def get_ranked_query(self, session: Session, table_name: str, query: str) -> Subquery:
+        config: SearchIndexConfig = self._get_config(table_name)
+        param_name: str = f"{table_name}_query"
+
+        ranked_selects: list[str] = []
+        if config.searchable_columns_high:
+            ranked_selects.append(
+                f"SELECT RANK * {HIGH_WEIGHT} AS Rank, [KEY] FROM CONTAINSTABLE({table_name}, "
+                f"({', '.join(config.searchable_columns_high)}), :{param_name})"
+            )
+        if config.searchable_columns_low:
+            ranked_selects.append(
+                f"SELECT RANK * {LOW_WEIGHT} AS Rank, [KEY] FROM CONTAINSTABLE({table_name}, "
+                f"({', '.join(config.searchable_columns_low)}), :{param_name})"
+            )
+
+        stmt = text(
+            f"""
+                SELECT [KEY] AS UUID, SUM(Rank) AS Rank
+                FROM ({" UNION ALL ".join(ranked_selects)}) AS x
+                GROUP BY [KEY]
+            """
+        ).bindparams(bindparam(param_name, f'"{self.to_phrase(query)}*"'))
+
+        source: Table = self._source_table(table_name)
+        return stmt.columns(column("UUID", source.c.UUID.type), column("Rank", Float)).subquery(f"{table_name}_ranked")
@@ -7,6 +7,9 @@ from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session
+from app.api.domains.publications.repository.publication_act_package_job_repository import (
+    PublicationActPackageJobRepository,
+)
 from app.api.domains.publications.repository.publication_act_package_repository import PublicationActPackageRepository
 from app.api.domains.publications.repository.publication_act_report_repository import PublicationActReportRepository
 from app.api.domains.publications.repository.publication_act_repository import PublicationActRepository
@@ -20,6 +23,9 @@ from app.api.domains.publications.repository.publication_announcement_repository
     PublicationAnnouncementRepository,
 )
 from app.api.domains.publications.repository.publication_environment_repository import PublicationEnvironmentRepository
+from app.api.domains.publications.repository.publication_pdf_export_job_repository import (
+    PublicationPdfExportJobRepository,
+)
 from app.api.domains.publications.repository.publication_repository import PublicationRepository
 from app.api.domains.publications.repository.publication_template_repository import PublicationTemplateRepository
 from app.api.domains.publications.repository.publication_version_attachment_repository import (
@@ -28,6 +34,7 @@ from app.api.domains.publications.repository.publication_version_attachment_repo
 from app.api.domains.publications.repository.publication_version_repository import PublicationVersionRepository
 from app.api.domains.publications.repository.publication_zip_repository import PublicationZipRepository
 from app.core.tables.publications import (
+    PublicationActPackageJobTable,
     PublicationActPackageReportTable,
     PublicationActPackageTable,
     PublicationActTable,
@@ -36,6 +43,7 @@ from app.core.tables.publications import (
     PublicationAnnouncementTable,
     PublicationEnvironmentTable,
     PublicationPackageZipTable,
+    PublicationPdfExportJobTable,
     PublicationTable,
     PublicationTemplateTable,
     PublicationVersionAttachmentTable,
@@ -230,3 +238,31 @@ def depends_publication_act_active(
     if not act.Is_Active:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Publicatie regeling is gesloten")
     return act
+
+
+@inject
+def depends_publication_pdf_export_job(
+    job_uuid: uuid.UUID,
+    session: Annotated[Session, Depends(depends_db_session)],
+    repository: Annotated[
+        PublicationPdfExportJobRepository, Depends(Provide[ApiContainer.publication.pdf_export_job_repository])
+    ],
+) -> PublicationPdfExportJobTable:
+    maybe_job: PublicationPdfExportJobTable | None = repository.get_by_uuid(session, job_uuid)
+    if not maybe_job:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Pdf export niet gevonden")
+    return maybe_job
+
+
+@inject
+def depends_publication_act_package_job(
+    job_uuid: uuid.UUID,
+    session: Annotated[Session, Depends(depends_db_session)],
+    repository: Annotated[
+        PublicationActPackageJobRepository, Depends(Provide[ApiContainer.publication.act_package_job_repository])
+    ],
+) -> PublicationActPackageJobTable:
+    maybe_job: PublicationActPackageJobTable | None = repository.get_by_uuid(session, job_uuid)
+    if not maybe_job:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Publication act package job niet gevonden")
+    return maybe_job
@@ -74,6 +74,7 @@ def post_create_environment_endpoint(
             Environment_UUID=environment.UUID,
             Adjust_On_UUID=None,
             State=(InitialState().state_dict()),
+            Schema_Version=InitialState.get_schema_version(),
             Is_Activated=True,
             Activated_Datetime=timepoint,
             Created_Date=timepoint,
@@ -1,5 +1,6 @@
 from .abort_act_package_endpoint import post_abort_act_package_endpoint
 from .create_act_package_endpoint import post_create_act_package_endpoint
+from .detail_act_package_job_endpoint import get_detail_act_package_job_endpoint
 from .download_act_package_endpoint import get_download_act_package_endpoint
 from .list_act_packages_endpoint import get_list_act_packages_endpoint
 from .validate_act_package_endpoint import get_validate_act_package_endpoint
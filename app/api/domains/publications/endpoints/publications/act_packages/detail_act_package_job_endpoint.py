@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.api.domains.publications.dependencies import depends_publication_act_package_job
+from app.api.domains.publications.types.models import PublicationActPackageJob
+from app.api.domains.users.dependencies import depends_current_user_with_permission_curried
+from app.api.permissions import Permissions
+from app.core.tables.publications import PublicationActPackageJobTable
+from app.core.tables.users import UsersTable
+
+
+def get_detail_act_package_job_endpoint(
+    job: Annotated[PublicationActPackageJobTable, Depends(depends_publication_act_package_job)],
+    _: Annotated[
+        UsersTable,
+        Depends(
+            depends_current_user_with_permission_curried(
+                Permissions.publication_can_view_publication_act_package,
+            )
+        ),
+    ],
+) -> PublicationActPackageJob:
+    return PublicationActPackageJob.model_validate(job)
@@ -1,18 +1,25 @@
 from datetime import UTC, datetime
 from typing import Annotated
 
-from fastapi import Depends, Response
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Request, Response
 from sqlalchemy.orm import Session
 
+from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session
 from app.api.domains.publications.dependencies import depends_publication_zip_by_act_package
+from app.api.domains.publications.repository import PublicationZipRepository
 from app.api.domains.users.dependencies import depends_current_user_with_permission_curried
 from app.api.permissions import Permissions
+from app.api.utils.binary_response import binary_response
+from app.core.db.session import SessionFactoryType
 from app.core.tables.publications import PublicationPackageZipTable
 from app.core.tables.users import UsersTable
 
 
+@inject
 def get_download_act_package_endpoint(
+    request: Request,
     package_zip: Annotated[PublicationPackageZipTable, Depends(depends_publication_zip_by_act_package)],
     user: Annotated[
         UsersTable,
@@ -23,18 +30,26 @@ def get_download_act_package_endpoint(
         ),
     ],
     session: Annotated[Session, Depends(depends_db_session)],
+    zip_repository: Annotated[PublicationZipRepository, Depends(Provide[ApiContainer.publication.zip_repository])],
+    db_session_factory: Annotated[SessionFactoryType, Depends(Provide[ApiContainer.db_session_factory])],
 ) -> Response:
     package_zip.Latest_Download_Date = datetime.now(UTC)
     package_zip.Latest_Download_By_UUID = user.UUID
 
     filename = package_zip.Filename
-    content = package_zip.Binary
+    size: int = zip_repository.get_binary_size(session, package_zip.UUID)
 
     session.add(package_zip)
     session.commit()
 
-    return Response(
-        content=content,
+    return binary_response(
+        request,
+        db_session_factory,
+        PublicationPackageZipTable.Binary,
+        package_zip.UUID,
+        size=size,
+        checksum=package_zip.Checksum,
+        last_modified=package_zip.Created_Date,
         media_type="application/x-zip-compressed",
         headers={
             "Access-Control-Expose-Headers": "Content-Disposition",
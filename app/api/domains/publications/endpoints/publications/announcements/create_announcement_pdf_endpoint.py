@@ -1,9 +1,7 @@
 from typing import Annotated
 
-import requests
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
@@ -17,17 +15,18 @@ from app.api.domains.publications.services.announcement_package.announcement_pac
 from app.api.domains.publications.services.announcement_package.announcement_package_builder_factory import (
     AnnouncementPackageBuilderFactory,
 )
+from app.api.domains.publications.services.pdf_export_job_queue import PdfExportJobQueue
 from app.api.domains.publications.services.pdf_export_service import (
-    PdfExportError,
     PdfExportService,
     PdfExportUnavailableError,
 )
 from app.api.domains.publications.types.enums import PackageType
+from app.api.domains.publications.types.models import PublicationPdfExportJob
 from app.api.domains.publications.types.zip import ZipData
 from app.api.domains.users.dependencies import depends_current_user_with_permission_curried
 from app.api.exceptions import LoggedHttpException
 from app.api.permissions import Permissions
-from app.core.tables.publications import PublicationAnnouncementTable
+from app.core.tables.publications import PublicationAnnouncementTable, PublicationPdfExportJobTable
 from app.core.tables.users import UsersTable
 
 
@@ -50,7 +49,8 @@ def post_create_announcement_pdf_endpoint(
         ),
     ],
     pdf_export_service: Annotated[PdfExportService, Depends(Provide[ApiContainer.publication.pdf_export_service])],
-) -> StreamingResponse:
+    pdf_export_job_queue: Annotated[PdfExportJobQueue, Depends(Provide[ApiContainer.publication.pdf_export_job_queue])],
+) -> PublicationPdfExportJob:
     if not announcement.Publication.Module.is_active:
         raise HTTPException(status.HTTP_409_CONFLICT, "This module is not active")
 
@@ -68,22 +68,19 @@ def post_create_announcement_pdf_endpoint(
         package_builder.build_publication_files()
         zip_data: ZipData = package_builder.zip_files()
 
-        pdf_response: requests.Response = pdf_export_service.create_pdf(
-            announcement.Publication.Environment.Code or "",
-            zip_data,
-        )
-
         filename: str = f"{zip_data.Filename.removesuffix('.zip')}.pdf"
-        response = StreamingResponse(
-            pdf_response.iter_content(chunk_size=1024),
-            media_type="application/pdf",
-            headers={
-                "Access-Control-Expose-Headers": "Content-Disposition",
-                "Content-Disposition": f"attachment; filename={filename}",
-            },
+
+        # The preview api takes up to a minute, so the pdf is generated in the background
+        job: PublicationPdfExportJobTable = pdf_export_job_queue.create_job(
+            announcement.Publication.Environment.Code or "",
+            filename,
+            user.UUID,
         )
+        session.add(job)
+        session.commit()
+        pdf_export_job_queue.submit(job, zip_data)
 
-        return response
+        return PublicationPdfExportJob.model_validate(job)
 
     except HTTPException:
         # This is already correctly formatted
@@ -92,8 +89,6 @@ def post_create_announcement_pdf_endpoint(
         raise HTTPException(441, e.errors())
     except DSOConfigurationException as e:
         raise LoggedHttpException(status_code=442, detail=e.message)
-    except PdfExportError as e:
-        raise LoggedHttpException(status_code=444, detail=e.msg)
     except Exception:
         # We do not know what to except here
         # This will result in a 500 server error
@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
 from app.api.api_container import ApiContainer
-from app.api.dependencies import depends_db_session, depends_optional_sorted_pagination
+from app.api.dependencies import depends_db_session, depends_keyset_sorted_pagination
 from app.api.domains.publications.services.unified_packages_provider import UnifiedPackagesProvider
 from app.api.domains.publications.types.enums import DocumentType, PackageType, PublicationType, ReportStatusType
 from app.api.domains.users.dependencies import depends_current_user_with_permission_curried
@@ -40,7 +40,7 @@ class UnifiedPackage(BaseModel):
 
 @inject
 def get_list_unified_packages_endpoint(
-    optional_pagination: Annotated[OptionalSortedPagination, Depends(depends_optional_sorted_pagination)],
+    optional_pagination: Annotated[OptionalSortedPagination, Depends(depends_keyset_sorted_pagination)],
     session: Annotated[Session, Depends(depends_db_session)],
     unified_packages_provider: Annotated[
         UnifiedPackagesProvider, Depends(Provide[ApiContainer.publication.unified_packages_provider])
@@ -79,6 +79,7 @@ def get_list_unified_packages_endpoint(
 
     return PagedResponse[UnifiedPackage](
         total=paginated_result.total_count,
+        next_cursor=paginated_result.next_cursor,
         offset=pagination.offset,
         limit=pagination.limit,
         results=results,
@@ -0,0 +1,2 @@
+from .detail_pdf_export_job_endpoint import get_detail_pdf_export_job_endpoint
+from .download_pdf_export_job_endpoint import get_download_pdf_export_job_endpoint
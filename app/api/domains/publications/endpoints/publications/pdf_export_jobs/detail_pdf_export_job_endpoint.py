@@ -0,0 +1,19 @@
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+
+from app.api.domains.publications.dependencies import depends_publication_pdf_export_job
+from app.api.domains.publications.types.models import PublicationPdfExportJob
+from app.api.domains.users.dependencies import depends_current_user
+from app.core.tables.publications import PublicationPdfExportJobTable
+from app.core.tables.users import UsersTable
+
+
+def get_detail_pdf_export_job_endpoint(
+    job: Annotated[PublicationPdfExportJobTable, Depends(depends_publication_pdf_export_job)],
+    user: Annotated[UsersTable, Depends(depends_current_user)],
+) -> PublicationPdfExportJob:
+    if job.Created_By_UUID != user.UUID:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Only the requester can access this pdf export")
+
+    return PublicationPdfExportJob.model_validate(job)
@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Response, status
+
+from app.api.domains.publications.dependencies import depends_publication_pdf_export_job
+from app.api.domains.publications.types.enums import PdfExportJobStatus
+from app.api.domains.users.dependencies import depends_current_user
+from app.core.tables.publications import PublicationPdfExportJobTable
+from app.core.tables.users import UsersTable
+
+
+def get_download_pdf_export_job_endpoint(
+    job: Annotated[PublicationPdfExportJobTable, Depends(depends_publication_pdf_export_job)],
+    user: Annotated[UsersTable, Depends(depends_current_user)],
+) -> Response:
+    if job.Created_By_UUID != user.UUID:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Only the requester can access this pdf export")
+    if job.Status != PdfExportJobStatus.COMPLETED or job.Binary is None:
+        raise HTTPException(status.HTTP_409_CONFLICT, f"Pdf export is not completed (status {job.Status})")
+
+    return Response(
+        content=job.Binary,
+        media_type="application/pdf",
+        headers={
+            "Access-Control-Expose-Headers": "Content-Disposition",
+            "Content-Disposition": f"attachment; filename={job.Filename}",
+        },
+    )
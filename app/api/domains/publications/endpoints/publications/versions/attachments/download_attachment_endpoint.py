@@ -1,18 +1,28 @@
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, Response, status
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, HTTPException, Request, Response, status
 
+from app.api.api_container import ApiContainer
 from app.api.domains.publications.dependencies import (
     depends_publication_version,
     depends_publication_version_attachment,
 )
 from app.api.domains.users.dependencies import depends_current_user_with_permission_curried
 from app.api.permissions import Permissions
-from app.core.tables.publications import PublicationVersionAttachmentTable, PublicationVersionTable
+from app.api.utils.binary_response import binary_response
+from app.core.db.session import SessionFactoryType
+from app.core.tables.publications import (
+    PublicationStorageFileTable,
+    PublicationVersionAttachmentTable,
+    PublicationVersionTable,
+)
 from app.core.tables.users import UsersTable
 
 
+@inject
 def get_download_attachment_endpoint(
+    request: Request,
     version: Annotated[PublicationVersionTable, Depends(depends_publication_version)],
     attachment: Annotated[PublicationVersionAttachmentTable, Depends(depends_publication_version_attachment)],
     user: Annotated[
@@ -23,19 +33,25 @@ def get_download_attachment_endpoint(
             )
         ),
     ],
+    db_session_factory: Annotated[SessionFactoryType, Depends(Provide[ApiContainer.db_session_factory])],
 ) -> Response:
     _guard(version, attachment)
-    filename = attachment.File.Filename
-    content = attachment.File.Binary
-    content_type = attachment.File.Content_Type
+    storage_file: PublicationStorageFileTable = attachment.File
+    filename = storage_file.Filename
+    content_type = storage_file.Content_Type
 
-    return Response(
-        content=content,
+    return binary_response(
+        request,
+        db_session_factory,
+        PublicationStorageFileTable.Binary,
+        storage_file.UUID,
+        size=storage_file.Size,
+        checksum=storage_file.Checksum,
+        last_modified=storage_file.Created_Date,
         media_type=content_type,
         headers={
             "Access-Control-Expose-Headers": "Content-Disposition",
             "Content-Disposition": f"attachment; filename={filename}",
-            "Content-Length": str(len(content)),
         },
     )
 
@@ -1,9 +1,7 @@
 from typing import Annotated
 
-import requests
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ValidationError
 from pydantic_core import ErrorDetails
 from sqlalchemy.orm import Session
@@ -14,19 +12,20 @@ from app.api.domains.publications.dependencies import depends_publication_versio
 from app.api.domains.publications.exceptions import DSOConfigurationException, DSORenvooiException
 from app.api.domains.publications.services.act_package.act_package_builder import ActPackageBuilder
 from app.api.domains.publications.services.act_package.act_package_builder_factory import ActPackageBuilderFactory
+from app.api.domains.publications.services.pdf_export_job_queue import PdfExportJobQueue
 from app.api.domains.publications.services.pdf_export_service import (
-    PdfExportError,
     PdfExportService,
     PdfExportUnavailableError,
 )
 from app.api.domains.publications.services.publication_version_validator import PublicationVersionValidator
 from app.api.domains.publications.services.validate_publication_service import ValidatePublicationException
 from app.api.domains.publications.types.enums import MutationStrategy, PackageType
+from app.api.domains.publications.types.models import PublicationPdfExportJob
 from app.api.domains.publications.types.zip import ZipData
 from app.api.domains.users.dependencies import depends_current_user_with_permission_curried
 from app.api.exceptions import LoggedHttpException
 from app.api.permissions import Permissions
-from app.core.tables.publications import PublicationVersionTable
+from app.core.tables.publications import PublicationPdfExportJobTable, PublicationVersionTable
 from app.core.tables.users import UsersTable
 
 
@@ -51,8 +50,9 @@ def post_create_version_pdf_endpoint(
         ActPackageBuilderFactory, Depends(Provide[ApiContainer.publication.act_package_builder_factory])
     ],
     pdf_export_service: Annotated[PdfExportService, Depends(Provide[ApiContainer.publication.pdf_export_service])],
+    pdf_export_job_queue: Annotated[PdfExportJobQueue, Depends(Provide[ApiContainer.publication.pdf_export_job_queue])],
     object_in: PublicationPackagePdf,
-) -> StreamingResponse:
+) -> PublicationPdfExportJob:
     _guard_publication(validator, version)
 
     try:
@@ -70,23 +70,20 @@ def post_create_version_pdf_endpoint(
         package_builder.build_publication_files()
         zip_data: ZipData = package_builder.zip_files()
 
-        pdf_response: requests.Response = pdf_export_service.create_pdf(
-            version.Publication.Environment.Code or "",
-            zip_data,
-        )
-
         mutation_strategy: MutationStrategy = object_in.Mutation or MutationStrategy(version.Mutation_Strategy)
         filename: str = f"{zip_data.Filename.removesuffix('.zip')}-{mutation_strategy.value}.pdf"
-        response = StreamingResponse(
-            pdf_response.iter_content(chunk_size=1024),
-            media_type="application/pdf",
-            headers={
-                "Access-Control-Expose-Headers": "Content-Disposition",
-                "Content-Disposition": f"attachment; filename={filename}",
-            },
+
+        # The preview api takes up to a minute, so the pdf is generated in the background
+        job: PublicationPdfExportJobTable = pdf_export_job_queue.create_job(
+            version.Publication.Environment.Code or "",
+            filename,
+            user.UUID,
         )
+        session.add(job)
+        session.commit()
+        pdf_export_job_queue.submit(job, zip_data)
 
-        return response
+        return PublicationPdfExportJob.model_validate(job)
 
     except HTTPException:
         # This is already correctly formatted
@@ -99,8 +96,6 @@ def post_create_version_pdf_endpoint(
         raise LoggedHttpException(status_code=443, detail=e.message, log_message=e.internal_error)
     except ValidatePublicationException as e:
         raise LoggedHttpException(status_code=444, detail=e.dump_errors(), log_message=e.dump_errors())
-    except PdfExportError as e:
-        raise LoggedHttpException(status_code=444, detail=e.msg)
     except Exception:
         # We do not know what to except here
         # This will result in a 500 server error
@@ -35,6 +35,8 @@ class PublicationContainer(containers.DeclarativeContainer):
     object_field_mapping_provider = providers.Dependency()
     publication_required_object_fields_rule_mapping = providers.Dependency()
     dso_gebiedsaanwijzingen_factory = providers.Dependency()
+    module_object_delta_repository = providers.Dependency()
+    db_session_factory = providers.Dependency()
 
     act_package_repository = providers.Singleton(repositories.PublicationActPackageRepository)
     act_report_repository = providers.Singleton(repositories.PublicationActReportRepository)
@@ -45,13 +47,23 @@ class PublicationContainer(containers.DeclarativeContainer):
     announcement_repository = providers.Singleton(repositories.PublicationAnnouncementRepository)
     aoj_repository = providers.Singleton(repositories.PublicationAOJRepository)
     environment_repository = providers.Singleton(repositories.PublicationEnvironmentRepository)
-    object_repository = providers.Singleton(repositories.PublicationObjectRepository)
+    environment_state_repository = providers.Singleton(repositories.PublicationEnvironmentStateRepository)
+    object_repository = providers.Singleton(
+        repositories.PublicationObjectRepository,
+        module_object_delta_repository=module_object_delta_repository,
+    )
     publication_repository = providers.Singleton(repositories.PublicationRepository)
     storage_file_repository = providers.Singleton(repositories.PublicationStorageFileRepository)
     template_repository = providers.Singleton(repositories.PublicationTemplateRepository)
     version_attachment_repository = providers.Singleton(repositories.PublicationVersionAttachmentRepository)
     version_repository = providers.Singleton(repositories.PublicationVersionRepository)
-    zip_repository = providers.Singleton(repositories.PublicationZipRepository)
+    pdf_export_job_repository = providers.Singleton(repositories.PublicationPdfExportJobRepository)
+    act_package_job_repository = providers.Singleton(repositories.PublicationActPackageJobRepository)
+    zip_repository = providers.Selector(
+        config.DB_TYPE,
+        sqlite=providers.Singleton(repositories.SqlitePublicationZipRepository),
+        mssql=providers.Singleton(repositories.MssqlPublicationZipRepository),
+    )
 
     act_defaults_provider = providers.Factory(
         services.ActDefaultsProvider,
@@ -60,9 +72,23 @@ class PublicationContainer(containers.DeclarativeContainer):
     act_frbr_provider = providers.Singleton(services.ActFrbrProvider)
     bill_frbr_provider = providers.Singleton(services.BillFrbrProvider)
     doc_frbr_provider = providers.Singleton(services.DocFrbrProvider)
+    koop_client = providers.Singleton(
+        services.KoopClient,
+        koop_settings=config.PUBLICATION_KOOP,
+        timeout_seconds=config.KOOP_TIMEOUT_SECONDS,
+        max_retries=config.KOOP_MAX_RETRIES,
+        backoff_seconds=config.KOOP_RETRY_BACKOFF_SECONDS,
+        circuit_failure_threshold=config.KOOP_CIRCUIT_FAILURE_THRESHOLD,
+        circuit_reset_seconds=config.KOOP_CIRCUIT_RESET_SECONDS,
+    )
     pdf_export_service = providers.Singleton(
         services.PdfExportService,
-        koop_settings=config.PUBLICATION_KOOP,
+        koop_client=koop_client,
+    )
+    pdf_export_job_queue = providers.Singleton(
+        services.PdfExportJobQueue,
+        pdf_export_service=pdf_export_service,
+        db_session_factory=db_session_factory,
     )
     announcement_defaults_provider = providers.Factory(
         services.PublicationAnnouncementDefaultsProvider,
@@ -74,7 +100,11 @@ class PublicationContainer(containers.DeclarativeContainer):
     )
     version_validator = providers.Singleton(services.PublicationVersionValidator)
     purpose_provider = providers.Singleton(services.PurposeProvider)
-    template_parser = providers.Singleton(services.TemplateParser)
+    template_parser = providers.Singleton(
+        services.TemplateParser,
+        cache_size=config.PUBLICATION_TEMPLATE_CACHE_SIZE,
+        bytecode_cache_dir=config.PUBLICATION_TEMPLATE_BYTECODE_CACHE_DIR,
+    )
 
     documents_provider = providers.Singleton(
         act_package_services.PublicationDocumentsProvider,
@@ -119,9 +149,9 @@ class PublicationContainer(containers.DeclarativeContainer):
     )
     publication_gios_provider_factory = providers.Factory(
         act_package_services.PublicationGiosProviderFactory,
-        area_repository=area_repository,
+        area_geometry_repository=area_geometry_repository,
     )
-    act_publication_data_provider = providers.Factory(
+    act_publication_data_provider = providers.Singleton(
         act_package_services.ActPublicationDataProvider,
         publication_object_provider=publication_object_provider,
         publication_asset_provider=publication_asset_provider,
@@ -131,6 +161,8 @@ class PublicationContainer(containers.DeclarativeContainer):
         publication_documents_provider=documents_provider,
         publication_aoj_repository=aoj_repository,
         template_parser=template_parser,
+        db_session_factory=db_session_factory,
+        max_workers=config.PUBLICATION_DATA_MAX_WORKERS,
     )
 
     state_version_factory = providers.Factory(
@@ -204,6 +236,12 @@ class PublicationContainer(containers.DeclarativeContainer):
         data_patcher_factory=api_act_input_data_patcher_factory,
         validate_publication_service=validate_publication_service,
     )
+    act_package_job_queue = providers.Singleton(
+        act_package_services.ActPackageJobQueue,
+        package_builder_factory=act_package_builder_factory,
+        zip_repository=zip_repository,
+        db_session_factory=db_session_factory,
+    )
     announcement_package_builder_factory = providers.Singleton(
         announcement_package_services.AnnouncementPackageBuilderFactory,
         doc_frbr_provider=doc_frbr_provider,
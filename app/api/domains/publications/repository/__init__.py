@@ -1,3 +1,5 @@
+from .mssql_publication_zip_repository import MssqlPublicationZipRepository
+from .publication_act_package_job_repository import PublicationActPackageJobRepository
 from .publication_act_package_repository import PublicationActPackageRepository
 from .publication_act_report_repository import PublicationActReportRepository
 from .publication_act_repository import PublicationActRepository
@@ -7,10 +9,13 @@ from .publication_announcement_report_repository import PublicationAnnouncementR
 from .publication_announcement_repository import PublicationAnnouncementRepository
 from .publication_aoj_repository import PublicationAOJRepository
 from .publication_environment_repository import PublicationEnvironmentRepository
+from .publication_environment_state_repository import PublicationEnvironmentStateRepository
 from .publication_object_repository import PublicationObjectRepository
+from .publication_pdf_export_job_repository import PublicationPdfExportJobRepository
 from .publication_repository import PublicationRepository
 from .publication_storage_file_repository import PublicationStorageFileRepository
 from .publication_template_repository import PublicationTemplateRepository
 from .publication_version_attachment_repository import PublicationVersionAttachmentRepository
 from .publication_version_repository import PublicationVersionRepository
 from .publication_zip_repository import PublicationZipRepository
+from .sqlite_publication_zip_repository import SqlitePublicationZipRepository
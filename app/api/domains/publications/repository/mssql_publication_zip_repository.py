@@ -0,0 +1,37 @@
+from typing import BinaryIO
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, LargeBinary, bindparam, func, text
+from sqlalchemy.orm import Session
+
+from app.api.domains.publications.repository.publication_zip_repository import (
+    WRITE_CHUNK_BYTES,
+    PublicationZipRepository,
+)
+from app.core.tables.publications import PublicationPackageZipTable
+
+
+class MssqlPublicationZipRepository(PublicationZipRepository):
+    def _binary_length(self) -> ColumnElement[int]:
+        return func.datalength(PublicationPackageZipTable.Binary)
+
+    def _write_chunks(self, session: Session, zip_uuid: UUID, file: BinaryIO, size: int) -> None:
+        # .WRITE with a NULL offset appends to the varbinary(max), which has to be non NULL to start with
+        stmt = text(
+            f"""
+                UPDATE {PublicationPackageZipTable.__tablename__}
+                SET [Binary].WRITE(:chunk, NULL, NULL)
+                WHERE UUID = :zip_uuid
+            """
+        ).bindparams(
+            bindparam("chunk", type_=LargeBinary()),
+            bindparam("zip_uuid", type_=PublicationPackageZipTable.UUID.type),
+        )
+        session.execute(
+            text(
+                f"UPDATE {PublicationPackageZipTable.__tablename__} SET [Binary] = 0x WHERE UUID = :zip_uuid"
+            ).bindparams(bindparam("zip_uuid", type_=PublicationPackageZipTable.UUID.type)),
+            {"zip_uuid": zip_uuid},
+        )
+        while chunk := file.read(WRITE_CHUNK_BYTES):
+            session.execute(stmt, {"chunk": chunk, "zip_uuid": zip_uuid})
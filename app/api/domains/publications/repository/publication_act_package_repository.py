@@ -41,6 +41,7 @@ class PublicationActPackageRepository(BaseRepository):
             session=session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
             sort=(pagination.sort.column, pagination.sort.order),
         )
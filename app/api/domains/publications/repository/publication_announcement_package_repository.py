@@ -34,6 +34,7 @@ class PublicationAnnouncementPackageRepository(BaseRepository):
             session=session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
             sort=(pagination.sort.column, pagination.sort.order),
         )
@@ -0,0 +1,35 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.api.base_repository import BaseRepository
+from app.core.tables.publications import PublicationEnvironmentStateTable, PublicationEnvironmentTable
+
+
+class PublicationEnvironmentStateRepository(BaseRepository):
+    def get_by_uuids(self, session: Session, uuids: Sequence[UUID]) -> Sequence[PublicationEnvironmentStateTable]:
+        stmt = select(PublicationEnvironmentStateTable).filter(PublicationEnvironmentStateTable.UUID.in_(uuids))
+        return self.fetch_all(session, stmt)
+
+    def get_outdated_active_uuids(self, session: Session, schema_version: int) -> list[UUID]:
+        """
+        Only the active states of the environments are used, older states are history
+        and might not even be upgradable anymore.
+        """
+        stmt = (
+            select(PublicationEnvironmentStateTable.UUID)
+            .join(
+                PublicationEnvironmentTable,
+                PublicationEnvironmentTable.Active_State_UUID == PublicationEnvironmentStateTable.UUID,
+            )
+            .filter(
+                or_(
+                    PublicationEnvironmentStateTable.Schema_Version.is_(None),
+                    PublicationEnvironmentStateTable.Schema_Version != schema_version,
+                )
+            )
+            .order_by(PublicationEnvironmentStateTable.Created_Date)
+        )
+        return list(session.scalars(stmt).all())
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session, aliased, selectinload
 from sqlalchemy.sql import func, literal, or_, union_all
 
 from app.api.base_repository import BaseRepository
+from app.api.domains.modules.repositories.module_object_delta_repository import ModuleObjectDeltaRepository
 from app.core.tables.modules import ModuleObjectContextTable, ModuleObjectsTable
 from app.core.tables.objects import ObjectsTable
 
@@ -22,6 +23,9 @@ PUBLICATION_BASE_FIELDS: Final[set[str]] = {
 
 
 class PublicationObjectRepository(BaseRepository):
+    def __init__(self, module_object_delta_repository: ModuleObjectDeltaRepository):
+        self._module_object_delta_repository: ModuleObjectDeltaRepository = module_object_delta_repository
+
     def fetch_objects(
         self,
         session: Session,
@@ -35,6 +39,9 @@ class PublicationObjectRepository(BaseRepository):
         query = self._get_full_query(module_id, timepoint, object_types, fields)
         result = session.execute(query)
         rows = [row._asdict() for row in result]
+        # The module objects might be compacted versions
+        module_rows: list[dict] = [row for row in rows if row["Module_ID"]]
+        self._module_object_delta_repository.restore_rows(session, module_rows, fields)
         return rows
 
     def _get_object_query(
@@ -0,0 +1,38 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.api.base_repository import BaseRepository
+from app.api.domains.publications.types.enums import PdfExportJobStatus
+from app.core.tables.publications import PublicationPdfExportJobTable
+
+
+class PublicationPdfExportJobRepository(BaseRepository):
+    def get_by_uuid(self, session: Session, uuidx: UUID) -> PublicationPdfExportJobTable | None:
+        stmt = select(PublicationPdfExportJobTable).filter(PublicationPdfExportJobTable.UUID == uuidx)
+        return self.fetch_first(session, stmt)
+
+    def fail_orphaned(self, session: Session, modified_before: datetime) -> int:
+        """
+        Fails the unfinished jobs which were not updated since `modified_before`,
+        their worker is gone as the job queue only lives in the process which submitted them.
+        Returns the number of failed jobs.
+        """
+        stmt = (
+            update(PublicationPdfExportJobTable)
+            .filter(
+                PublicationPdfExportJobTable.Status.in_(
+                    [PdfExportJobStatus.QUEUED.value, PdfExportJobStatus.RUNNING.value]
+                ),
+                PublicationPdfExportJobTable.Modified_Date <= modified_before,
+            )
+            .values(
+                Status=PdfExportJobStatus.FAILED.value,
+                Error="The job was interrupted by a restart, please try again",
+                Modified_Date=datetime.now(UTC),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return session.execute(stmt).rowcount
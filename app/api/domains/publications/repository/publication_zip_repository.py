@@ -1,6 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, select
 from sqlalchemy.orm import Session
 
 from app.api.base_repository import BaseRepository
@@ -10,8 +12,10 @@ from app.core.tables.publications import (
     PublicationPackageZipTable,
 )
 
+WRITE_CHUNK_BYTES: int = 1024 * 1024
 
-class PublicationZipRepository(BaseRepository):
+
+class PublicationZipRepository(BaseRepository, ABC):
     def get_by_uuid(self, session: Session, uuidx: UUID) -> PublicationPackageZipTable | None:
         stmt = select(PublicationPackageZipTable).filter(PublicationPackageZipTable.UUID == uuidx)
         return self.fetch_first(session, stmt)
@@ -31,3 +35,25 @@ class PublicationZipRepository(BaseRepository):
             .filter(PublicationAnnouncementPackageTable.UUID == uuidx)
         )
         return self.fetch_first(session, stmt)
+
+    def get_binary_size(self, session: Session, zip_uuid: UUID) -> int:
+        stmt = select(self._binary_length()).filter(PublicationPackageZipTable.UUID == zip_uuid)
+        return session.execute(stmt).scalar_one()
+
+    def write_binary(
+        self, session: Session, package_zip: PublicationPackageZipTable, file: BinaryIO, size: int
+    ) -> None:
+        """
+        Stores the content of `file` as the Binary of the (flushed) zip, in chunks,
+        so the content does not have to be loaded in memory.
+        """
+        self._write_chunks(session, package_zip.UUID, file, size)
+        session.expire(package_zip, ["Binary"])
+
+    @abstractmethod
+    def _binary_length(self) -> ColumnElement[int]:
+        pass
+
+    @abstractmethod
+    def _write_chunks(self, session: Session, zip_uuid: UUID, file: BinaryIO, size: int) -> None:
+        pass
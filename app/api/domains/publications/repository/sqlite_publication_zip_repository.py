@@ -0,0 +1,35 @@
+from typing import BinaryIO
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, func, literal_column, select, update
+from sqlalchemy.orm import Session
+
+from app.api.domains.publications.repository.publication_zip_repository import (
+    WRITE_CHUNK_BYTES,
+    PublicationZipRepository,
+)
+from app.core.tables.publications import PublicationPackageZipTable
+
+
+class SqlitePublicationZipRepository(PublicationZipRepository):
+    def _binary_length(self) -> ColumnElement[int]:
+        return func.length(PublicationPackageZipTable.Binary)
+
+    def _write_chunks(self, session: Session, zip_uuid: UUID, file: BinaryIO, size: int) -> None:
+        # Reserve the size upfront and fill it through the incremental blob api
+        session.execute(
+            update(PublicationPackageZipTable)
+            .where(PublicationPackageZipTable.UUID == zip_uuid)
+            .values(Binary=func.zeroblob(size))
+            .execution_options(synchronize_session=False)
+        )
+        rowid: int = session.execute(
+            select(literal_column("rowid"))
+            .select_from(PublicationPackageZipTable)
+            .where(PublicationPackageZipTable.UUID == zip_uuid)
+        ).scalar_one()
+
+        dbapi_connection = session.connection().connection.driver_connection
+        with dbapi_connection.blobopen(PublicationPackageZipTable.__tablename__, "Binary", rowid) as blob:
+            while chunk := file.read(WRITE_CHUNK_BYTES):
+                blob.write(chunk)
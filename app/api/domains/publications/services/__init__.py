@@ -2,6 +2,8 @@ from .act_defaults_provider import ActDefaultsProvider
 from .act_frbr_provider import ActFrbrProvider
 from .bill_frbr_provider import BillFrbrProvider
 from .doc_frbr_provider import DocFrbrProvider
+from .koop_client import KoopClient
+from .pdf_export_job_queue import PdfExportJobQueue
 from .pdf_export_service import PdfExportService
 from .publication_announcement_defaults_provider import PublicationAnnouncementDefaultsProvider
 from .publication_object_provider import PublicationObjectProvider
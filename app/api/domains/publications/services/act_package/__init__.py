@@ -1,5 +1,6 @@
 from .act_package_builder import ActPackageBuilder
 from .act_package_builder_factory import ActPackageBuilderFactory
+from .act_package_job_queue import ActPackageJobQueue
 from .act_publication_data_provider import ActPublicationDataProvider
 from .api_act_input_data_patcher_factory import ApiActInputDataPatcherFactory
 from .documents_provider import PublicationDocumentsProvider
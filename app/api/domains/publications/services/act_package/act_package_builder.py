@@ -1,5 +1,6 @@
 import hashlib
 import io
+import tempfile
 import uuid
 
 from dso.act_builder.builder import Builder
@@ -10,9 +11,12 @@ from app.api.domains.publications.services.act_package.act_state_patcher import
 from app.api.domains.publications.services.state.state import State
 from app.api.domains.publications.services.state.versions import ActiveState
 from app.api.domains.publications.types.api_input_data import ActFrbr, ApiActInputData, BillFrbr, Purpose
-from app.api.domains.publications.types.zip import ZipData
+from app.api.domains.publications.types.zip import SpooledZipData, ZipData
 from app.core.tables.publications import PublicationEnvironmentStateTable, PublicationEnvironmentTable
 
+ZIP_CHUNK_BYTES: int = 1024 * 1024
+ZIP_SPOOL_MAX_MEMORY_BYTES: int = 8 * 1024 * 1024
+
 
 class ActPackageBuilder:
     def __init__(
@@ -47,6 +51,34 @@ class ActPackageBuilder:
         )
         return zip_data
 
+    def spool_zip_files(self) -> SpooledZipData:
+        """
+        Like `zip_files`, but moves the zip into a spooled temporary file, which the caller has to close.
+        This way the zip is not kept in memory while it is stored.
+        """
+        zip_buffer: io.BytesIO = self._dso_builder.zip_files()
+        zip_buffer.seek(0)
+
+        # Closed by the caller, once the zip is stored
+        spool = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_MEMORY_BYTES)  # noqa: SIM115
+        checksum = hashlib.sha256()
+        size: int = 0
+        while chunk := zip_buffer.read(ZIP_CHUNK_BYTES):
+            checksum.update(chunk)
+            spool.write(chunk)
+            size += len(chunk)
+        zip_buffer.close()
+        spool.seek(0)
+
+        publication_filename: str = self._input_data.publication_settings.opdracht.publicatie_bestand
+        return SpooledZipData(
+            Publication_Filename=publication_filename,
+            Filename=publication_filename.replace(".xml", ".zip"),
+            File=spool,
+            Size=size,
+            Checksum=checksum.hexdigest(),
+        )
+
     def get_input_data(self) -> InputData:
         return self._input_data
 
@@ -63,6 +95,9 @@ class ActPackageBuilder:
     def get_consolidation_purpose(self) -> Purpose:
         return self._api_input_data.Consolidation_Purpose
 
+    def get_stage_timings(self) -> dict[str, float]:
+        return self._api_input_data.Publication_Data.stage_timings
+
     def create_new_state(self) -> PublicationEnvironmentStateTable:
         if self._state is None:
             raise RuntimeError("Can not create new state")
@@ -77,6 +112,7 @@ class ActPackageBuilder:
             Environment_UUID=environment.UUID,
             Adjust_On_UUID=environment.Active_State_UUID,
             State=state.state_dict(),
+            Schema_Version=state.get_schema_version(),
             Is_Activated=False,
             Activated_Datetime=None,
         )
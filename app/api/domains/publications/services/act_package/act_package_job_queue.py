@@ -0,0 +1,375 @@
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import ValidationError
+from pydantic_core import to_jsonable_python
+from sqlalchemy.orm import Session
+
+from app.api.domains.publications.exceptions import DSOConfigurationException, DSORenvooiException
+from app.api.domains.publications.repository.publication_zip_repository import PublicationZipRepository
+from app.api.domains.publications.services.act_package.act_package_builder import ActPackageBuilder
+from app.api.domains.publications.services.act_package.act_package_builder_factory import ActPackageBuilderFactory
+from app.api.domains.publications.services.validate_publication_service import ValidatePublicationException
+from app.api.domains.publications.types.api_input_data import ActFrbr, BillFrbr, Purpose
+from app.api.domains.publications.types.enums import (
+    ActPackageJobStatus,
+    PackageType,
+    PublicationVersionStatus,
+    ReportStatusType,
+)
+from app.api.domains.publications.types.zip import SpooledZipData
+from app.core.db.session import SessionFactoryType, session_scope_with_context
+from app.core.logging import logger
+from app.core.tables.publications import (
+    PublicationActPackageJobTable,
+    PublicationActPackageTable,
+    PublicationActVersionTable,
+    PublicationBillTable,
+    PublicationBillVersionTable,
+    PublicationEnvironmentStateTable,
+    PublicationEnvironmentTable,
+    PublicationPackageZipTable,
+    PublicationPurposeTable,
+    PublicationVersionTable,
+)
+
+
+class ActPackageJobError(Exception):
+    def __init__(self, code: int, detail: Any):
+        super().__init__(str(detail))
+        self.code: int = code
+        self.detail: Any = detail
+
+
+def get_act_package_conflict(publication_version: PublicationVersionTable, package_type: PackageType) -> str | None:
+    """
+    Returns why no package of `package_type` can be created for the publication version right now, if so.
+    """
+    environment: PublicationEnvironmentTable = publication_version.Publication.Environment
+    match package_type:
+        case PackageType.VALIDATION:
+            if not environment.Can_Validate:
+                return "Can not create Validation for this environment"
+        case PackageType.PUBLICATION:
+            if not environment.Can_Publicate:
+                return "Can not create Publication for this environment"
+
+    if not publication_version.Publication.Module.is_active:
+        return "This module is not active"
+    if publication_version.Is_Locked:
+        return "This publication version is locked"
+    # allow creation of packages while validating, even when the environment is locked
+    if environment.Is_Locked and package_type is not PackageType.VALIDATION:
+        return "This environment is locked"
+    if not publication_version.Publication.Act.Is_Active:
+        return "This act can no longer be used"
+    return None
+
+
+class ActPackageJobQueue:
+    """
+    Builds act packages in the background, so the request only checks the publication version and queues the job.
+    The status, the error and the created package are stored on the job row.
+
+    Jobs of an environment run one after another, as a publication package locks its environment
+    and changes the state the next package is built on. Other environments are not blocked by them.
+    The workers live in this process, so jobs are only serialized per api process, the conflict check
+    of the worker guards the jobs of other processes. The jobs of a stopped process are never picked up again,
+    these are failed on startup, see `ORPHANED_JOB_TIMEOUT_SECONDS`.
+    """
+
+    def __init__(
+        self,
+        package_builder_factory: ActPackageBuilderFactory,
+        zip_repository: PublicationZipRepository,
+        db_session_factory: SessionFactoryType,
+    ):
+        self._package_builder_factory: ActPackageBuilderFactory = package_builder_factory
+        self._zip_repository: PublicationZipRepository = zip_repository
+        self._db_session_factory: SessionFactoryType = db_session_factory
+        self._executors: dict[uuid.UUID, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def create_job(
+        self,
+        publication_version_uuid: uuid.UUID,
+        package_type: PackageType,
+        user_uuid: uuid.UUID,
+    ) -> PublicationActPackageJobTable:
+        timepoint: datetime = datetime.now(UTC)
+        return PublicationActPackageJobTable(
+            UUID=uuid.uuid4(),
+            Publication_Version_UUID=publication_version_uuid,
+            Package_Type=package_type.value,
+            Status=ActPackageJobStatus.QUEUED.value,
+            Created_Date=timepoint,
+            Modified_Date=timepoint,
+            Created_By_UUID=user_uuid,
+        )
+
+    def submit(self, job: PublicationActPackageJobTable, environment_uuid: uuid.UUID) -> Future:
+        """
+        The job has to be committed before it is submitted, the worker uses its own session.
+        """
+        executor: ThreadPoolExecutor = self._get_executor(environment_uuid)
+        return executor.submit(self.run_job, job.UUID)
+
+    def run_job(self, job_uuid: uuid.UUID) -> None:
+        self._update(job_uuid, Status=ActPackageJobStatus.RUNNING.value)
+
+        try:
+            with session_scope_with_context(self._db_session_factory) as session:
+                self._create_package(session, job_uuid)
+        except ActPackageJobError as e:
+            self._fail(job_uuid, e.code, e.detail)
+        except ValidationError as e:
+            self._fail(job_uuid, 441, e.errors(include_url=False))
+        except DSOConfigurationException as e:
+            self._fail(job_uuid, 442, e.message)
+        except DSORenvooiException as e:
+            logger.warning(f"Act package job {job_uuid} failed on renvooi: {e.internal_error}")
+            self._fail(job_uuid, 443, e.message)
+        except ValidatePublicationException as e:
+            self._fail(job_uuid, 444, e.dump_errors())
+        except Exception:
+            logger.exception(f"Act package job {job_uuid} failed")
+            self._fail(job_uuid, 500, "Unexpected error building the package")
+
+    def _create_package(self, session: Session, job_uuid: uuid.UUID) -> None:
+        job: PublicationActPackageJobTable | None = session.get(PublicationActPackageJobTable, job_uuid)
+        if job is None:
+            raise RuntimeError(f"Act package job {job_uuid} does not exist")
+        publication_version: PublicationVersionTable | None = session.get(
+            PublicationVersionTable,
+            job.Publication_Version_UUID,
+        )
+        if publication_version is None:
+            raise ActPackageJobError(404, "Publication version niet gevonden")
+
+        # Checked again as other jobs might have changed the environment since this job was queued
+        package_type: PackageType = PackageType(job.Package_Type)
+        conflict: str | None = get_act_package_conflict(publication_version, package_type)
+        if conflict is not None:
+            raise ActPackageJobError(409, conflict)
+
+        package_builder: ActPackageBuilder = self._package_builder_factory.create_builder(
+            session,
+            publication_version,
+            package_type,
+        )
+        package_builder.build_publication_files()
+
+        timepoint: datetime = datetime.now(UTC)
+        zip_data: SpooledZipData = package_builder.spool_zip_files()
+        try:
+            package_zip: PublicationPackageZipTable = self._store_zip(session, zip_data, job.Created_By_UUID, timepoint)
+        finally:
+            zip_data.File.close()
+
+        creator = _ActPackageCreator(session, publication_version, package_type, job.Created_By_UUID, timepoint)
+        package: PublicationActPackageTable = creator.create(package_builder, package_zip)
+
+        job.Status = ActPackageJobStatus.COMPLETED.value
+        job.Act_Package_UUID = package.UUID
+        job.Stage_Timings = package_builder.get_stage_timings()
+        job.Modified_Date = datetime.now(UTC)
+        session.add(job)
+        session.commit()
+
+    def _store_zip(
+        self,
+        session: Session,
+        zip_data: SpooledZipData,
+        user_uuid: uuid.UUID,
+        timepoint: datetime,
+    ) -> PublicationPackageZipTable:
+        package_zip = PublicationPackageZipTable(
+            UUID=uuid.uuid4(),
+            Filename=zip_data.Filename,
+            Binary=b"",
+            Checksum=zip_data.Checksum,
+            Latest_Download_Date=None,
+            Latest_Download_By_UUID=None,
+            Created_Date=timepoint,
+            Created_By_UUID=user_uuid,
+        )
+        session.add(package_zip)
+        session.flush()
+
+        self._zip_repository.write_binary(session, package_zip, zip_data.File, zip_data.Size)
+        return package_zip
+
+    def _fail(self, job_uuid: uuid.UUID, code: int, detail: Any) -> None:
+        error: Any = to_jsonable_python(detail, fallback=str)
+        self._update(job_uuid, Status=ActPackageJobStatus.FAILED.value, Error_Code=code, Error=error)
+
+    def _update(self, job_uuid: uuid.UUID, **values) -> None:
+        with session_scope_with_context(self._db_session_factory) as session:
+            job: PublicationActPackageJobTable | None = session.get(PublicationActPackageJobTable, job_uuid)
+            if job is None:
+                return
+            for key, value in values.items():
+                setattr(job, key, value)
+            job.Modified_Date = datetime.now(UTC)
+            session.add(job)
+            session.commit()
+
+    def _get_executor(self, environment_uuid: uuid.UUID) -> ThreadPoolExecutor:
+        with self._lock:
+            executor: ThreadPoolExecutor | None = self._executors.get(environment_uuid)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix=f"act-package-{environment_uuid}",
+                )
+                self._executors[environment_uuid] = executor
+            return executor
+
+
+class _ActPackageCreator:
+    def __init__(
+        self,
+        session: Session,
+        publication_version: PublicationVersionTable,
+        package_type: PackageType,
+        user_uuid: uuid.UUID,
+        timepoint: datetime,
+    ):
+        self._session: Session = session
+        self._publication_version: PublicationVersionTable = publication_version
+        self._package_type: PackageType = package_type
+        self._user_uuid: uuid.UUID = user_uuid
+        self._timepoint: datetime = timepoint
+        self._environment: PublicationEnvironmentTable = publication_version.Publication.Environment
+
+    def create(
+        self,
+        package_builder: ActPackageBuilder,
+        package_zip: PublicationPackageZipTable,
+    ) -> PublicationActPackageTable:
+        report_status: ReportStatusType = ReportStatusType.NOT_APPLICABLE
+        if self._environment.Has_State:
+            report_status = ReportStatusType.PENDING
+
+        package = PublicationActPackageTable(
+            UUID=uuid.uuid4(),
+            Publication_Version_UUID=self._publication_version.UUID,
+            Zip_UUID=package_zip.UUID,
+            Delivery_ID=package_builder.get_delivery_id(),
+            Package_Type=self._package_type,
+            Report_Status=report_status,
+            Created_Date=self._timepoint,
+            Modified_Date=self._timepoint,
+            Created_By_UUID=self._user_uuid,
+            Modified_By_UUID=self._user_uuid,
+            Module_ID=self._publication_version.Publication.Module_ID,
+            Module_Status_ID=self._publication_version.Module_Status_ID,
+        )
+        self._session.add(package)
+        self._session.flush()
+
+        self._handle_new_state(package_builder, package)
+        self._handle_bill_act_purpose(package_builder, package)
+
+        if self._publication_version.Status != PublicationVersionStatus.NOT_APPLICABLE:
+            match self._package_type:
+                case PackageType.VALIDATION:
+                    self._publication_version.Status = PublicationVersionStatus.VALIDATION
+                case PackageType.PUBLICATION:
+                    self._publication_version.Status = PublicationVersionStatus.PUBLICATION
+            self._session.add(self._publication_version)
+            self._session.flush()
+
+        return package
+
+    def _handle_new_state(self, package_builder: ActPackageBuilder, package: PublicationActPackageTable):
+        if not self._environment.Has_State:
+            return
+        if self._package_type != PackageType.PUBLICATION:
+            return
+
+        new_state: PublicationEnvironmentStateTable = package_builder.create_new_state()
+        new_state.Created_Date = self._timepoint
+        new_state.Created_By_UUID = self._user_uuid
+        self._session.add(new_state)
+        self._session.flush()
+
+        package.Used_Environment_State_UUID = self._environment.Active_State_UUID
+        package.Created_Environment_State_UUID = new_state.UUID
+        self._session.add(package)
+        self._session.flush()
+
+        environment: PublicationEnvironmentTable = self._environment
+        environment.Is_Locked = True
+        self._session.add(environment)
+
+    def _handle_bill_act_purpose(self, package_builder: ActPackageBuilder, package: PublicationActPackageTable):
+        if not self._environment.Has_State:
+            return
+        if self._package_type != PackageType.PUBLICATION:
+            return
+
+        purpose: Purpose = package_builder.get_consolidation_purpose()
+        purpose_table = PublicationPurposeTable(
+            UUID=uuid.uuid4(),
+            Environment_UUID=self._environment.UUID,
+            Purpose_Type=purpose.Purpose_Type,
+            Effective_Date=purpose.Effective_Date,
+            Work_Province_ID=purpose.Work_Province_ID,
+            Work_Date=purpose.Work_Date,
+            Work_Other=purpose.Work_Other,
+            Created_Date=self._timepoint,
+            Created_By_UUID=self._user_uuid,
+        )
+        self._session.add(purpose_table)
+        self._session.flush()
+
+        bill_frbr: BillFrbr = package_builder.get_bill_frbr()
+        bill = PublicationBillTable(
+            UUID=uuid.uuid4(),
+            Environment_UUID=self._environment.UUID,
+            Document_Type=self._publication_version.Publication.Document_Type,
+            Work_Province_ID=bill_frbr.Work_Province_ID,
+            Work_Country=bill_frbr.Work_Country,
+            Work_Date=bill_frbr.Work_Date,
+            Work_Other=bill_frbr.Work_Other,
+            Created_Date=self._timepoint,
+            Modified_Date=self._timepoint,
+            Created_By_UUID=self._user_uuid,
+            Modified_By_UUID=self._user_uuid,
+        )
+        self._session.add(bill)
+        self._session.flush()
+
+        bill_version = PublicationBillVersionTable(
+            UUID=uuid.uuid4(),
+            Bill_UUID=bill.UUID,
+            Expression_Language=bill_frbr.Expression_Language,
+            Expression_Date=bill_frbr.Expression_Date,
+            Expression_Version=bill_frbr.Expression_Version,
+            Created_Date=self._timepoint,
+            Created_By_UUID=self._user_uuid,
+        )
+        self._session.add(bill_version)
+
+        act_frbr: ActFrbr = package_builder.get_act_frbr()
+        act_version = PublicationActVersionTable(
+            UUID=uuid.uuid4(),
+            Act_UUID=self._publication_version.Publication.Act.UUID,
+            Consolidation_Purpose_UUID=purpose_table.UUID,
+            Expression_Language=act_frbr.Expression_Language,
+            Expression_Date=act_frbr.Expression_Date,
+            Expression_Version=act_frbr.Expression_Version,
+            Created_Date=self._timepoint,
+            Created_By_UUID=self._user_uuid,
+        )
+        self._session.add(act_version)
+        self._session.flush()
+
+        package.Bill_Version_UUID = bill_version.UUID
+        package.Act_Version_UUID = act_version.UUID
+        self._session.add(package)
+        self._session.flush()
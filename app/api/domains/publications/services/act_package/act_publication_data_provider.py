@@ -1,7 +1,13 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import Any
 
 import dso.models as dso_models
 from bs4 import BeautifulSoup
+from sqlalchemy import Engine
 from sqlalchemy.orm import Session
 
 from app.api.domains.publications.repository.publication_aoj_repository import PublicationAOJRepository
@@ -26,10 +32,18 @@ from app.api.domains.publications.services.validate_publication_service import (
     validation_exception,
 )
 from app.api.domains.publications.types.api_input_data import ActFrbr, BillFrbr, PublicationData
+from app.core.db.session import SessionFactoryType, session_scope_with_context
+from app.core.logging import logger
 from app.core.tables.publications import PublicationAreaOfJurisdictionTable, PublicationVersionTable
 
 
 class ActPublicationDataProvider:
+    """
+    Fetches the data of a publication in stages. After the objects are loaded, the stages which
+    only depend on the objects run concurrently on a pool of `max_workers` threads.
+    The seconds spent per stage are kept in `PublicationData.stage_timings`.
+    """
+
     def __init__(
         self,
         publication_object_provider: PublicationObjectProvider,
@@ -40,6 +54,8 @@ class ActPublicationDataProvider:
         publication_documents_provider: PublicationDocumentsProvider,
         publication_aoj_repository: PublicationAOJRepository,
         template_parser: TemplateParser,
+        db_session_factory: SessionFactoryType,
+        max_workers: int,
     ):
         self._publication_object_provider: PublicationObjectProvider = publication_object_provider
         self._publication_asset_provider: PublicationAssetProvider = publication_asset_provider
@@ -52,6 +68,10 @@ class ActPublicationDataProvider:
         self._publication_documents_provider: PublicationDocumentsProvider = publication_documents_provider
         self._publication_aoj_repository: PublicationAOJRepository = publication_aoj_repository
         self._template_parser: TemplateParser = template_parser
+        self._db_session_factory: SessionFactoryType = db_session_factory
+        self._max_workers: int = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
 
     def fetch_data(
         self,
@@ -60,7 +80,13 @@ class ActPublicationDataProvider:
         bill_frbr: BillFrbr,
         act_frbr: ActFrbr,
     ) -> PublicationData:
+        timings: dict[str, float] = {}
+
+        started: float = time.monotonic()
         objects: list[dict] = self._publication_object_provider.get_objects(session, publication_version)
+        timings["objects"] = time.monotonic() - started
+
+        started = time.monotonic()
         parsed_template = self._template_parser.get_parsed_template(
             publication_version.Publication.Template.Text_Template,
             objects,
@@ -68,33 +94,37 @@ class ActPublicationDataProvider:
         all_object_codes = {o["Code"] for o in objects}
         used_object_codes: set[str] = self._get_used_object_codes(parsed_template)
         used_objects: list[dict] = self._get_used_objects(objects, used_object_codes)
-        assets: list[dict] = self._publication_asset_provider.get_assets(session, used_objects)
+        timings["template"] = time.monotonic() - started
+        # Read here, the stages might run in other threads which should not touch the instances of this session
+        created_date: datetime | None = publication_version.Created_Date
 
-        gebiedsaanwijzingen: dict[str, GebiedsaanwijzingData] = (
-            self._publication_gebiedsaanwijzingen_provider.get_gebiedsaanwijzingen(
+        # These stages only depend on the objects, and are listed in the order they used to run in
+        stages: dict[str, Callable[[Session], Any]] = {
+            "assets": lambda stage_session: self._publication_asset_provider.get_assets(stage_session, used_objects),
+            "geo": lambda stage_session: self._get_geo_data(stage_session, act_frbr, objects, used_objects),
+            "documents": lambda stage_session: self._publication_documents_provider.get_documents(
+                stage_session,
+                act_frbr,
                 objects,
                 used_objects,
-            )
-        )
-        gebieden_data: GebiedenData = self._publication_gebieden_provider.get_gebieden_data(
-            objects,
-            used_objects,
-        )
-        geo_data: PublicationGeoData = self._publication_gios_provider.process(
-            session,
-            act_frbr,
-            gebieden_data,
-            gebiedsaanwijzingen,
-        )
+            ),
+            "area_of_jurisdiction": lambda stage_session: self._get_aoj(stage_session, created_date),
+        }
+        results: dict[str, Any] = self._run_stages(session, stages, timings)
 
-        documents: list[dict] = self._publication_documents_provider.get_documents(
-            session,
-            act_frbr,
-            objects,
-            used_objects,
-        )
-        area_of_jurisdiction: dict = self._get_aoj(session, publication_version.Created_Date)
+        assets: list[dict] = results["assets"]
+        geo_data: PublicationGeoData = results["geo"]
+        documents: list[dict] = results["documents"]
+        area_of_jurisdiction: dict = results["area_of_jurisdiction"]
+
+        started = time.monotonic()
         bill_attachments: list[dict] = self._get_bill_attachments(publication_version, bill_frbr)
+        timings["bill_attachments"] = time.monotonic() - started
+
+        logger.info(
+            f"Fetched publication data for version {publication_version.UUID} in stages: "
+            + ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items())
+        )
 
         result: PublicationData = PublicationData(
             all_object_codes=all_object_codes,
@@ -109,9 +139,87 @@ class ActPublicationDataProvider:
             bill_attachments=bill_attachments,
             area_of_jurisdiction=area_of_jurisdiction,
             parsed_template=parsed_template,
+            stage_timings=timings,
         )
         return result
 
+    def _get_geo_data(
+        self,
+        session: Session,
+        act_frbr: ActFrbr,
+        objects: list[dict],
+        used_objects: list[dict],
+    ) -> PublicationGeoData:
+        gebiedsaanwijzingen: dict[str, GebiedsaanwijzingData] = (
+            self._publication_gebiedsaanwijzingen_provider.get_gebiedsaanwijzingen(
+                objects,
+                used_objects,
+            )
+        )
+        gebieden_data: GebiedenData = self._publication_gebieden_provider.get_gebieden_data(
+            objects,
+            used_objects,
+        )
+        geo_data: PublicationGeoData = self._publication_gios_provider.process(
+            session,
+            act_frbr,
+            gebieden_data,
+            gebiedsaanwijzingen,
+        )
+        return geo_data
+
+    def _run_stages(
+        self,
+        session: Session,
+        stages: dict[str, Callable[[Session], Any]],
+        timings: dict[str, float],
+    ) -> dict[str, Any]:
+        """
+        Runs the stages on the worker pool, each in its own session, when that is possible.
+        Otherwise they run one after another in the given session.
+
+        Results are collected in the order of `stages`, so when several stages fail
+        the error of the first one is raised, just like when running them in sequence.
+        """
+        if not self._can_run_concurrently(session):
+            results: dict[str, Any] = {}
+            for name, stage in stages.items():
+                results[name], timings[name] = self._run_timed(stage, session)
+            return results
+
+        futures: dict[str, Future] = {
+            name: self._get_executor().submit(self._run_in_own_session, stage) for name, stage in stages.items()
+        }
+        results = {}
+        for name, future in futures.items():
+            results[name], timings[name] = future.result()
+        return results
+
+    def _can_run_concurrently(self, session: Session) -> bool:
+        if self._max_workers < 2:
+            return False
+        # A session bound to a single connection (an outer transaction, like in the tests)
+        # might see data which other sessions do not, and a connection can not be shared between threads
+        return isinstance(session.get_bind(), Engine)
+
+    def _run_in_own_session(self, stage: Callable[[Session], Any]) -> tuple[Any, float]:
+        with session_scope_with_context(self._db_session_factory) as stage_session:
+            return self._run_timed(stage, stage_session)
+
+    def _run_timed(self, stage: Callable[[Session], Any], session: Session) -> tuple[Any, float]:
+        started: float = time.monotonic()
+        result: Any = stage(session)
+        return result, time.monotonic() - started
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="publication-data",
+                )
+            return self._executor
+
     def _get_used_object_codes(self, text_template: str) -> set[str]:
         soup = BeautifulSoup(text_template, "html.parser")
         objects = soup.find_all("object")
@@ -1,5 +1,5 @@
-import hashlib
 from datetime import UTC, datetime
+from uuid import UUID
 
 import dso.models as dso_models
 from sqlalchemy.orm import Session
@@ -25,28 +25,48 @@ from app.api.domains.publications.types.api_input_data import (
     PublicationGio,
     PublicationGioLocatie,
 )
-from app.api.domains.werkingsgebieden.repositories.area_repository import AreaRepository
-from app.core.tables.others import AreasTable
+from app.api.domains.werkingsgebieden.repositories.area_geometry_repository import AreaGeometryRepository, AreaGml
 
 
 class PublicationGiosProvider:
-    def __init__(self, session: Session, area_repository: AreaRepository, act_frbr: ActFrbr):
+    def __init__(self, session: Session, area_geometry_repository: AreaGeometryRepository, act_frbr: ActFrbr):
         self._session: Session = session
-        self._area_repository: AreaRepository = area_repository
+        self._area_geometry_repository: AreaGeometryRepository = area_geometry_repository
         self._act_frbr: ActFrbr = act_frbr
         self._result: PublicationGeoData = PublicationGeoData()
         self._gio_seq: int = 0
+        self._areas: dict[UUID, AreaGml] = {}
+        # Gio keys by their data key, so an existing gio is found without comparing it to all gios
+        self._gio_keys_by_data: dict[tuple, str] = {}
 
     def resolve_geo(
         self,
         gebieden_data: GebiedenData,
         gebiedsaanwijzingen: dict[str, GebiedsaanwijzingData],
     ) -> PublicationGeoData:
+        self._load_areas(gebieden_data, gebiedsaanwijzingen)
         self._resolve_gebiedengroepen(gebieden_data)
         self._resolve_gebiedsaanwijzingen(gebieden_data, gebiedsaanwijzingen)
 
         return self._result
 
+    def _load_areas(self, gebieden_data: GebiedenData, gebiedsaanwijzingen: dict[str, GebiedsaanwijzingData]):
+        # Loads the Gml of every used gebied upfront in a few queries, instead of one query per location
+        gebied_codes: set[str] = {code for groep in gebieden_data.used_gebiedengroepen for code in groep.gebied_codes}
+        gebied_codes.update(
+            code for aanwijzing in gebiedsaanwijzingen.values() for code in aanwijzing.resolved_gebied_codes
+        )
+
+        # Unknown codes are reported when the gio is resolved
+        area_uuids: list[UUID] = [
+            gebied.area_uuid
+            for code in sorted(gebied_codes)
+            if (gebied := gebieden_data.all_gebieden.get(code)) is not None
+        ]
+        for areas in self._area_geometry_repository.iter_areas_with_gml(self._session, area_uuids):
+            for area in areas:
+                self._areas[area.uuid] = area
+
     #
     # Gebiedengroepen
     #
@@ -186,8 +206,8 @@ class PublicationGiosProvider:
             )
         return gebied
 
-    def _fetch_area(self, input_gebied: InputGebied) -> AreasTable:
-        area: AreasTable | None = self._area_repository.get_with_gml(self._session, input_gebied.area_uuid)
+    def _fetch_area(self, input_gebied: InputGebied) -> AreaGml:
+        area: AreaGml | None = self._areas.get(input_gebied.area_uuid)
         if area is None:
             raise validation_exception(
                 [
@@ -201,16 +221,14 @@ class PublicationGiosProvider:
         return area
 
     def _as_location(self, input_gebied: InputGebied) -> PublicationGioLocatie:
-        area: AreasTable = self._fetch_area(input_gebied)
-        gml_hash = hashlib.sha512()
-        gml_hash.update(area.Gml.encode())
+        area: AreaGml = self._fetch_area(input_gebied)
 
         return PublicationGioLocatie(
             code=input_gebied.code,
             title=input_gebied.title,
             basisgeo_id=str(input_gebied.basisgeo_id),
-            source_hash=gml_hash.hexdigest(),
-            gml=area.Gml,
+            source_hash=area.gml_hash,
+            gml=area.gml,
         )
 
     def _new_gio_key(self) -> str:
@@ -220,18 +238,20 @@ class PublicationGiosProvider:
 
     def _manage_gio(self, new_gio: PublicationGio) -> str:
         # If this GIO already exists than reuse the existing GIO
-        for existing_gio in self._result.gios.values():
-            if existing_gio.has_same_data(new_gio):
-                return existing_gio.key
+        data_key: tuple = new_gio.get_data_key()
+        existing_key: str | None = self._gio_keys_by_data.get(data_key)
+        if existing_key is not None:
+            return existing_key
 
         # Save to accumulator
         self._result.gios[new_gio.key] = new_gio
+        self._gio_keys_by_data[data_key] = new_gio.key
         return new_gio.key
 
 
 class PublicationGiosProviderFactory:
-    def __init__(self, area_repository: AreaRepository):
-        self._area_repository: AreaRepository = area_repository
+    def __init__(self, area_geometry_repository: AreaGeometryRepository):
+        self._area_geometry_repository: AreaGeometryRepository = area_geometry_repository
 
     def process(
         self,
@@ -242,7 +262,7 @@ class PublicationGiosProviderFactory:
     ) -> PublicationGeoData:
         service: PublicationGiosProvider = PublicationGiosProvider(
             session,
-            self._area_repository,
+            self._area_geometry_repository,
             act_frbr,
         )
         return service.resolve_geo(gebieden_data, gebiedsaanwijzingen)
@@ -1,4 +1,3 @@
-import hashlib
 import re
 import uuid
 from datetime import UTC, datetime
@@ -7,13 +6,12 @@ import dso.models as dso_models
 from sqlalchemy.orm import Session
 
 from app.api.domains.publications.types.api_input_data import ActFrbr
-from app.api.domains.werkingsgebieden.repositories.area_repository import AreaRepository
-from app.core.tables.others import AreasTable
+from app.api.domains.werkingsgebieden.repositories.area_geometry_repository import AreaGeometryRepository, AreaGml
 
 
 class PublicationWerkingsgebiedenProvider:
-    def __init__(self, area_repository: AreaRepository):
-        self._area_repository: AreaRepository = area_repository
+    def __init__(self, area_geometry_repository: AreaGeometryRepository):
+        self._area_geometry_repository: AreaGeometryRepository = area_geometry_repository
 
     def get_werkingsgebieden(
         self,
@@ -42,15 +40,19 @@ class PublicationWerkingsgebiedenProvider:
         act_frbr: ActFrbr,
         werkingsgebieden_objects: list[dict],
     ) -> list[dict]:
-        result: list[dict] = []
+        for werkingsgebied in werkingsgebieden_objects:
+            if werkingsgebied["Area_UUID"] is None:
+                raise RuntimeError(f"Missing area for werkingsgebied with code: {werkingsgebied['Code']}")
+
+        areas: dict[uuid.UUID, AreaGml] = {}
+        area_uuids: list[uuid.UUID] = [uuid.UUID(str(w["Area_UUID"])) for w in werkingsgebieden_objects]
+        for chunk in self._area_geometry_repository.iter_areas_with_gml(session, area_uuids):
+            areas.update((area.uuid, area) for area in chunk)
 
+        result: list[dict] = []
         for werkingsgebied in werkingsgebieden_objects:
             code = werkingsgebied["Code"]
-            area_uuid = werkingsgebied["Area_UUID"]
-            if area_uuid is None:
-                raise RuntimeError(f"Missing area for werkingsgebied with code: {code}")
-
-            area: AreasTable | None = self._area_repository.get_with_gml(session, area_uuid)
+            area: AreaGml | None = areas.get(uuid.UUID(str(werkingsgebied["Area_UUID"])))
             if area is None:
                 raise RuntimeError(f"Area UUID does not exist for code: {code}")
 
@@ -63,7 +65,7 @@ class PublicationWerkingsgebiedenProvider:
         self,
         act_frbr: ActFrbr,
         werkingsgebied: dict,
-        area: AreasTable,
+        area: AreaGml,
     ) -> dict:
         # We build it so that werkingsgebieden are consolidated per Act
         # Therefor their Work_Date is the acts Work_Date
@@ -82,18 +84,15 @@ class PublicationWerkingsgebiedenProvider:
             Expression_Version=1,
         )
 
-        gml_hash = hashlib.sha512()
-        gml_hash.update(area.Gml.encode())
-
         result = {
             "UUID": werkingsgebied["UUID"],
             "Identifier": str(uuid.uuid4()),
-            "Hash": gml_hash.hexdigest(),
+            "Hash": area.gml_hash,
             "Object_ID": werkingsgebied["Object_ID"],
             "Code": werkingsgebied["Code"],
             "New": True,
             "Frbr": frbr,
-            "Title": area.Source_Title,
+            "Title": area.title,
             "Geboorteregeling": act_frbr.get_work(),
             "Achtergrond_Verwijzing": "TOP10NL",
             "Achtergrond_Actualiteit": str(werkingsgebied["Modified_Date"])[:10],
@@ -103,8 +102,8 @@ class PublicationWerkingsgebiedenProvider:
                     "Identifier": str(uuid.uuid4()),
                     "Gml_ID": str(uuid.uuid4()),
                     "Group_ID": str(uuid.uuid4()),
-                    "Title": area.Source_Title,
-                    "Gml": area.Gml,
+                    "Title": area.title,
+                    "Gml": area.gml,
                 }
             ],
         }
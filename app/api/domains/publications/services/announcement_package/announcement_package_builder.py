@@ -73,6 +73,7 @@ class AnnouncementPackageBuilder:
             Environment_UUID=environment.UUID,
             Adjust_On_UUID=environment.Active_State_UUID,
             State=state.state_dict(),
+            Schema_Version=state.get_schema_version(),
             Is_Activated=False,
             Activated_Datetime=None,
         )
@@ -0,0 +1,241 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.settings import KoopSettings
+
+
+class KoopUnavailableError(Exception):
+    def __init__(self, msg: str):
+        self.msg = msg
+
+
+class KoopCircuitOpenError(KoopUnavailableError):
+    pass
+
+
+@dataclass
+class KoopCallMetrics:
+    calls: int = 0
+    failures: int = 0
+    retries: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+class KoopCircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for `reset_seconds`.
+    After that calls are let through again, but a single failure opens the circuit for another period.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self._failure_threshold: int = failure_threshold
+        self._reset_seconds: float = reset_seconds
+        self._failures: int = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self._reset_seconds:
+                return False
+
+            # Half open
+            self._opened_at = None
+            self._failures = self._failure_threshold - 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class KoopRetryBudget:
+    """
+    Retries are allowed up to `ratio` of the calls, plus a small reserve,
+    so a failing service does not receive a multiple of its normal load.
+    """
+
+    def __init__(self, ratio: float, reserve: int):
+        self._ratio: float = ratio
+        self._reserve: float = float(reserve)
+        self._tokens: float = float(reserve)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self._ratio, self._reserve)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class KoopClient:
+    """
+    Shared http client for the KOOP apis of the publication environments in `PUBLICATION_KOOP`.
+
+    Every environment gets a pooled `requests.Session` with keep-alive connections,
+    its own circuit breaker and retry budget. Only calls marked `retry=True` (the idempotent ones)
+    are retried, on connection errors and 5xx responses, with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        koop_settings: dict[str, KoopSettings],
+        timeout_seconds: float,
+        max_retries: int,
+        backoff_seconds: float,
+        circuit_failure_threshold: int,
+        circuit_reset_seconds: float,
+    ):
+        # @todo: should be parsed by the Settings
+        self._koop_settings: dict[str, KoopSettings] = {
+            k: KoopSettings(**v) if not isinstance(v, KoopSettings) else v for k, v in koop_settings.items()
+        }
+        self._timeout_seconds: float = timeout_seconds
+        self._max_retries: int = max_retries
+        self._backoff_seconds: float = backoff_seconds
+        self._circuit_failure_threshold: int = circuit_failure_threshold
+        self._circuit_reset_seconds: float = circuit_reset_seconds
+
+        self._sessions: dict[str, requests.Session] = {}
+        self._breakers: dict[str, KoopCircuitBreaker] = {}
+        self._budgets: dict[str, KoopRetryBudget] = {}
+        self._metrics: dict[tuple[str, str], KoopCallMetrics] = {}
+        self._lock = threading.Lock()
+
+    def get_api_settings(self, environment_code: str) -> KoopSettings:
+        api_settings: KoopSettings | None = self._koop_settings.get(environment_code)
+        if api_settings is None:
+            raise RuntimeError("Missing runtime environment settings for this Publication Environment Code")
+
+        return api_settings
+
+    def request(
+        self,
+        environment_code: str,
+        method: str,
+        url: str,
+        name: str,
+        retry: bool = False,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        `name` identifies the call in the metrics, `url` is joined on the preview api of the environment
+        unless it is absolute. Raises KoopUnavailableError when the service can not be reached.
+        """
+        api_settings: KoopSettings = self.get_api_settings(environment_code)
+        session: requests.Session = self._get_session(environment_code, api_settings)
+        breaker: KoopCircuitBreaker = self._get_breaker(environment_code)
+        budget: KoopRetryBudget = self._get_budget(environment_code)
+        metrics: KoopCallMetrics = self._get_metrics(environment_code, name)
+
+        budget.deposit()
+        attempt: int = 0
+        while True:
+            if not breaker.allow():
+                raise KoopCircuitOpenError(f"KOOP service for {environment_code} is unavailable, try again later")
+
+            started: float = time.monotonic()
+            response: requests.Response | None = None
+            error: str | None = None
+            try:
+                response = session.request(
+                    method,
+                    urljoin(api_settings.PREVIEW_API_URL, url),
+                    timeout=timeout or self._timeout_seconds,
+                    **kwargs,
+                )
+            except requests.Timeout:
+                error = "KOOP service timed out"
+            except requests.ConnectionError:
+                error = "KOOP service is unreachable"
+
+            failed: bool = response is None or response.status_code >= 500
+            self._record(metrics, time.monotonic() - started, failed)
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if not failed or not retry or attempt >= self._max_retries or not budget.withdraw():
+                if response is None:
+                    raise KoopUnavailableError(error or "KOOP service is unavailable")
+                return response
+
+            with self._lock:
+                metrics.retries += 1
+            attempt += 1
+            time.sleep(self._backoff_seconds * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+
+    def get_metrics(self) -> dict[tuple[str, str], KoopCallMetrics]:
+        """
+        Copy of the metrics per (environment code, call name).
+        """
+        with self._lock:
+            return {key: KoopCallMetrics(**vars(value)) for key, value in self._metrics.items()}
+
+    def _record(self, metrics: KoopCallMetrics, seconds: float, failed: bool) -> None:
+        with self._lock:
+            metrics.calls += 1
+            metrics.failures += int(failed)
+            metrics.total_seconds += seconds
+            metrics.max_seconds = max(metrics.max_seconds, seconds)
+
+    def _get_session(self, environment_code: str, api_settings: KoopSettings) -> requests.Session:
+        with self._lock:
+            session: requests.Session | None = self._sessions.get(environment_code)
+            if session is None:
+                session = requests.Session()
+                session.headers["x-api-key"] = api_settings.API_KEY
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(api_settings.PREVIEW_MAX_CONCURRENT, 1))
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[environment_code] = session
+            return session
+
+    def _get_breaker(self, environment_code: str) -> KoopCircuitBreaker:
+        with self._lock:
+            if environment_code not in self._breakers:
+                self._breakers[environment_code] = KoopCircuitBreaker(
+                    self._circuit_failure_threshold,
+                    self._circuit_reset_seconds,
+                )
+            return self._breakers[environment_code]
+
+    def _get_budget(self, environment_code: str) -> KoopRetryBudget:
+        with self._lock:
+            if environment_code not in self._budgets:
+                self._budgets[environment_code] = KoopRetryBudget(ratio=0.2, reserve=10)
+            return self._budgets[environment_code]
+
+    def _get_metrics(self, environment_code: str, name: str) -> KoopCallMetrics:
+        with self._lock:
+            key: tuple[str, str] = (environment_code, name)
+            if key not in self._metrics:
+                self._metrics[key] = KoopCallMetrics()
+            return self._metrics[key]
@@ -0,0 +1,93 @@
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
+
+import requests
+
+from app.api.domains.publications.services.pdf_export_service import PdfExportError, PdfExportService
+from app.api.domains.publications.types.enums import PdfExportJobStatus
+from app.api.domains.publications.types.zip import ZipData
+from app.core.db.session import SessionFactoryType, session_scope_with_context
+from app.core.logging import logger
+from app.core.tables.publications import PublicationPdfExportJobTable
+
+
+class PdfExportJobQueue:
+    """
+    Generates the pdf previews in the background, so the request only builds the package
+    and returns the job. The status and result are stored on the job row.
+
+    Every KOOP environment gets its own pool of `PREVIEW_MAX_CONCURRENT` workers,
+    which limits the load per preview api and keeps a busy environment from blocking the others.
+    The pools live in this process, so the limit applies per api process and the jobs of a stopped process
+    are never picked up again. These are failed on startup, see `ORPHANED_JOB_TIMEOUT_SECONDS`.
+    """
+
+    def __init__(self, pdf_export_service: PdfExportService, db_session_factory: SessionFactoryType):
+        self._pdf_export_service: PdfExportService = pdf_export_service
+        self._db_session_factory: SessionFactoryType = db_session_factory
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def create_job(self, environment_code: str, filename: str, user_uuid: uuid.UUID) -> PublicationPdfExportJobTable:
+        timepoint: datetime = datetime.now(UTC)
+        return PublicationPdfExportJobTable(
+            UUID=uuid.uuid4(),
+            Environment_Code=environment_code,
+            Filename=filename,
+            Status=PdfExportJobStatus.QUEUED.value,
+            Progress=0,
+            Created_Date=timepoint,
+            Modified_Date=timepoint,
+            Created_By_UUID=user_uuid,
+        )
+
+    def submit(self, job: PublicationPdfExportJobTable, zip_data: ZipData) -> Future:
+        """
+        The job has to be committed before it is submitted, the worker uses its own session.
+        """
+        executor: ThreadPoolExecutor = self._get_executor(job.Environment_Code)
+        return executor.submit(self.run_job, job.UUID, job.Environment_Code, zip_data)
+
+    def run_job(self, job_uuid: uuid.UUID, environment_code: str, zip_data: ZipData) -> None:
+        self._update(job_uuid, Status=PdfExportJobStatus.RUNNING.value)
+
+        try:
+            response: requests.Response = self._pdf_export_service.create_pdf(
+                environment_code,
+                zip_data,
+                on_progress=lambda attempt: self._update(job_uuid, Progress=attempt),
+            )
+            binary: bytes = response.content
+        except PdfExportError as e:
+            self._update(job_uuid, Status=PdfExportJobStatus.FAILED.value, Error=e.msg)
+            return
+        except Exception:
+            logger.exception(f"Pdf export job {job_uuid} failed")
+            self._update(job_uuid, Status=PdfExportJobStatus.FAILED.value, Error="Unexpected error generating the pdf")
+            return
+
+        self._update(job_uuid, Status=PdfExportJobStatus.COMPLETED.value, Binary=binary)
+
+    def _get_executor(self, environment_code: str) -> ThreadPoolExecutor:
+        with self._lock:
+            executor: ThreadPoolExecutor | None = self._executors.get(environment_code)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self._pdf_export_service.get_max_concurrent(environment_code),
+                    thread_name_prefix=f"pdf-export-{environment_code}",
+                )
+                self._executors[environment_code] = executor
+            return executor
+
+    def _update(self, job_uuid: uuid.UUID, **values) -> None:
+        with session_scope_with_context(self._db_session_factory) as session:
+            job: PublicationPdfExportJobTable | None = session.get(PublicationPdfExportJobTable, job_uuid)
+            if job is None:
+                return
+
+            for key, value in values.items():
+                setattr(job, key, value)
+            job.Modified_Date = datetime.now(UTC)
+            session.commit()
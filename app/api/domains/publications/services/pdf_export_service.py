@@ -1,12 +1,12 @@
 import time
 from abc import ABCMeta
-from urllib.parse import urljoin
+from collections.abc import Callable
 
 import requests
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
+from app.api.domains.publications.services.koop_client import KoopClient, KoopUnavailableError
 from app.api.domains.publications.types.zip import ZipData
-from app.core.settings import KoopSettings
 
 
 class PdfExportError(Exception, metaclass=ABCMeta):
@@ -45,37 +45,33 @@ class PdfExportUnkownError(PdfExportError):
 
 
 class PdfExportService:
-    def __init__(self, koop_settings: dict[str, KoopSettings]):
-        # @todo: should be parsed by the Settings
-        self._koop_settings: dict[str, KoopSettings] = {
-            k: KoopSettings(**v) if not isinstance(v, KoopSettings) else v for k, v in koop_settings.items()
-        }
+    def __init__(self, koop_client: KoopClient):
+        self._koop_client: KoopClient = koop_client
 
     def healthcheck(self, environment_code: str) -> None:
-        try:
-            api_settings: KoopSettings = self._get_api_settings(environment_code)
-
-            response = requests.get(
-                urljoin(api_settings.PREVIEW_API_URL, "/health"),
-                headers={"x-api-key": api_settings.API_KEY},
-                timeout=5,
-            )
-            if response.status_code >= 500:
-                raise PdfExportUnavailableError(f"PDF preview service is unavailable (status {response.status_code})")
-        except requests.ConnectionError:
-            raise PdfExportUnavailableError("PDF preview service is unreachable")
-        except requests.Timeout:
-            raise PdfExportUnavailableError("PDF preview service timed out")
-
-    def create_pdf(self, environment_code: str, zip_data: ZipData) -> requests.Response:
-        api_settings: KoopSettings = self._get_api_settings(environment_code)
-        idx: str = self._request_generate(api_settings, zip_data)
-        self._wait_for_completion(api_settings, idx)
-        result: requests.Response = self._download_pdf(api_settings, idx)
+        response: requests.Response = self._request(environment_code, "GET", "/health", "health", timeout=5)
+        if response.status_code >= 500:
+            raise PdfExportUnavailableError(f"PDF preview service is unavailable (status {response.status_code})")
+
+    def get_max_concurrent(self, environment_code: str) -> int:
+        return self._koop_client.get_api_settings(environment_code).PREVIEW_MAX_CONCURRENT
+
+    def create_pdf(
+        self,
+        environment_code: str,
+        zip_data: ZipData,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> requests.Response:
+        """
+        Blocks until the preview is generated, `on_progress` is called with the attempt after every status poll.
+        """
+        idx: str = self._request_generate(environment_code, zip_data)
+        self._wait_for_completion(environment_code, idx, on_progress)
+        result: requests.Response = self._download_pdf(environment_code, idx)
 
         return result
 
-    def _request_generate(self, api_settings: KoopSettings, zip_data: ZipData) -> str:
+    def _request_generate(self, environment_code: str, zip_data: ZipData) -> str:
         multipart_data = MultipartEncoder(
             fields={
                 "aanlevering-zip": (zip_data.Filename, zip_data.Binary, "application/zip"),
@@ -83,96 +79,69 @@ class PdfExportService:
                 "auto-clean-up": "true",
             }
         )
-        headers = {
-            "x-api-key": api_settings.API_KEY,
-            "Content-Type": multipart_data.content_type,
-        }
-        response = requests.post(
-            urljoin(api_settings.PREVIEW_API_URL, "/maak-bekendmaking"),
-            headers=headers,
+        response: requests.Response = self._request(
+            environment_code,
+            "POST",
+            "/maak-bekendmaking",
+            "generate",
+            headers={"Content-Type": multipart_data.content_type},
             data=multipart_data,
         )
+        self._raise_for_status(response)
 
-        match response.status_code:
-            case 200 | 202:
-                response_body = response.json()
-                idx: str = response_body.get("id")
-                return idx
-            case 403:
-                raise PdfExportUnauthorizedError("Pdf export unauthorized")
-            case 404:
-                raise PdfExportNotFoundError("Pdf export not found")
-            case 422:
-                raise PdfExportXmlError("Pdf export xml")
-            case 500:
-                raise PdfExportInternalServerError("Pdf export internal server error")
-            case _ as code:
-                raise PdfExportUnkownError("Pdf export unkown", code)
+        idx: str = response.json().get("id")
+        return idx
 
-    def _wait_for_completion(self, api_settings: KoopSettings, idx: str):
-        headers = {
-            "x-api-key": api_settings.API_KEY,
-        }
+    def _wait_for_completion(
+        self,
+        environment_code: str,
+        idx: str,
+        on_progress: Callable[[int], None] | None = None,
+    ):
         delay_ms: int = 200
         attempts: int = 0
 
         while True:
-            response = requests.get(
-                urljoin(api_settings.PREVIEW_API_URL, f"/status/{idx}"),
-                headers=headers,
-            )
-
-            match response.status_code:
-                case 200 | 202:
-                    response_body = response.json()
-                    status_pdf: str = response_body.get("status-pdf")
-                    if status_pdf == "gereed":
-                        return
-                case 403:
-                    raise PdfExportUnauthorizedError(response.text)
-                case 404:
-                    raise PdfExportNotFoundError(response.text)
-                case 422:
-                    raise PdfExportXmlError(response.text)
-                case 500:
-                    raise PdfExportInternalServerError(response.text)
-                case _ as code:
-                    raise PdfExportUnkownError(response.text, code)
+            response: requests.Response = self._request(environment_code, "GET", f"/status/{idx}", "status", retry=True)
+            self._raise_for_status(response)
+
+            status_pdf: str = response.json().get("status-pdf")
+            if status_pdf == "gereed":
+                return
 
             time.sleep(delay_ms / 1000)
             delay_ms = min(int(delay_ms * 1.5), 5000)
             attempts += 1
+            if on_progress is not None:
+                on_progress(attempts)
             if attempts >= 20:
                 raise PdfExportTooManyAttemptsError("Too many attempts on getting the status")
 
-    def _download_pdf(self, api_settings: KoopSettings, idx: str) -> requests.Response:
-        headers = {
-            "x-api-key": api_settings.API_KEY,
-        }
-
-        response = requests.get(
-            urljoin(api_settings.PREVIEW_API_URL, f"/download/{idx}"),
-            headers=headers,
-            stream=True,
+    def _download_pdf(self, environment_code: str, idx: str) -> requests.Response:
+        response: requests.Response = self._request(
+            environment_code, "GET", f"/download/{idx}", "download", retry=True, stream=True
         )
+        self._raise_for_status(response)
+        return response
 
+    def _request(self, environment_code: str, method: str, url: str, name: str, **kwargs) -> requests.Response:
+        try:
+            return self._koop_client.request(environment_code, method, url, name, **kwargs)
+        except KoopUnavailableError as e:
+            raise PdfExportUnavailableError(f"PDF preview service: {e.msg}")
+
+    def _raise_for_status(self, response: requests.Response) -> None:
+        msg: str = response.text or f"Pdf export failed with status {response.status_code}"
         match response.status_code:
             case 200 | 202:
-                return response
+                return
             case 403:
-                raise PdfExportUnauthorizedError(response.text)
+                raise PdfExportUnauthorizedError(msg)
             case 404:
-                raise PdfExportNotFoundError(response.text)
+                raise PdfExportNotFoundError(msg)
             case 422:
-                raise PdfExportXmlError(response.text)
+                raise PdfExportXmlError(msg)
             case 500:
-                raise PdfExportInternalServerError(response.text)
+                raise PdfExportInternalServerError(msg)
             case _ as code:
-                raise PdfExportUnkownError(response.text, code)
-
-    def _get_api_settings(self, environment_code: str) -> KoopSettings:
-        api_settings: KoopSettings | None = self._koop_settings.get(environment_code)
-        if api_settings is None:
-            raise RuntimeError("Missing runtime environment settings for this Publication Environment Code")
-
-        return api_settings
+                raise PdfExportUnkownError(msg, code)
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from uuid import UUID
 
 import dso.models as dso_models
@@ -43,22 +44,23 @@ class StateGioPool:
     """
 
     def __init__(self, active_act: models.ActiveAct):
+        used_by_gio_key: dict[str, set[str]] = defaultdict(set)
+        for groep in active_act.Gebiedengroepen.values():
+            used_by_gio_key[groep.gio_key].add(groep.code)
+        for aanwijzing in active_act.Gebiedsaanwijzingen.values():
+            used_by_gio_key[aanwijzing.gio_key].add(aanwijzing.code)
+
         self._entries: list[StateGioEntry] = []
+        # Entries per owner code, in the order of `_entries`
+        self._entries_by_owner: dict[str, list[StateGioEntry]] = defaultdict(list)
         for gio_key, state_gio in active_act.Gios.items():
-            used_by: set[str] = set()
-            for groep in active_act.Gebiedengroepen.values():
-                if groep.gio_key == gio_key:
-                    used_by.add(groep.code)
-            for aanwijzing in active_act.Gebiedsaanwijzingen.values():
-                if aanwijzing.gio_key == gio_key:
-                    used_by.add(aanwijzing.code)
-
-            self._entries.append(
-                StateGioEntry(
-                    used_by=used_by,
-                    state_gio=state_gio,
-                )
+            entry = StateGioEntry(
+                used_by=set(used_by_gio_key.get(gio_key, set())),
+                state_gio=state_gio,
             )
+            self._entries.append(entry)
+            for owner_code in entry.used_by:
+                self._entries_by_owner[owner_code].append(entry)
 
     def claim(self, new_gio: PublicationGio, owner_codes: list[str]) -> PublicationGio:
         """
@@ -77,8 +79,8 @@ class StateGioPool:
         return new_gio
 
     def _find_unclaimed_entry_for_owner(self, owner_code: str) -> StateGioEntry | None:
-        for entry in self._entries:
-            if not entry.claimed and owner_code in entry.used_by:
+        for entry in self._entries_by_owner.get(owner_code, []):
+            if not entry.claimed:
                 return entry
         return None
 
@@ -133,8 +135,9 @@ class PatchActMutation:
     def _patch_gios(self, data: ApiActInputData) -> ApiActInputData:
         gios: dict[str, PublicationGio] = data.Publication_Data.gios
 
+        owner_codes_by_gio: dict[str, list[str]] = self._owner_codes_by_gio(data)
         for gio_key, new_gio in gios.items():
-            owner_codes: list[str] = self._owner_codes_for_gio(data, gio_key)
+            owner_codes: list[str] = owner_codes_by_gio.get(gio_key, [])
             gios[gio_key] = self._gio_pool.claim(new_gio, owner_codes)
 
         # After patching the GIOs, we need to restore the original basisgeo_ids on the locaties.
@@ -165,22 +168,20 @@ class PatchActMutation:
 
         return data
 
-    def _owner_codes_for_gio(self, data: ApiActInputData, gio_key: str) -> list[str]:
+    def _owner_codes_by_gio(self, data: ApiActInputData) -> dict[str, list[str]]:
         # Owners are ordered by priority: gebiedengroepen first (sorted by
         # code), then gebiedsaanwijzingen (sorted by code). So when a new gio
         # is shared by owners that previously pointed to different state gios,
         # the gebiedengroep lineage wins deterministically.
-        owner_codes: list[str] = []
+        owner_codes: dict[str, list[str]] = defaultdict(list)
 
         gebiedengroepen = data.Publication_Data.gebiedengroepen.values()
         for groep in sorted(gebiedengroepen, key=lambda g: g.code):
-            if groep.gio_key == gio_key:
-                owner_codes.append(groep.code)
+            owner_codes[groep.gio_key].append(groep.code)
 
         gebiedsaanwijzingen = data.Publication_Data.gebiedsaanwijzingen.values()
         for aanwijzing in sorted(gebiedsaanwijzingen, key=lambda a: a.code):
-            if aanwijzing.gio_key == gio_key:
-                owner_codes.append(aanwijzing.code)
+            owner_codes[aanwijzing.gio_key].append(aanwijzing.code)
 
         return owner_codes
 
@@ -26,12 +26,26 @@ class StateLoader:
         if environment.Active_State is None:
             raise RuntimeError("Unexpecting to not have an active state while the environment is stateful")
         current_state_table: PublicationEnvironmentStateTable = environment.Active_State
-        current_state_dict: dict = current_state_table.State
+
+        return self.load_from_state_table(session, current_state_table)
+
+    def load_from_state_table(self, session: Session, state_table: PublicationEnvironmentStateTable) -> ActiveState:
+        """
+        Outdated states are upgraded once and stored again at the active schema version,
+        the caller decides whether that is committed.
+        """
+        if state_table.Schema_Version == ActiveState.get_schema_version():
+            return ActiveState.model_validate(state_table.State["Data"])
 
         state: ActiveState = self._state_version_factory.get_state_model(
             session,
-            environment.UUID,
-            current_state_dict,
+            state_table.Environment_UUID,
+            state_table.State,
         )
 
+        state_table.State = state.state_dict()
+        state_table.Schema_Version = state.get_schema_version()
+        session.add(state_table)
+        session.flush()
+
         return state
@@ -1,19 +1,104 @@
+import hashlib
+import threading
+import time
 from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
 
-from jinja2 import Template
+from jinja2 import BaseLoader, BytecodeCache, Environment, FileSystemBytecodeCache, Template
+
+
+@dataclass
+class TemplateParserStats:
+    renders: int
+    compiles: int
+    compile_seconds: float
+    render_seconds: float
+
+
+class _TextTemplateLoader(BaseLoader):
+    """
+    Templates are named by the hash of their text, the text is only needed while it is compiled.
+    """
+
+    def __init__(self):
+        self.sources: dict[str, str] = {}
+        # Only called when the template is not in the cache of the Environment
+        self.loads: int = 0
+
+    def get_source(self, environment: Environment, template: str) -> tuple[str, str | None, Callable[[], bool]]:
+        self.loads += 1
+        # The name is the hash of the source, so a compiled template never goes stale
+        return self.sources[template], None, lambda: True
 
 
 class TemplateParser:
+    """
+    Renders the text templates of the publication templates.
+
+    Compiled templates are kept in the LRU cache of a shared jinja2 Environment,
+    keyed by the hash of the template text, so edited templates get a new entry.
+    With a `bytecode_cache_dir` the compiled code is kept on disk as well and reused by other processes.
+    """
+
+    def __init__(self, cache_size: int = 64, bytecode_cache_dir: str | None = None):
+        bytecode_cache: BytecodeCache | None = None
+        if bytecode_cache_dir:
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+        self._loader = _TextTemplateLoader()
+        self._environment = Environment(
+            loader=self._loader,
+            cache_size=cache_size,
+            auto_reload=False,
+            bytecode_cache=bytecode_cache,
+        )
+        self._renders: int = 0
+        self._compiles: int = 0
+        self._compile_seconds: float = 0.0
+        self._render_seconds: float = 0.0
+        self._lock = threading.Lock()
+
     def get_parsed_template(self, text_template: str, objects: list[dict]) -> str:
         aggregated_objects = defaultdict(list)
         for o in objects:
             aggregated_objects[o["Object_Type"]].append(o)
 
-        base_template = Template(text_template)
+        base_template = self._get_template(text_template)
+        started: float = time.monotonic()
         free_text_template_str = base_template.render(
             **aggregated_objects,
         )
         free_text_template_str = free_text_template_str.strip()
         free_text_template_str = free_text_template_str.replace("\n", "")
 
+        with self._lock:
+            self._renders += 1
+            self._render_seconds += time.monotonic() - started
+
         return free_text_template_str
+
+    def get_stats(self) -> TemplateParserStats:
+        with self._lock:
+            return TemplateParserStats(
+                renders=self._renders,
+                compiles=self._compiles,
+                compile_seconds=self._compile_seconds,
+                render_seconds=self._render_seconds,
+            )
+
+    def _get_template(self, text_template: str) -> Template:
+        name: str = hashlib.sha256(text_template.encode("utf-8")).hexdigest()
+        with self._lock:
+            loads: int = self._loader.loads
+            started: float = time.monotonic()
+            self._loader.sources[name] = text_template
+            try:
+                template: Template = self._environment.get_template(name)
+            finally:
+                del self._loader.sources[name]
+
+            if self._loader.loads != loads:
+                self._compiles += 1
+                self._compile_seconds += time.monotonic() - started
+            return template
@@ -99,4 +99,7 @@ class UnifiedPackagesProvider:
             limit=pagination.limit,
             offset=pagination.offset,
             sort=(getattr(combined.c, pagination.sort.column), pagination.sort.order),
+            keyset=combined.c.UUID,
+            cursor=pagination.cursor,
+            count_mode=pagination.get_count_mode(),
         )
@@ -9,11 +9,13 @@ from dso import Gebiedsaanwijzingen, GebiedsaanwijzingenFactory
 from dso.models import DocumentType
 from dso.services.koop.waardelijsten.gen import OnderwerpType, RechtsgebiedType
 from dso.services.ow.gebiedsaanwijzingen.types import Gebiedsaanwijzing, GebiedsaanwijzingWaarde
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, computed_field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError, computed_field
 from sqlalchemy.orm import Session
 
 from app.api.domains.publications.services.act_package.dso_act_input_data_builder import DOCUMENT_TYPE_MAP
 from app.api.domains.publications.types.api_input_data import ApiActInputData, PublicationGio
+from app.api.utils.html_documents import HtmlDocuments, HtmlDocumentStats
+from app.core.logging import logger
 from app.core.services import MainConfig
 
 
@@ -41,6 +43,14 @@ class ValidatePublicationRequest(BaseModel):
     document_type: str
     input_data: ApiActInputData
 
+    _html_documents: HtmlDocuments = PrivateAttr(default_factory=HtmlDocuments)
+
+    def get_html_document(self, owner_key: str, field_name: str, text: str) -> BeautifulSoup:
+        return self._html_documents.get(owner_key, field_name, text)
+
+    def get_html_document_stats(self) -> HtmlDocumentStats:
+        return self._html_documents.get_stats()
+
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
 
 
@@ -80,6 +90,9 @@ class ValidatePublicationService:
         for rule in self._rules:
             errors += rule.validate(db, request)
 
+        html_stats: HtmlDocumentStats = request.get_html_document_stats()
+        logger.info(f"Validated publication: parsed {html_stats.parses} html fields, reused {html_stats.hits}")
+
         return ValidatePublicationResult(
             errors=errors,
         )
@@ -422,8 +435,12 @@ class ForbiddenHtmlTagsRule(ValidatePublicationRule):
 
         for used_object in request.input_data.Publication_Data.used_objects:
             for field_name in self._config.fields:
-                value: str = str(used_object.get(field_name, ""))
-                maybe_forbidden_tag = self._has_forbidden_tags(value)
+                document: BeautifulSoup = request.get_html_document(
+                    used_object.get("Code"),
+                    field_name,
+                    str(used_object.get(field_name, "")),
+                )
+                maybe_forbidden_tag = self._has_forbidden_tags(document)
                 if maybe_forbidden_tag:
                     errors.append(
                         ValidatePublicationError(
@@ -440,8 +457,7 @@ class ForbiddenHtmlTagsRule(ValidatePublicationRule):
 
         return errors
 
-    def _has_forbidden_tags(self, text: str) -> str | None:
-        soup = BeautifulSoup(text, "html.parser")
+    def _has_forbidden_tags(self, soup: BeautifulSoup) -> str | None:
         for tag in self._config.forbidden_html_tags:
             elements = soup.find_all(tag)
             if elements:
@@ -470,7 +486,7 @@ class BillCompactForbiddenTagsRule(ValidatePublicationRule):
             if not article:
                 continue
 
-            soup = BeautifulSoup(article, "html.parser")
+            soup: BeautifulSoup = request.get_html_document("Bill_Compact", article_field, article)
             for tag in self._config.forbidden_tags:
                 tags = soup.find_all(tag)
                 if len(tags) == 0:
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 
 import dso.models as dso_models
@@ -122,12 +122,11 @@ class PublicationGio(BaseModel):
     locaties: list[PublicationGioLocatie]
 
     def has_same_data(self, other: "PublicationGio") -> bool:
-        if self.title != other.title:
-            return False
+        return self.get_data_key() == other.get_data_key()
 
-        self_locs = sorted((loc.title, loc.source_hash) for loc in self.locaties)
-        other_locs = sorted((loc.title, loc.source_hash) for loc in other.locaties)
-        return self_locs == other_locs
+    def get_data_key(self) -> tuple[str, tuple[tuple[str, str], ...]]:
+        # Gios with the same data key are interchangeable, so this can be used to index them
+        return (self.title, tuple(sorted((loc.title, loc.source_hash) for loc in self.locaties)))
 
 
 class PublicationGebiedengroep(BaseModel):
@@ -173,6 +172,8 @@ class PublicationData:
     bill_attachments: list[dict]
     area_of_jurisdiction: dict
     parsed_template: str
+    # Seconds spent per stage while fetching the data, not part of the package itself
+    stage_timings: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -49,3 +49,17 @@ class PublicationVersionStatus(str, Enum):
 class PublicationType(str, Enum):
     ACT = "act"
     ANNOUNCEMENT = "announcement"
+
+
+class PdfExportJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ActPackageJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
@@ -7,7 +7,13 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_core import ErrorDetails
 
 from app.api.domains.modules.types import ModuleStatus
-from app.api.domains.publications.types.enums import MutationStrategy, PublicationVersionStatus
+from app.api.domains.publications.types.enums import (
+    ActPackageJobStatus,
+    MutationStrategy,
+    PackageType,
+    PdfExportJobStatus,
+    PublicationVersionStatus,
+)
 
 
 # This model is meant for frontend
@@ -476,3 +482,34 @@ class PublicationAnnouncementPackageReport(BaseModel):
 
     Created_Date: datetime
     model_config = ConfigDict(from_attributes=True)
+
+
+class PublicationPdfExportJob(BaseModel):
+    UUID: uuid.UUID
+    Environment_Code: str
+    Filename: str
+
+    Status: PdfExportJobStatus
+    Progress: int
+    Error: str | None = None
+
+    Created_Date: datetime
+    Modified_Date: datetime
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PublicationActPackageJob(BaseModel):
+    UUID: uuid.UUID
+    Publication_Version_UUID: uuid.UUID
+    Package_Type: PackageType
+
+    Status: ActPackageJobStatus
+    # The http status code the package creation used to fail with, like 444 for validation errors
+    Error_Code: int | None = None
+    Error: Any = None
+    Act_Package_UUID: uuid.UUID | None = None
+    Stage_Timings: dict[str, float] | None = None
+
+    Created_Date: datetime
+    Modified_Date: datetime
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import BinaryIO
 
 
 @dataclass
@@ -7,3 +8,13 @@ class ZipData:
     Filename: str
     Binary: bytes
     Checksum: str
+
+
+@dataclass
+class SpooledZipData:
+    Publication_Filename: str
+    Filename: str
+    # Positioned at the start, kept in memory up to a limit and on disk beyond that
+    File: BinaryIO
+    Size: int
+    Checksum: str
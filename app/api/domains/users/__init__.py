@@ -1,2 +1,2 @@
-from .services import Security
+from .services import Security, UserCache
 from .user_repository import UserRepository
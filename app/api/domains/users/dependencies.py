@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.api.api_container import ApiContainer
 from app.api.dependencies import depends_db_session
 from app.api.domains.users.services.security import Security
+from app.api.domains.users.services.user_cache import UserCache
 from app.api.domains.users.types import TokenPayload
 from app.api.domains.users.user_repository import UserRepository
 from app.api.services.permission_service import PermissionService
@@ -24,8 +25,9 @@ def depends_current_user(
     session: Annotated[Session, Depends(depends_db_session)],
     user_repository: Annotated[UserRepository, Depends(Provide[ApiContainer.user_repository])],
     security: Annotated[Security, Depends(Provide[ApiContainer.security])],
+    user_cache: Annotated[UserCache, Depends(Provide[ApiContainer.user_cache])],
 ) -> UsersTable:
-    return _do_depends_current_user(session, token, user_repository, security)
+    return _do_depends_current_user(session, token, user_repository, security, user_cache)
 
 
 def _do_depends_current_user(
@@ -33,15 +35,20 @@ def _do_depends_current_user(
     token: str | None,
     user_repository: UserRepository,
     security: Security,
+    user_cache: UserCache,
 ) -> UsersTable:
     if not token:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Not authenticated")
 
     token_data: TokenPayload = security.decode_token(token)
+    user_uuid: UUID = UUID(token_data.sub)
 
-    user: UsersTable | None = user_repository.get_by_uuid(session, UUID(token_data.sub))
+    user: UsersTable | None = user_cache.get(session, user_uuid, token_data.exp)
     if not user:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Token valid, but no matching user found.")
+        user = user_repository.get_by_uuid(session, user_uuid)
+        if not user:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Token valid, but no matching user found.")
+        user_cache.put(user, token_data.exp)
     if not user.IsActive:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Inactive user")
 
@@ -54,9 +61,10 @@ def depends_optional_current_user(
     token: Annotated[str | None, Depends(reusable_oauth2)],
     user_repository: Annotated[UserRepository, Depends(Provide[ApiContainer.user_repository])],
     security: Annotated[Security, Depends(Provide[ApiContainer.security])],
+    user_cache: Annotated[UserCache, Depends(Provide[ApiContainer.user_cache])],
 ) -> UsersTable | None:
     try:
-        return _do_depends_current_user(session, token, user_repository, security)
+        return _do_depends_current_user(session, token, user_repository, security, user_cache)
     except HTTPException:
         return None
 
@@ -1 +1,2 @@
 from .security import Security
+from .user_cache import UserCache
@@ -0,0 +1,81 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.db.session import register_commit_invalidation
+from app.core.tables.users import UsersTable
+
+# Sessions carrying a UserCache in their `info` invalidate it when they commit user writes
+USER_CACHE_INFO_KEY = "user_cache"
+
+WATCHED_TABLES: frozenset[str] = frozenset({UsersTable.__tablename__})
+
+# The password hash is not kept in memory, it is loaded from the database when accessed
+_CACHED_COLUMNS: tuple[str, ...] = tuple(
+    column.key for column in UsersTable.__table__.columns if column.key != "Wachtwoord"
+)
+
+_Key = tuple[uuid.UUID, int | None]
+
+
+class UserCache:
+    """
+    Short lived cache of the users resolved from access tokens, keyed by the user UUID and the token expiry.
+    An entry never outlives the token it was loaded for.
+
+    All entries are dropped when a session commits a write to the users table,
+    the ttl bounds the staleness of writes made by other processes.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 1024):
+        self._ttl_seconds: int = ttl_seconds
+        self._max_entries: int = max_entries
+        self._entries: OrderedDict[_Key, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_entries > 0
+
+    def get(self, session: Session, user_uuid: uuid.UUID, token_expires_at: int | None) -> UsersTable | None:
+        key: _Key = (user_uuid, token_expires_at)
+        with self._lock:
+            entry: tuple[float, dict] | None = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, values = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        user = UsersTable(**values)
+        make_transient_to_detached(user)
+        # Attaches the user to the session without a query, or returns the instance the session already has
+        return session.merge(user, load=False)
+
+    def put(self, user: UsersTable, token_expires_at: int | None) -> None:
+        if not self.is_enabled():
+            return
+
+        expires_at: float = time.time() + self._ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        values: dict = {column: getattr(user, column) for column in _CACHED_COLUMNS}
+        key: _Key = (user.UUID, token_expires_at)
+        with self._lock:
+            self._entries[key] = (expires_at, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+register_commit_invalidation(USER_CACHE_INFO_KEY, WATCHED_TABLES, UserCache.invalidate)
@@ -5,6 +5,7 @@ from pydantic import BaseModel, ConfigDict, field_validator
 
 class TokenPayload(BaseModel):
     sub: str | None = None
+    exp: int | None = None
 
 
 class UserShort(BaseModel):
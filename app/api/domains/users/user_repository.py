@@ -47,6 +47,7 @@ class UserRepository(BaseRepository):
             session=session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
             sort=(getattr(UsersTable, pagination.sort.column), pagination.sort.order),
         )
@@ -57,6 +58,7 @@ class UserRepository(BaseRepository):
             session=session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
             sort=(getattr(UsersTable, pagination.sort.column), pagination.sort.order),
         )
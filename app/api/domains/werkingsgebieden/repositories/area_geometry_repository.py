@@ -1,14 +1,28 @@
+import hashlib
 import uuid
 from abc import ABCMeta, abstractmethod
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.orm import Session
 
 from app.api.domains.werkingsgebieden.repositories.area_repository import AreaRepository
 from app.core.tables.others import AreasTable
 from app.core.tables.werkingsgebieden import InputGeoOnderverdelingenTable
 
+# Keeps the number of parameters and the size of the fetched Gml per query bounded
+AREAS_PER_QUERY: int = 100
+
+
+@dataclass
+class AreaGml:
+    uuid: uuid.UUID
+    title: str
+    gml: str
+    gml_hash: str  # sha512 hex of the gml
+
 
 class AreaGeometryRepository(AreaRepository, metaclass=ABCMeta):
     @abstractmethod
@@ -27,6 +41,14 @@ class AreaGeometryRepository(AreaRepository, metaclass=ABCMeta):
     def _calculate_hex(self, column: str) -> str:
         pass
 
+    @abstractmethod
+    def _new_uuid(self) -> str:
+        pass
+
+    @abstractmethod
+    def _left(self, column: str, length: int) -> str:
+        pass
+
     def get_shape_hash(self, session: Session, uuidx: uuid.UUID) -> str | None:
         params = {
             "uuid": self._format_uuid(uuidx),
@@ -90,6 +112,53 @@ class AreaGeometryRepository(AreaRepository, metaclass=ABCMeta):
         """
         session.execute(text(put_geometry_stmt), put_geometry_params)
 
+    def create_areas_from_onderverdelingen(
+        self,
+        session: Session,
+        created_date: datetime,
+        created_by_uuid: uuid.UUID,
+        onderverdeling_uuids: Iterable[uuid.UUID],
+    ) -> dict[uuid.UUID, uuid.UUID]:
+        """
+        Same as `create_area` for many onderverdelingen, the Gml and geometries are copied by the database
+        with one INSERT ... SELECT per chunk instead of passing through the application.
+
+        Returns the new area UUID per onderverdeling UUID.
+        """
+        result: dict[uuid.UUID, uuid.UUID] = {}
+        for chunk in self._chunks(onderverdeling_uuids):
+            params, placeholders = self._in_params(chunk)
+            params["created_by_uuid"] = self._format_uuid(created_by_uuid)
+            insert_sql = f"""
+                INSERT INTO areas (
+                    UUID, Created_Date, Created_By_UUID, Shape, Gml,
+                    Source_Symbol, Source_Geometry_Index, Source_Geometry_Hash,
+                    Source_UUID, Source_Title, Source_Created_Date
+                )
+                SELECT
+                    {self._new_uuid()}, :created_date, :created_by_uuid, Geometry, GML,
+                    Symbol, {self._left("Geometry_Hash", 10)}, Geometry_Hash,
+                    UUID, Title, Created_Date
+                FROM
+                    Input_GEO_Onderverdeling
+                WHERE
+                    UUID IN ({placeholders})
+                """
+            insert_stmt = text(insert_sql).bindparams(bindparam("created_date", type_=AreasTable.Created_Date.type))
+            session.execute(insert_stmt, {**params, "created_date": created_date})
+
+            select_sql = f"""
+                SELECT
+                    UUID, Source_UUID
+                FROM
+                    areas
+                WHERE
+                    Source_UUID IN ({placeholders})
+                """
+            for row in session.execute(text(select_sql), params):
+                result[self._parse_uuid(row.Source_UUID)] = self._parse_uuid(row.UUID)
+        return result
+
     def get_area(self, session: Session, uuidx: uuid.UUID) -> dict:
         row = self.get_area_optional(session, uuidx)
         if row is None:
@@ -117,19 +186,59 @@ class AreaGeometryRepository(AreaRepository, metaclass=ABCMeta):
         row_dict = row._asdict()
         return row_dict
 
-    # TODO: WIP - not used yet. combine query for multiple areas for performance
-    def get_areas(self, session: Session, uuids: list[uuid.UUID]) -> dict[uuid.UUID, dict]:
-        placeholders = ", ".join(f":uuid{i}" for i in range(len(uuids)))
-        params = {f"uuid{i}": uuid for i, uuid in enumerate(uuids)}
-        sql = f"""
-            SELECT
-                UUID, Created_Date, Created_By_UUID,
-                {self._shape_to_text("Shape")} AS Shape,
-                Source_Title, Source_Symbol
-            FROM
-                areas
-            WHERE
-                UUID IN ({placeholders})
-            """
-        rows = session.execute(text(sql), params).fetchall()
-        return {row.UUID: row._asdict() for row in rows}
+    def get_areas(self, session: Session, uuids: Iterable[uuid.UUID]) -> dict[uuid.UUID, dict]:
+        result: dict[uuid.UUID, dict] = {}
+        for chunk in self._chunks(uuids):
+            params, placeholders = self._in_params(chunk)
+            sql = f"""
+                SELECT
+                    UUID, Created_Date, Created_By_UUID,
+                    {self._shape_to_text("Shape")} AS Shape,
+                    Source_Title, Source_Symbol
+                FROM
+                    areas
+                WHERE
+                    UUID IN ({placeholders})
+                """
+            for row in session.execute(text(sql), params):
+                result[self._parse_uuid(row.UUID)] = row._asdict()
+        return result
+
+    def iter_areas_with_gml(self, session: Session, uuids: Iterable[uuid.UUID]) -> Iterator[list[AreaGml]]:
+        """
+        Yields the Gml of the areas one chunk (query) at a time, unknown UUIDs are skipped.
+        The rows do not become ORM instances, so nothing is kept in the session.
+        """
+        for chunk in self._chunks(uuids):
+            params, placeholders = self._in_params(chunk)
+            sql = f"""
+                SELECT
+                    UUID, Source_Title, Gml
+                FROM
+                    areas
+                WHERE
+                    UUID IN ({placeholders})
+                """
+            yield [
+                AreaGml(
+                    uuid=self._parse_uuid(row.UUID),
+                    title=row.Source_Title,
+                    gml=row.Gml,
+                    gml_hash=hashlib.sha512(row.Gml.encode()).hexdigest(),
+                )
+                for row in session.execute(text(sql), params)
+            ]
+
+    def _chunks(self, uuids: Iterable[uuid.UUID]) -> Iterator[list[uuid.UUID]]:
+        unique_uuids: list[uuid.UUID] = list(dict.fromkeys(uuids))
+        for i in range(0, len(unique_uuids), AREAS_PER_QUERY):
+            yield unique_uuids[i : i + AREAS_PER_QUERY]
+
+    def _in_params(self, uuids: list[uuid.UUID]) -> tuple[dict[str, str], str]:
+        params: dict[str, str] = {f"uuid{i}": self._format_uuid(uuidx) for i, uuidx in enumerate(uuids)}
+        placeholders: str = ", ".join(f":{key}" for key in params)
+        return params, placeholders
+
+    def _parse_uuid(self, value) -> uuid.UUID:
+        # Depending on the driver the UUID column is returned as UUID, hex or string
+        return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
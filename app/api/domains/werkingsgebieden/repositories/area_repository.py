@@ -6,6 +6,9 @@ from sqlalchemy.orm import Session, undefer
 from app.api.base_repository import BaseRepository
 from app.core.tables.others import AreasTable
 
+# Keeps the number of parameters per query below the limit of mssql
+SOURCES_PER_QUERY: int = 500
+
 
 class AreaRepository(BaseRepository):
     def get_by_uuid(self, session: Session, uuidx: UUID) -> AreasTable | None:
@@ -29,6 +32,27 @@ class AreaRepository(BaseRepository):
         )
         return self.fetch_first(session, stmt)
 
+    def get_by_source_hashes_and_titles(
+        self, session: Session, sources: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], AreasTable]:
+        """
+        Same as `get_by_source_hash_and_title` for many (source_hash, source_title) pairs at once.
+        """
+        unique_sources: list[tuple[str, str]] = list(dict.fromkeys(source for source in sources if source[0]))
+        result: dict[tuple[str, str], AreasTable] = {}
+        for i in range(0, len(unique_sources), SOURCES_PER_QUERY):
+            chunk: list[tuple[str, str]] = unique_sources[i : i + SOURCES_PER_QUERY]
+            hashes: set[str] = {source_hash for source_hash, _ in chunk}
+            stmt = (
+                select(AreasTable)
+                .filter(AreasTable.Source_Geometry_Index.in_({source_hash[0:10] for source_hash in hashes}))
+                .filter(AreasTable.Source_Geometry_Hash.in_(hashes))
+                .filter(AreasTable.Source_Title.in_({source_title for _, source_title in chunk}))
+            )
+            for area in self.fetch_all(session, stmt):
+                result.setdefault((area.Source_Geometry_Hash, area.Source_Title), area)
+        return result
+
     def get_by_source_hash(self, session: Session, source_hash: str) -> AreasTable | None:
         if not source_hash:
             return None
@@ -49,6 +49,7 @@ class InputGeoWerkingsgebiedenRepository(BaseRepository):
             session=session,
             statement=stmt,
             offset=pagination.offset,
+            count_mode=pagination.get_count_mode(),
             limit=pagination.limit,
             sort=(sort_column, pagination.sort.order),
         )
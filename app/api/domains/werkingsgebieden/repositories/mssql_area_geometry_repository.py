@@ -15,3 +15,9 @@ class MssqlAreaGeometryRepository(AreaGeometryRepository):
 
     def _calculate_hex(self, column: str) -> str:
         return f"CONVERT(varchar(max), {column}.STAsBinary(), 2)"
+
+    def _new_uuid(self) -> str:
+        return "NEWID()"
+
+    def _left(self, column: str, length: int) -> str:
+        return f"LEFT({column}, {length})"
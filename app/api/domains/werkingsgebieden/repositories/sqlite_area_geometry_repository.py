@@ -15,3 +15,13 @@ class SqliteAreaGeometryRepository(AreaGeometryRepository):
 
     def _calculate_hex(self, column: str) -> str:
         return f"hex({column})"
+
+    def _new_uuid(self) -> str:
+        # Uuid columns are stored as 32 hex characters, formatted as a version 4 UUID
+        return (
+            "lower(hex(randomblob(6)) || '4' || substr(hex(randomblob(2)), 2) || "
+            "substr('89ab', 1 + (abs(random()) % 4), 1) || substr(hex(randomblob(2)), 2) || hex(randomblob(6)))"
+        )
+
+    def _left(self, column: str, length: int) -> str:
+        return f"substr({column}, 1, {length})"
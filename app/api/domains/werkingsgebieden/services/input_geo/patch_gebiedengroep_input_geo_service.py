@@ -4,16 +4,17 @@ from enum import Enum
 
 from fastapi import HTTPException, status
 from slugify import slugify
-from sqlalchemy import String, func, insert, select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 import app.api.domains.modules.services.manage_object_context_service as mocs
 from app.api.domains.modules.repositories.module_object_repository import ModuleObjectRepository
 from app.api.domains.modules.services.manage_object_context_service import ManageObjectContextService
 from app.api.domains.objects.repositories.object_static_repository import ObjectStaticRepository
+from app.api.domains.others.services.search_backend import SearchBackend
 from app.api.domains.werkingsgebieden.repositories.area_geometry_repository import AreaGeometryRepository
 from app.api.domains.werkingsgebieden.repositories.area_repository import AreaRepository
-from app.core.tables.modules import ModuleObjectContextTable, ModuleObjectsTable
+from app.core.tables.modules import ModuleObjectsTable
 from app.core.tables.objects import ObjectStaticsTable
 from app.core.tables.others import AreasTable
 from app.core.tables.users import UsersTable
@@ -34,6 +35,7 @@ class PatchGebiedengroepInputGeoService:
         object_context_service: ManageObjectContextService,
         area_repository: AreaRepository,
         area_geometry_repository: AreaGeometryRepository,
+        search_backend: SearchBackend,
         session: Session,
         user: UsersTable,
         onderverdeling_object_type: str,
@@ -44,31 +46,44 @@ class PatchGebiedengroepInputGeoService:
         self._object_context_service: ManageObjectContextService = object_context_service
         self._area_repository: AreaRepository = area_repository
         self._area_geometry_repository: AreaGeometryRepository = area_geometry_repository
+        self._search_backend: SearchBackend = search_backend
         self._session: Session = session
         self._user: UsersTable = user
         self._onderverdeling_object_type: str = onderverdeling_object_type
         self._input_geo_werkingsgebied: InputGeoWerkingsgebiedenTable = input_geo_werkingsgebied
         self._timepoint: datetime = datetime.now(UTC)
+        self._written_uuids: list[uuid.UUID] = []
 
     def patch(self, main_obj: ModuleObjectsTable) -> ModuleObjectsTable:
-        used_sub_codes: set[str] = set()
-        something_changed: bool = False
-
+        # Onderverdelingen with the same title share their sub object, which points to the area of the last one
+        onderverdelingen: dict[str, InputGeoOnderverdelingenTable] = {}
         for onderverdeling in self._input_geo_werkingsgebied.Onderverdelingen:
-            sub_object_static: ObjectStaticsTable = self._ensure_static_object(
-                main_obj,
-                onderverdeling,
-            )
-            area_uuid: uuid.UUID = self._ensure_area(onderverdeling)
-            _sub_object_context: ModuleObjectContextTable = self._ensure_object_context(
-                sub_object_static,
+            if not onderverdeling.Geometry_Hash:
+                raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Onderverdeling does not have an Hash")
+            onderverdelingen[self._get_source_key(onderverdeling)] = onderverdeling
+
+        sub_object_statics: dict[str, ObjectStaticsTable] = self._ensure_static_objects(main_obj, onderverdelingen)
+        area_uuids: dict[str, uuid.UUID] = self._ensure_areas(onderverdelingen)
+        self._ensure_object_contexts(list(sub_object_statics.values()), main_obj.Module_ID)
+
+        existing_objects: dict[str, ModuleObjectsTable] = (
+            self._module_object_repository.get_latest_by_module_id_object_codes(
+                self._session,
                 main_obj.Module_ID,
+                {sub_object_static.Code for sub_object_static in sub_object_statics.values()},
             )
+        )
 
+        used_sub_codes: set[str] = set()
+        something_changed: bool = False
+
+        for source_key, onderverdeling in onderverdelingen.items():
+            sub_object_static: ObjectStaticsTable = sub_object_statics[source_key]
             object_result_action, _sub_object = self._ensure_object_newest_area(
                 sub_object_static,
+                existing_objects.get(sub_object_static.Code),
                 main_obj.Module_ID,
-                area_uuid,
+                area_uuids[source_key],
                 onderverdeling.Title,
             )
             if object_result_action in [ObjectResultType.CREATED, ObjectResultType.UPDATED]:
@@ -96,46 +111,56 @@ class PatchGebiedengroepInputGeoService:
             )
             self._session.add(new_main_obj)
             self._session.flush()
+            self._search_backend.sync(
+                self._session,
+                ModuleObjectsTable.__tablename__,
+                [new_main_obj.UUID, *self._written_uuids],
+            )
             self._session.commit()
 
             return new_main_obj
 
         return main_obj
 
-    def _ensure_static_object(
+    def _get_source_key(self, onderverdeling: InputGeoOnderverdelingenTable) -> str:
+        return slugify(f"igo:{onderverdeling.Title}")
+
+    def _ensure_static_objects(
         self,
         main_obj: ModuleObjectsTable,
-        onderverdeling: InputGeoOnderverdelingenTable,
-    ) -> ObjectStaticsTable:
-        source_key: str = slugify(f"igo:{onderverdeling.Title}")
-        sub_obj_static: ObjectStaticsTable | None = self._object_static_repository.get_by_source(
+        onderverdelingen: dict[str, InputGeoOnderverdelingenTable],
+    ) -> dict[str, ObjectStaticsTable]:
+        sub_object_statics: dict[str, ObjectStaticsTable] = self._object_static_repository.get_by_sources(
             self._session,
-            source_key,
+            set(onderverdelingen.keys()),
         )
-        if sub_obj_static:
-            return sub_obj_static
+        missing: dict[str, InputGeoOnderverdelingenTable] = {
+            source_key: onderverdeling
+            for source_key, onderverdeling in onderverdelingen.items()
+            if source_key not in sub_object_statics
+        }
+        if missing:
+            sub_object_statics.update(self._create_object_statics(main_obj, missing))
 
-        return self._create_object_static(main_obj, onderverdeling, source_key)
+        return sub_object_statics
 
-    def _create_object_static(
+    def _create_object_statics(
         self,
         main_obj: ModuleObjectsTable,
-        onderverdeling: InputGeoOnderverdelingenTable,
-        source_key: str,
-    ) -> ObjectStaticsTable:
-        generate_id_subq = (
-            select(func.coalesce(func.max(ObjectStaticsTable.Object_ID), 0) + 1)
-            .select_from(ObjectStaticsTable)
-            .filter(ObjectStaticsTable.Object_Type == self._onderverdeling_object_type)
-            .scalar_subquery()
-        )
+        onderverdelingen: dict[str, InputGeoOnderverdelingenTable],
+    ) -> dict[str, ObjectStaticsTable]:
+        max_object_id: int = self._session.execute(
+            select(func.coalesce(func.max(ObjectStaticsTable.Object_ID), 0)).filter(
+                ObjectStaticsTable.Object_Type == self._onderverdeling_object_type
+            )
+        ).scalar_one()
 
-        stmt = (
-            insert(ObjectStaticsTable)
-            .values(
+        result: dict[str, ObjectStaticsTable] = {}
+        for object_id, (source_key, onderverdeling) in enumerate(onderverdelingen.items(), start=max_object_id + 1):
+            result[source_key] = ObjectStaticsTable(
                 Object_Type=self._onderverdeling_object_type,
-                Object_ID=generate_id_subq,
-                Code=(self._onderverdeling_object_type + "-" + func.cast(generate_id_subq, String)),
+                Object_ID=object_id,
+                Code=f"{self._onderverdeling_object_type}-{object_id}",
                 Cached_Title=onderverdeling.Title,
                 Source_Identifier=source_key,
                 # These are inherited from the parent object
@@ -143,68 +168,65 @@ class PatchGebiedengroepInputGeoService:
                 Owner_2_UUID=main_obj.ObjectStatics.Owner_2_UUID,
                 Client_1_UUID=main_obj.ObjectStatics.Client_1_UUID,
             )
-            .returning(ObjectStaticsTable)
-        )
-
-        response: ObjectStaticsTable | None = self._session.execute(stmt).scalars().first()
-        if response is None:
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to create new object static")
-
-        return response
 
-    def _ensure_area(self, onderverdeling: InputGeoOnderverdelingenTable) -> uuid.UUID:
-        if not onderverdeling.Geometry_Hash:
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Onderverdeling does not have an Hash")
+        # Inserted in one batch by the flush
+        self._session.add_all(result.values())
+        self._session.flush()
+        return result
 
+    def _ensure_areas(self, onderverdelingen: dict[str, InputGeoOnderverdelingenTable]) -> dict[str, uuid.UUID]:
         # These sources hashes are not unique sadly
         # We try to push for the most correct area by filtering by title first
-        existing_area: AreasTable | None = self._area_repository.get_by_source_hash_and_title(
+        existing_areas: dict[tuple[str, str], AreasTable] = self._area_repository.get_by_source_hashes_and_titles(
             self._session,
-            onderverdeling.Geometry_Hash,
-            onderverdeling.Title,
+            [(onderverdeling.Geometry_Hash, onderverdeling.Title) for onderverdeling in onderverdelingen.values()],
         )
-        if existing_area:
-            return existing_area.UUID
 
-        area_uuid: uuid.UUID = uuid.uuid4()
-        self._area_geometry_repository.create_area(
-            self._session,
-            area_uuid,
-            self._timepoint,
-            self._user.UUID,
-            onderverdeling,
-        )
-        return area_uuid
-
-    def _ensure_object_context(self, sub_object_static: ObjectStaticsTable, module_id: int) -> ModuleObjectContextTable:
-        request = mocs.ExistRequest(
-            module_id=module_id,
-            object_type=sub_object_static.Object_Type,
-            object_id=sub_object_static.Object_ID,
-            timepoint=self._timepoint,
-            original_adjust_on=None,
-            explanation="",
-            conclusion="",
-            user_uuid=self._user.UUID,
-        )
-        result: mocs.Result = self._object_context_service.ensure_exists(
-            self._session,
-            request,
-        )
-        return result.object_context
+        area_uuids: dict[str, uuid.UUID] = {}
+        missing: dict[str, InputGeoOnderverdelingenTable] = {}
+        for source_key, onderverdeling in onderverdelingen.items():
+            existing_area: AreasTable | None = existing_areas.get((onderverdeling.Geometry_Hash, onderverdeling.Title))
+            if existing_area:
+                area_uuids[source_key] = existing_area.UUID
+            else:
+                missing[source_key] = onderverdeling
+
+        if missing:
+            created: dict[uuid.UUID, uuid.UUID] = self._area_geometry_repository.create_areas_from_onderverdelingen(
+                self._session,
+                self._timepoint,
+                self._user.UUID,
+                [onderverdeling.UUID for onderverdeling in missing.values()],
+            )
+            for source_key, onderverdeling in missing.items():
+                area_uuids[source_key] = created[onderverdeling.UUID]
+
+        return area_uuids
+
+    def _ensure_object_contexts(self, sub_object_statics: list[ObjectStaticsTable], module_id: int) -> None:
+        requests: list[mocs.ExistRequest] = [
+            mocs.ExistRequest(
+                module_id=module_id,
+                object_type=sub_object_static.Object_Type,
+                object_id=sub_object_static.Object_ID,
+                timepoint=self._timepoint,
+                original_adjust_on=None,
+                explanation="",
+                conclusion="",
+                user_uuid=self._user.UUID,
+            )
+            for sub_object_static in sub_object_statics
+        ]
+        self._object_context_service.ensure_exists_many(self._session, module_id, requests)
 
     def _ensure_object_newest_area(
         self,
         sub_object_static: ObjectStaticsTable,
+        existing_object: ModuleObjectsTable | None,
         module_id: int,
         area_uuid: uuid.UUID,
         title: str,
     ) -> tuple[ObjectResultType, ModuleObjectsTable]:
-        existing_object: ModuleObjectsTable | None = self._module_object_repository.get_latest_by_module_id_object_code(
-            self._session,
-            module_id,
-            sub_object_static.Code,
-        )
         if existing_object is None:
             return ObjectResultType.CREATED, self._create_sub_object(sub_object_static, module_id, area_uuid, title)
 
@@ -236,6 +258,7 @@ class PatchGebiedengroepInputGeoService:
         module_object.Modified_By_UUID = self._user.UUID
 
         self._session.add(module_object)
+        self._written_uuids.append(module_object.UUID)
         return module_object
 
     def _modify_sub_object(
@@ -253,6 +276,7 @@ class PatchGebiedengroepInputGeoService:
             self._user.UUID,
         )
         self._session.add(patched_sub_object)
+        self._written_uuids.append(patched_sub_object.UUID)
         return patched_sub_object
 
 
@@ -264,12 +288,14 @@ class PatchGebiedengroepInputGeoServiceFactory:
         object_context_service: ManageObjectContextService,
         area_repository: AreaRepository,
         area_geometry_repository: AreaGeometryRepository,
+        search_backend: SearchBackend,
     ):
         self._object_static_repository: ObjectStaticRepository = object_static_repository
         self._module_object_repository: ModuleObjectRepository = module_object_repository
         self._object_context_service: ManageObjectContextService = object_context_service
         self._area_repository: AreaRepository = area_repository
         self._area_geometry_repository: AreaGeometryRepository = area_geometry_repository
+        self._search_backend: SearchBackend = search_backend
 
     def create_service(
         self,
@@ -284,6 +310,7 @@ class PatchGebiedengroepInputGeoServiceFactory:
             self._object_context_service,
             self._area_repository,
             self._area_geometry_repository,
+            self._search_backend,
             session,
             user,
             onderverdeling_object_type,
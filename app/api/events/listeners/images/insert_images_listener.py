@@ -2,7 +2,7 @@ import json
 import re
 from uuid import UUID
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -10,12 +10,16 @@ from app.api.domains.objects.repositories.asset_repository import AssetRepositor
 from app.api.events.retrieved_module_objects_event import RetrievedModuleObjectsEvent
 from app.api.events.retrieved_objects_event import RetrievedObjectsEvent
 from app.api.events.types import ApiEvent, ApiListener
+from app.api.types import AssetMode
 from app.core.tables.others import AssetsTable
 from app.core.types import DynamicObjectModel, Model
 
+ASSET_URL = "/assets/{uuid}"
+
 
 class InsertHtmlImagesConfig(BaseModel):
     fields: set[str]
+    mode: AssetMode = AssetMode.INLINE
 
 
 class HtmlImagesInserter:
@@ -32,7 +36,11 @@ class HtmlImagesInserter:
         self._asset_repository: AssetRepository = asset_repository
 
     def process(self) -> list[BaseModel]:
-        for index, row in enumerate(self._rows):
+        # Parse every field once and remember the placeholders,
+        # so all assets can be fetched in a single pass
+        parsed_fields: list[tuple[BaseModel, str, BeautifulSoup, list[tuple[Tag, UUID]]]] = []
+        asset_uuids: list[UUID] = []
+        for row in self._rows:
             for field_name in self._config.fields:
                 if not hasattr(row, field_name):
                     continue
@@ -43,29 +51,51 @@ class HtmlImagesInserter:
 
                 soup = BeautifulSoup(content, "html.parser")
 
+                placeholders: list[tuple[Tag, UUID]] = []
                 for img in soup.find_all("img", src=re.compile(r"^\[ASSET")):
                     try:
                         asset_uuid = UUID(img["src"].split(":")[1][:-1])
                     except ValueError:
                         continue
 
-                    asset: AssetsTable | None = self._asset_repository.get_by_uuid(self._session, asset_uuid)
-                    if not asset:
-                        continue
-
-                    content: str = asset.Content
-                    # @note: We have some invalid entries in the database where the data:image prefix is not present
-                    if content[0:10] != "data:image":
-                        meta: dict[str, str] = json.loads(asset.Meta)
-                        mime_type = meta.get("ext", "png").lower()
-                        content = f"data:image/{mime_type};base64,{content}"
+                    placeholders.append((img, asset_uuid))
+                    asset_uuids.append(asset_uuid)
 
-                    img["src"] = content
+                parsed_fields.append((row, field_name, soup, placeholders))
 
+        if self._config.mode == AssetMode.URL:
+            # Links do not need the asset content, the client fetches (and caches) them separately
+            for row, field_name, soup, placeholders in parsed_fields:
+                for img, asset_uuid in placeholders:
+                    img["src"] = ASSET_URL.format(uuid=asset_uuid)
                 setattr(row, field_name, str(soup))
+            return self._rows
+
+        assets: dict[UUID, AssetsTable] = {}
+        if asset_uuids:
+            assets = self._asset_repository.get_map_by_uuids(self._session, asset_uuids)
+
+        for row, field_name, soup, placeholders in parsed_fields:
+            for img, asset_uuid in placeholders:
+                asset: AssetsTable | None = assets.get(asset_uuid)
+                if not asset:
+                    continue
+
+                img["src"] = self._as_data_url(asset)
+
+            setattr(row, field_name, str(soup))
 
         return self._rows
 
+    def _as_data_url(self, asset: AssetsTable) -> str:
+        content: str = asset.Content
+        # @note: We have some invalid entries in the database where the data:image prefix is not present
+        if content[0:10] != "data:image":
+            meta: dict[str, str] = json.loads(asset.Meta)
+            mime_type = meta.get("ext", "png").lower()
+            content = f"data:image/{mime_type};base64,{content}"
+        return content
+
 
 class HtmlImagesInserterFactory:
     def __init__(self, asset_repository: AssetRepository):
@@ -93,6 +123,8 @@ class InsertHtmlImagesListenerBase[EventT: ApiEvent](ApiListener[EventT]):
         config: InsertHtmlImagesConfig | None = self._collect_config(event.context.response_model)
         if not config or not config.fields:
             return event
+        if event.context.asset_mode is not None:
+            config.mode = event.context.asset_mode
 
         inserter: HtmlImagesInserter = self._service_factory.create(session, event.payload.rows, config)
         result_rows = inserter.process()
@@ -115,7 +147,13 @@ class InsertHtmlImagesListenerBase[EventT: ApiEvent](ApiListener[EventT]):
         if not fields:
             return None
 
-        config: InsertHtmlImagesConfig = InsertHtmlImagesConfig(fields=set(fields))
+        mode: str = config_dict.get("mode", AssetMode.INLINE.value)
+        try:
+            asset_mode = AssetMode(mode)
+        except ValueError:
+            raise RuntimeError("Invalid insert_assets config, expect `mode` to be `inline` or `url`")
+
+        config: InsertHtmlImagesConfig = InsertHtmlImagesConfig(fields=set(fields), mode=asset_mode)
         return config
 
 
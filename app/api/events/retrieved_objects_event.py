@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from pydantic import BaseModel
 
 from app.api.events.types import ApiEvent
+from app.api.types import AssetMode
 from app.core.types import Model
 
 
@@ -15,6 +16,7 @@ class RetrievedObjectsEventPayload:
 class RetrievedObjectsEventContext:
     endpoint_id: str
     response_model: Model
+    asset_mode: AssetMode | None = None
 
 
 class RetrievedObjectsEvent(ApiEvent):
@@ -32,11 +34,13 @@ class RetrievedObjectsEvent(ApiEvent):
         rows: list[BaseModel],
         endpoint_id: str,
         response_model: Model,
+        asset_mode: AssetMode | None = None,
     ):
         return RetrievedObjectsEvent(
             payload=RetrievedObjectsEventPayload(rows),
             context=RetrievedObjectsEventContext(
                 endpoint_id,
                 response_model,
+                asset_mode,
             ),
         )
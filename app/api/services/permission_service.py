@@ -8,19 +8,19 @@ from app.core.tables.users import UsersTable
 
 class PermissionService:
     def __init__(self, main_config: MainConfig):
-        self._permissions_per_role: dict[str, set[str]] = {}
+        self._permissions_per_role: dict[str, frozenset[str]] = {}
 
         main_config_dict: dict = main_config.get_main_config()
         config_permissions: dict[str, list[str]] = main_config_dict.get("users_permissions", {})
         for role, permissions in config_permissions.items():
-            self._permissions_per_role[role] = set(permissions)
+            self._permissions_per_role[role] = frozenset(permissions)
 
     def has_permission(self, permission: str, user: UsersTable) -> bool:
         role: str | None = user.Rol
         if role is None:
             return False
 
-        permissions: set[str] = self._permissions_per_role.get(role, set())
+        permissions: frozenset[str] = self._permissions_per_role.get(role, frozenset())
         return permission in permissions
 
     def guard_valid_user(
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -13,3 +14,14 @@ class PreparedQuery:
 
 class ResponseOK(BaseModel):
     message: str = Field("OK")
+
+
+class AssetMode(str, Enum):
+    """
+    How `[ASSET:uuid]` placeholders in html fields are resolved in responses
+    - inline: as base64 data urls
+    - url: as links to the asset endpoint, which clients can cache
+    """
+
+    INLINE = "inline"
+    URL = "url"
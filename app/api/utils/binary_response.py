@@ -0,0 +1,131 @@
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from typing import NamedTuple
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.api.utils.http_cache import if_none_match
+from app.core.db.session import SessionFactoryType, session_scope_with_context
+
+READ_CHUNK_BYTES: int = 1024 * 1024
+
+
+class ByteRange(NamedTuple):
+    start: int
+    end: int  # Inclusive
+
+
+def parse_range(request: Request, size: int, validators: tuple[str, ...]) -> ByteRange | None:
+    """
+    Returns the single byte range requested by the `Range` header, or None when the whole content should be sent.
+    Multiple ranges are not supported, the whole content is sent instead which is allowed by RFC 9110.
+    """
+    header: str | None = request.headers.get("range")
+    if not header:
+        return None
+
+    # A range of another version of the content is useless, send the whole current content
+    if_range: str | None = request.headers.get("if-range")
+    if if_range is not None and if_range.strip() not in validators:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first == "":
+            # The last bytes, an empty suffix is not satisfiable
+            suffix_length: int = int(last)
+            start = max(size - suffix_length, 0) if suffix_length > 0 else size
+            end = size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+
+    if start >= size or start > end:
+        raise HTTPException(
+            status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            "Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return ByteRange(start, end)
+
+
+def iter_binary(
+    session_factory: SessionFactoryType,
+    column: InstrumentedAttribute[bytes],
+    row_uuid: uuid.UUID,
+    byte_range: ByteRange,
+) -> Iterator[bytes]:
+    """
+    Reads the bytes of a binary column in chunks, so the content is never loaded in memory at once.
+    The response is streamed after the request session is closed, every chunk is read in its own short session
+    so the connection goes back to the pool while the client receives the previous chunk.
+    """
+    table = column.class_
+    position: int = byte_range.start
+    while position <= byte_range.end:
+        length: int = min(READ_CHUNK_BYTES, byte_range.end - position + 1)
+        stmt = select(func.substring(column, position + 1, length)).filter(table.UUID == row_uuid)
+        with session_scope_with_context(session_factory) as session:
+            chunk: bytes | None = session.execute(stmt).scalar_one_or_none()
+        if not chunk:
+            return
+        yield bytes(chunk)
+        position += len(chunk)
+
+
+def binary_response(
+    request: Request,
+    session_factory: SessionFactoryType,
+    column: InstrumentedAttribute[bytes],
+    row_uuid: uuid.UUID,
+    size: int,
+    checksum: str,
+    last_modified: datetime,
+    media_type: str,
+    headers: dict[str, str],
+) -> Response:
+    """
+    Streams a stored file with support for conditional and range requests,
+    the checksum of the file is used as its ETag.
+    """
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=UTC)
+
+    etag: str = f'"{checksum}"'
+    last_modified_header: str = format_datetime(last_modified.astimezone(UTC), usegmt=True)
+    headers = {
+        **headers,
+        "ETag": etag,
+        "Last-Modified": last_modified_header,
+        "Accept-Ranges": "bytes",
+    }
+
+    if if_none_match(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range: ByteRange | None = parse_range(request, size, (etag, last_modified_header))
+    status_code: int = status.HTTP_206_PARTIAL_CONTENT
+    if byte_range is None:
+        byte_range = ByteRange(0, size - 1)
+        status_code = status.HTTP_200_OK
+    else:
+        headers["Content-Range"] = f"bytes {byte_range.start}-{byte_range.end}/{size}"
+    headers["Content-Length"] = str(byte_range.end - byte_range.start + 1)
+
+    return StreamingResponse(
+        iter_binary(session_factory, column, row_uuid, byte_range),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -0,0 +1,76 @@
+import threading
+import time
+from collections.abc import Hashable
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from app.core.db.session import register_commit_invalidation
+
+# Sessions carrying a CountCache in their `info` can use and invalidate it
+COUNT_CACHE_INFO_KEY = "count_cache"
+
+# Writes to these tables change the totals of the paged listings
+WATCHED_TABLES: frozenset[str] = frozenset(
+    {
+        "objects",
+        "object_statics",
+        "valid_objects",
+        "module_objects",
+        "module_object_context",
+        "modules",
+    }
+)
+
+
+class CountCache:
+    """
+    Short lived cache of total counts for paged responses,
+    keyed by the compiled count statement and its parameters.
+
+    All entries are dropped when a session commits a write to one of the `WATCHED_TABLES`,
+    the ttl bounds the staleness of writes made outside of these sessions.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self._ttl_seconds: int = ttl_seconds
+        self._entries: dict[Hashable, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def get(self, key: Hashable) -> int | None:
+        with self._lock:
+            entry: tuple[float, int] | None = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, count = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return count
+
+    def put(self, key: Hashable, count: int) -> None:
+        if not self.is_enabled():
+            return
+
+        with self._lock:
+            now: float = time.monotonic()
+            # Drop the expired entries so the cache can not grow with every distinct filter forever
+            self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+            self._entries[key] = (now + self._ttl_seconds, count)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def create_key(statement: Select, session: Session) -> Hashable:
+        compiled = statement.compile(bind=session.get_bind())
+        params: tuple = tuple(sorted((k, repr(v)) for k, v in compiled.params.items()))
+        return (str(compiled), params)
+
+
+register_commit_invalidation(COUNT_CACHE_INFO_KEY, WATCHED_TABLES, CountCache.invalidate)
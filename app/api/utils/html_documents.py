@@ -0,0 +1,43 @@
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from bs4 import BeautifulSoup
+
+
+@dataclass
+class HtmlDocumentStats:
+    parses: int = 0
+    hits: int = 0
+
+
+class HtmlDocuments:
+    """
+    Parsed html of the fields validated in one validation run, keyed by the owner (like an object UUID)
+    and the field name. Every rule gets the same tree, so each field is parsed once per run.
+
+    The trees are shared between the rules and must not be modified.
+    """
+
+    def __init__(self):
+        self._documents: dict[tuple[Hashable, str], BeautifulSoup] = {}
+        self._stats: HtmlDocumentStats = HtmlDocumentStats()
+
+    def get(self, owner_key: Hashable, field_name: str, text: str) -> BeautifulSoup:
+        key: tuple[Hashable, str] = (owner_key, field_name)
+        document: BeautifulSoup | None = self._documents.get(key)
+        if document is not None:
+            self._stats.hits += 1
+            return document
+
+        document = self.parse(text)
+        self._documents[key] = document
+        self._stats.parses += 1
+        return document
+
+    def get_stats(self) -> HtmlDocumentStats:
+        return HtmlDocumentStats(parses=self._stats.parses, hits=self._stats.hits)
+
+    @staticmethod
+    def parse(text: str) -> BeautifulSoup:
+        # html.parser keeps block elements nested in a paragraph where the editor put them, lxml would move them out
+        return BeautifulSoup(text, "html.parser")
@@ -0,0 +1,13 @@
+from fastapi import Request
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    header: str | None = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
@@ -1,12 +1,17 @@
+import base64
+import binascii
 from collections.abc import Sequence
 from enum import Enum
 from typing import Any
+from uuid import UUID
 
 from fastapi import HTTPException, status
-from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import asc, desc, func, select
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
+from sqlalchemy import and_, asc, desc, func, or_, select
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import Select
+from sqlalchemy.sql import ColumnElement, Select
+
+from app.api.utils.count_cache import COUNT_CACHE_INFO_KEY, CountCache
 
 
 class SortOrder(str, Enum):
@@ -14,6 +19,12 @@ class SortOrder(str, Enum):
     DESC = "DESC"
 
 
+class CountMode(str, Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    NONE = "none"
+
+
 class Sort(BaseModel):
     column: str
     order: SortOrder
@@ -73,6 +84,20 @@ class OrderConfig(BaseModel):
 class SimplePagination(BaseModel):
     offset: int = Field(0)
     limit: int = Field(20)
+    cursor: str | None = Field(None)
+    include_total: bool | None = Field(None)
+    count_mode: CountMode | None = Field(None)
+
+    def get_count_mode(self) -> CountMode:
+        """
+        The total is counted by default when paging by offset.
+        When paging by cursor the client has to ask for it explicitly.
+        """
+        if self.count_mode is not None:
+            return self.count_mode
+        if self.include_total is not None:
+            return CountMode.EXACT if self.include_total else CountMode.NONE
+        return CountMode.EXACT if self.cursor is None else CountMode.NONE
 
     @field_validator("offset", mode="before")
     def default_offset(cls, v):
@@ -102,20 +127,50 @@ class OptionalSortedPagination(SimplePagination):
         return SortedPagination(
             offset=self.offset,
             limit=self.limit,
+            cursor=self.cursor,
+            include_total=self.include_total,
+            count_mode=self.count_mode,
             sort=sort,
         )
 
 
 class PagedResponse[T: BaseModel](BaseModel):
-    total: int
+    total: int | None = None
     offset: int = 0
     limit: int = -1
+    next_cursor: str | None = None
     results: list[T]
 
 
 class PaginatedQueryResult(BaseModel):
     items: Sequence[Any] = Field(default_factory=list)
-    total_count: int = Field(0)
+    total_count: int | None = Field(0)
+    next_cursor: str | None = Field(None)
+
+
+class Cursor(BaseModel):
+    """
+    Position after the last row of a page, used for keyset pagination.
+
+    The cursor is bound to the sort it was created with,
+    so a client can not continue a listing with a different sort.
+    """
+
+    column: str
+    order: SortOrder
+    value: Any
+    uuid: UUID
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(raw: str) -> "Cursor":
+        try:
+            padded: str = raw + "=" * (-len(raw) % 4)
+            return Cursor.model_validate_json(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, ValueError, ValidationError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
 
 
 def query_paginated(
@@ -124,6 +179,9 @@ def query_paginated(
     limit: int = -1,
     offset: int = 0,
     sort: tuple | None = None,
+    keyset: ColumnElement | None = None,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> PaginatedQueryResult:
     """
     Extend a query with pagination and wrap the query results
@@ -135,10 +193,18 @@ def query_paginated(
     `sort` should be a tuple like (column, sort_direction)
     where `sort_direction` is either 'asc' or 'desc'
     and `column` is the sqlalch column object.
+
+    When `keyset` is given the first page and pages requested by `cursor`
+    are paginated by keyset, see `query_keyset_paginated`.
+    Pages requested by `offset` then still work, using `keyset` as tie breaker.
     """
-    paginated: Select = add_pagination(query, limit, offset, sort)
+    _guard_cursor(keyset, cursor)
+    if keyset is not None and (cursor is not None or offset == 0):
+        return query_keyset_paginated(query, session, limit, sort, keyset, cursor, count_mode, scalars=True)
+
+    paginated: Select = add_pagination(query, limit, offset, sort, keyset)
     results: Sequence[Any] = session.execute(paginated).scalars().all()
-    total_count: int = query_total_count(query, session)
+    total_count: int | None = resolve_total_count(query, session, count_mode, limit, offset, len(results))
     return PaginatedQueryResult(items=list(results), total_count=total_count)
 
 
@@ -148,35 +214,180 @@ def query_paginated_no_scalars(
     limit: int = -1,
     offset: int = 0,
     sort: tuple | None = None,
+    keyset: ColumnElement | None = None,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> PaginatedQueryResult:
     """
     Same as fetch_paginated without calling scalars() on results
     to allow custom query results.
     """
-    paginated = add_pagination(query, limit, offset, sort)
+    _guard_cursor(keyset, cursor)
+    if keyset is not None and (cursor is not None or offset == 0):
+        return query_keyset_paginated(query, session, limit, sort, keyset, cursor, count_mode, scalars=False)
+
+    paginated = add_pagination(query, limit, offset, sort, keyset)
     results = session.execute(paginated).all()
-    total_count = query_total_count(query, session)
+    total_count = resolve_total_count(query, session, count_mode, limit, offset, len(results))
     return PaginatedQueryResult(items=list(results), total_count=total_count)
 
 
+def query_keyset_paginated(
+    query: Select,
+    session: Session,
+    limit: int,
+    sort: tuple | None,
+    keyset: ColumnElement,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.EXACT,
+    scalars: bool = True,
+) -> PaginatedQueryResult:
+    """
+    Paginate by continuing after the position in `cursor` instead of skipping
+    `offset` rows, which keeps deep pages as cheap as the first one.
+
+    `keyset` is the unique column (the UUID) used as tie breaker
+    for rows sharing the same value in the sort column.
+    Without a cursor the first page is returned.
+
+    The returned `next_cursor` is None when there are no more rows.
+    """
+    if sort is None:
+        raise ValueError("Keyset pagination requires a sort")
+
+    column, sort_direction = sort
+    order: SortOrder = SortOrder.DESC if sort_direction == SortOrder.DESC else SortOrder.ASC
+
+    paginated: Select = query
+    if cursor is not None:
+        position: Cursor = Cursor.decode(cursor)
+        if position.column != column.key or position.order != order:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor does not match the sort")
+        paginated = paginated.filter(_keyset_after(column, keyset, order, position))
+
+    direction = desc if order == SortOrder.DESC else asc
+    paginated = paginated.order_by(direction(column), direction(keyset))
+
+    # Fetch one extra row to know if there is a next page
+    if limit >= 0:
+        paginated = paginated.limit(limit + 1)
+
+    result = session.execute(paginated)
+    rows: list[Any] = list(result.scalars().all() if scalars else result.all())
+
+    next_cursor: str | None = None
+    if 0 <= limit < len(rows):
+        rows = rows[:limit]
+        last: Any = rows[-1] if rows else None
+        if last is not None:
+            next_cursor = Cursor(
+                column=column.key,
+                order=order,
+                value=_row_value(last, column.key),
+                uuid=_row_value(last, keyset.key),
+            ).encode()
+
+    # The offset of a page requested by cursor is unknown
+    offset: int | None = 0 if cursor is None else None
+    total_count: int | None = resolve_total_count(query, session, count_mode, limit, offset, len(rows))
+    return PaginatedQueryResult(items=rows, total_count=total_count, next_cursor=next_cursor)
+
+
+def _guard_cursor(keyset: ColumnElement | None, cursor: str | None) -> None:
+    # Without a keyset the cursor would silently be ignored and the first page returned again
+    if keyset is None and cursor is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This listing does not support cursor pagination",
+        )
+
+
+def _keyset_after(column: Any, keyset: Any, order: SortOrder, position: Cursor) -> ColumnElement[bool]:
+    """
+    Filter for the rows after `position`.
+
+    Nulls are treated as the lowest values, which is how both SQLite and MSSQL sort them.
+    """
+    value: Any = _coerce_value(column, position.value)
+
+    if order == SortOrder.ASC:
+        if value is None:
+            return or_(column.is_not(None), and_(column.is_(None), keyset > position.uuid))
+        return or_(column > value, and_(column == value, keyset > position.uuid))
+
+    if value is None:
+        return and_(column.is_(None), keyset < position.uuid)
+    return or_(column < value, and_(column == value, keyset < position.uuid), column.is_(None))
+
+
+def _coerce_value(column: Any, value: Any) -> Any:
+    # The cursor went through json, so restore the python type of the column (like datetime)
+    if value is None:
+        return None
+    try:
+        python_type: type = column.type.python_type
+    except NotImplementedError:
+        return value
+    return TypeAdapter(python_type).validate_python(value)
+
+
+def _row_value(row: Any, key: str) -> Any:
+    if hasattr(row, key):
+        return getattr(row, key)
+
+    # Rows of multiple entities, the first entity holding the attribute wins
+    for element in row:
+        if hasattr(element, key):
+            return getattr(element, key)
+    raise ValueError(f"Row does not contain '{key}' required for the cursor")
+
+
 def add_pagination(
     query: Select,
     limit: int = -1,
     offset: int = 0,
     sort: tuple | None = None,
+    keyset: ColumnElement | None = None,
 ) -> Select:
     if sort is not None:
         column, sort_direction = sort
-        if sort_direction == SortOrder.DESC:
-            query = query.order_by(desc(column))
-        else:
-            query = query.order_by(asc(column))
+        direction = desc if sort_direction == SortOrder.DESC else asc
+        query = query.order_by(direction(column))
+        if keyset is not None:
+            query = query.order_by(direction(keyset))
 
     result: Select = query.limit(limit).offset(offset)
     return result
 
 
-def query_total_count(query: Select, session: Session) -> int:
+def resolve_total_count(
+    query: Select,
+    session: Session,
+    count_mode: CountMode,
+    limit: int,
+    offset: int | None,
+    page_size: int,
+) -> int | None:
+    if count_mode == CountMode.NONE:
+        return None
+
+    # A page shorter than the limit is the last page, so the total follows from it
+    if offset is not None and 0 <= page_size < limit and (page_size > 0 or offset == 0):
+        return offset + page_size
+
+    return query_total_count(query, session, cached=count_mode == CountMode.CACHED)
+
+
+def query_total_count(query: Select, session: Session, cached: bool = False) -> int:
     count_stmt: Select = select(func.count()).select_from(query.alias())
-    total_count: int = session.execute(count_stmt).scalar_one()
+
+    cache: CountCache | None = session.info.get(COUNT_CACHE_INFO_KEY) if cached else None
+    if cache is None or not cache.is_enabled():
+        return session.execute(count_stmt).scalar_one()
+
+    key = CountCache.create_key(count_stmt, session)
+    total_count: int | None = cache.get(key)
+    if total_count is None:
+        total_count = session.execute(count_stmt).scalar_one()
+        cache.put(key, total_count)
     return total_count
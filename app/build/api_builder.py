@@ -6,7 +6,7 @@ from app.api.endpoint import EndpointContextBuilderData
 from app.build.api_models import DECLARED_MODELS
 from app.build.endpoint_builders.endpoint_builder import ConfiguredFastapiEndpoint, EndpointBuilder
 from app.build.endpoint_builders.endpoint_builder_provider import EndpointBuilderProvider
-from app.build.objects.types import BuildData, EndpointConfig, ObjectApi
+from app.build.objects.types import BuildData, EndpointConfig, IntermediateModel, ObjectApi
 from app.build.services.config_parser import ConfigParser
 from app.build.services.object_models_builder import ObjectModelsBuilder
 from app.build.services.tables_builder import TablesBuilder
@@ -19,6 +19,7 @@ class ApiBuilderResult:
     object_field_mapping_provider: ObjectFieldMappingProvider
     routes: list[ConfiguredFastapiEndpoint]
     required_object_fields_rule_mapping: dict[str, type[BaseModel]]
+    required_object_fields_rule_validators: dict[str, dict]
     publication_required_object_fields_rule_mapping: dict[str, dict[str, type[BaseModel]]]
 
 
@@ -58,6 +59,8 @@ class ApiBuilder:
             self._models_provider,
         )
 
+        required_object_fields_rule_validators: dict[str, dict] = self._build_object_fields_rule_validators(build_data)
+
         publication_required_object_fields_rule_mapping: dict[str, dict[str, type[BaseModel]]] = (
             self._build_publication_object_fields_rule_mapping(
                 build_data,
@@ -69,6 +72,7 @@ class ApiBuilder:
             object_field_mapping_provider=object_field_mapping_provider,
             routes=object_routes,
             required_object_fields_rule_mapping=required_object_fields_rule_mapping,
+            required_object_fields_rule_validators=required_object_fields_rule_validators,
             publication_required_object_fields_rule_mapping=publication_required_object_fields_rule_mapping,
         )
 
@@ -84,6 +88,38 @@ class ApiBuilder:
             rule_mapping[object_type] = model_type
         return rule_mapping
 
+    def _build_object_fields_rule_validators(self, build_data: BuildData) -> dict[str, dict]:
+        """
+        The validator config of the required object fields rule models and the models they depend on,
+        as configured in the object yml files, so changes of the config can be detected.
+        """
+        intermediate_models: dict[str, IntermediateModel] = {
+            intermediate_model.id: intermediate_model
+            for object_intermediate in build_data.object_intermediates
+            for intermediate_model in object_intermediate.intermediate_models
+        }
+
+        result: dict[str, dict] = {}
+        rule_config: dict[str, str] = build_data.main_config["required_object_fields_rule"]
+        for object_type, model_id in rule_config.items():
+            validators: dict[str, dict] = {}
+            pending: list[str] = [model_id]
+            while pending:
+                current_id: str = pending.pop()
+                if current_id in validators or current_id not in intermediate_models:
+                    continue
+                intermediate_model: IntermediateModel = intermediate_models[current_id]
+                validators[current_id] = {
+                    "validators": {
+                        field.name: field.validators
+                        for field in intermediate_model.fields + intermediate_model.static_fields
+                    },
+                    "model_validators": intermediate_model.model_validators_config,
+                }
+                pending += intermediate_model.dependency_model_ids
+            result[object_type] = validators
+        return result
+
     def _build_publication_object_fields_rule_mapping(
         self,
         build_data: BuildData,
@@ -34,6 +34,10 @@ class BuildContainer(containers.DeclarativeContainer):
         create_db_engine,
         uri=config.SQLALCHEMY_DATABASE_URI,
         echo=config.SQLALCHEMY_ECHO,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_POOL_MAX_OVERFLOW,
+        pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
     )
     db_session_factory = providers.Singleton(
         sessionmaker,
@@ -179,6 +183,9 @@ class BuildContainer(containers.DeclarativeContainer):
                 endpoint_builders_publications.publications.act_packages.AbortPublicationPackageEndpointBuilder
             ),
             providers.Factory(endpoint_builders_publications.publications.act_packages.DetailActPackageEndpointBuilder),
+            providers.Factory(
+                endpoint_builders_publications.publications.act_packages.DetailActPackageJobEndpointBuilder
+            ),
             providers.Factory(endpoint_builders_publications.publications.act_packages.DownloadPackageEndpointBuilder),
             providers.Factory(
                 endpoint_builders_publications.publications.act_packages.ListPublicationPackagesEndpointBuilder
@@ -212,6 +219,13 @@ class BuildContainer(containers.DeclarativeContainer):
             providers.Factory(
                 endpoint_builders_publications.publications.announcement_packages.ListPublicationAnnouncementPackagesEndpointBuilder
             ),
+            #       Pdf Export Jobs
+            providers.Factory(
+                endpoint_builders_publications.publications.pdf_export_jobs.DetailPdfExportJobEndpointBuilder
+            ),
+            providers.Factory(
+                endpoint_builders_publications.publications.pdf_export_jobs.DownloadPdfExportJobEndpointBuilder
+            ),
             #       Unified Packages
             providers.Factory(endpoint_builders_publications.packages.ListUnifiedPackagesEndpointBuilder),
             #       Announcement Reports
@@ -328,6 +342,7 @@ class BuildContainer(containers.DeclarativeContainer):
             providers.Factory(endpoint_builders_others.DetailStorageFilesEndpointBuilder),
             providers.Factory(endpoint_builders_others.DownloadStorageFilesEndpointBuilder),
             providers.Factory(endpoint_builders_others.StorageFileUploadFileEndpointBuilder),
+            providers.Factory(endpoint_builders_others.DownloadAssetEndpointBuilder),
             providers.Factory(endpoint_builders_others.FullGraphEndpointBuilder),
             providers.Factory(endpoint_builders_others.ObjectGraphEndpointBuilder),
             providers.Factory(
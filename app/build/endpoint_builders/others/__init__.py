@@ -1,3 +1,4 @@
+from .asset_download_endpoint_builder import DownloadAssetEndpointBuilder
 from .files_detail_endpoint_builder import DetailStorageFilesEndpointBuilder
 from .files_download_endpoint_builder import DownloadStorageFilesEndpointBuilder
 from .files_list_endpoint_builder import ListStorageFilesEndpointBuilder
@@ -0,0 +1,27 @@
+from app.api.domains.others.endpoints import get_asset_download_endpoint
+from app.api.endpoint import EndpointContextBuilderData
+from app.build.endpoint_builders.endpoint_builder import ConfiguredFastapiEndpoint, EndpointBuilder
+from app.build.objects.types import EndpointConfig, ObjectApi
+from app.core.services import ModelsProvider
+
+
+class DownloadAssetEndpointBuilder(EndpointBuilder):
+    def get_id(self) -> str:
+        return "download_asset"
+
+    def build_endpoint(
+        self,
+        models_provider: ModelsProvider,
+        builder_data: EndpointContextBuilderData,
+        endpoint_config: EndpointConfig,
+        api: ObjectApi,
+    ) -> ConfiguredFastapiEndpoint:
+        return ConfiguredFastapiEndpoint(
+            path=builder_data.path,
+            endpoint=get_asset_download_endpoint,
+            methods=["GET"],
+            response_model=None,
+            summary="Download asset",
+            description="Serves the raw asset, cacheable by its ETag",
+            tags=["Assets"],
+        )
@@ -43,6 +43,7 @@ class SearchEndpointBuilder(EndpointBuilder):
             allowed_object_types=set(model_map.keys()),
             search_columns=search_columns,
             used_columns=used_columns,
+            full_text=resolver_config.get("full_text", False),
         )
         endpoint = self._inject_context(get_search_endpoint, context)
 
@@ -30,6 +30,7 @@ from .create_publication_endpoint_builder import CreatePublicationEndpointBuilde
 from .detail_publication_endpoint_builder import DetailPublicationEndpointBuilder
 from .edit_publication_endpoint_builder import EditPublicationEndpointBuilder
 from .list_publications_endpoint_builder import ListPublicationsEndpointBuilder
+from .pdf_export_jobs import DetailPdfExportJobEndpointBuilder, DownloadPdfExportJobEndpointBuilder
 from .versions import (
     CreatePublicationVersionEndpointBuilder,
     CreatePublicationVersionPdfEndpointBuilder,
@@ -1,6 +1,7 @@
 from .abort_act_package_endpoint_builder import AbortPublicationPackageEndpointBuilder
 from .create_act_package_endpoint_builder import CreatePublicationPackageEndpointBuilder
 from .detail_act_package_endpoint_builder import DetailActPackageEndpointBuilder
+from .detail_act_package_job_endpoint_builder import DetailActPackageJobEndpointBuilder
 from .download_act_package_endpoint_builder import DownloadPackageEndpointBuilder
 from .list_act_packages_endpoint_builder import ListPublicationPackagesEndpointBuilder
 from .validate_act_package_endpoint_builder import ValidatePublicationPackageEndpointBuilder
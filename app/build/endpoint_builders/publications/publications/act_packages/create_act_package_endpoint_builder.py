@@ -1,7 +1,7 @@
 from app.api.domains.publications.endpoints.publications.act_packages.create_act_package_endpoint import (
-    PublicationPackageCreatedResponse,
     post_create_act_package_endpoint,
 )
+from app.api.domains.publications.types.models import PublicationActPackageJob
 from app.api.endpoint import EndpointContextBuilderData
 from app.build.endpoint_builders.endpoint_builder import ConfiguredFastapiEndpoint, EndpointBuilder
 from app.build.objects.types import EndpointConfig, ObjectApi
@@ -26,7 +26,7 @@ class CreatePublicationPackageEndpointBuilder(EndpointBuilder):
             path=builder_data.path,
             endpoint=post_create_act_package_endpoint,
             methods=["POST"],
-            response_model=PublicationPackageCreatedResponse,
-            summary="Create new Publication Act Package",
+            response_model=PublicationActPackageJob,
+            summary="Start building a new Publication Act Package",
             tags=["Publication Act Packages"],
         )
@@ -0,0 +1,32 @@
+from app.api.domains.publications.endpoints.publications.act_packages.detail_act_package_job_endpoint import (
+    get_detail_act_package_job_endpoint,
+)
+from app.api.domains.publications.types.models import PublicationActPackageJob
+from app.api.endpoint import EndpointContextBuilderData
+from app.build.endpoint_builders.endpoint_builder import ConfiguredFastapiEndpoint, EndpointBuilder
+from app.build.objects.types import EndpointConfig, ObjectApi
+from app.core.services.models_provider import ModelsProvider
+
+
+class DetailActPackageJobEndpointBuilder(EndpointBuilder):
+    def get_id(self) -> str:
+        return "detail_publication_act_package_job"
+
+    def build_endpoint(
+        self,
+        models_provider: ModelsProvider,
+        builder_data: EndpointContextBuilderData,
+        endpoint_config: EndpointConfig,
+        api: ObjectApi,
+    ) -> ConfiguredFastapiEndpoint:
+        if "{job_uuid}" not in builder_data.path:
+            raise RuntimeError("Missing {job_uuid} argument in path")
+
+        return ConfiguredFastapiEndpoint(
+            path=builder_data.path,
+            endpoint=get_detail_act_package_job_endpoint,
+            methods=["GET"],
+            response_model=PublicationActPackageJob,
+            summary="Status of a Publication Act Package build",
+            tags=["Publication Act Packages"],
+        )
@@ -0,0 +1,2 @@
+from .detail_pdf_export_job_endpoint_builder import DetailPdfExportJobEndpointBuilder
+from .download_pdf_export_job_endpoint_builder import DownloadPdfExportJobEndpointBuilder
@@ -0,0 +1,31 @@
+from app.api.domains.publications.endpoints.publications.pdf_export_jobs.download_pdf_export_job_endpoint import (
+    get_download_pdf_export_job_endpoint,
+)
+from app.api.endpoint import EndpointContextBuilderData
+from app.build.endpoint_builders.endpoint_builder import ConfiguredFastapiEndpoint, EndpointBuilder
+from app.build.objects.types import EndpointConfig, ObjectApi
+from app.core.services.models_provider import ModelsProvider
+
+
+class DownloadPdfExportJobEndpointBuilder(EndpointBuilder):
+    def get_id(self) -> str:
+        return "download_publication_pdf_export_job"
+
+    def build_endpoint(
+        self,
+        models_provider: ModelsProvider,
+        builder_data: EndpointContextBuilderData,
+        endpoint_config: EndpointConfig,
+        api: ObjectApi,
+    ) -> ConfiguredFastapiEndpoint:
+        if "{job_uuid}" not in builder_data.path:
+            raise RuntimeError("Missing {job_uuid} argument in path")
+
+        return ConfiguredFastapiEndpoint(
+            path=builder_data.path,
+            endpoint=get_download_pdf_export_job_endpoint,
+            methods=["GET"],
+            response_model=None,
+            summary="Download the Pdf of a completed Pdf export job",
+            tags=["Publication Pdf Exports"],
+        )
@@ -1,6 +1,7 @@
 from app.api.domains.publications.endpoints.publications.versions.create_version_pdf_endpoint import (
     post_create_version_pdf_endpoint,
 )
+from app.api.domains.publications.types.models import PublicationPdfExportJob
 from app.api.endpoint import EndpointContextBuilderData
 from app.build.endpoint_builders.endpoint_builder import ConfiguredFastapiEndpoint, EndpointBuilder
 from app.build.objects.types import EndpointConfig, ObjectApi
@@ -25,7 +26,7 @@ class CreatePublicationVersionPdfEndpointBuilder(EndpointBuilder):
             path=builder_data.path,
             endpoint=post_create_version_pdf_endpoint,
             methods=["POST"],
-            response_model=None,
-            summary="Download Publication Version as Pdf",
+            response_model=PublicationPdfExportJob,
+            summary="Start a Pdf export of the Publication Version",
             tags=["Publication Versions"],
         )
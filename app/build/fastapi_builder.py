@@ -1,4 +1,7 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
 
 import sqlalchemy
 import sqlalchemy.exc
@@ -12,7 +15,8 @@ from app.api.api_container import ApiContainer
 from app.api.exceptions import LoggedHttpException
 from app.api.health_endpoint import health_check
 from app.build.endpoint_builders.endpoint_builder import ConfiguredFastapiEndpoint
-from app.core.logging import init_logging, log_message
+from app.core.db.session import session_scope_with_context
+from app.core.logging import init_logging, log_message, logger
 
 
 def _generate_unique_id_function(route: APIRoute) -> str:
@@ -29,6 +33,7 @@ class FastAPIBuilder:
 
         app: FastAPI = FastAPI(
             generate_unique_id_function=_generate_unique_id_function,
+            lifespan=self._create_lifespan(container),
         )
         app.container = container
 
@@ -49,6 +54,39 @@ class FastAPIBuilder:
 
         return app
 
+    def _create_lifespan(self, container: ApiContainer):
+        @asynccontextmanager
+        async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+            self._fail_orphaned_jobs(container)
+            yield
+
+        return lifespan
+
+    def _fail_orphaned_jobs(self, container: ApiContainer) -> None:
+        """
+        Background jobs only run in the process which submitted them,
+        the unfinished jobs of a stopped process would otherwise stay queued or running forever.
+        """
+        timeout_seconds: int = container.config.ORPHANED_JOB_TIMEOUT_SECONDS()
+        modified_before: datetime = datetime.now(UTC) - timedelta(seconds=timeout_seconds)
+        try:
+            with session_scope_with_context(container.db_session_factory()) as session:
+                pdf_export_jobs: int = container.publication.pdf_export_job_repository().fail_orphaned(
+                    session, modified_before
+                )
+                act_package_jobs: int = container.publication.act_package_job_repository().fail_orphaned(
+                    session, modified_before
+                )
+                session.commit()
+        except sqlalchemy.exc.SQLAlchemyError:
+            logger.exception("Could not fail the orphaned jobs")
+            return
+
+        if pdf_export_jobs:
+            logger.warning(f"Failed {pdf_export_jobs} orphaned pdf export jobs")
+        if act_package_jobs:
+            logger.warning(f"Failed {act_package_jobs} orphaned act package jobs")
+
     def _add_routes(self, app: FastAPI, routes: list[ConfiguredFastapiEndpoint]):
         router = APIRouter()
         for endpoint_config in routes:
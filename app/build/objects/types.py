@@ -47,6 +47,7 @@ class IntermediateModel(BaseModel):
     static_fields: list[Field]  # Fields from the static table
     service_config: dict  # Services can add data to fields and columns
     model_validators: dict
+    model_validators_config: list[dict] = PydanticField(default_factory=list)  # As configured, to detect changes
     dependency_model_ids: list[str] = PydanticField(default_factory=list)
 
 
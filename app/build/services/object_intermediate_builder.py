@@ -129,6 +129,7 @@ class ObjectIntermediateBuilder:
                     static_fields=static_fields,
                     service_config=model_config.get("services", {}),
                     model_validators=model_validators,
+                    model_validators_config=model_validators_config,
                     dependency_model_ids=model_config.get("dependency_model_ids", []),
                 )
             )
@@ -3,8 +3,15 @@ import click
 from app.api.api_container import ApiContainer
 from app.build.api_builder import ApiBuilder, ApiBuilderResult
 from app.build.build_container import BuildContainer
-from app.commands import check_pdfs, database_commands, mssql_commands, publication_commands
-from app.commands.gdpr_command_check_images import check_images
+from app.commands import (
+    check_pdfs,
+    database_commands,
+    module_commands,
+    mssql_commands,
+    object_commands,
+    publication_commands,
+)
+from app.commands.gdpr_command_check_images import check_images, delete_asset
 from app.core.logging import init_logging
 
 
@@ -18,7 +25,13 @@ cli.add_command(database_commands.dropdb)
 cli.add_command(database_commands.load_fixtures)
 cli.add_command(mssql_commands.mssql_setup_search_database)
 cli.add_command(publication_commands.create_dso_json_scenario)
+cli.add_command(publication_commands.migrate_publication_states)
+cli.add_command(object_commands.refresh_valid_objects)
+cli.add_command(object_commands.rebuild_search_index)
+cli.add_command(object_commands.refresh_plain_texts)
+cli.add_command(module_commands.compact_module_object_history)
 cli.add_command(check_images)
+cli.add_command(delete_asset)
 cli.add_command(check_pdfs)
 
 
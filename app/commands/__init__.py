@@ -1,3 +1,3 @@
 from .database_commands import dropdb, initdb, load_fixtures
-from .gdpr_command_check_images import check_images
+from .gdpr_command_check_images import check_images, delete_asset
 from .gdpr_command_check_pdfs import check_pdfs
@@ -131,3 +131,24 @@ def check_images(
             message: str = "\n".join(issues)
             object_log: str | None = object_lookups.get_log(asset.UUID) or ""
             log_message(message=f"Asset {asset.UUID}{object_log} has the following message: {message}")
+
+
+@click.command()
+@click.argument("asset_uuid", type=click.UUID)
+@inject
+def delete_asset(
+    asset_uuid: uuid.UUID,
+    db_session_factory: Annotated[SessionFactoryType, Provide[ApiContainer.db_session_factory]],
+    asset_repository: Annotated[AssetRepository, Provide[ApiContainer.asset_repository]],
+) -> None:
+    """
+    Removes an asset flagged by `check-images`, after its references are cleaned up from the objects.
+    The asset cache of running api processes keeps the content until they restart.
+    """
+    with session_scope_with_context(db_session_factory) as session:
+        if asset_repository.get_by_uuid(session, asset_uuid) is None:
+            raise click.ClickException(f"Asset {asset_uuid} does not exist")
+
+        asset_repository.delete_by_uuid(session, asset_uuid)
+        session.commit()
+    log_message(message=f"Asset {asset_uuid} is deleted")
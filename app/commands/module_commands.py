@@ -0,0 +1,43 @@
+from typing import Annotated
+
+import click
+from dependency_injector.wiring import Provide, inject
+
+from app.api.api_container import ApiContainer
+from app.api.domains.modules.repositories import ModuleObjectDeltaRepository
+from app.core.db.session import SessionFactoryType, session_scope_with_context
+
+
+@click.command()
+@click.option("--interval", type=int, default=None, help="Versions between whole versions, 0 keeps all versions whole")
+@click.option("--batch-size", type=int, default=100, help="Module objects committed per transaction")
+@inject
+def compact_module_object_history(
+    interval: int | None,
+    batch_size: int,
+    db_session_factory: Annotated[SessionFactoryType, Provide[ApiContainer.db_session_factory]],
+    module_object_delta_repository: Annotated[
+        ModuleObjectDeltaRepository, Provide[ApiContainer.module_object_delta_repository]
+    ],
+):
+    """
+    Rewrites the history of the module objects as deltas between whole versions.
+    Defaults to the MODULE_OBJECT_DELTA_SNAPSHOT_INTERVAL setting.
+    """
+    if interval is not None and interval > 1 and not module_object_delta_repository.is_enabled():
+        raise click.UsageError(
+            "The api only reconstructs compacted versions with MODULE_OBJECT_DELTA_SNAPSHOT_INTERVAL above 1"
+        )
+
+    click.echo("Compacting module object history")
+    with session_scope_with_context(db_session_factory) as session:
+        chains: list[tuple[int, str]] = module_object_delta_repository.get_chains(session)
+
+    count: int = 0
+    for offset in range(0, len(chains), batch_size):
+        with session_scope_with_context(db_session_factory) as session:
+            for module_id, code in chains[offset : offset + batch_size]:
+                count += module_object_delta_repository.compact(session, module_id, code, interval)
+            session.commit()
+        click.echo(f"Processed {min(offset + batch_size, len(chains))}/{len(chains)} module objects")
+    click.echo(f"Done, updated {count} versions")
@@ -207,7 +207,7 @@ def mssql_setup_search_database(
             session.execute(DDL(f"CREATE FULLTEXT CATALOG {mssql_search_ftc_name};"))
 
         main_config_dict: dict = main_config.get_main_config()
-        for search_config in main_config_dict.get("mssql_search", []):
+        for search_config in main_config_dict.get("search_index", []):
             table_name = search_config.get("table_name")
             columns = search_config.get("searchable_columns_low", []) + search_config.get("searchable_columns_high", [])
             _reset_fulltext_index(
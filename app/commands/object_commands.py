@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+from typing import Annotated
+
+import click
+from dependency_injector.wiring import Provide, inject
+
+from app.api.api_container import ApiContainer
+from app.api.domains.objects.repositories import ValidObjectsRepository
+from app.api.domains.others.services.search_backend import SearchBackend
+from app.core.db.session import SessionFactoryType, session_scope_with_context
+
+
+@click.command()
+@inject
+def refresh_valid_objects(
+    db_session_factory: Annotated[SessionFactoryType, Provide[ApiContainer.db_session_factory]],
+    valid_objects_repository: Annotated[ValidObjectsRepository, Provide[ApiContainer.valid_objects_repository]],
+):
+    """
+    Rebuilds the valid_objects projection.
+    Should be scheduled so that versions with a Start_Validity in the future become valid.
+    """
+    click.echo("Refreshing valid objects")
+    with session_scope_with_context(db_session_factory) as session:
+        valid_objects_repository.refresh_all(session, datetime.now(UTC))
+        session.commit()
+    click.echo("Done")
+
+
+@click.command()
+@inject
+def rebuild_search_index(
+    db_session_factory: Annotated[SessionFactoryType, Provide[ApiContainer.db_session_factory]],
+    search_backend: Annotated[SearchBackend, Provide[ApiContainer.search_backend]],
+):
+    """
+    Rebuilds the full text index and the plain texts of the search backend from scratch.
+    Needed after the search_index config changed, MSSQL tracks its own full text index.
+    """
+    click.echo("Rebuilding search index")
+    with session_scope_with_context(db_session_factory) as session:
+        search_backend.rebuild(session)
+        session.commit()
+    click.echo("Done")
+
+
+@click.command()
+@inject
+def refresh_plain_texts(
+    db_session_factory: Annotated[SessionFactoryType, Provide[ApiContainer.db_session_factory]],
+    search_backend: Annotated[SearchBackend, Provide[ApiContainer.search_backend]],
+):
+    """
+    Backfills the plain texts of the searchable html fields of all existing rows.
+    """
+    click.echo("Refreshing plain texts")
+    with session_scope_with_context(db_session_factory) as session:
+        count: int = search_backend.refresh_plain_texts(session)
+        session.commit()
+    click.echo(f"Done, converted {count} rows")
@@ -7,10 +7,16 @@ from dependency_injector.wiring import Provide, inject
 from dso.act_builder.state_manager.input_data.input_data_loader import InputData, InputDataExporter
 
 from app.api.api_container import ApiContainer
+from app.api.domains.publications.repository.publication_environment_state_repository import (
+    PublicationEnvironmentStateRepository,
+)
 from app.api.domains.publications.repository.publication_version_repository import PublicationVersionRepository
 from app.api.domains.publications.services.act_package.act_package_builder import ActPackageBuilder
 from app.api.domains.publications.services.act_package.act_package_builder_factory import ActPackageBuilderFactory
+from app.api.domains.publications.services.state.state_loader import StateLoader
+from app.api.domains.publications.services.state.versions import ActiveState
 from app.api.domains.publications.types.enums import MutationStrategy, PackageType
+from app.core.db.session import SessionFactoryType, session_scope_with_context
 
 
 @click.command()
@@ -66,3 +72,49 @@ def create_dso_json_scenario(
         click.echo(click.style("Error while exporting DSO JSON scenario:", fg="red"))
         click.echo(click.style(f"{e}", fg="red"))
         return
+
+
+@click.command()
+@click.option("--batch-size", default=50, help="Number of states committed at once")
+@inject
+def migrate_publication_states(
+    batch_size: int,
+    db_session_factory: Annotated[SessionFactoryType, Provide[ApiContainer.db_session_factory]],
+    state_repository: Annotated[
+        PublicationEnvironmentStateRepository, Provide[ApiContainer.publication.environment_state_repository]
+    ],
+    state_loader: Annotated[StateLoader, Provide[ApiContainer.publication.state_loader]],
+) -> None:
+    """
+    Upgrades the active publication environment states to the latest schema version.
+    States are upgraded on load as well, this saves that cost for environments that are rarely used.
+    States which fail to upgrade are skipped and reported at the end.
+    """
+    schema_version: int = ActiveState.get_schema_version()
+    count: int = 0
+    failures: dict[UUID, str] = {}
+    with session_scope_with_context(db_session_factory) as session:
+        state_uuids = state_repository.get_outdated_active_uuids(session, schema_version)
+        click.echo(f"Upgrading {len(state_uuids)} states to schema version {schema_version}")
+
+        for offset in range(0, len(state_uuids), batch_size):
+            for state_table in state_repository.get_by_uuids(session, state_uuids[offset : offset + batch_size]):
+                state_uuid: UUID = state_table.UUID
+                try:
+                    with session.begin_nested():
+                        state_loader.load_from_state_table(session, state_table)
+                    count += 1
+                except Exception as e:
+                    failures[state_uuid] = str(e)
+                    click.echo(click.style(f"Failed to upgrade state {state_uuid}: {e}", fg="red"))
+            session.commit()
+            session.expunge_all()
+            click.echo(f"Upgraded {count} states")
+
+    if failures:
+        click.echo(click.style(f"Failed to upgrade {len(failures)} states:", fg="red"))
+        for state_uuid, error in failures.items():
+            click.echo(click.style(f"- {state_uuid}: {error}", fg="red"))
+        raise click.exceptions.Exit(1)
+
+    click.echo("Done")
@@ -1,28 +1,49 @@
 import sqlite3
 from collections.abc import Callable
 from contextlib import AbstractContextManager, contextmanager
+from typing import Any
 
-from sqlalchemy import Engine, create_engine, event, text
-from sqlalchemy.orm import Session
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
 
 SessionFactoryType = Callable[..., AbstractContextManager[Session]]
 
 
-def _enable_sqlite_load_extension(dbapi_connection, connection_record) -> None:
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """
+    Runs once per new pooled connection: enforces the foreign keys and loads Spatialite.
+    """
     if isinstance(dbapi_connection, sqlite3.Connection):
         dbapi_connection.enable_load_extension(True)
-        dbapi_connection.execute('SELECT load_extension("mod_spatialite")')
         dbapi_connection.load_extension("mod_spatialite")
+        dbapi_connection.enable_load_extension(False)
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
 
 
-def create_db_engine(uri: str, echo: str) -> Engine:
+def create_db_engine(
+    uri: str,
+    echo: str,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_recycle: int = -1,
+    pool_pre_ping: bool = True,
+) -> Engine:
+    pool_options: dict = {
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": pool_pre_ping,
+    }
+    # The pools sqlite uses for in memory databases are not sized
+    if make_url(uri).get_backend_name() != "sqlite":
+        pool_options["pool_size"] = pool_size
+        pool_options["max_overflow"] = max_overflow
+
     engine = create_engine(
         uri,
-        pool_pre_ping=True,
         echo=echo,
+        **pool_options,
     )
     if engine.dialect.name == "sqlite":
-        event.listen(engine, "connect", _enable_sqlite_load_extension)
+        event.listen(engine, "connect", _configure_sqlite_connection)
 
     return engine
 
@@ -31,12 +52,44 @@ def create_db_engine(uri: str, echo: str) -> Engine:
 def session_scope_with_context(session_factory: SessionFactoryType):
     with session_factory() as session:
         try:
-            # when using SQLite, ensure FK constraints and load Spatialite
-            if session.bind.dialect.name == "sqlite":
-                session.execute(text("PRAGMA foreign_keys = ON"))
-                session.execute(text("SELECT load_extension('mod_spatialite')"))
             yield session
             # commit happens automatically when exiting the 'with' block
         except Exception:
             session.rollback()
             raise
+
+
+def register_commit_invalidation(info_key: str, tables: frozenset[str], invalidate: Callable[[Any], None]) -> None:
+    """
+    Calls `invalidate` with the object stored under `info_key` in the session `info`,
+    when such a session commits a write to one of the `tables`. Rolled back writes are forgotten.
+    """
+    dirty_key: str = f"{info_key}_dirty"
+
+    def mark_dirty(session: Session, table_names: set[str]) -> None:
+        if info_key in session.info and not tables.isdisjoint(table_names):
+            session.info[dirty_key] = True
+
+    def on_after_flush(session: Session, flush_context: UOWTransaction) -> None:
+        table_names: set[str] = {
+            getattr(instance, "__tablename__", "") for instance in (*session.new, *session.dirty, *session.deleted)
+        }
+        mark_dirty(session, table_names)
+
+    def on_orm_execute(state: ORMExecuteState) -> None:
+        # Bulk statements like insert().from_select() bypass the unit of work
+        if state.is_insert or state.is_update or state.is_delete:
+            table = getattr(state.statement, "table", None)
+            mark_dirty(state.session, {getattr(table, "name", "")})
+
+    def on_after_commit(session: Session) -> None:
+        if session.info.pop(dirty_key, False):
+            invalidate(session.info[info_key])
+
+    def on_after_rollback(session: Session) -> None:
+        session.info.pop(dirty_key, None)
+
+    event.listen(Session, "after_flush", on_after_flush)
+    event.listen(Session, "do_orm_execute", on_orm_execute)
+    event.listen(Session, "after_commit", on_after_commit)
+    event.listen(Session, "after_rollback", on_after_rollback)
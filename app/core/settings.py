@@ -9,6 +9,8 @@ class KoopSettings(BaseModel):
     API_KEY: str
     RENVOOI_API_URL: str
     PREVIEW_API_URL: str
+    # Number of background workers generating pdf previews for this environment, per api process
+    PREVIEW_MAX_CONCURRENT: int = 2
 
 
 class Settings(BaseSettings):
@@ -63,6 +65,46 @@ class Settings(BaseSettings):
 
         return f"mssql+pyodbc:///?odbc_connect={encoded_settings}"
 
+    # Connection pool of the engine, the sizes are not used for sqlite
+    DB_POOL_SIZE: int = Field(5, description="Connections kept open in the pool")
+    DB_POOL_MAX_OVERFLOW: int = Field(10, description="Connections opened on top of the pool size under load")
+    # -1 keeps connections open until they fail
+    DB_POOL_RECYCLE_SECONDS: int = Field(-1, description="Age in seconds after which a connection is replaced")
+    DB_POOL_PRE_PING: bool = Field(True, description="Test connections for liveness when they are checked out")
+
+    # Let the valid object queries use the `valid_objects` projection
+    # Requires a scheduled `refresh-valid-objects` to pick up versions whose Start_Validity passes in time
+    OBJECTS_USE_VALID_INDEX: bool = Field(False, description="Resolve valid objects via the valid_objects table")
+
+    # In process cache for the (immutable) assets, bounded by the total size of the content
+    # Set to 0 to disable
+    ASSET_CACHE_MAX_BYTES: int = Field(128 * 1024 * 1024, description="Byte budget of the asset cache")
+
+    # Ttl of the totals cached for paged responses requested with count_mode=cached
+    # Set to 0 to disable
+    COUNT_CACHE_TTL_SECONDS: int = Field(30, description="Ttl in seconds of cached total counts")
+
+    # In process index of the relations used by the graph endpoints, dropped on relation writes of this process
+    # Set to 0 to disable
+    RELATION_GRAPH_TTL_SECONDS: int = Field(300, description="Ttl in seconds of the relation graph index")
+
+    # Users resolved from access tokens, dropped on user writes of this process and never kept past the token expiry
+    # Set to 0 to disable
+    USER_CACHE_TTL_SECONDS: int = Field(60, description="Ttl in seconds of the cached current users")
+    USER_CACHE_MAX_ENTRIES: int = Field(1024, description="Number of cached current users")
+
+    # Queued and running jobs are failed on startup when they were not updated for this long,
+    # as their workers only live in the process which submitted them.
+    # Keep 0 for a single api process, with more processes use more than the longest job takes.
+    # Act package jobs are not updated while their package is built
+    ORPHANED_JOB_TIMEOUT_SECONDS: int = Field(0, description="Seconds without updates before a job is orphaned")
+
+    # Older module object versions are stored as deltas with a whole version every N versions
+    # Applied by `compact-module-object-history`, set to 0 to keep every version whole.
+    # The api only reconstructs compacted versions while this is more than 1,
+    # so run the command with the lowered setting before restarting the api with it
+    MODULE_OBJECT_DELTA_SNAPSHOT_INTERVAL: int = Field(0, description="Versions between whole module object versions")
+
     # Dynamic
     MAIN_CONFIG_FILE: str = "./config/main.yml"
     OBJECT_CONFIG_PATH: str = "./config/objects/"
@@ -72,6 +114,24 @@ class Settings(BaseSettings):
     MSSQL_SEARCH_STOPLIST_NAME: str = "Omgevingsbeleid_SW"
 
     PUBLICATION_KOOP: dict[str, KoopSettings] = Field(default_factory=dict)
+    # Shared by the http calls to the KOOP services of all environments
+    KOOP_TIMEOUT_SECONDS: float = Field(30.0, description="Timeout of a single call to a KOOP service")
+    KOOP_MAX_RETRIES: int = Field(2, description="Retries of idempotent calls on connection errors and 5xx responses")
+    KOOP_RETRY_BACKOFF_SECONDS: float = Field(0.5, description="Base delay between retries, doubled on every retry")
+    KOOP_CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        5, description="Consecutive failures which make a KOOP service unavailable"
+    )
+    KOOP_CIRCUIT_RESET_SECONDS: float = Field(30.0, description="Seconds a KOOP service stays unavailable")
+    # Set to 1 to fetch the data of an act package in sequence
+    PUBLICATION_DATA_MAX_WORKERS: int = Field(
+        4, description="Threads fetching the independent parts of an act package concurrently"
+    )
+    # Compiled text templates of the publication templates, keyed by the hash of the template text
+    PUBLICATION_TEMPLATE_CACHE_SIZE: int = Field(64, description="Number of compiled publication templates kept")
+    # Empty to keep the compiled templates in memory only
+    PUBLICATION_TEMPLATE_BYTECODE_CACHE_DIR: str = Field(
+        "", description="Directory where the bytecode of compiled publication templates is shared between processes"
+    )
     PUBLICATION_OW_DATASET: str = Field(
         "provincie Zuid-holland",
         description="Dataset identifier for OW (Omgevingswet) publications",
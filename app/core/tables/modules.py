@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import ForeignKey, ForeignKeyConstraint, Unicode
+from sqlalchemy import JSON, Column, ForeignKey, ForeignKeyConstraint, Unicode
 from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.expression import or_, select
@@ -111,6 +111,11 @@ class ModuleObjectsTable(Base):
     Code: Mapped[str] = mapped_column(Unicode(35), ForeignKey("object_statics.Code"))
     Deleted: Mapped[bool] = mapped_column(default=False)
 
+    # Older versions can be stored as the fields which differ from the newer version `Delta_Base_UUID`,
+    # the other large fields are then NULL, see `ModuleObjectDeltaRepository`
+    Delta_Base_UUID: Mapped[uuid.UUID | None] = mapped_column(nullable=True)
+    Delta: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
     ModuleObjectContext: Mapped["ModuleObjectContextTable"] = relationship()
     ObjectStatics: Mapped[ObjectStaticsTable] = relationship(
         primaryjoin="ModuleObjectsTable.Code == ObjectStaticsTable.Code",
@@ -153,3 +158,20 @@ class ModuleObjectContextTable(Base, TimeStamped, UserMetaData, SerializerMixin)
 
     def __repr__(self) -> str:
         return f"ModuleObjectContextTable(Module_ID={self.Module_ID!r}, Code={self.Code!r}, Action={self.Action!r})"
+
+
+class ModuleObjectValidationTable(Base):
+    """
+    Stored results of the module validation rules which only look at the module object itself.
+    Module objects get a new UUID on every change, so the results stay valid for the same Rules_Version.
+    """
+
+    __tablename__ = "module_object_validations"
+
+    Module_Object_UUID: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    Rules_Version: Mapped[str] = mapped_column(Unicode(64), primary_key=True)
+    Module_ID: Mapped[int] = mapped_column(ForeignKey("modules.Module_ID"), index=True)
+
+    Errors = Column(JSON)
+
+    Created_Date: Mapped[datetime]
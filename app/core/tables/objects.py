@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import ForeignKey, Unicode
+from sqlalchemy import ForeignKey, Unicode, UnicodeText
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db.base import Base
@@ -38,3 +39,41 @@ class ObjectStaticsTable(Base, SerializerMixin):
 
     def __repr__(self) -> str:
         return f"ObjectStatics(Code={self.Code!r})"
+
+
+class ValidObjectsTable(Base):
+    """
+    Projection of the latest started object version per Code.
+
+    Maintained by the write paths which create or change object versions
+    and by the `refresh-valid-objects` command for versions whose Start_Validity
+    passes in time. The End_Validity is still checked on the joined object.
+    """
+
+    __tablename__ = "valid_objects"
+
+    Code: Mapped[str] = mapped_column(Unicode(35), ForeignKey("object_statics.Code"), primary_key=True)
+    Object_Type: Mapped[str] = mapped_column(Unicode(25), index=True)
+    Object_UUID: Mapped[uuid.UUID] = mapped_column(ForeignKey("objects.UUID"), unique=True)
+    Refreshed_Date: Mapped[datetime]
+
+    def __repr__(self) -> str:
+        return f"ValidObjects(Code={self.Code!r}, Object_UUID={self.Object_UUID!r})"
+
+
+class PlainTextsTable(Base):
+    """
+    Plain text of the searchable (html) fields per object or module object version.
+
+    Written by the search backend sync of the write paths which create versions
+    and by the `refresh-plain-texts` command for existing rows.
+    """
+
+    __tablename__ = "plain_texts"
+
+    UUID: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    Field: Mapped[str] = mapped_column(Unicode(50), primary_key=True)
+    Text: Mapped[str] = mapped_column(UnicodeText)
+
+    def __repr__(self) -> str:
+        return f"PlainTexts(UUID={self.UUID!r}, Field={self.Field!r})"
@@ -98,6 +98,8 @@ class PublicationEnvironmentStateTable(Base):
     )
 
     State = Column(JSON)
+    # Schema version of the stored State, states are upgraded and stored again when they are outdated
+    Schema_Version: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     Is_Activated: Mapped[bool]
     Activated_Datetime: Mapped[datetime | None]
@@ -525,3 +527,43 @@ class PublicationAnnouncementPackageReportTable(Base):
 
     Created_Date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     Created_By_UUID: Mapped[uuid.UUID] = mapped_column(ForeignKey("Gebruikers.UUID"))
+
+
+class PublicationPdfExportJobTable(Base):
+    __tablename__ = "publication_pdf_export_jobs"
+
+    UUID: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    Environment_Code: Mapped[str] = mapped_column(Unicode(32), nullable=False)
+    Filename: Mapped[str] = mapped_column(Unicode(255), nullable=False)
+
+    Status: Mapped[str] = mapped_column(Unicode(32), nullable=False)
+    # Number of times the status was polled at the preview api
+    Progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    Error: Mapped[str | None] = mapped_column(UnicodeText, nullable=True)
+
+    Binary: Mapped[bytes | None] = deferred(mapped_column(LargeBinary(), nullable=True))
+
+    Created_Date: Mapped[datetime]
+    Modified_Date: Mapped[datetime]
+    Created_By_UUID: Mapped[uuid.UUID] = mapped_column(ForeignKey("Gebruikers.UUID"))
+
+
+class PublicationActPackageJobTable(Base):
+    __tablename__ = "publication_act_package_jobs"
+
+    UUID: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    Publication_Version_UUID: Mapped[uuid.UUID] = mapped_column(ForeignKey("publication_versions.UUID"), nullable=False)
+    Package_Type: Mapped[str] = mapped_column(Unicode(64), nullable=False)
+
+    Status: Mapped[str] = mapped_column(Unicode(32), nullable=False)
+    Error_Code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    Error: Mapped[Any | None] = mapped_column(JSON, nullable=True)
+    Act_Package_UUID: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("publication_act_packages.UUID"), nullable=True
+    )
+    # Seconds spent per stage of fetching the publication data
+    Stage_Timings: Mapped[dict[str, float] | None] = mapped_column(JSON, nullable=True)
+
+    Created_Date: Mapped[datetime]
+    Modified_Date: Mapped[datetime]
+    Created_By_UUID: Mapped[uuid.UUID] = mapped_column(ForeignKey("Gebruikers.UUID"))
@@ -17,6 +17,7 @@ api_container = ApiContainer(
     models_provider=build_container.models_provider,
     object_field_mapping_provider=build_result.object_field_mapping_provider,
     required_object_fields_rule_mapping=build_result.required_object_fields_rule_mapping,
+    required_object_fields_rule_validators=build_result.required_object_fields_rule_validators,
     publication_required_object_fields_rule_mapping=build_result.publication_required_object_fields_rule_mapping,
 )
 api_container.wire(packages=["app.core", "app.api"])
@@ -0,0 +1,67 @@
+from datetime import UTC, datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.api.domains.modules.types import ModuleStatusCode
+from app.core.tables.modules import ModuleStatusHistoryTable, ModuleTable
+from app.core.tables.objects import ObjectsTable, ObjectStaticsTable
+from tests.conftest import Context
+from tests.fixtures.internal.spec.modules import ModuleBeleidskeuzeSpec
+from tests.fixtures.internal.spec.user_spec import UserSpec
+from tests.fixtures.internal.types import Ref
+
+
+def _set_vastgesteld(ctx: Context, module_id: int) -> None:
+    ctx.s.add(
+        ModuleStatusHistoryTable(
+            Module_ID=module_id,
+            Status=ModuleStatusCode.Vastgesteld,
+            Created_Date=datetime.now(UTC),
+            Created_By_UUID=ctx.f.primary_key_uuid(Ref(UserSpec, "admin")),
+        )
+    )
+    ctx.s.commit()
+
+
+def test_completing_creates_the_objects_and_their_cached_titles(admin: TestClient, ctx: Context):
+    _set_vastgesteld(ctx, 5)
+    beleidskeuze: ModuleBeleidskeuzeSpec = ctx.f.find(
+        Ref(ModuleBeleidskeuzeSpec, "mod_5_beleidskeuze_510_first_entry")
+    ).spec
+
+    response = admin.post("/modules/5/complete", json={})
+
+    assert response.status_code == 200, response.text
+    ctx.s.expire_all()
+    module: ModuleTable | None = ctx.s.get(ModuleTable, 5)
+    assert module is not None
+    assert module.Closed is True
+    assert module.Successful is True
+
+    new_object: ObjectsTable | None = ctx.s.scalars(
+        select(ObjectsTable).filter(ObjectsTable.Adjust_On == beleidskeuze.UUID)
+    ).one_or_none()
+    assert new_object is not None
+    assert new_object.UUID != beleidskeuze.UUID
+    assert new_object.Code == "beleidskeuze-510"
+    assert new_object.Title == "Beleidskeuze 510 from module 5"
+    assert new_object.Description == "Description of beleidskeuze 510"
+
+    # Every completed object updates the cached title of its statics
+    rows = ctx.s.execute(
+        select(ObjectsTable.Title, ObjectStaticsTable.Cached_Title)
+        .join(ObjectStaticsTable, ObjectStaticsTable.Code == ObjectsTable.Code)
+        .filter(ObjectsTable.Modified_Date == new_object.Modified_Date)
+    ).all()
+    assert len(rows) > 1
+    assert all(row.Cached_Title == row.Title for row in rows)
+
+
+def test_only_vastgesteld_modules_can_be_completed(admin: TestClient, ctx: Context):
+    response = admin.post("/modules/5/complete", json={})
+
+    assert response.status_code == 400, response.text
+    module: ModuleTable | None = ctx.s.get(ModuleTable, 5)
+    assert module is not None
+    assert module.Closed is False
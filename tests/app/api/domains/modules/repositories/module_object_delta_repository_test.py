@@ -0,0 +1,148 @@
+import uuid
+from collections.abc import Generator, Iterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import load_only
+
+from app.api.domains.modules.repositories import (
+    ModuleObjectDeltaRepository,
+    ModuleObjectRepository,
+    init_restore_listener,
+)
+from app.core.tables.modules import ModuleObjectsTable
+from tests.conftest import Context
+from tests.fixtures.internal.spec.modules import ModuleBeleidskeuzeSpec
+from tests.fixtures.internal.spec.user_spec import UserSpec
+from tests.fixtures.internal.types import Ref
+
+
+@pytest.fixture()
+def repository() -> Generator[ModuleObjectDeltaRepository]:
+    """The delta mode with its listener, as the test settings keep every version whole"""
+    repository = ModuleObjectDeltaRepository(snapshot_interval=2)
+    listener: Iterator[None] = init_restore_listener(repository)
+    next(listener)
+    yield repository
+    next(listener, None)
+
+
+def _add_versions(ctx: Context, descriptions: list[str]) -> list[uuid.UUID]:
+    """Returns the uuids of the added versions, newest first"""
+    module_object_repository = ModuleObjectRepository()
+    first_entry: ModuleBeleidskeuzeSpec = ctx.f.find(
+        Ref(ModuleBeleidskeuzeSpec, "mod_5_beleidskeuze_1_first_entry")
+    ).spec
+    admin_uuid: uuid.UUID = ctx.f.primary_key_uuid(Ref(UserSpec, "admin"))
+    timepoint: datetime = datetime.now(UTC)
+
+    uuids: list[uuid.UUID] = []
+    record: ModuleObjectsTable | None = ctx.s.get(ModuleObjectsTable, first_entry.UUID)
+    assert record is not None
+    for index, description in enumerate(descriptions):
+        record = module_object_repository.patch_module_object(
+            ctx.s,
+            record,
+            {"Description": description},
+            timepoint + timedelta(minutes=index),
+            admin_uuid,
+        )
+        ctx.s.add(record)
+        ctx.s.flush()
+        uuids.insert(0, record.UUID)
+    ctx.s.commit()
+    return uuids
+
+
+def _stored_descriptions(ctx: Context, uuids: list[uuid.UUID]) -> list[str | None]:
+    stmt = select(ModuleObjectsTable.UUID, ModuleObjectsTable.Description).filter(ModuleObjectsTable.UUID.in_(uuids))
+    stored: dict[uuid.UUID, str | None] = {row.UUID: row.Description for row in ctx.s.execute(stmt)}
+    return [stored[object_uuid] for object_uuid in uuids]
+
+
+def test_compacted_versions_are_reconstructed_on_load(ctx: Context, repository: ModuleObjectDeltaRepository):
+    uuids: list[uuid.UUID] = _add_versions(ctx, ["<p>One</p>", "<p>Two</p>", "<p>Three</p>", "<p>Four</p>"])
+
+    updated: int = repository.compact(ctx.s, 5, "beleidskeuze-1")
+    ctx.s.commit()
+
+    assert updated >= 2
+    assert _stored_descriptions(ctx, uuids) == ["<p>Four</p>", None, "<p>Two</p>", None]
+
+    ctx.s.expunge_all()
+    versions: list[ModuleObjectsTable] = [ctx.s.get(ModuleObjectsTable, object_uuid) for object_uuid in uuids]
+    assert [version.Description for version in versions] == ["<p>Four</p>", "<p>Three</p>", "<p>Two</p>", "<p>One</p>"]
+    assert versions[1].Delta_Base_UUID == uuids[0]
+
+    # The rows of column selects are restored on request
+    rows: list[dict] = [{"UUID": object_uuid, "Description": None} for object_uuid in uuids[1:2]]
+    repository.restore_rows(ctx.s, rows, ["UUID", "Description"])
+    assert rows[0]["Description"] == "<p>Three</p>"
+
+    # Compacting again without an interval stores every version whole
+    repository.compact(ctx.s, 5, "beleidskeuze-1", snapshot_interval=0)
+    ctx.s.commit()
+
+    assert _stored_descriptions(ctx, uuids) == ["<p>Four</p>", "<p>Three</p>", "<p>Two</p>", "<p>One</p>"]
+
+
+def test_patching_a_compacted_version_stores_a_whole_version(ctx: Context, repository: ModuleObjectDeltaRepository):
+    uuids: list[uuid.UUID] = _add_versions(ctx, ["<p>One</p>", "<p>Two</p>"])
+    repository.compact(ctx.s, 5, "beleidskeuze-1")
+    ctx.s.commit()
+    ctx.s.expunge_all()
+
+    compacted: ModuleObjectsTable | None = ctx.s.get(ModuleObjectsTable, uuids[1])
+    assert compacted is not None and compacted.Delta_Base_UUID is not None
+    patched: ModuleObjectsTable = ModuleObjectRepository().patch_module_object(
+        ctx.s, compacted, {"Title": "Patched"}, datetime.now(UTC) + timedelta(hours=1), compacted.Modified_By_UUID
+    )
+    ctx.s.add(patched)
+    ctx.s.commit()
+
+    assert _stored_descriptions(ctx, [patched.UUID]) == ["<p>One</p>"]
+    assert patched.Delta_Base_UUID is None and patched.Delta is None
+
+
+def test_partial_loads_only_reconstruct_compacted_versions(ctx: Context, repository: ModuleObjectDeltaRepository):
+    uuids: list[uuid.UUID] = _add_versions(ctx, ["<p>One</p>", "<p>Two</p>", "<p>Three</p>"])
+    repository.compact(ctx.s, 5, "beleidskeuze-1")
+    ctx.s.commit()
+    ctx.s.expunge_all()
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    stmt = (
+        select(ModuleObjectsTable)
+        .filter(ModuleObjectsTable.UUID.in_(uuids))
+        .options(load_only(ModuleObjectsTable.UUID, ModuleObjectsTable.Description))
+    )
+    engine = ctx.s.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        whole: list[ModuleObjectsTable] = list(ctx.s.scalars(stmt.filter(ModuleObjectsTable.UUID != uuids[1])))
+        assert len(statements) == 1
+        compacted: ModuleObjectsTable | None = ctx.s.scalars(stmt.filter(ModuleObjectsTable.UUID == uuids[1])).first()
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert {version.Description for version in whole} == {"<p>Three</p>", "<p>One</p>"}
+    assert compacted is not None and compacted.Description == "<p>Two</p>"
+
+
+def test_disabled_delta_mode_does_not_register_the_listener(ctx: Context):
+    uuids: list[uuid.UUID] = _add_versions(ctx, ["<p>One</p>", "<p>Two</p>"])
+    listener: Iterator[None] = init_restore_listener(ModuleObjectDeltaRepository(snapshot_interval=0))
+    next(listener)
+    ModuleObjectDeltaRepository().compact(ctx.s, 5, "beleidskeuze-1", snapshot_interval=2)
+    ctx.s.commit()
+    ctx.s.expunge_all()
+
+    compacted: ModuleObjectsTable | None = ctx.s.get(ModuleObjectsTable, uuids[1])
+
+    assert compacted is not None and compacted.Description is None
+    next(listener, None)
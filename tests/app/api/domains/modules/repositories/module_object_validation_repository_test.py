@@ -0,0 +1,45 @@
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+
+from app.api.domains.modules.repositories import ModuleObjectValidationRepository
+from app.core.tables.modules import ModuleObjectValidationTable
+from tests.conftest import Context
+
+
+def _stored(ctx: Context) -> dict[tuple[uuid.UUID, str], list[dict]]:
+    stmt = select(ModuleObjectValidationTable).filter(ModuleObjectValidationTable.Module_ID == 5)
+    return {(row.Module_Object_UUID, row.Rules_Version): row.Errors for row in ctx.s.execute(stmt).scalars()}
+
+
+def test_store_keeps_existing_results_and_prunes_superseded_versions(ctx: Context):
+    repository = ModuleObjectValidationRepository()
+    kept, superseded, patched = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    errors: list[dict] = [{"Rule_Index": 0, "Error": {"rule": "rule"}}]
+
+    repository.store(ctx.s, 5, "v1", {kept: errors, superseded: []}, [kept, superseded], datetime.now(UTC))
+    ctx.s.commit()
+
+    # A concurrent run of the same rules version stores the same results, these are left as they are
+    repository.store(ctx.s, 5, "v1", {kept: errors, patched: []}, [kept, patched], datetime.now(UTC))
+    ctx.s.commit()
+
+    assert _stored(ctx) == {(kept, "v1"): errors, (patched, "v1"): []}
+
+    repository.store(ctx.s, 5, "v2", {patched: []}, [kept, patched], datetime.now(UTC))
+    ctx.s.commit()
+
+    assert _stored(ctx) == {(patched, "v2"): []}
+
+
+def test_get_errors_chunks_large_inputs(ctx: Context, monkeypatch):
+    repository = ModuleObjectValidationRepository()
+    first, second, absent = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    errors: list[dict] = [{"Rule_Index": 0, "Error": {"rule": "rule"}}]
+    repository.store(ctx.s, 5, "v1", {first: errors, second: []}, [first, second], datetime.now(UTC))
+    ctx.s.commit()
+    monkeypatch.setattr("app.api.domains.modules.repositories.module_object_validation_repository.UUIDS_PER_QUERY", 1)
+
+    assert repository.get_errors(ctx.s, [first, absent, second], "v1") == {first: errors, second: []}
+    assert repository.get_errors(ctx.s, [], "v1") == {}
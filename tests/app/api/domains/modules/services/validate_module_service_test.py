@@ -0,0 +1,221 @@
+import uuid
+from contextlib import nullcontext
+from datetime import datetime
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.api.domains.modules.services.validate_module_service import (
+    CheckEmptyAreaDesignationTextRule,
+    ForbiddenHtmlTagsRule,
+    ForbidEmptyHtmlNodesRule,
+    RequiredObjectFieldsRule,
+    ValidateModuleError,
+    ValidateModuleObject,
+    ValidateModuleRequest,
+    ValidateModuleRule,
+    ValidateModuleService,
+)
+from app.core.services import MainConfig
+from app.core.tables.modules import ModuleObjectsTable
+
+FIELDS: list[str] = ["Description", "Explanation"]
+
+
+class FakeMainConfig(MainConfig):
+    def __init__(self):
+        self._main_config = {
+            "forbidden_html_tags_rule": {"fields": FIELDS, "forbidden_html_tags": ["script"]},
+            "forbid_empty_html_nodes_rule": {
+                "fields": FIELDS,
+                "html_void_elements": ["br"],
+                "allowed_empty_when_sole_child": {"td": ["p"]},
+            },
+            "check_empty_area_designation_text_rule": {"fields": FIELDS},
+        }
+
+
+class FakeValidationRepository:
+    def __init__(self):
+        self.results: dict[tuple[uuid.UUID, str], list[dict]] = {}
+
+    def get_errors(self, session, module_object_uuids, rules_version: str) -> dict[uuid.UUID, list[dict]]:
+        return {
+            module_object_uuid: self.results[(module_object_uuid, rules_version)]
+            for module_object_uuid in module_object_uuids
+            if (module_object_uuid, rules_version) in self.results
+        }
+
+    def store(
+        self,
+        session,
+        module_id: int,
+        rules_version: str,
+        errors_by_uuid: dict,
+        current_uuids: list[uuid.UUID],
+        timepoint: datetime,
+    ) -> None:
+        self.results = {
+            key: errors for key, errors in self.results.items() if key[1] == rules_version and key[0] in current_uuids
+        }
+        for module_object_uuid, errors in errors_by_uuid.items():
+            self.results[(module_object_uuid, rules_version)] = errors
+
+
+class FakeSession:
+    def __init__(self):
+        self.commits: int = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+class ModuleRule(ValidateModuleRule):
+    def __init__(self):
+        self.validated: int = 0
+
+    def validate(self, db: Session, request: ValidateModuleRequest) -> list[ValidateModuleError]:
+        self.validated += 1
+        first = request.module_objects[0]
+        return [
+            ValidateModuleError(
+                rule="module_rule",
+                object=ValidateModuleObject(
+                    code=first.Code,
+                    object_id=first.Object_ID,
+                    object_type=first.Object_Type,
+                    title=first.Title,
+                ),
+                messages=["Module wide"],
+            )
+        ]
+
+
+def _module_object(object_id: int, description: str) -> ModuleObjectsTable:
+    return ModuleObjectsTable(
+        UUID=uuid.uuid4(),
+        Code=f"beleidskeuze-{object_id}",
+        Object_ID=object_id,
+        Object_Type="beleidskeuze",
+        Title=f"Beleidskeuze {object_id}",
+        Description=description,
+        Explanation="<p>Toelichting</p>",
+    )
+
+
+def test_html_rules_share_the_parsed_fields():
+    main_config = FakeMainConfig()
+    service = ValidateModuleService(
+        rules=[
+            ForbiddenHtmlTagsRule(main_config),
+            ForbidEmptyHtmlNodesRule(main_config),
+            CheckEmptyAreaDesignationTextRule(main_config),
+        ]
+    )
+    module_objects: list[ModuleObjectsTable] = [
+        _module_object(1, "<p>Tekst</p>"),
+        _module_object(2, "<p>Tekst</p><script>alert(1)</script>"),
+        _module_object(3, "<table><tr><td><p></p></td></tr></table><p></p>"),
+        _module_object(4, '<p>Zie <a data-hint-type="gebiedsaanwijzing" data-code="gebied-1"></a></p>'),
+    ]
+    request = ValidateModuleRequest(module_id=1, module_objects=module_objects)
+
+    result = service.validate(None, request)
+
+    assert [(error.rule, error.object.code) for error in result.errors] == [
+        ("forbidden_html_tags_rule", "beleidskeuze-2"),
+        ("forbid_empty_html_nodes_rule", "beleidskeuze-3"),
+        ("forbid_empty_html_nodes_rule", "beleidskeuze-4"),
+        ("check_empty_area_designation_text_rule", "beleidskeuze-4"),
+    ]
+    stats = request.get_html_document_stats()
+    assert stats.parses == len(module_objects) * len(FIELDS)
+    assert stats.hits == 2 * len(module_objects) * len(FIELDS)
+
+
+def test_only_changed_module_objects_are_validated_again():
+    main_config = FakeMainConfig()
+    repository = FakeValidationRepository()
+    module_rule = ModuleRule()
+    rules: list[ValidateModuleRule] = [
+        ForbiddenHtmlTagsRule(main_config),
+        module_rule,
+        ForbidEmptyHtmlNodesRule(main_config),
+    ]
+    session = FakeSession()
+    service = ValidateModuleService(
+        rules=rules,
+        validation_repository=repository,
+        db_session_factory=lambda: nullcontext(session),
+    )
+    module_objects: list[ModuleObjectsTable] = [
+        _module_object(1, "<p></p>"),
+        _module_object(2, "<p>Tekst</p><script>alert(1)</script>"),
+        _module_object(3, "<p>Tekst</p>"),
+    ]
+
+    first_request = ValidateModuleRequest(module_id=1, module_objects=module_objects)
+    first = service.validate(None, first_request)
+
+    # Object 3 is patched and gets a new UUID
+    module_objects[2] = _module_object(3, "<p></p>")
+    second_request = ValidateModuleRequest(module_id=1, module_objects=module_objects)
+    second = service.validate(None, second_request)
+
+    assert [(error.rule, error.object.code) for error in first.errors] == [
+        ("forbidden_html_tags_rule", "beleidskeuze-2"),
+        ("module_rule", "beleidskeuze-1"),
+        ("forbid_empty_html_nodes_rule", "beleidskeuze-1"),
+    ]
+    assert [(error.rule, error.object.code) for error in second.errors] == [
+        ("forbidden_html_tags_rule", "beleidskeuze-2"),
+        ("module_rule", "beleidskeuze-1"),
+        ("forbid_empty_html_nodes_rule", "beleidskeuze-1"),
+        ("forbid_empty_html_nodes_rule", "beleidskeuze-3"),
+    ]
+    assert module_rule.validated == 2
+    assert second_request.get_html_document_stats().parses == len(FIELDS)
+    # The results are committed in their own session and the previous version of object 3 is pruned
+    assert session.commits == 2
+    assert {module_object_uuid for module_object_uuid, _ in repository.results} == {
+        module_object.UUID for module_object in module_objects
+    }
+
+
+def test_changed_rule_config_invalidates_the_stored_results():
+    repository = FakeValidationRepository()
+    main_config = FakeMainConfig()
+    service = ValidateModuleService(
+        rules=[ForbiddenHtmlTagsRule(main_config)],
+        validation_repository=repository,
+        db_session_factory=lambda: nullcontext(FakeSession()),
+    )
+    module_objects: list[ModuleObjectsTable] = [_module_object(1, "<p>Tekst</p><script>alert(1)</script>")]
+    service.validate(None, ValidateModuleRequest(module_id=1, module_objects=module_objects))
+
+    main_config._main_config["forbidden_html_tags_rule"]["forbidden_html_tags"] = ["table"]
+    changed_service = ValidateModuleService(
+        rules=[ForbiddenHtmlTagsRule(main_config)],
+        validation_repository=repository,
+        db_session_factory=lambda: nullcontext(FakeSession()),
+    )
+    result = changed_service.validate(None, ValidateModuleRequest(module_id=1, module_objects=module_objects))
+
+    assert changed_service.get_rules_version() != service.get_rules_version()
+    assert result.errors == []
+    assert {rules_version for _, rules_version in repository.results} == {changed_service.get_rules_version()}
+
+
+def test_changed_validator_config_changes_the_required_fields_version():
+    class Model(BaseModel):
+        Title: str
+
+    config: dict[str, dict] = {"beleidskeuze_module_validate": {"validators": {"Title": [{"id": "length"}]}}}
+    changed_config: dict[str, dict] = {
+        "beleidskeuze_module_validate": {"validators": {"Title": [{"id": "length", "data": {"min": 4}}]}}
+    }
+
+    version: str = RequiredObjectFieldsRule({"beleidskeuze": Model}, {"beleidskeuze": config}).get_version()
+
+    assert version == RequiredObjectFieldsRule({"beleidskeuze": Model}, {"beleidskeuze": dict(config)}).get_version()
+    assert version != RequiredObjectFieldsRule({"beleidskeuze": Model}, {"beleidskeuze": changed_config}).get_version()
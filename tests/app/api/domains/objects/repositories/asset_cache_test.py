@@ -0,0 +1,76 @@
+import uuid
+from datetime import UTC, datetime
+
+from app.api.domains.objects.repositories.asset_cache import AssetCache
+from app.core.tables.others import AssetsTable
+
+
+def _asset(content: str) -> AssetsTable:
+    return AssetsTable(
+        UUID=uuid.uuid4(),
+        Created_Date=datetime(2025, 1, 1, tzinfo=UTC),
+        Created_By_UUID=uuid.uuid4(),
+        Lookup="0123456789",
+        Hash="0123456789",
+        Meta="{}",
+        Content=content,
+    )
+
+
+def test_returns_detached_copies():
+    cache = AssetCache(max_bytes=1_000)
+    asset = _asset("a" * 10)
+
+    stored = cache.put_many([asset])
+    found = cache.get_many([asset.UUID])
+
+    assert found[asset.UUID] is stored[asset.UUID]
+    assert found[asset.UUID] is not asset
+    assert found[asset.UUID].Content == asset.Content
+
+
+def test_evicts_least_recently_used_when_over_budget():
+    # Each entry is 10 bytes of content + 2 bytes of meta
+    cache = AssetCache(max_bytes=30)
+    first, second, third = _asset("a" * 10), _asset("b" * 10), _asset("c" * 10)
+
+    cache.put_many([first, second])
+    cache.get_many([first.UUID])
+    cache.put_many([third])
+
+    assert set(cache.get_many([first.UUID, second.UUID, third.UUID]).keys()) == {first.UUID, third.UUID}
+    stats = cache.get_stats()
+    assert stats.evictions == 1
+    assert stats.size_bytes == 24
+
+
+def test_counts_hits_and_misses():
+    cache = AssetCache(max_bytes=1_000)
+    asset = _asset("a")
+    cache.put_many([asset])
+
+    cache.get_many([asset.UUID, uuid.uuid4()])
+
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_skips_entries_larger_than_budget():
+    cache = AssetCache(max_bytes=5)
+    asset = _asset("a" * 10)
+
+    cache.put_many([asset])
+
+    assert cache.get_many([asset.UUID]) == {}
+    assert cache.get_stats().entries == 0
+
+
+def test_evict():
+    cache = AssetCache(max_bytes=1_000)
+    asset = _asset("a")
+    cache.put_many([asset])
+
+    cache.evict(asset.UUID)
+
+    assert cache.get_many([asset.UUID]) == {}
+    assert cache.get_stats().size_bytes == 0
@@ -2,6 +2,7 @@ import uuid
 
 from sqlalchemy.orm import Session
 
+from app.api.domains.objects.repositories.asset_cache import AssetCache
 from app.api.domains.objects.repositories.asset_repository import AssetRepository
 from tests.conftest import Context
 from tests.fixtures.internal.spec.asset_spec import AssetSpec
@@ -50,3 +51,34 @@ def test_get_all(session: Session, ctx: Context):
     results = AssetRepository().get_all(session)
 
     assert {a.UUID for a in results} == {blue_uuid, green_uuid, yellow_uuid}
+
+
+def test_get_by_uuids_chunks_large_inputs(session: Session, ctx: Context, monkeypatch):
+    blue_uuid = ctx.f.primary_key_uuid(Ref(AssetSpec, "blue"))
+    green_uuid = ctx.f.primary_key_uuid(Ref(AssetSpec, "green"))
+    monkeypatch.setattr("app.api.domains.objects.repositories.asset_repository.UUIDS_PER_QUERY", 1)
+
+    results = AssetRepository().get_by_uuids(session, [blue_uuid, ABSENT_UUID, green_uuid, blue_uuid])
+
+    assert sorted(a.UUID for a in results) == sorted([blue_uuid, green_uuid])
+
+
+def test_get_map_by_uuids(session: Session, ctx: Context):
+    blue_uuid = ctx.f.primary_key_uuid(Ref(AssetSpec, "blue"))
+
+    results = AssetRepository().get_map_by_uuids(session, [blue_uuid, ABSENT_UUID])
+
+    assert list(results.keys()) == [blue_uuid]
+    assert results[blue_uuid].UUID == blue_uuid
+
+
+def test_delete_by_uuid_evicts_the_cached_asset(session: Session, ctx: Context):
+    blue_uuid = ctx.f.primary_key_uuid(Ref(AssetSpec, "blue"))
+    cache = AssetCache(max_bytes=10_000_000)
+    repo = AssetRepository(cache)
+    assert repo.get_by_uuid(session, blue_uuid) is not None
+
+    repo.delete_by_uuid(session, blue_uuid)
+
+    assert cache.get_stats().entries == 0
+    assert repo.get_by_uuid(session, blue_uuid) is None
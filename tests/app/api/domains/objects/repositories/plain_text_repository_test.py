@@ -0,0 +1,49 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.domains.objects.repositories.plain_text_repository import PlainTextRepository
+from app.core.tables.objects import ObjectsTable, PlainTextsTable
+from tests.conftest import Context
+from tests.fixtures.internal.spec.objects import BeleidsdoelSpec
+from tests.fixtures.internal.types import Ref
+
+
+def _texts(session: Session) -> dict:
+    return {(row.UUID, row.Field): row.Text for row in session.scalars(select(PlainTextsTable)).all()}
+
+
+def test_refresh_stores_text_without_html(session: Session, ctx: Context):
+    spec = ctx.f.find(Ref(BeleidsdoelSpec, "beleidsdoel_1_latest_valid")).spec
+    row: ObjectsTable = session.get(ObjectsTable, spec.UUID)
+    row.Description = "<p>Een <strong>mooie</strong> provincie</p>"
+    session.flush()
+
+    PlainTextRepository().refresh(session, ObjectsTable.__table__, ["Title", "Description"], [spec.UUID])
+
+    texts = _texts(session)
+    assert texts[(spec.UUID, "Description")] == "Een mooie provincie"
+    assert texts[(spec.UUID, "Title")] == row.Title
+    assert {uuid for uuid, _ in texts} == {spec.UUID}
+
+
+def test_refresh_replaces_previous_text(session: Session, ctx: Context):
+    repository = PlainTextRepository()
+    spec = ctx.f.find(Ref(BeleidsdoelSpec, "beleidsdoel_1_latest_valid")).spec
+    row: ObjectsTable = session.get(ObjectsTable, spec.UUID)
+
+    row.Description = "<p>Oud</p>"
+    session.flush()
+    repository.refresh(session, ObjectsTable.__table__, ["Description"], [spec.UUID])
+    row.Description = "<p>Nieuw</p>"
+    session.flush()
+    repository.refresh(session, ObjectsTable.__table__, ["Description"], [spec.UUID])
+
+    assert _texts(session) == {(spec.UUID, "Description"): "Nieuw"}
+
+
+def test_refresh_all_covers_every_row(session: Session):
+    count = PlainTextRepository().refresh_all(session, ObjectsTable.__table__, ["Title"], batch_size=2)
+
+    object_uuids = set(session.scalars(select(ObjectsTable.UUID)).all())
+    assert count == len(object_uuids)
+    assert {uuid for uuid, _ in _texts(session)} == object_uuids
@@ -0,0 +1,68 @@
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.domains.objects.repositories.object_repository import ObjectRepository
+from app.api.domains.objects.repositories.valid_objects_repository import ValidObjectsRepository
+from app.core.tables.objects import ObjectsTable, ValidObjectsTable
+from tests.conftest import Context
+from tests.fixtures.internal.spec.objects import BeleidsdoelSpec, MaatregelSpec
+from tests.fixtures.internal.types import Ref
+
+
+def _valid_uuids(session: Session, repository: ObjectRepository, object_type: str) -> set:
+    prepared = repository.prepare_list_valid_lineages(object_type)
+    return {row.UUID for row in session.scalars(prepared.query).all()}
+
+
+def test_refresh_all_points_to_latest_started_version(session: Session, ctx: Context):
+    ValidObjectsRepository().refresh_all(session, datetime.now(UTC))
+
+    expected = ctx.f.find(Ref(BeleidsdoelSpec, "beleidsdoel_3_latest_valid")).spec
+    row = session.scalars(select(ValidObjectsTable).filter(ValidObjectsTable.Code == expected.Code)).one()
+
+    assert row.Object_UUID == expected.UUID
+
+
+@pytest.mark.parametrize("object_type", ["beleidsdoel", "beleidskeuze", "maatregel", "gebied"])
+def test_indexed_lineages_match_window_query(session: Session, object_type: str):
+    ValidObjectsRepository().refresh_all(session, datetime.now(UTC))
+
+    assert _valid_uuids(session, ObjectRepository(use_valid_index=True), object_type) == _valid_uuids(
+        session, ObjectRepository(), object_type
+    )
+
+
+def _valid_subquery_uuids(session: Session, repository: ObjectRepository, object_type: str) -> set:
+    subq = repository.get_valid_subquery(ObjectsTable.Object_Type == object_type)
+    return set(session.scalars(select(subq.c.UUID)).all())
+
+
+@pytest.mark.parametrize("object_type", ["beleidsdoel", "beleidskeuze", "maatregel", "gebied"])
+def test_indexed_valid_subquery_matches_window_query(session: Session, object_type: str):
+    ValidObjectsRepository().refresh_all(session, datetime.now(UTC))
+
+    assert _valid_subquery_uuids(session, ObjectRepository(use_valid_index=True), object_type) == _valid_subquery_uuids(
+        session, ObjectRepository(), object_type
+    )
+
+
+def test_indexed_lineages_exclude_ended_objects(session: Session, ctx: Context):
+    ValidObjectsRepository().refresh_all(session, datetime.now(UTC))
+    expired = ctx.f.find(Ref(MaatregelSpec, "maatregel_6_past_end_validity")).spec
+
+    assert expired.UUID not in _valid_uuids(session, ObjectRepository(use_valid_index=True), "maatregel")
+
+
+def test_refresh_codes_only_touches_given_codes(session: Session, ctx: Context):
+    repository = ValidObjectsRepository()
+    beleidsdoel = ctx.f.find(Ref(BeleidsdoelSpec, "beleidsdoel_1_latest_valid")).spec
+    maatregel = ctx.f.find(Ref(MaatregelSpec, "maatregel_1_latest_valid")).spec
+
+    repository.refresh_codes(session, {beleidsdoel.Code}, datetime.now(UTC))
+    codes = set(session.scalars(select(ValidObjectsTable.Code)).all())
+
+    assert codes == {beleidsdoel.Code}
+    assert maatregel.Code not in codes
@@ -0,0 +1,50 @@
+import base64
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import Context
+from tests.fixtures.internal.spec.asset_spec import AssetSpec
+from tests.fixtures.internal.types import Ref
+
+
+@pytest.mark.parametrize("asset_key", ["blue", "green", "yellow"])
+def test_serves_the_decoded_asset(client: TestClient, ctx: Context, asset_key: str):
+    expected: AssetSpec = ctx.f.find(Ref(AssetSpec, asset_key)).spec
+
+    response = client.get(f"/assets/{expected.UUID}")
+
+    assert response.status_code == 200, response.text
+    assert response.content == base64.b64decode(expected.Content.split(",", 1)[1])
+    assert response.headers["Content-Type"] == "image/png"
+    assert response.headers["ETag"] == f'"{expected.Hash}"'
+    assert "immutable" in response.headers["Cache-Control"]
+
+
+@pytest.mark.parametrize("if_none_match", ['"{hash}"', 'W/"{hash}"', '"other", "{hash}"', "*"])
+def test_matching_etag_returns_304(client: TestClient, ctx: Context, if_none_match: str):
+    expected: AssetSpec = ctx.f.find(Ref(AssetSpec, "blue")).spec
+
+    response = client.get(
+        f"/assets/{expected.UUID}",
+        headers={"If-None-Match": if_none_match.format(hash=expected.Hash)},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == f'"{expected.Hash}"'
+
+
+def test_stale_etag_returns_content(client: TestClient, ctx: Context):
+    expected: AssetSpec = ctx.f.find(Ref(AssetSpec, "blue")).spec
+
+    response = client.get(f"/assets/{expected.UUID}", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200, response.text
+
+
+def test_unknown_uuid_returns_404(client: TestClient):
+    response = client.get("/assets/00000000-0000-0000-0000-00000000dead")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Asset niet gevonden"
@@ -37,3 +37,60 @@ def test_unauthenticated_can_download(client: TestClient, ctx: Context):
 
     assert response.status_code == 200, response.text
     assert response.content == document.Binary
+
+
+def test_sends_the_checksum_as_etag(client: TestClient, ctx: Context):
+    document: StorageFileSpec = ctx.f.find(Ref(StorageFileSpec, "file_1")).spec
+    response = client.get(f"/storage-files/{document.UUID}/download")
+
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] == f'"{document.Checksum}"'
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert "Last-Modified" in response.headers
+
+    response = client.get(
+        f"/storage-files/{document.UUID}/download", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_range_requests_return_partial_content(client: TestClient, ctx: Context):
+    document: StorageFileSpec = ctx.f.find(Ref(StorageFileSpec, "file_1")).spec
+
+    response = client.get(f"/storage-files/{document.UUID}/download", headers={"Range": "bytes=2-9"})
+
+    assert response.status_code == 206, response.text
+    assert response.content == document.Binary[2:10]
+    assert response.headers["Content-Range"] == f"bytes 2-9/{document.Size}"
+    assert response.headers["Content-Length"] == "8"
+
+    response = client.get(f"/storage-files/{document.UUID}/download", headers={"Range": "bytes=-4"})
+
+    assert response.status_code == 206, response.text
+    assert response.content == document.Binary[-4:]
+
+
+def test_range_of_another_version_returns_the_whole_file(client: TestClient, ctx: Context):
+    document: StorageFileSpec = ctx.f.find(Ref(StorageFileSpec, "file_1")).spec
+
+    response = client.get(
+        f"/storage-files/{document.UUID}/download",
+        headers={"Range": "bytes=2-9", "If-Range": '"outdated"'},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.content == document.Binary
+
+
+def test_unsatisfiable_range_returns_416(client: TestClient, ctx: Context):
+    document: StorageFileSpec = ctx.f.find(Ref(StorageFileSpec, "file_1")).spec
+
+    response = client.get(
+        f"/storage-files/{document.UUID}/download",
+        headers={"Range": f"bytes={document.Size}-"},
+    )
+
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == f"bytes */{document.Size}"
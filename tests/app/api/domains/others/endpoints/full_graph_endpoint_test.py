@@ -0,0 +1,52 @@
+from collections.abc import Generator
+
+import pytest
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+
+from app.api.domains.others.services.relation_graph_index import RELATION_GRAPH_INDEX_INFO_KEY, RelationGraphIndex
+
+# Relations are stored with their codes sorted
+EDGE = ("beleidsdoel-1", "beleidskeuze-1")
+
+
+@pytest.fixture()
+def relation_graph_index(admin: TestClient) -> Generator[RelationGraphIndex]:
+    """Enables the relation graph index, which the test settings disable"""
+    index = RelationGraphIndex(ttl_seconds=300)
+    admin.app.container.relation_graph_index.override(providers.Object(index))
+    admin.app.state.db_sessionmaker.configure(info={RELATION_GRAPH_INDEX_INFO_KEY: index})
+    try:
+        yield index
+    finally:
+        admin.app.container.relation_graph_index.reset_override()
+
+
+def _relation_edges(client: TestClient) -> set[tuple[str, str]]:
+    response = client.get("/full-graph")
+    assert response.status_code == 200, response.text
+    return {
+        (edge["Vertice_A_Code"], edge["Vertice_B_Code"])
+        for edge in response.json()["Edges"]
+        if edge["Type"] == "relation"
+    }
+
+
+def test_relation_write_is_served_by_the_relation_graph_index(
+    admin: TestClient, relation_graph_index: RelationGraphIndex
+):
+    # Warm the index before the write
+    assert EDGE not in _relation_edges(admin)
+
+    response = admin.post(
+        "/beleidskeuze/relations/1",
+        json=[{"Object_ID": 1, "Object_Type": "beleidsdoel", "Description": "Bijdrage"}],
+    )
+    assert response.status_code == 200, response.text
+
+    assert EDGE in _relation_edges(admin)
+
+    response = admin.post("/beleidskeuze/relations/1", json=[])
+    assert response.status_code == 200, response.text
+
+    assert EDGE not in _relation_edges(admin)
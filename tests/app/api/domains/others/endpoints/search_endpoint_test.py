@@ -253,3 +253,50 @@ def test_search_request_validation(
 
     if expected_limit is not None:
         assert response.json()["limit"] == expected_limit
+
+
+@pytest.mark.parametrize(
+    "client_fixture, expected_refs",
+    [
+        pytest.param(
+            "client",
+            [
+                Ref(BeleidsdoelSpec, "beleidsdoel_1_latest_valid"),
+                Ref(ModuleBeleidsdoelSpec, "mod_1_beleidsdoel_1_second_entry"),
+            ],
+            id="client-can-view-public-versions-b1",
+        ),
+        pytest.param(
+            "admin",
+            [
+                Ref(BeleidsdoelSpec, "beleidsdoel_1_latest_valid"),
+                Ref(ModuleBeleidsdoelSpec, "mod_1_beleidsdoel_1_third_entry"),
+            ],
+            id="admin-can-view-newer-versions-b1",
+        ),
+    ],
+)
+def test_full_text_search_matches_like_search(
+    request: FixtureRequest,
+    ctx: Context,
+    client_fixture: str,
+    expected_refs: list[Ref],
+):
+    client: TestClient = request.getfixturevalue(client_fixture)
+    body = client.post(
+        "/search/full-text",
+        json={"query": "%beleidsdoel 1%"},
+    ).raise_for_status()
+    results: list[dict[str, Any]] = body.json()["results"]
+
+    result_uuids: set[UUID] = {UUID(result["Model"]["UUID"]) for result in results}
+    assert result_uuids == set(ctx.f.find_uuids(expected_refs))
+
+    scores: list[float] = [result["Score"] for result in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_full_text_search_without_words_is_rejected(client: TestClient):
+    response = client.post("/search/full-text", json={"query": "%%"})
+
+    assert response.status_code == 422
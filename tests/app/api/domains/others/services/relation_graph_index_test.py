@@ -0,0 +1,54 @@
+from app.api.domains.others.services.relation_graph_index import RelationAdjacency
+
+
+def _adjacency(*edges: tuple[str, str]) -> RelationAdjacency:
+    adjacency = RelationAdjacency()
+    for edge in edges:
+        adjacency.add(edge)
+    return adjacency
+
+
+def test_walk_follows_the_allowed_object_types_per_iteration():
+    adjacency = _adjacency(
+        ("beleidskeuze-1", "beleidsdoel-1"),
+        ("beleidsdoel-1", "ambitie-1"),
+        ("maatregel-1", "beleidskeuze-1"),
+        ("ambitie-1", "ambitie-2"),
+        ("beleidsdoel-2", "beleidsdoel-3"),
+    )
+
+    edges = adjacency.walk("beleidskeuze-1", [["beleidsdoel", "maatregel"], ["ambitie"]])
+
+    assert edges == {
+        ("beleidskeuze-1", "beleidsdoel-1"),
+        ("maatregel-1", "beleidskeuze-1"),
+        ("beleidsdoel-1", "ambitie-1"),
+    }
+
+
+def test_walk_skips_edges_to_codes_searched_before():
+    adjacency = _adjacency(
+        ("beleidskeuze-1", "beleidskeuze-2"),
+        ("beleidskeuze-2", "beleidskeuze-3"),
+        ("beleidskeuze-3", "beleidskeuze-1"),
+    )
+
+    edges = adjacency.walk("beleidskeuze-1", [["beleidskeuze"], ["beleidskeuze"], ["beleidskeuze"]])
+
+    # Both neighbours are found in the first iteration, the edge between them in the second
+    assert edges == {
+        ("beleidskeuze-1", "beleidskeuze-2"),
+        ("beleidskeuze-3", "beleidskeuze-1"),
+        ("beleidskeuze-2", "beleidskeuze-3"),
+    }
+    assert adjacency.walk("beleidskeuze-1", []) == set()
+    assert adjacency.walk("beleidskeuze-4", [["beleidskeuze"]]) == set()
+
+
+def test_object_type_prefix_is_matched_with_the_separator():
+    adjacency = _adjacency(
+        ("beleidskeuze-1", "beleidsdoel-1"),
+        ("beleidskeuze-1", "beleidsdoelen-1"),
+    )
+
+    assert adjacency.walk("beleidskeuze-1", [["beleidsdoel"]]) == {("beleidskeuze-1", "beleidsdoel-1")}
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy.orm import Session
+
+from app.api.domains.publications.repository.publication_zip_repository import WRITE_CHUNK_BYTES
+from app.api.domains.publications.repository.sqlite_publication_zip_repository import SqlitePublicationZipRepository
+from app.core.tables.publications import PublicationPackageZipTable
+from tests.conftest import Context
+from tests.fixtures.internal.spec.user_spec import UserSpec
+from tests.fixtures.internal.types import Ref
+
+
+def _package_zip(session: Session, ctx: Context) -> PublicationPackageZipTable:
+    package_zip = PublicationPackageZipTable(
+        UUID=uuid.uuid4(),
+        Filename="package.zip",
+        Binary=b"",
+        Checksum="",
+        Created_Date=datetime.now(UTC),
+        Created_By_UUID=ctx.f.primary_key_uuid(Ref(UserSpec, "admin")),
+    )
+    session.add(package_zip)
+    session.flush()
+    return package_zip
+
+
+def test_write_binary_stores_the_file_in_chunks(session: Session, ctx: Context):
+    content: bytes = os.urandom(2 * WRITE_CHUNK_BYTES + 123)
+    package_zip = _package_zip(session, ctx)
+
+    with tempfile.SpooledTemporaryFile(max_size=1024) as file:
+        file.write(content)
+        file.seek(0)
+        SqlitePublicationZipRepository().write_binary(session, package_zip, file, len(content))
+
+    assert package_zip.Binary == content
+
+
+def test_write_binary_of_an_empty_file(session: Session, ctx: Context):
+    package_zip = _package_zip(session, ctx)
+
+    with tempfile.SpooledTemporaryFile() as file:
+        SqlitePublicationZipRepository().write_binary(session, package_zip, file, 0)
+
+    assert package_zip.Binary == b""
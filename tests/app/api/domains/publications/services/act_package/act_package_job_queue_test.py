@@ -0,0 +1,310 @@
+import io
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.domains.publications.exceptions import DSOConfigurationException, DSORenvooiException
+from app.api.domains.publications.repository import PublicationActPackageJobRepository
+from app.api.domains.publications.repository.sqlite_publication_zip_repository import SqlitePublicationZipRepository
+from app.api.domains.publications.services.act_package.act_package_job_queue import ActPackageJobQueue
+from app.api.domains.publications.services.validate_publication_service import ValidatePublicationException
+from app.api.domains.publications.types.enums import (
+    ActPackageJobStatus,
+    PackageType,
+    PublicationVersionStatus,
+    ReportStatusType,
+)
+from app.api.domains.publications.types.zip import SpooledZipData
+from app.core.tables.modules import ModuleStatusHistoryTable
+from app.core.tables.publications import (
+    PublicationActPackageJobTable,
+    PublicationActPackageTable,
+    PublicationActTable,
+    PublicationEnvironmentTable,
+    PublicationTable,
+    PublicationTemplateTable,
+    PublicationVersionTable,
+)
+from tests.conftest import Context
+from tests.fixtures.internal.spec.user_spec import UserSpec
+from tests.fixtures.internal.types import Ref
+
+ZIP_CONTENT = b"PK package"
+
+
+class _Strict(BaseModel):
+    value: int
+
+
+def _validation_error() -> ValidationError:
+    try:
+        _Strict.model_validate({"value": "x"})
+    except ValidationError as e:
+        return e
+    raise AssertionError("Expected a validation error")
+
+
+class _PackageBuilder:
+    def __init__(self, error: Exception | None):
+        self._error: Exception | None = error
+
+    def build_publication_files(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def spool_zip_files(self) -> SpooledZipData:
+        return SpooledZipData(
+            Publication_Filename="publication.zip",
+            Filename="package.zip",
+            File=io.BytesIO(ZIP_CONTENT),
+            Size=len(ZIP_CONTENT),
+            Checksum="checksum",
+        )
+
+    def get_delivery_id(self) -> str:
+        return "delivery-1"
+
+    def get_stage_timings(self) -> dict[str, float]:
+        return {"build": 1.5}
+
+
+class _PackageBuilderFactory:
+    def __init__(self, error: Exception | None = None):
+        self._error: Exception | None = error
+        self.created: int = 0
+
+    def create_builder(self, session, publication_version, package_type) -> _PackageBuilder:
+        self.created += 1
+        return _PackageBuilder(self._error)
+
+
+def _publication_version(ctx: Context) -> PublicationVersionTable:
+    user_uuid: uuid.UUID = ctx.f.primary_key_uuid(Ref(UserSpec, "admin"))
+    timepoint: datetime = datetime.now(UTC)
+    user_data: dict = {
+        "Created_Date": timepoint,
+        "Modified_Date": timepoint,
+        "Created_By_UUID": user_uuid,
+        "Modified_By_UUID": user_uuid,
+    }
+
+    environment = PublicationEnvironmentTable(
+        UUID=uuid.uuid4(),
+        Title="Test",
+        Code="test",
+        Description="",
+        Province_ID="pv28",
+        Authority_ID="00000001002306608000",
+        Submitter_ID="00000001002306608000",
+        Governing_Body_Type="provinciale_staten",
+        Frbr_Country="nl",
+        Frbr_Language="nld",
+        Is_Active=True,
+        Has_State=False,
+        Can_Validate=True,
+        Can_Publicate=False,
+        Is_Locked=False,
+        **user_data,
+    )
+    template = PublicationTemplateTable(
+        UUID=uuid.uuid4(),
+        Title="Template",
+        Description="",
+        Is_Active=True,
+        Document_Type="omgevingsvisie",
+        Object_Types=[],
+        Text_Template="",
+        Object_Templates={},
+        **user_data,
+    )
+    act = PublicationActTable(
+        UUID=uuid.uuid4(),
+        Environment_UUID=environment.UUID,
+        Document_Type="omgevingsvisie",
+        Title="Act",
+        Is_Active=True,
+        Work_Province_ID="pv28",
+        Work_Country="nl",
+        Work_Date="2025",
+        Work_Other=f"act-{uuid.uuid4()}",
+        **user_data,
+    )
+    publication = PublicationTable(
+        UUID=uuid.uuid4(),
+        Module_ID=5,
+        Document_Type="omgevingsvisie",
+        Procedure_Type="final",
+        Template_UUID=template.UUID,
+        Environment_UUID=environment.UUID,
+        Act_UUID=act.UUID,
+        **user_data,
+    )
+    module_status_id: int = ctx.s.execute(
+        select(ModuleStatusHistoryTable.ID).filter(ModuleStatusHistoryTable.Module_ID == 5).limit(1)
+    ).scalar_one()
+    publication_version = PublicationVersionTable(
+        UUID=uuid.uuid4(),
+        Publication_UUID=publication.UUID,
+        Module_Status_ID=module_status_id,
+        Status=PublicationVersionStatus.ACTIVE.value,
+        **user_data,
+    )
+    ctx.s.add_all([environment, template, act, publication, publication_version])
+    ctx.s.commit()
+    return publication_version
+
+
+def _queue(session: Session, package_builder_factory: _PackageBuilderFactory) -> ActPackageJobQueue:
+    session_factory = sessionmaker(bind=session.connection(), join_transaction_mode="create_savepoint")
+    return ActPackageJobQueue(package_builder_factory, SqlitePublicationZipRepository(), session_factory)
+
+
+def _run(queue: ActPackageJobQueue, ctx: Context, publication_version: PublicationVersionTable):
+    job = queue.create_job(
+        publication_version.UUID,
+        PackageType.VALIDATION,
+        ctx.f.primary_key_uuid(Ref(UserSpec, "admin")),
+    )
+    ctx.s.add(job)
+    ctx.s.commit()
+
+    queue.submit(job, publication_version.Publication.Environment_UUID).result(timeout=30)
+
+    ctx.s.expire_all()
+    return ctx.s.get(PublicationActPackageJobTable, job.UUID)
+
+
+def test_create_job_queues_the_package_type(session: Session, ctx: Context):
+    queue = _queue(session, _PackageBuilderFactory())
+    publication_version: PublicationVersionTable = _publication_version(ctx)
+    user_uuid: uuid.UUID = ctx.f.primary_key_uuid(Ref(UserSpec, "admin"))
+
+    job = queue.create_job(publication_version.UUID, PackageType.VALIDATION, user_uuid)
+
+    assert job.Publication_Version_UUID == publication_version.UUID
+    assert job.Package_Type == PackageType.VALIDATION.value
+    assert job.Status == ActPackageJobStatus.QUEUED.value
+    assert job.Created_By_UUID == user_uuid
+    assert job.Error_Code is None
+    assert job.Act_Package_UUID is None
+
+
+def test_job_creates_the_package(session: Session, ctx: Context):
+    package_builder_factory = _PackageBuilderFactory()
+    queue = _queue(session, package_builder_factory)
+    publication_version: PublicationVersionTable = _publication_version(ctx)
+
+    job = _run(queue, ctx, publication_version)
+
+    assert job.Status == ActPackageJobStatus.COMPLETED
+    assert job.Error_Code is None
+    assert job.Stage_Timings == {"build": 1.5}
+
+    package: PublicationActPackageTable | None = ctx.s.get(PublicationActPackageTable, job.Act_Package_UUID)
+    assert package is not None
+    assert package.Publication_Version_UUID == publication_version.UUID
+    assert package.Package_Type == PackageType.VALIDATION
+    assert package.Delivery_ID == "delivery-1"
+    assert package.Report_Status == ReportStatusType.NOT_APPLICABLE
+    assert package.Zip.Binary == ZIP_CONTENT
+
+    ctx.s.refresh(publication_version)
+    assert publication_version.Status == PublicationVersionStatus.VALIDATION
+
+
+def test_job_checks_for_conflicts_again_before_building(session: Session, ctx: Context):
+    package_builder_factory = _PackageBuilderFactory()
+    queue = _queue(session, package_builder_factory)
+    publication_version: PublicationVersionTable = _publication_version(ctx)
+
+    # Locked by another job after this one was queued
+    publication_version.Is_Locked = True
+    ctx.s.add(publication_version)
+    ctx.s.commit()
+
+    job = _run(queue, ctx, publication_version)
+
+    assert job.Status == ActPackageJobStatus.FAILED
+    assert job.Error_Code == 409
+    assert job.Error == "This publication version is locked"
+    assert job.Act_Package_UUID is None
+    assert package_builder_factory.created == 0
+
+
+@pytest.mark.parametrize(
+    "error, error_code, detail",
+    [
+        (DSOConfigurationException("Missing configuration"), 442, "Missing configuration"),
+        (DSORenvooiException("Renvooi failed", "internal"), 443, "Renvooi failed"),
+        (ValidatePublicationException("Invalid publication"), 444, []),
+        (RuntimeError("Broken"), 500, "Unexpected error building the package"),
+    ],
+)
+def test_job_stores_the_error_code(session: Session, ctx: Context, error: Exception, error_code: int, detail):
+    queue = _queue(session, _PackageBuilderFactory(error))
+    publication_version: PublicationVersionTable = _publication_version(ctx)
+
+    job = _run(queue, ctx, publication_version)
+
+    assert job.Status == ActPackageJobStatus.FAILED
+    assert job.Error_Code == error_code
+    assert job.Error == detail
+    assert job.Act_Package_UUID is None
+    assert (
+        ctx.s.scalars(
+            select(PublicationActPackageTable).filter(
+                PublicationActPackageTable.Publication_Version_UUID == publication_version.UUID
+            )
+        ).all()
+        == []
+    )
+
+
+def test_job_stores_the_validation_errors(session: Session, ctx: Context):
+    queue = _queue(session, _PackageBuilderFactory(_validation_error()))
+    publication_version: PublicationVersionTable = _publication_version(ctx)
+
+    job = _run(queue, ctx, publication_version)
+
+    assert job.Status == ActPackageJobStatus.FAILED
+    assert job.Error_Code == 441
+    assert [error["loc"] for error in job.Error] == [["value"]]
+
+
+def test_orphaned_jobs_are_failed(session: Session, ctx: Context):
+    queue = _queue(session, _PackageBuilderFactory())
+    publication_version: PublicationVersionTable = _publication_version(ctx)
+    user_uuid: uuid.UUID = ctx.f.primary_key_uuid(Ref(UserSpec, "admin"))
+    timepoint: datetime = datetime.now(UTC)
+
+    jobs: dict[str, PublicationActPackageJobTable] = {}
+    for name, status, minutes_ago in [
+        ("queued", ActPackageJobStatus.QUEUED, 10),
+        ("running", ActPackageJobStatus.RUNNING, 10),
+        ("completed", ActPackageJobStatus.COMPLETED, 10),
+        ("recent", ActPackageJobStatus.RUNNING, 0),
+    ]:
+        job = queue.create_job(publication_version.UUID, PackageType.VALIDATION, user_uuid)
+        job.Status = status.value
+        job.Modified_Date = timepoint - timedelta(minutes=minutes_ago)
+        ctx.s.add(job)
+        jobs[name] = job
+    ctx.s.commit()
+
+    failed: int = PublicationActPackageJobRepository().fail_orphaned(ctx.s, timepoint - timedelta(minutes=5))
+    ctx.s.commit()
+    ctx.s.expire_all()
+
+    assert failed == 2
+    stored = {name: ctx.s.get(PublicationActPackageJobTable, job.UUID) for name, job in jobs.items()}
+    assert {name: job.Status for name, job in stored.items()} == {
+        "queued": ActPackageJobStatus.FAILED,
+        "running": ActPackageJobStatus.FAILED,
+        "completed": ActPackageJobStatus.COMPLETED,
+        "recent": ActPackageJobStatus.RUNNING,
+    }
+    assert stored["queued"].Error_Code == 500
@@ -0,0 +1,170 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.domains.publications.services.act_package.act_publication_data_provider import (
+    ActPublicationDataProvider,
+)
+from app.api.domains.publications.types.api_input_data import PublicationGeoData
+from app.core.db.session import create_db_engine
+
+OBJECTS: list[dict] = [
+    {"Code": "beleidsdoel-1", "Object_Type": "beleidsdoel"},
+    {"Code": "beleidsdoel-2", "Object_Type": "beleidsdoel"},
+]
+
+
+class _Recorder:
+    def __init__(self):
+        self.sessions: dict[str, Session] = {}
+
+
+class _ObjectProvider:
+    def get_objects(self, session, publication_version) -> list[dict]:
+        return OBJECTS
+
+
+class _TemplateParser:
+    def get_parsed_template(self, text_template: str, objects: list[dict]) -> str:
+        return text_template
+
+
+class _AssetProvider:
+    def __init__(self, recorder: _Recorder):
+        self._recorder = recorder
+
+    def get_assets(self, session, objects: list[dict]) -> list[dict]:
+        self._recorder.sessions["assets"] = session
+        return [{"UUID": o["Code"]} for o in objects]
+
+
+class _GebiedsaanwijzingenProvider:
+    def get_gebiedsaanwijzingen(self, objects, used_objects) -> dict:
+        return {}
+
+
+class _GebiedenProvider:
+    def get_gebieden_data(self, objects, used_objects):
+        return SimpleNamespace()
+
+
+class _GiosProviderFactory:
+    def __init__(self, recorder: _Recorder):
+        self._recorder = recorder
+
+    def process(self, session, act_frbr, gebieden_data, gebiedsaanwijzingen) -> PublicationGeoData:
+        self._recorder.sessions["geo"] = session
+        return PublicationGeoData()
+
+
+class _DocumentsProvider:
+    def __init__(self, recorder: _Recorder, fail: bool = False):
+        self._recorder = recorder
+        self._fail = fail
+
+    def get_documents(self, session, act_frbr, all_objects, used_objects) -> list[dict]:
+        self._recorder.sessions["documents"] = session
+        if self._fail:
+            raise RuntimeError("documents failed")
+        return [{"Code": "document-1"}]
+
+
+AOJ_UUID: UUID = UUID("0b9a3a43-8f4c-4c32-9f34-fd2b0e4c6a01")
+
+
+class _AojRepository:
+    def get_latest(self, session, before_datetime=None):
+        return SimpleNamespace(
+            UUID=AOJ_UUID,
+            Title="Provincie",
+            Administrative_Borders_ID="pv28",
+            Administrative_Borders_Domain="NL.BI.BestuurlijkGebied",
+            Administrative_Borders_Date=datetime(2024, 1, 1, tzinfo=UTC).date(),
+            Created_Date=before_datetime,
+        )
+
+
+@pytest.fixture()
+def db_session_factory() -> sessionmaker:
+    return sessionmaker(bind=create_db_engine("sqlite://", echo=False))
+
+
+def _provider(
+    recorder: _Recorder,
+    db_session_factory: sessionmaker,
+    max_workers: int,
+    fail_documents: bool = False,
+) -> ActPublicationDataProvider:
+    return ActPublicationDataProvider(
+        publication_object_provider=_ObjectProvider(),
+        publication_asset_provider=_AssetProvider(recorder),
+        publication_gebiedsaanwijzingen_provider=_GebiedsaanwijzingenProvider(),
+        publication_gebieden_provider=_GebiedenProvider(),
+        publication_gios_provider=_GiosProviderFactory(recorder),
+        publication_documents_provider=_DocumentsProvider(recorder, fail_documents),
+        publication_aoj_repository=_AojRepository(),
+        template_parser=_TemplateParser(),
+        db_session_factory=db_session_factory,
+        max_workers=max_workers,
+    )
+
+
+def _publication_version():
+    return SimpleNamespace(
+        UUID=uuid4(),
+        Created_Date=datetime(2024, 1, 1, tzinfo=UTC),
+        Publication=SimpleNamespace(Template=SimpleNamespace(Text_Template='<object code="beleidsdoel-1"/>')),
+        Attachments=[],
+    )
+
+
+def _fetch(provider: ActPublicationDataProvider, session: Session, publication_version):
+    return provider.fetch_data(session, publication_version, bill_frbr=None, act_frbr=None)
+
+
+def test_concurrent_stages_give_the_same_data_as_in_sequence(db_session_factory: sessionmaker):
+    publication_version = _publication_version()
+    with db_session_factory() as session:
+        sequential = _fetch(_provider(_Recorder(), db_session_factory, max_workers=1), session, publication_version)
+        concurrent = _fetch(_provider(_Recorder(), db_session_factory, max_workers=4), session, publication_version)
+
+    assert sequential.stage_timings.keys() == concurrent.stage_timings.keys()
+    sequential.stage_timings = concurrent.stage_timings = {}
+    assert sequential == concurrent
+    assert concurrent.used_object_codes == {"beleidsdoel-1"}
+
+
+def test_concurrent_stages_use_their_own_session(db_session_factory: sessionmaker):
+    recorder = _Recorder()
+    with db_session_factory() as session:
+        result = _fetch(_provider(recorder, db_session_factory, max_workers=4), session, _publication_version())
+
+    assert set(recorder.sessions) == {"assets", "geo", "documents"}
+    assert all(stage_session is not session for stage_session in recorder.sessions.values())
+    assert set(result.stage_timings) == {
+        "objects",
+        "template",
+        "assets",
+        "geo",
+        "documents",
+        "area_of_jurisdiction",
+        "bill_attachments",
+    }
+
+
+def test_stages_run_in_the_given_session_when_bound_to_a_connection(db_session_factory: sessionmaker):
+    recorder = _Recorder()
+    engine = db_session_factory.kw["bind"]
+    with engine.connect() as connection, Session(bind=connection) as session:
+        _fetch(_provider(recorder, db_session_factory, max_workers=4), session, _publication_version())
+
+    assert all(stage_session is session for stage_session in recorder.sessions.values())
+
+
+def test_concurrent_stage_error_is_raised(db_session_factory: sessionmaker):
+    provider = _provider(_Recorder(), db_session_factory, max_workers=4, fail_documents=True)
+    with db_session_factory() as session, pytest.raises(RuntimeError, match="documents failed"):
+        _fetch(provider, session, _publication_version())
@@ -0,0 +1,97 @@
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+
+from app.api.domains.publications.services.koop_client import (
+    KoopCircuitOpenError,
+    KoopClient,
+    KoopUnavailableError,
+)
+from app.core.settings import KoopSettings
+
+
+class _FlakyServiceStub(BaseHTTPRequestHandler):
+    """
+    Answers 503 to the first `failures` calls and 200 afterwards.
+    """
+
+    failures: ClassVar[int] = 0
+    calls: ClassVar[int] = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        code: int = 503 if self.calls <= self.failures else 200
+        self.send_response(code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def service_url() -> Generator[str]:
+    _FlakyServiceStub.failures = 0
+    _FlakyServiceStub.calls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyServiceStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(url: str, max_retries: int = 2, circuit_failure_threshold: int = 5) -> KoopClient:
+    return KoopClient(
+        {"test": KoopSettings(API_KEY="key", RENVOOI_API_URL="", PREVIEW_API_URL=url)},
+        timeout_seconds=5,
+        max_retries=max_retries,
+        backoff_seconds=0,
+        circuit_failure_threshold=circuit_failure_threshold,
+        circuit_reset_seconds=60,
+    )
+
+
+def test_retries_idempotent_calls_on_server_errors(service_url: str):
+    _FlakyServiceStub.failures = 2
+    client = _client(service_url)
+
+    response = client.request("test", "GET", "/status/1", "status", retry=True)
+
+    assert response.status_code == 200
+    metrics = client.get_metrics()[("test", "status")]
+    assert (metrics.calls, metrics.failures, metrics.retries) == (3, 2, 2)
+
+
+def test_does_not_retry_without_retry_flag(service_url: str):
+    _FlakyServiceStub.failures = 1
+    client = _client(service_url)
+
+    response = client.request("test", "GET", "/health", "health")
+
+    assert response.status_code == 503
+    assert _FlakyServiceStub.calls == 1
+
+
+def test_circuit_opens_after_consecutive_failures(service_url: str):
+    _FlakyServiceStub.failures = 10
+    client = _client(service_url, max_retries=0, circuit_failure_threshold=2)
+
+    client.request("test", "GET", "/health", "health")
+    client.request("test", "GET", "/health", "health")
+    with pytest.raises(KoopCircuitOpenError):
+        client.request("test", "GET", "/health", "health")
+
+    assert _FlakyServiceStub.calls == 2
+
+
+def test_unreachable_service_raises_unavailable():
+    client = _client("http://127.0.0.1:9", max_retries=0)
+
+    with pytest.raises(KoopUnavailableError):
+        client.request("test", "GET", "/health", "health")
@@ -0,0 +1,162 @@
+import json
+import threading
+import uuid
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.domains.publications.repository import PublicationPdfExportJobRepository
+from app.api.domains.publications.services.koop_client import KoopClient
+from app.api.domains.publications.services.pdf_export_job_queue import PdfExportJobQueue
+from app.api.domains.publications.services.pdf_export_service import PdfExportService, PdfExportXmlError
+from app.api.domains.publications.types.enums import PdfExportJobStatus
+from app.api.domains.publications.types.zip import ZipData
+from app.core.settings import KoopSettings
+from app.core.tables.publications import PublicationPdfExportJobTable
+from tests.conftest import Context
+from tests.fixtures.internal.spec.user_spec import UserSpec
+from tests.fixtures.internal.types import Ref
+
+PDF_CONTENT = b"%PDF-1.7 preview"
+
+
+class _PreviewApiStub(BaseHTTPRequestHandler):
+    """
+    Local stand in for the KOOP preview api, every preview is ready on the second status poll.
+    """
+
+    polls: ClassVar[dict[str, int]] = {}
+
+    def do_POST(self):
+        body: bytes = self.rfile.read(int(self.headers["Content-Length"]))
+        if b"invalid.zip" in body:
+            self._send(422, b"Invalid xml")
+            return
+
+        idx: str = str(uuid.uuid4())
+        self.polls[idx] = 0
+        self._send(202, json.dumps({"id": idx}).encode())
+
+    def do_GET(self):
+        _, action, idx = self.path.split("/")
+        if action == "status":
+            self.polls[idx] += 1
+            status_pdf: str = "gereed" if self.polls[idx] >= 2 else "bezig"
+            self._send(200, json.dumps({"status-pdf": status_pdf}).encode())
+        elif action == "download":
+            self._send(200, PDF_CONTENT)
+        else:
+            self._send(404, b"")
+
+    def _send(self, code: int, body: bytes):
+        self.send_response(code)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def pdf_export_service() -> Generator[PdfExportService]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PreviewApiStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        koop_client = KoopClient(
+            {
+                "test": KoopSettings(
+                    API_KEY="key",
+                    RENVOOI_API_URL="",
+                    PREVIEW_API_URL=f"http://127.0.0.1:{server.server_port}",
+                )
+            },
+            timeout_seconds=5,
+            max_retries=0,
+            backoff_seconds=0,
+            circuit_failure_threshold=5,
+            circuit_reset_seconds=30,
+        )
+        yield PdfExportService(koop_client)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _zip_data(filename: str = "preview.zip") -> ZipData:
+    return ZipData(Publication_Filename=filename, Filename=filename, Binary=b"zip", Checksum="")
+
+
+def _run(queue: PdfExportJobQueue, session: Session, ctx: Context, zip_data: ZipData) -> PublicationPdfExportJobTable:
+    job = queue.create_job("test", "preview.pdf", ctx.f.primary_key_uuid(Ref(UserSpec, "admin")))
+    session.add(job)
+    session.commit()
+
+    queue.submit(job, zip_data).result(timeout=30)
+
+    session.expire_all()
+    return session.get(PublicationPdfExportJobTable, job.UUID)
+
+
+def test_job_stores_the_generated_pdf(session: Session, ctx: Context, pdf_export_service: PdfExportService):
+    session_factory = sessionmaker(bind=session.connection(), join_transaction_mode="create_savepoint")
+    queue = PdfExportJobQueue(pdf_export_service, session_factory)
+
+    job = _run(queue, session, ctx, _zip_data())
+
+    assert job.Status == PdfExportJobStatus.COMPLETED
+    assert job.Progress == 1
+    assert job.Binary == PDF_CONTENT
+
+
+def test_job_stores_the_preview_api_error(session: Session, ctx: Context, pdf_export_service: PdfExportService):
+    session_factory = sessionmaker(bind=session.connection(), join_transaction_mode="create_savepoint")
+    queue = PdfExportJobQueue(pdf_export_service, session_factory)
+
+    job = _run(queue, session, ctx, _zip_data("invalid.zip"))
+
+    assert job.Status == PdfExportJobStatus.FAILED
+    assert job.Error == "Invalid xml"
+    assert job.Binary is None
+
+
+def test_create_pdf_raises_on_invalid_package(pdf_export_service: PdfExportService):
+    with pytest.raises(PdfExportXmlError):
+        pdf_export_service.create_pdf("test", _zip_data("invalid.zip"))
+
+
+def test_orphaned_jobs_are_failed(session: Session, ctx: Context, pdf_export_service: PdfExportService):
+    queue = PdfExportJobQueue(pdf_export_service, sessionmaker())
+    user_uuid: uuid.UUID = ctx.f.primary_key_uuid(Ref(UserSpec, "admin"))
+    timepoint: datetime = datetime.now(UTC)
+
+    jobs: dict[str, PublicationPdfExportJobTable] = {}
+    for name, status, minutes_ago in [
+        ("queued", PdfExportJobStatus.QUEUED, 10),
+        ("running", PdfExportJobStatus.RUNNING, 10),
+        ("completed", PdfExportJobStatus.COMPLETED, 10),
+        ("recent", PdfExportJobStatus.RUNNING, 0),
+    ]:
+        job = queue.create_job("test", f"{name}.pdf", user_uuid)
+        job.Status = status.value
+        job.Modified_Date = timepoint - timedelta(minutes=minutes_ago)
+        session.add(job)
+        jobs[name] = job
+    session.commit()
+
+    failed: int = PublicationPdfExportJobRepository().fail_orphaned(session, timepoint - timedelta(minutes=5))
+    session.commit()
+    session.expire_all()
+
+    assert failed == 2
+    assert {name: session.get(PublicationPdfExportJobTable, job.UUID).Status for name, job in jobs.items()} == {
+        "queued": PdfExportJobStatus.FAILED,
+        "running": PdfExportJobStatus.FAILED,
+        "completed": PdfExportJobStatus.COMPLETED,
+        "recent": PdfExportJobStatus.RUNNING,
+    }
@@ -0,0 +1,129 @@
+import dso.models as dso_models
+
+from app.api.domains.publications.services.state.patch_act_mutation import StateGioPool
+from app.api.domains.publications.services.state.versions.v7 import models
+from app.api.domains.publications.types.api_input_data import PublicationGio, PublicationGioLocatie
+
+
+def _state_gio(key: str, source_hash: str, version: int = 1) -> models.Gio:
+    return models.Gio(
+        key=key,
+        source_codes={f"gebied-{key}"},
+        title=f"Gio {key}",
+        frbr=models.Frbr(
+            Work_Province_ID="pv28",
+            Work_Country="nl",
+            Work_Date="2024",
+            Work_Other=f"gio-{key}",
+            Expression_Language="nld",
+            Expression_Date="2024-01-01",
+            Expression_Version=version,
+        ),
+        geboorteregeling="/akn/nl/act/pv28/2024/1",
+        achtergrond_verwijzing="TOP10NL",
+        achtergrond_actualiteit="2024-01-01",
+        locaties=[
+            models.GioLocatie(
+                title=f"Gebied {key}",
+                basisgeo_id=f"basisgeo-{key}",
+                source_hash=source_hash,
+                source_code=f"gebied-{key}",
+            )
+        ],
+    )
+
+
+def _new_gio(key: str, source_hash: str) -> PublicationGio:
+    return PublicationGio(
+        key=f"new-{key}",
+        source_codes={f"gebied-{key}"},
+        title=f"Gio {key}",
+        frbr=dso_models.GioFRBR(
+            Work_Province_ID="pv28",
+            Work_Date="2025",
+            Work_Other=f"new-gio-{key}",
+            Expression_Language="nld",
+            Expression_Date="2025-01-01",
+            Expression_Version=1,
+        ),
+        new=True,
+        geboorteregeling="",
+        achtergrond_verwijzing="TOP10NL",
+        achtergrond_actualiteit="2025-01-01",
+        locaties=[
+            PublicationGioLocatie(
+                code=f"gebied-{key}",
+                title=f"Gebied {key}",
+                basisgeo_id=f"new-basisgeo-{key}",
+                source_hash=source_hash,
+                gml="<gml/>",
+            )
+        ],
+    )
+
+
+def _active_act(state_gios: list[models.Gio], owners: dict[str, str]) -> models.ActiveAct:
+    # owners maps a gebiedengroep code on the key of the state gio it used
+    return models.ActiveAct.model_construct(
+        Gios={gio.key: gio for gio in state_gios},
+        Gebiedengroepen={
+            code: models.Gebiedengroep(
+                uuid=code,
+                code=code,
+                title=code,
+                source_gebieden_codes=set(),
+                gio_key=gio_key,
+            )
+            for code, gio_key in owners.items()
+        },
+        Gebiedsaanwijzingen={},
+    )
+
+
+def test_claim_reuses_frbr_of_unchanged_gio():
+    pool = StateGioPool(_active_act([_state_gio("1", "hash-1", version=3)], {"gebiedengroep-1": "1"}))
+
+    gio = pool.claim(_new_gio("1", "hash-1"), ["gebiedengroep-1"])
+
+    assert gio.new is False
+    assert gio.frbr.Work_Other == "gio-1"
+    assert gio.frbr.Expression_Version == 3
+    assert pool.get_removed_state_gios() == []
+
+
+def test_claim_creates_new_expression_for_changed_gio():
+    pool = StateGioPool(_active_act([_state_gio("1", "hash-1", version=3)], {"gebiedengroep-1": "1"}))
+
+    gio = pool.claim(_new_gio("1", "hash-2"), ["gebiedengroep-1"])
+
+    assert gio.new is True
+    assert gio.frbr.Work_Other == "gio-1"
+    assert gio.frbr.Expression_Version == 4
+
+
+def test_claim_prefers_first_owner_and_withdraws_the_other_lineage():
+    pool = StateGioPool(
+        _active_act(
+            [_state_gio("1", "hash-1"), _state_gio("2", "hash-2")],
+            {"gebiedengroep-1": "1", "gebiedengroep-2": "2"},
+        )
+    )
+
+    gio = pool.claim(_new_gio("1", "hash-1"), ["gebiedengroep-2", "gebiedengroep-1"])
+
+    assert gio.frbr.Work_Other == "gio-2"
+    assert [state_gio.key for state_gio in pool.get_removed_state_gios()] == ["1"]
+
+
+def test_claim_many_gios_keeps_state_order():
+    count: int = 3000
+    state_gios: list[models.Gio] = [_state_gio(str(i), f"hash-{i}") for i in range(count)]
+    pool = StateGioPool(_active_act(state_gios, {f"gebiedengroep-{i}": str(i) for i in range(count)}))
+
+    # Every other gio is gone from the new publication
+    for i in range(0, count, 2):
+        gio = pool.claim(_new_gio(str(i), f"hash-{i}"), [f"gebiedengroep-{i}"])
+        assert gio.frbr.Work_Other == f"gio-{i}"
+
+    removed: list[str] = [state_gio.key for state_gio in pool.get_removed_state_gios()]
+    assert removed == [str(i) for i in range(1, count, 2)]
@@ -0,0 +1,63 @@
+import uuid
+
+from app.api.domains.publications.services.state.state import InitialState
+from app.api.domains.publications.services.state.state_loader import StateLoader
+from app.api.domains.publications.services.state.versions import ActiveState
+from app.core.tables.publications import PublicationEnvironmentStateTable
+
+
+class FakeStateVersionFactory:
+    def __init__(self):
+        self.calls: int = 0
+
+    def get_state_model(self, session, environment_uuid: uuid.UUID, state_dict: dict) -> ActiveState:
+        self.calls += 1
+        return ActiveState.model_validate(state_dict["Data"])
+
+
+class FakeSession:
+    def __init__(self):
+        self.added: list = []
+        self.flushes: int = 0
+
+    def add(self, instance) -> None:
+        self.added.append(instance)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+def _state_table(schema_version: int | None) -> PublicationEnvironmentStateTable:
+    return PublicationEnvironmentStateTable(
+        UUID=uuid.uuid4(),
+        Environment_UUID=uuid.uuid4(),
+        State=InitialState().state_dict(),
+        Schema_Version=schema_version,
+    )
+
+
+class TestStateLoader:
+    def test_outdated_state_is_upgraded_and_stored(self):
+        factory = FakeStateVersionFactory()
+        session = FakeSession()
+        state_table = _state_table(None)
+
+        state = StateLoader(factory).load_from_state_table(session, state_table)
+
+        assert isinstance(state, ActiveState)
+        assert factory.calls == 1
+        assert state_table.Schema_Version == ActiveState.get_schema_version()
+        assert state_table.State == state.state_dict()
+        assert session.added == [state_table]
+        assert session.flushes == 1
+
+    def test_current_state_skips_the_upgraders(self):
+        factory = FakeStateVersionFactory()
+        session = FakeSession()
+        state_table = _state_table(ActiveState.get_schema_version())
+
+        state = StateLoader(factory).load_from_state_table(session, state_table)
+
+        assert isinstance(state, ActiveState)
+        assert factory.calls == 0
+        assert session.added == []
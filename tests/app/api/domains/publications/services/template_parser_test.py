@@ -0,0 +1,49 @@
+from jinja2 import Template
+
+from app.api.domains.publications.services.template_parser import TemplateParser
+
+TEXT_TEMPLATE = """
+<Lichaam>
+{% for o in visie_algemeen | sort(attribute='Title') %}
+<Divisie>{{ o.Title }}</Divisie>
+{% endfor %}
+{% for o in beleidsdoel %}[OBJECT:{{ o.Code }}]{% endfor %}
+</Lichaam>
+"""
+
+OBJECTS: list[dict] = [
+    {"Object_Type": "visie_algemeen", "Code": "visie_algemeen-2", "Title": "B"},
+    {"Object_Type": "visie_algemeen", "Code": "visie_algemeen-1", "Title": "A"},
+    {"Object_Type": "beleidsdoel", "Code": "beleidsdoel-1", "Title": "Doel"},
+]
+
+
+def test_renders_as_an_uncached_template():
+    expected: str = Template(TEXT_TEMPLATE).render(
+        visie_algemeen=OBJECTS[:2],
+        beleidsdoel=OBJECTS[2:],
+    )
+    expected = expected.strip().replace("\n", "")
+
+    assert TemplateParser().get_parsed_template(TEXT_TEMPLATE, OBJECTS) == expected
+
+
+def test_template_is_compiled_once_per_text():
+    parser = TemplateParser()
+
+    for _ in range(10):
+        parser.get_parsed_template(TEXT_TEMPLATE, OBJECTS)
+    changed: str = parser.get_parsed_template(TEXT_TEMPLATE.replace("Divisie", "Hoofdstuk"), OBJECTS)
+
+    assert "<Hoofdstuk>A</Hoofdstuk>" in changed
+    stats = parser.get_stats()
+    assert stats.renders == 11
+    assert stats.compiles == 2
+
+
+def test_bytecode_is_shared_through_the_cache_dir(tmp_path):
+    first: str = TemplateParser(bytecode_cache_dir=str(tmp_path)).get_parsed_template(TEXT_TEMPLATE, OBJECTS)
+    assert any(tmp_path.iterdir())
+
+    second: str = TemplateParser(bytecode_cache_dir=str(tmp_path)).get_parsed_template(TEXT_TEMPLATE, OBJECTS)
+    assert first == second
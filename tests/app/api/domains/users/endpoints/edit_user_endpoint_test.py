@@ -1,11 +1,14 @@
 import uuid
+from collections.abc import Generator
 
 import pytest
+from dependency_injector import providers
 from fastapi.testclient import TestClient
 from pytest import FixtureRequest
 from sqlalchemy import desc, select
 from sqlalchemy.orm import Session
 
+from app.api.domains.users.services.user_cache import USER_CACHE_INFO_KEY, UserCache
 from app.core.tables.others import ChangeLogTable
 from app.core.tables.users import IS_ACTIVE, UsersTable
 from tests.conftest import Context
@@ -24,6 +27,18 @@ def target_uuid(ctx: Context) -> uuid.UUID:
     return ctx.f.primary_key_uuid(Ref(UserSpec, "viewer"))
 
 
+@pytest.fixture()
+def user_cache(admin: TestClient) -> Generator[UserCache]:
+    """Enables the user cache, which the test settings disable"""
+    cache = UserCache(ttl_seconds=60)
+    admin.app.container.user_cache.override(providers.Object(cache))
+    admin.app.state.db_sessionmaker.configure(info={USER_CACHE_INFO_KEY: cache})
+    try:
+        yield cache
+    finally:
+        admin.app.container.user_cache.reset_override()
+
+
 def test_edit_user_success(admin: TestClient, target_uuid: uuid.UUID, session: Session):
     payload = {
         "Gebruikersnaam": "Edited Name",
@@ -130,3 +145,19 @@ def test_edit_user_rejected(
     response = test_client.post(f"/users/{target}", json=payload)
     assert response.status_code == expected_status, response.text
     assert response.json()["detail"] == expected_detail
+
+
+def test_deactivated_user_is_not_served_from_the_user_cache(
+    admin: TestClient,
+    viewer: TestClient,
+    user_cache: UserCache,
+    target_uuid: uuid.UUID,
+):
+    assert viewer.get(f"/users/{target_uuid}").status_code == 200
+    assert viewer.get(f"/users/{target_uuid}").status_code == 200
+
+    deactivate = admin.post(f"/users/{target_uuid}", json={"IsActive": False})
+    assert deactivate.status_code == 200, deactivate.text
+
+    response = viewer.get(f"/users/{target_uuid}")
+    assert response.status_code == 401, response.text
@@ -0,0 +1,75 @@
+import time
+import uuid
+
+from app.api.domains.users.services.user_cache import USER_CACHE_INFO_KEY, UserCache
+from app.core.tables.users import UsersTable
+from tests.conftest import Context
+from tests.fixtures.internal.spec.user_spec import UserSpec
+from tests.fixtures.internal.types import Ref
+
+
+def _load_user(ctx: Context) -> UsersTable:
+    admin_uuid: uuid.UUID = ctx.f.primary_key_uuid(Ref(UserSpec, "admin"))
+    user: UsersTable | None = ctx.s.get(UsersTable, admin_uuid)
+    assert user is not None
+    return user
+
+
+def test_get_returns_the_user_attached_to_the_session(ctx: Context):
+    cache = UserCache(ttl_seconds=60)
+    user: UsersTable = _load_user(ctx)
+    token_expires_at: int = int(time.time()) + 600
+    cache.put(user, token_expires_at)
+    ctx.s.expunge_all()
+
+    cached: UsersTable | None = cache.get(ctx.s, user.UUID, token_expires_at)
+
+    assert cached is not None
+    assert cached in ctx.s
+    assert cached.to_dict_safe() == user.to_dict_safe()
+    # The password hash is not cached but still loads
+    assert cached.Wachtwoord == user.Wachtwoord
+    # Keyed by the token expiry as well
+    assert cache.get(ctx.s, user.UUID, token_expires_at + 1) is None
+
+
+def test_entries_do_not_outlive_the_token(ctx: Context):
+    cache = UserCache(ttl_seconds=60)
+    user: UsersTable = _load_user(ctx)
+    token_expires_at: int = int(time.time()) - 1
+    cache.put(user, token_expires_at)
+
+    assert cache.get(ctx.s, user.UUID, token_expires_at) is None
+
+
+def test_disabled_cache_stores_nothing(ctx: Context):
+    cache = UserCache(ttl_seconds=0)
+    user: UsersTable = _load_user(ctx)
+    cache.put(user, None)
+
+    assert not cache.is_enabled()
+    assert cache.get(ctx.s, user.UUID, None) is None
+
+
+def test_keeps_the_most_recent_entries(ctx: Context):
+    cache = UserCache(ttl_seconds=60, max_entries=1)
+    user: UsersTable = _load_user(ctx)
+    cache.put(user, 1)
+    cache.put(user, None)
+
+    assert cache.get(ctx.s, user.UUID, 1) is None
+    assert cache.get(ctx.s, user.UUID, None) is not None
+
+
+def test_committed_user_writes_invalidate_the_cache(ctx: Context):
+    cache = UserCache(ttl_seconds=60)
+    ctx.s.info[USER_CACHE_INFO_KEY] = cache
+    user: UsersTable = _load_user(ctx)
+    cache.put(user, None)
+
+    user.Gebruikersnaam = "Edited"
+    ctx.s.add(user)
+    ctx.s.flush()
+    ctx.s.commit()
+
+    assert cache.get(ctx.s, user.UUID, None) is None
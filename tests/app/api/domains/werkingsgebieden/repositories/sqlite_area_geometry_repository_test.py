@@ -0,0 +1,105 @@
+import hashlib
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.api.domains.werkingsgebieden.repositories import area_geometry_repository
+from app.api.domains.werkingsgebieden.repositories.area_repository import AreaRepository
+from app.api.domains.werkingsgebieden.repositories.sqlite_area_geometry_repository import (
+    SqliteAreaGeometryRepository,
+)
+from app.core.tables.others import AreasTable
+from app.core.tables.werkingsgebieden import InputGeoOnderverdelingenTable
+from tests.conftest import Context
+from tests.fixtures.internal.spec.area_spec import AreaSpec
+from tests.fixtures.internal.spec.input_geo_onderverdeling_spec import InputGeoOnderverdelingSpec
+from tests.fixtures.internal.spec.user_spec import UserSpec
+from tests.fixtures.internal.types import Ref
+
+AREA_KEYS = ["nature-west-v1", "nature-east-v1", "nature-south-v1", "sea-v1", "lake-v1"]
+
+
+def _area_uuids(ctx: Context) -> list[uuid.UUID]:
+    return [ctx.f.find(Ref(AreaSpec, key)).spec.UUID for key in AREA_KEYS]
+
+
+def test_iter_areas_with_gml_matches_single_lookups(session: Session, ctx: Context):
+    area_uuids = _area_uuids(ctx)
+
+    areas = [
+        area for chunk in SqliteAreaGeometryRepository().iter_areas_with_gml(session, area_uuids) for area in chunk
+    ]
+
+    assert {area.uuid for area in areas} == set(area_uuids)
+    for area in areas:
+        expected = AreaRepository().get_with_gml(session, area.uuid)
+        assert area.gml == expected.Gml
+        assert area.title == expected.Source_Title
+        assert area.gml_hash == hashlib.sha512(expected.Gml.encode()).hexdigest()
+
+
+def test_iter_areas_with_gml_queries_per_chunk(session: Session, ctx: Context, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(area_geometry_repository, "AREAS_PER_QUERY", 2)
+    area_uuids = _area_uuids(ctx)
+
+    chunks = list(SqliteAreaGeometryRepository().iter_areas_with_gml(session, [*area_uuids, area_uuids[0]]))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_iter_areas_with_gml_skips_unknown_areas(session: Session, ctx: Context):
+    known = _area_uuids(ctx)[0]
+
+    chunks = list(SqliteAreaGeometryRepository().iter_areas_with_gml(session, [known, uuid.uuid4()]))
+
+    assert [area.uuid for area in chunks[0]] == [known]
+
+
+def test_get_areas_returns_every_area(session: Session, ctx: Context):
+    area_uuids = _area_uuids(ctx)
+
+    areas = SqliteAreaGeometryRepository().get_areas(session, area_uuids)
+
+    assert set(areas) == set(area_uuids)
+
+
+def test_create_areas_from_onderverdelingen_copies_the_sources(session: Session, ctx: Context):
+    admin_uuid: uuid.UUID = ctx.f.primary_key_uuid(Ref(UserSpec, "admin"))
+    onderverdeling_uuids: list[uuid.UUID] = [
+        ctx.f.find(Ref(InputGeoOnderverdelingSpec, key)).spec.UUID for key in ["nature-west-v3", "nature-noord-v3"]
+    ]
+    repository = SqliteAreaGeometryRepository()
+
+    created = repository.create_areas_from_onderverdelingen(
+        session,
+        datetime.now(UTC),
+        admin_uuid,
+        onderverdeling_uuids,
+    )
+
+    assert set(created) == set(onderverdeling_uuids)
+    for onderverdeling_uuid, area_uuid in created.items():
+        onderverdeling = session.get(InputGeoOnderverdelingenTable, onderverdeling_uuid)
+        area = repository.get_with_gml(session, area_uuid)
+        assert onderverdeling and area
+        assert area.Source_UUID == onderverdeling.UUID
+        assert area.Source_Title == onderverdeling.Title
+        assert area.Source_Geometry_Hash == onderverdeling.Geometry_Hash
+        assert area.Source_Geometry_Index == onderverdeling.Geometry_Hash[0:10]
+        assert area.Gml == onderverdeling.GML
+        assert area.Shape == onderverdeling.Geometry
+        assert area.Created_By_UUID == admin_uuid
+
+
+def test_get_by_source_hashes_and_titles_matches_single_lookups(session: Session, ctx: Context):
+    areas: list[AreasTable] = [AreaRepository().get_with_gml(session, area_uuid) for area_uuid in _area_uuids(ctx)]
+    sources: list[tuple[str, str]] = [(area.Source_Geometry_Hash, area.Source_Title) for area in areas]
+
+    found = AreaRepository().get_by_source_hashes_and_titles(session, [*sources, (sources[0][0], "Unknown title")])
+
+    assert set(found) == set(sources)
+    for source_hash, source_title in sources:
+        expected = AreaRepository().get_by_source_hash_and_title(session, source_hash, source_title)
+        assert found[(source_hash, source_title)].UUID == expected.UUID
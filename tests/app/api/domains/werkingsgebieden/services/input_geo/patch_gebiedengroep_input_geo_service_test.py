@@ -0,0 +1,113 @@
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from app.api.domains.werkingsgebieden.services.input_geo.patch_gebiedengroep_input_geo_service import (
+    PatchGebiedengroepInputGeoService,
+)
+from app.core.tables.modules import ModuleObjectsTable
+from app.core.tables.objects import ObjectStaticsTable
+from app.core.tables.werkingsgebieden import InputGeoOnderverdelingenTable, InputGeoWerkingsgebiedenTable
+
+
+class _Session:
+    def __init__(self):
+        self.added: list = []
+
+    def add(self, instance) -> None:
+        self.added.append(instance)
+
+    def flush(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+
+class _ObjectStaticRepository:
+    def get_by_sources(self, session, source_keys: set[str]) -> dict[str, ObjectStaticsTable]:
+        return {
+            source_key: ObjectStaticsTable(Object_Type="gebied", Object_ID=index, Code=f"gebied-{index}")
+            for index, source_key in enumerate(sorted(source_keys), start=1)
+        }
+
+
+class _ModuleObjectRepository:
+    def get_latest_by_module_id_object_codes(self, session, module_id: int, codes: set[str]) -> dict:
+        return {}
+
+    def patch_module_object(self, session, module_object, changes: dict, timepoint, by_uuid):
+        return SimpleNamespace(UUID=uuid.uuid4(), **changes)
+
+
+class _ObjectContextService:
+    def ensure_exists_many(self, session, module_id: int, requests: list) -> None:
+        pass
+
+
+class _AreaRepository:
+    def get_by_source_hashes_and_titles(self, session, keys: list[tuple[str, str]]) -> dict:
+        return {}
+
+
+class _AreaGeometryRepository:
+    def __init__(self):
+        self.onderverdeling_uuids: list[uuid.UUID] = []
+        self.created: dict[uuid.UUID, uuid.UUID] = {}
+
+    def create_areas_from_onderverdelingen(
+        self, session, timepoint, user_uuid, onderverdeling_uuids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, uuid.UUID]:
+        self.onderverdeling_uuids.extend(onderverdeling_uuids)
+        self.created.update({onderverdeling_uuid: uuid.uuid4() for onderverdeling_uuid in onderverdeling_uuids})
+        return self.created
+
+
+class _SearchBackend:
+    def sync(self, session, table_name: str, uuids: list[uuid.UUID]) -> None:
+        pass
+
+
+def _onderverdeling(title: str, geometry_hash: str) -> InputGeoOnderverdelingenTable:
+    return InputGeoOnderverdelingenTable(
+        UUID=uuid.uuid4(),
+        Title=title,
+        Created_Date=datetime.now(UTC),
+        Geometry_Hash=geometry_hash,
+    )
+
+
+def test_onderverdelingen_with_the_same_title_use_the_last_area():
+    first = _onderverdeling("Gebied A", "hash-1")
+    last = _onderverdeling("Gebied A", "hash-2")
+    other = _onderverdeling("Gebied B", "hash-3")
+    input_geo_werkingsgebied = InputGeoWerkingsgebiedenTable(
+        UUID=uuid.uuid4(),
+        Title="Gebiedengroep",
+        Created_Date=datetime.now(UTC),
+    )
+    input_geo_werkingsgebied.Onderverdelingen = [first, last, other]
+    session = _Session()
+    area_geometry_repository = _AreaGeometryRepository()
+    service = PatchGebiedengroepInputGeoService(
+        _ObjectStaticRepository(),
+        _ModuleObjectRepository(),
+        _ObjectContextService(),
+        _AreaRepository(),
+        area_geometry_repository,
+        _SearchBackend(),
+        session,
+        SimpleNamespace(UUID=uuid.uuid4()),
+        "gebied",
+        input_geo_werkingsgebied,
+    )
+
+    result = service.patch(SimpleNamespace(Module_ID=1, Source_Title=None, Source_UUID=None))
+
+    assert area_geometry_repository.onderverdeling_uuids == [last.UUID, other.UUID]
+    sub_objects: dict[str, ModuleObjectsTable] = {
+        instance.Title: instance for instance in session.added if isinstance(instance, ModuleObjectsTable)
+    }
+    assert sub_objects.keys() == {"Gebied A", "Gebied B"}
+    assert sub_objects["Gebied A"].Area_UUID == area_geometry_repository.created[last.UUID]
+    assert sorted(result.Gebieden) == sorted(sub_object.Code for sub_object in sub_objects.values())
@@ -0,0 +1,43 @@
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.api.utils.count_cache import CountCache
+from app.core.tables.objects import ObjectsTable
+
+
+def test_get_returns_put_count():
+    cache = CountCache(ttl_seconds=60)
+    cache.put("key", 12)
+
+    assert cache.get("key") == 12
+    assert cache.get("other") is None
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    cache = CountCache(ttl_seconds=60)
+    cache.put("key", 12)
+
+    now: float = time.monotonic()
+    monkeypatch.setattr("app.api.utils.count_cache.time.monotonic", lambda: now + 61)
+
+    assert cache.get("key") is None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = CountCache(ttl_seconds=0)
+    cache.put("key", 12)
+
+    assert not cache.is_enabled()
+    assert cache.get("key") is None
+
+
+def test_key_depends_on_parameters(session: Session):
+    stmt = select(func.count()).select_from(ObjectsTable)
+
+    key_a = CountCache.create_key(stmt.filter(ObjectsTable.Object_Type == "beleidsdoel"), session)
+    key_b = CountCache.create_key(stmt.filter(ObjectsTable.Object_Type == "maatregel"), session)
+
+    assert key_a != key_b
+    assert key_a == CountCache.create_key(stmt.filter(ObjectsTable.Object_Type == "beleidsdoel"), session)
@@ -0,0 +1,41 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from app.api.utils.html_documents import HtmlDocuments
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "None",
+        "<p>Tekst</p><p></p>",
+        "<td><p></p></td>",
+        "<ul><li>Punt</li></ul><p><br></p>",
+        '<p>Zie <a data-hint-type="gebiedsaanwijzing" data-code="gebied-1"></a></p>',
+        "<p><ul><li>x</li></ul></p>",
+        "<p><table><tr><td>x</td></tr></table></p>",
+        "<p><h2>x</h2></p>",
+        "<p>a<div>b</div></p>",
+    ],
+)
+def test_parse_finds_the_same_elements_as_the_html_parser(text: str):
+    expected = [(tag.name, tag.get_text()) for tag in BeautifulSoup(text, "html.parser").find_all(True)]
+
+    document: BeautifulSoup = HtmlDocuments.parse(text)
+
+    assert [(tag.name, tag.get_text()) for tag in document.find_all(True)] == expected
+
+
+def test_fields_are_parsed_once():
+    documents = HtmlDocuments()
+
+    first = documents.get("object-1", "Description", "<p>Tekst</p>")
+    second = documents.get("object-1", "Description", "<p>Tekst</p>")
+    documents.get("object-1", "Explanation", "<p>Tekst</p>")
+    documents.get("object-2", "Description", "<p>Tekst</p>")
+
+    assert first is second
+    stats = documents.get_stats()
+    assert stats.parses == 3
+    assert stats.hits == 1
@@ -0,0 +1,105 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.api.utils.pagination import CountMode, Cursor, SortOrder, query_paginated
+from app.core.tables.objects import ObjectsTable
+
+
+@pytest.mark.parametrize("column", ["Title", "Modified_Date", "End_Validity"])
+@pytest.mark.parametrize("order", [SortOrder.ASC, SortOrder.DESC])
+def test_cursor_pages_return_every_row_once(session: Session, column: str, order: SortOrder):
+    expected: int = len(session.scalars(select(ObjectsTable.UUID)).all())
+
+    seen: list = []
+    cursor: str | None = None
+    while True:
+        result = query_paginated(
+            query=select(ObjectsTable),
+            session=session,
+            limit=3,
+            sort=(getattr(ObjectsTable, column), order),
+            keyset=ObjectsTable.UUID,
+            cursor=cursor,
+            count_mode=CountMode.NONE,
+        )
+        assert result.total_count is None
+        seen.extend(row.UUID for row in result.items)
+        cursor = result.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == expected
+    assert len(set(seen)) == expected
+
+
+def test_offset_and_cursor_pages_match(session: Session):
+    sort = (ObjectsTable.Title, SortOrder.ASC)
+    first_page = query_paginated(select(ObjectsTable), session, limit=3, sort=sort, keyset=ObjectsTable.UUID)
+
+    by_cursor = query_paginated(
+        select(ObjectsTable), session, limit=3, sort=sort, keyset=ObjectsTable.UUID, cursor=first_page.next_cursor
+    )
+    by_offset = query_paginated(select(ObjectsTable), session, limit=3, offset=3, sort=sort, keyset=ObjectsTable.UUID)
+
+    assert [row.UUID for row in by_cursor.items] == [row.UUID for row in by_offset.items]
+    assert by_cursor.total_count == by_offset.total_count
+
+
+def test_cursor_of_other_sort_is_rejected(session: Session):
+    first_page = query_paginated(
+        select(ObjectsTable), session, limit=1, sort=(ObjectsTable.Title, SortOrder.ASC), keyset=ObjectsTable.UUID
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        query_paginated(
+            select(ObjectsTable),
+            session,
+            limit=1,
+            sort=(ObjectsTable.Title, SortOrder.DESC),
+            keyset=ObjectsTable.UUID,
+            cursor=first_page.next_cursor,
+        )
+    assert exc.value.status_code == 400
+
+
+def test_cursor_without_keyset_is_rejected(session: Session):
+    first_page = query_paginated(
+        select(ObjectsTable), session, limit=1, sort=(ObjectsTable.Title, SortOrder.ASC), keyset=ObjectsTable.UUID
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        query_paginated(
+            select(ObjectsTable),
+            session,
+            limit=1,
+            sort=(ObjectsTable.Title, SortOrder.ASC),
+            cursor=first_page.next_cursor,
+        )
+    assert exc.value.status_code == 400
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        Cursor.decode("not-a-cursor")
+    assert exc.value.detail == "Invalid cursor"
+
+
+def test_short_first_page_skips_the_count(session: Session):
+    expected: int = len(session.scalars(select(ObjectsTable.UUID)).all())
+    statements: list[str] = []
+
+    def track(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", track)
+    try:
+        result = query_paginated(
+            select(ObjectsTable), session, limit=expected + 10, sort=(ObjectsTable.Title, SortOrder.ASC)
+        )
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", track)
+
+    assert result.total_count == expected
+    assert len(statements) == 1
@@ -0,0 +1,76 @@
+from sqlalchemy import Engine, create_engine, text, update
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.core.db.session import create_db_engine, register_commit_invalidation
+
+
+def test_sqlite_connections_are_configured_when_opened():
+    engine: Engine = create_db_engine("sqlite://", echo=False)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA foreign_keys")).scalar_one() == 1
+        assert connection.execute(text("SELECT spatialite_version()")).scalar_one()
+
+    engine.dispose()
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _WatchedTable(_Base):
+    __tablename__ = "commit_invalidation_watched"
+
+    ID: Mapped[int] = mapped_column(primary_key=True)
+    Value: Mapped[str]
+
+
+class _OtherTable(_Base):
+    __tablename__ = "commit_invalidation_other"
+
+    ID: Mapped[int] = mapped_column(primary_key=True)
+
+
+class _Cache:
+    def __init__(self):
+        self.invalidated: int = 0
+
+    def invalidate(self) -> None:
+        self.invalidated += 1
+
+
+register_commit_invalidation("commit_invalidation_cache", frozenset({_WatchedTable.__tablename__}), _Cache.invalidate)
+
+
+def test_committed_writes_to_watched_tables_invalidate():
+    engine: Engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    cache = _Cache()
+
+    with Session(engine, info={"commit_invalidation_cache": cache}) as session:
+        session.add(_OtherTable(ID=1))
+        session.commit()
+        assert cache.invalidated == 0
+
+        session.add(_WatchedTable(ID=1, Value="a"))
+        session.flush()
+        session.rollback()
+        session.commit()
+        assert cache.invalidated == 0
+
+        session.add(_WatchedTable(ID=1, Value="a"))
+        session.commit()
+        assert cache.invalidated == 1
+
+        # Bulk statements bypass the unit of work
+        session.execute(update(_WatchedTable).values(Value="b"))
+        session.commit()
+        assert cache.invalidated == 2
+
+    # Sessions without the cache are not tracked
+    with Session(engine) as session:
+        session.add(_WatchedTable(ID=2, Value="c"))
+        session.commit()
+    assert cache.invalidated == 2
+
+    engine.dispose()
@@ -17,7 +17,7 @@ import app.main as _app_module
 from app.api.api_container import ApiContainer
 from app.api.domains.users.services.security import Security
 from app.core.db.base import Base
-from app.core.db.session import _enable_sqlite_load_extension
+from app.core.db.session import _configure_sqlite_connection
 from app.core.services.models_provider import ModelsProvider
 from tests.fixtures.internal.fixtures_service import FixturesService
 from tests.fixtures.internal.spec.user_spec import UserSpec
@@ -81,10 +81,8 @@ def engine():
         # https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#transactions-with-sqlite-and-the-sqlite3-driver
         dbapi_connection.isolation_level = None
 
-        # Load mod_spatialite for the geo tests that need it.
-        _enable_sqlite_load_extension(dbapi_connection, connection_record)
-
-        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+        # Load mod_spatialite for the geo tests that need it and enforce the foreign keys, like the app engine.
+        _configure_sqlite_connection(dbapi_connection, connection_record)
 
     @event.listens_for(_engine, "begin")
     def _sqlite_emit_begin(conn) -> None: